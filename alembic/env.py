@@ -27,7 +27,22 @@ target_metadata = Base.metadata
 config.set_main_option("sqlalchemy.url", str(settings.DATABASE_URL))
 
 # ----- Limit autogenerate to our app tables only -----
-APP_TABLES = {"device", "device_config", "message", "reading"}
+# (monthly partitions of reading / message are managed by app/services/partitions.py)
+APP_TABLES = {
+    "device",
+    "device_config",
+    "message",
+    "reading",
+    "device_status_snapshot",
+    "alert_transition",
+    "device_depth",
+    "reading_hourly",
+    "reading_daily",
+    "reading_pyramid",
+    "ingest_watermark",
+    "farm_aggregate",
+    "farm_cluster",
+}
 
 def include_object(obj, name, type_, reflected, compare_to):
     if type_ == "table":
@@ -0,0 +1,31 @@
+"""add indexes for /v1/devices sorting and filtering
+
+Revision ID: a2f7c5e9d3b1
+Revises: f6c3a9d2e8b4
+Create Date: 2026-10-19 19:00:00.000000
+
+The ESN prefix index uses varchar_pattern_ops so LIKE 'prefix%' can use it
+under any Postgres collation; SQLite gets no equivalent (its LIKE is
+case-insensitive and never uses a plain index).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'a2f7c5e9d3b1'
+down_revision = 'f6c3a9d2e8b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_device_sort_name', 'device', [sa.text('coalesce(name, esn)'), 'id'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_device_esn_pattern', 'device', ['esn'], unique=False, postgresql_ops={'esn': 'varchar_pattern_ops'})
+    op.create_index('ix_device_status_snapshot_last_seen_sort', 'device_status_snapshot', ['last_seen_sort', 'device_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_device_status_snapshot_last_seen_sort', table_name='device_status_snapshot')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_device_esn_pattern', table_name='device')
+    op.drop_index('ix_device_sort_name', table_name='device')
@@ -0,0 +1,205 @@
+"""partition reading and message by month
+
+Revision ID: a4d2e8b1c7f9
+Revises: f3c8a1d5b6e2
+Create Date: 2026-10-19 14:00:00.000000
+
+Postgres only (other dialects are left as they are). Rebuilds reading
+(by timestamp) and message (by received_at) as range-partitioned tables with
+one partition per month that holds data, the current month and
+PREMAKE_MONTHS ahead, plus a DEFAULT partition for anything else. The app's
+partition maintainer keeps months ahead and applies retention from then on
+(app/services/partitions.py).
+
+Partitioned primary keys must contain the partition key, so they become
+(id, timestamp) / (id, received_at), and reading.message_id can no longer be
+a foreign key to message.id; retention drops both tables by month instead of
+relying on ON DELETE CASCADE. Ids keep coming from the existing sequences.
+
+The data is copied inside the migration transaction, which blocks ingest
+while it runs: run it in a maintenance window on large databases.
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'a4d2e8b1c7f9'
+down_revision = 'f3c8a1d5b6e2'
+branch_labels = None
+depends_on = None
+
+PREMAKE_MONTHS = 3
+# Older rows (bad probe clocks) go to the default partition instead of one partition each
+HISTORY_YEARS = 5
+
+COLUMNS = {
+    'message': 'id, device_id, message_id, raw_payload, received_at',
+    'reading': 'id, message_id, device_id, depth_cm, moisture_pct, temperature_c, timestamp',
+}
+KEYS = {'message': 'received_at', 'reading': 'timestamp'}
+
+# Same indexes as d776ab29a494 / f3c8a1d5b6e2, built on the partitioned parents
+INDEXES = (
+    'CREATE INDEX ix_message_message_id ON message (message_id)',
+    'CREATE INDEX ix_reading_device_depth_timestamp ON reading (device_id, depth_cm, timestamp DESC) '
+    'INCLUDE (moisture_pct, temperature_c)',
+    'CREATE INDEX ix_reading_device_timestamp ON reading (device_id, timestamp)',
+    'CREATE INDEX ix_reading_timestamp_id ON reading (timestamp, id)',
+    'CREATE INDEX brin_reading_timestamp ON reading USING brin (timestamp)',
+)
+
+
+def _add_months(month: datetime, n: int) -> datetime:
+    years, index = divmod(month.month - 1 + n, 12)
+    return datetime(month.year + years, index + 1, 1)
+
+
+def _rename_with_indexes(bind, table: str, new_name: str) -> None:
+    """Rename a table and its indexes (index names are schema-wide)."""
+    op.execute(f'ALTER TABLE {table} RENAME TO {new_name}')
+    indexes = bind.execute(
+        sa.text('SELECT indexname FROM pg_indexes WHERE tablename = :t'), {'t': new_name}
+    ).scalars().all()
+    for index in indexes:
+        op.execute(f'ALTER INDEX {index} RENAME TO {index}_{new_name.rsplit("_", 1)[-1]}')
+
+
+def _serial_sequence(bind, table: str) -> str:
+    return bind.execute(sa.text("SELECT pg_get_serial_sequence(:t, 'id')"), {'t': table}).scalar()
+
+
+def _create_partitions(bind, table: str, source: str) -> None:
+    key = KEYS[table]
+    current = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    oldest = _add_months(current, -12 * HISTORY_YEARS)
+    newest = _add_months(current, PREMAKE_MONTHS)
+    months = {
+        m.replace(tzinfo=None)
+        for m in bind.execute(
+            sa.text(
+                f"SELECT DISTINCT date_trunc('month', {key}) FROM {source} "
+                f"WHERE {key} >= :lo AND {key} < :hi"
+            ),
+            {'lo': oldest, 'hi': _add_months(newest, 1)},
+        ).scalars()
+    }
+    months.update(_add_months(current, i) for i in range(PREMAKE_MONTHS + 1))
+    for month in sorted(months):
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_y{month.year:04d}m{month.month:02d} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table in ('reading', 'message'):
+        _rename_with_indexes(bind, table, f'{table}_unpartitioned')
+    sequences = {t: _serial_sequence(bind, f'{t}_unpartitioned') for t in ('message', 'reading')}
+
+    op.execute(f"""
+        CREATE TABLE message (
+            id integer NOT NULL DEFAULT nextval('{sequences['message']}'::regclass),
+            device_id integer NOT NULL,
+            message_id varchar(64) NOT NULL,
+            raw_payload text,
+            received_at timestamp without time zone NOT NULL,
+            CONSTRAINT pk_message PRIMARY KEY (id, received_at),
+            CONSTRAINT fk_message_device_id_device FOREIGN KEY (device_id)
+                REFERENCES device (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (received_at)
+    """)
+    op.execute(f"""
+        CREATE TABLE reading (
+            id integer NOT NULL DEFAULT nextval('{sequences['reading']}'::regclass),
+            message_id integer NOT NULL,
+            device_id integer NOT NULL,
+            depth_cm double precision NOT NULL,
+            moisture_pct double precision,
+            temperature_c double precision,
+            timestamp timestamp without time zone NOT NULL,
+            CONSTRAINT pk_reading PRIMARY KEY (id, timestamp),
+            CONSTRAINT fk_reading_device_id_device FOREIGN KEY (device_id)
+                REFERENCES device (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (timestamp)
+    """)
+
+    for table in ('message', 'reading'):
+        _create_partitions(bind, table, f'{table}_unpartitioned')
+        op.execute(
+            f'INSERT INTO {table} ({COLUMNS[table]}) '
+            f'SELECT {COLUMNS[table]} FROM {table}_unpartitioned'
+        )
+    for ddl in INDEXES:
+        op.execute(ddl)
+
+    for table in ('message', 'reading'):
+        # Move sequence ownership so dropping the old table keeps it
+        op.execute(f'ALTER SEQUENCE {sequences[table]} OWNED BY {table}.id')
+    op.execute('DROP TABLE reading_unpartitioned')
+    op.execute('DROP TABLE message_unpartitioned')
+    op.execute('ANALYZE message')
+    op.execute('ANALYZE reading')
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # Renaming the parent leaves partition and index names as they are;
+    # the parent's own partitioned indexes need new names
+    for table in ('reading', 'message'):
+        _rename_with_indexes(bind, table, f'{table}_partitioned')
+    sequences = {t: _serial_sequence(bind, f'{t}_partitioned') for t in ('message', 'reading')}
+
+    op.execute(f"""
+        CREATE TABLE message (
+            id integer NOT NULL DEFAULT nextval('{sequences['message']}'::regclass),
+            device_id integer NOT NULL,
+            message_id varchar(64) NOT NULL,
+            raw_payload text,
+            received_at timestamp without time zone NOT NULL,
+            CONSTRAINT pk_message PRIMARY KEY (id),
+            CONSTRAINT fk_message_device_id_device FOREIGN KEY (device_id)
+                REFERENCES device (id) ON DELETE CASCADE
+        )
+    """)
+    op.execute(f"""
+        CREATE TABLE reading (
+            id integer NOT NULL DEFAULT nextval('{sequences['reading']}'::regclass),
+            message_id integer NOT NULL,
+            device_id integer NOT NULL,
+            depth_cm double precision NOT NULL,
+            moisture_pct double precision,
+            temperature_c double precision,
+            timestamp timestamp without time zone NOT NULL,
+            CONSTRAINT pk_reading PRIMARY KEY (id),
+            CONSTRAINT fk_reading_device_id_device FOREIGN KEY (device_id)
+                REFERENCES device (id) ON DELETE CASCADE
+        )
+    """)
+    for table in ('message', 'reading'):
+        op.execute(
+            f'INSERT INTO {table} ({COLUMNS[table]}) '
+            f'SELECT {COLUMNS[table]} FROM {table}_partitioned'
+        )
+    # Readings whose message was retired can't satisfy the foreign key
+    op.execute('DELETE FROM reading r WHERE NOT EXISTS (SELECT 1 FROM message m WHERE m.id = r.message_id)')
+    op.execute(
+        'ALTER TABLE reading ADD CONSTRAINT fk_reading_message_id_message FOREIGN KEY (message_id) '
+        'REFERENCES message (id) ON DELETE CASCADE'
+    )
+    for ddl in INDEXES:
+        op.execute(ddl)
+
+    for table in ('message', 'reading'):
+        op.execute(f'ALTER SEQUENCE {sequences[table]} OWNED BY {table}.id')
+    op.execute('DROP TABLE reading_partitioned')
+    op.execute('DROP TABLE message_partitioned')
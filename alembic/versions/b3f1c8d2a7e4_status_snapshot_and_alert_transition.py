@@ -0,0 +1,52 @@
+"""add device_status_snapshot and alert_transition tables
+
+Revision ID: b3f1c8d2a7e4
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'b3f1c8d2a7e4'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'device_status_snapshot',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('severity', sa.Integer(), nullable=False),
+        sa.Column('worst_depth_cm', sa.Float(), nullable=True),
+        sa.Column('last_seen', sa.DateTime(), nullable=True),
+        sa.Column('battery_hint', sa.String(length=16), nullable=False, server_default='unknown'),
+        sa.Column('spike_detected', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('moisture_30cm', sa.Float(), nullable=True),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['device_id'], ['device.id'], name='fk_device_status_snapshot_device_id_device', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('device_id', name='pk_device_status_snapshot')
+    )
+
+    op.create_table(
+        'alert_transition',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('old_status', sa.String(length=16), nullable=False),
+        sa.Column('new_status', sa.String(length=16), nullable=False),
+        sa.Column('depth_cm', sa.Float(), nullable=True),
+        sa.Column('transitioned_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['device_id'], ['device.id'], name='fk_alert_transition_device_id_device', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id', name='pk_alert_transition')
+    )
+    op.create_index('ix_alert_transition_device_id', 'alert_transition', ['device_id'], unique=False)
+    op.create_index('ix_alert_transition_transitioned_at', 'alert_transition', ['transitioned_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_alert_transition_transitioned_at', table_name='alert_transition')
+    op.drop_index('ix_alert_transition_device_id', table_name='alert_transition')
+    op.drop_table('alert_transition')
+    op.drop_table('device_status_snapshot')
@@ -0,0 +1,88 @@
+"""add reading_pyramid multi-resolution rollup and backfill from reading
+
+Revision ID: b7e3f9a2c4d8
+Revises: a4d2e8b1c7f9
+Create Date: 2026-10-19 15:00:00.000000
+
+Level 0 is aggregated from reading, every coarser level from the level
+below (bucket widths as in app/services/rollups.py).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'b7e3f9a2c4d8'
+down_revision = 'a4d2e8b1c7f9'
+branch_labels = None
+depends_on = None
+
+BASE_SECONDS = 900
+LEVELS = 18
+
+
+def _bucket(is_pg: bool, column: str, width: int) -> str:
+    """Epoch-aligned bucket start of a timestamp column (SQLite: SQLAlchemy's DateTime storage format)."""
+    if is_pg:
+        return f"(to_timestamp(floor(extract(epoch from {column}) / {width}) * {width}) AT TIME ZONE 'UTC')"
+    return f"strftime('%Y-%m-%d %H:%M:%S.000000', (CAST(strftime('%s', {column}) AS INTEGER) / {width}) * {width}, 'unixepoch')"
+
+
+def upgrade() -> None:
+    is_pg = op.get_bind().dialect.name == 'postgresql'
+
+    op.create_table(
+        'reading_pyramid',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('depth_cm', sa.Float(), nullable=False),
+        sa.Column('level', sa.Integer(), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('reading_count', sa.Integer(), nullable=False),
+        sa.Column('moisture_count', sa.Integer(), nullable=False),
+        sa.Column('moisture_sum', sa.Float(), nullable=True),
+        sa.Column('moisture_min', sa.Float(), nullable=True),
+        sa.Column('moisture_max', sa.Float(), nullable=True),
+        sa.Column('temp_count', sa.Integer(), nullable=False),
+        sa.Column('temp_sum', sa.Float(), nullable=True),
+        sa.Column('temp_min', sa.Float(), nullable=True),
+        sa.Column('temp_max', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['device_id'], ['device.id'], name='fk_reading_pyramid_device_id_device', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('device_id', 'depth_cm', 'level', 'bucket_start', name='pk_reading_pyramid')
+    )
+    op.create_index('ix_reading_pyramid_level_bucket_start', 'reading_pyramid', ['level', 'bucket_start'], unique=False)
+
+    bucket = _bucket(is_pg, 'timestamp', BASE_SECONDS)
+    op.execute(
+        f"""
+        INSERT INTO reading_pyramid (
+            device_id, depth_cm, level, bucket_start, reading_count,
+            moisture_count, moisture_sum, moisture_min, moisture_max,
+            temp_count, temp_sum, temp_min, temp_max
+        )
+        SELECT device_id, depth_cm, 0, {bucket}, COUNT(*),
+               COUNT(moisture_pct), SUM(moisture_pct), MIN(moisture_pct), MAX(moisture_pct),
+               COUNT(temperature_c), SUM(temperature_c), MIN(temperature_c), MAX(temperature_c)
+        FROM reading
+        GROUP BY device_id, depth_cm, {bucket}
+        """
+    )
+    for level in range(1, LEVELS):
+        bucket = _bucket(is_pg, 'bucket_start', BASE_SECONDS << level)
+        op.execute(
+            f"""
+            INSERT INTO reading_pyramid (
+                device_id, depth_cm, level, bucket_start, reading_count,
+                moisture_count, moisture_sum, moisture_min, moisture_max,
+                temp_count, temp_sum, temp_min, temp_max
+            )
+            SELECT device_id, depth_cm, {level}, {bucket}, SUM(reading_count),
+                   SUM(moisture_count), SUM(moisture_sum), MIN(moisture_min), MAX(moisture_max),
+                   SUM(temp_count), SUM(temp_sum), MIN(temp_min), MAX(temp_max)
+            FROM reading_pyramid
+            WHERE level = {level - 1}
+            GROUP BY device_id, depth_cm, {bucket}
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reading_pyramid_level_bucket_start', table_name='reading_pyramid')
+    op.drop_table('reading_pyramid')
@@ -0,0 +1,26 @@
+"""add GiST index on device_config point(lon, lat)
+
+Revision ID: b8e2d6f4a9c1
+Revises: a2f7c5e9d3b1
+Create Date: 2026-10-19 20:00:00.000000
+
+Postgres only, on the core point type so the PostGIS extension is not
+required. SQLite dev uses the in-process grid in app/services/geo.py.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'b8e2d6f4a9c1'
+down_revision = 'a2f7c5e9d3b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_device_config_point', 'device_config', [sa.text('point(lon, lat)')], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_device_config_point', table_name='device_config')
@@ -0,0 +1,68 @@
+"""add farm_cluster and device.farm_cluster_id
+
+Revision ID: c3a9e5f1b7d2
+Revises: b8e2d6f4a9c1
+Create Date: 2026-10-19 21:00:00.000000
+
+No backfill: the farm clusterer's first run after start-up regroups the
+whole fleet. Cluster slugs derive from the members' location, so most
+located devices keep their farm_slug.
+
+On SQLite the batch rebuild of device drops the expression index
+ix_device_sort_name (it cannot be reflected), so it is recreated after.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c3a9e5f1b7d2'
+down_revision = 'b8e2d6f4a9c1'
+branch_labels = None
+depends_on = None
+
+
+def _restore_sort_name_index() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        op.create_index('ix_device_sort_name', 'device', [sa.text('coalesce(name, esn)'), 'id'], unique=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'farm_cluster',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('slug', sa.String(length=128), nullable=False),
+        sa.Column('name', sa.String(length=128), nullable=False),
+        sa.Column('device_count', sa.Integer(), nullable=False),
+        sa.Column('lat', sa.Float(), nullable=True),
+        sa.Column('lon', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_farm_cluster'),
+        sa.UniqueConstraint('slug', name='uq_farm_cluster_slug')
+    )
+    with op.batch_alter_table('device', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('farm_cluster_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_device_farm_cluster_id_farm_cluster', 'farm_cluster', ['farm_cluster_id'], ['id'], ondelete='SET NULL'
+        )
+        batch_op.create_index('ix_device_farm_cluster_id', ['farm_cluster_id'], unique=False)
+    _restore_sort_name_index()
+
+    with op.batch_alter_table('device_config', schema=None) as batch_op:
+        batch_op.create_index('ix_device_config_updated_at', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('device_config', schema=None) as batch_op:
+        batch_op.drop_index('ix_device_config_updated_at')
+
+    # Located devices go back to their location-based farm
+    op.execute(
+        "UPDATE device SET farm_slug = lower(replace(coalesce(location, 'Unassigned'), ' ', '-'))"
+        " WHERE farm_cluster_id IS NOT NULL"
+    )
+    with op.batch_alter_table('device', schema=None) as batch_op:
+        batch_op.drop_index('ix_device_farm_cluster_id')
+        batch_op.drop_constraint('fk_device_farm_cluster_id_farm_cluster', type_='foreignkey')
+        batch_op.drop_column('farm_cluster_id')
+    _restore_sort_name_index()
+
+    op.drop_table('farm_cluster')
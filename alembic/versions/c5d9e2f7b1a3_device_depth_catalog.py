@@ -0,0 +1,40 @@
+"""add device_depth catalog and backfill from reading
+
+Revision ID: c5d9e2f7b1a3
+Revises: b3f1c8d2a7e4
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c5d9e2f7b1a3'
+down_revision = 'b3f1c8d2a7e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'device_depth',
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('depth_cm', sa.Float(), nullable=False),
+        sa.Column('first_seen', sa.DateTime(), nullable=False),
+        sa.Column('last_seen', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['device_id'], ['device.id'], name='fk_device_depth_device_id_device', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('device_id', 'depth_cm', name='pk_device_depth')
+    )
+
+    # Seed the catalog from history so status covers existing probes immediately
+    op.execute(
+        """
+        INSERT INTO device_depth (device_id, depth_cm, first_seen, last_seen)
+        SELECT device_id, depth_cm, MIN(timestamp), MAX(timestamp)
+        FROM reading
+        GROUP BY device_id, depth_cm
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('device_depth')
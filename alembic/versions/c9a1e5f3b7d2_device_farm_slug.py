@@ -0,0 +1,40 @@
+"""add indexed device.farm_slug
+
+Revision ID: c9a1e5f3b7d2
+Revises: b7e3f9a2c4d8
+Create Date: 2026-10-19 16:00:00.000000
+
+Backfilled in Python with the same rule as app.models.device.location_slug
+(SQL lower() can differ from str.lower() outside ASCII).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'c9a1e5f3b7d2'
+down_revision = 'b7e3f9a2c4d8'
+branch_labels = None
+depends_on = None
+
+
+def _slug(location):
+    return (location or 'Unassigned').lower().replace(' ', '-')
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('device', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('farm_slug', sa.String(length=128), server_default='unassigned', nullable=False))
+        batch_op.create_index(batch_op.f('ix_device_farm_slug'), ['farm_slug'], unique=False)
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text('SELECT id, location FROM device WHERE location IS NOT NULL')).all()
+    if rows:
+        bind.execute(
+            sa.text('UPDATE device SET farm_slug = :slug WHERE id = :id'),
+            [{'id': device_id, 'slug': _slug(location)} for device_id, location in rows],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('device', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_device_farm_slug'))
+        batch_op.drop_column('farm_slug')
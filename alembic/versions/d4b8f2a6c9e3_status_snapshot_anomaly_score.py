@@ -0,0 +1,25 @@
+"""add device_status_snapshot.anomaly_score
+
+Revision ID: d4b8f2a6c9e3
+Revises: c3a9e5f1b7d2
+Create Date: 2026-10-19 22:00:00.000000
+
+Filled by the neighbour anomaly job on its first run.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'd4b8f2a6c9e3'
+down_revision = 'c3a9e5f1b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('device_status_snapshot', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('anomaly_score', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('device_status_snapshot', schema=None) as batch_op:
+        batch_op.drop_column('anomaly_score')
@@ -0,0 +1,70 @@
+"""add reading_hourly and reading_daily rollups and backfill from reading
+
+Revision ID: d8a4f1c6e2b9
+Revises: c5d9e2f7b1a3
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'd8a4f1c6e2b9'
+down_revision = 'c5d9e2f7b1a3'
+branch_labels = None
+depends_on = None
+
+ROLLUPS = (
+    # table, Postgres date_trunc unit, SQLite strftime format (matches SQLAlchemy's DateTime storage)
+    ('reading_hourly', 'hour', '%Y-%m-%d %H:00:00.000000'),
+    ('reading_daily', 'day', '%Y-%m-%d 00:00:00.000000'),
+)
+
+
+def _create_rollup_table(name: str) -> None:
+    op.create_table(
+        name,
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        sa.Column('depth_cm', sa.Float(), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('reading_count', sa.Integer(), nullable=False),
+        sa.Column('moisture_count', sa.Integer(), nullable=False),
+        sa.Column('moisture_sum', sa.Float(), nullable=True),
+        sa.Column('moisture_min', sa.Float(), nullable=True),
+        sa.Column('moisture_max', sa.Float(), nullable=True),
+        sa.Column('temp_count', sa.Integer(), nullable=False),
+        sa.Column('temp_sum', sa.Float(), nullable=True),
+        sa.Column('temp_min', sa.Float(), nullable=True),
+        sa.Column('temp_max', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['device_id'], ['device.id'], name=f'fk_{name}_device_id_device', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('device_id', 'depth_cm', 'bucket_start', name=f'pk_{name}')
+    )
+    op.create_index(f'ix_{name}_bucket_start', name, ['bucket_start'], unique=False)
+
+
+def upgrade() -> None:
+    is_pg = op.get_bind().dialect.name == 'postgresql'
+
+    for name, unit, fmt in ROLLUPS:
+        _create_rollup_table(name)
+
+        bucket = f"date_trunc('{unit}', timestamp)" if is_pg else f"strftime('{fmt}', timestamp)"
+        op.execute(
+            f"""
+            INSERT INTO {name} (
+                device_id, depth_cm, bucket_start, reading_count,
+                moisture_count, moisture_sum, moisture_min, moisture_max,
+                temp_count, temp_sum, temp_min, temp_max
+            )
+            SELECT device_id, depth_cm, {bucket}, COUNT(*),
+                   COUNT(moisture_pct), SUM(moisture_pct), MIN(moisture_pct), MAX(moisture_pct),
+                   COUNT(temperature_c), SUM(temperature_c), MIN(temperature_c), MAX(temperature_c)
+            FROM reading
+            GROUP BY device_id, depth_cm, {bucket}
+            """
+        )
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(ROLLUPS):
+        op.drop_index(f'ix_{name}_bucket_start', table_name=name)
+        op.drop_table(name)
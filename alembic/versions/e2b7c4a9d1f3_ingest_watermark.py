@@ -0,0 +1,28 @@
+"""add ingest_watermark for ETag derivation
+
+Revision ID: e2b7c4a9d1f3
+Revises: d8a4f1c6e2b9
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'e2b7c4a9d1f3'
+down_revision = 'd8a4f1c6e2b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ingest_watermark',
+        sa.Column('scope', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('scope', name='pk_ingest_watermark')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ingest_watermark')
@@ -0,0 +1,36 @@
+"""add farm_aggregate
+
+Revision ID: e5b2c8f4a1d6
+Revises: c9a1e5f3b7d2
+Create Date: 2026-10-19 17:00:00.000000
+
+Starts empty: the status scheduler's next run fills every farm without a
+row, and /v1/farms aggregates live until then.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'e5b2c8f4a1d6'
+down_revision = 'c9a1e5f3b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'farm_aggregate',
+        sa.Column('farm_slug', sa.String(length=128), nullable=False),
+        sa.Column('name', sa.String(length=128), nullable=False),
+        sa.Column('device_count', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('attention_count', sa.Integer(), nullable=False),
+        sa.Column('last_reading_at', sa.DateTime(), nullable=True),
+        sa.Column('lat', sa.Float(), nullable=True),
+        sa.Column('lon', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('farm_slug', name='pk_farm_aggregate')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('farm_aggregate')
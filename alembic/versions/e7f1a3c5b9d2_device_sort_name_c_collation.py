@@ -0,0 +1,30 @@
+"""sort /v1/devices names bytewise on Postgres
+
+Revision ID: e7f1a3c5b9d2
+Revises: d4b8f2a6c9e3
+Create Date: 2026-10-20 09:00:00.000000
+
+/v1/devices merges keyset rows from SQL with devices ranked live in Python,
+against one cursor. Under a locale collation (en_US.UTF-8, the usual
+default) the two orders disagree on case and punctuation, so the name
+index is rebuilt with COLLATE "C". SQLite's BINARY default already matches.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'e7f1a3c5b9d2'
+down_revision = 'd4b8f2a6c9e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_device_sort_name', table_name='device')
+        op.create_index('ix_device_sort_name', 'device', [sa.text('coalesce(name, esn) COLLATE "C"'), 'id'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_device_sort_name', table_name='device')
+        op.create_index('ix_device_sort_name', 'device', [sa.text('coalesce(name, esn)'), 'id'], unique=False)
@@ -0,0 +1,61 @@
+"""add composite, covering and BRIN indexes on reading
+
+Revision ID: f3c8a1d5b6e2
+Revises: e2b7c4a9d1f3
+Create Date: 2026-10-19 13:00:00.000000
+
+On Postgres the indexes are built CONCURRENTLY (outside the migration
+transaction) so ingest keeps writing while they build. A CONCURRENTLY build
+that fails leaves an INVALID index behind: drop it and rerun the upgrade.
+Other dialects (SQLite dev) get plain btree indexes and no BRIN.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'f3c8a1d5b6e2'
+down_revision = 'e2b7c4a9d1f3'
+branch_labels = None
+depends_on = None
+
+# name, columns, Postgres-only kwargs
+INDEXES = (
+    (
+        'ix_reading_device_depth_timestamp',
+        ['device_id', 'depth_cm', sa.text('timestamp DESC')],
+        {'postgresql_include': ['moisture_pct', 'temperature_c']},
+    ),
+    ('ix_reading_device_timestamp', ['device_id', 'timestamp'], {}),
+    ('ix_reading_timestamp_id', ['timestamp', 'id'], {}),
+)
+BRIN = 'brin_reading_timestamp'
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, columns, _ in INDEXES:
+            op.create_index(name, 'reading', columns, unique=False)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns, pg_kwargs in INDEXES:
+            op.create_index(
+                name, 'reading', columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True, **pg_kwargs,
+            )
+        op.create_index(
+            BRIN, 'reading', ['timestamp'], unique=False,
+            postgresql_using='brin', postgresql_concurrently=True, if_not_exists=True,
+        )
+    op.execute('ANALYZE reading')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='reading')
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(BRIN, table_name='reading', postgresql_concurrently=True, if_exists=True)
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='reading', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,31 @@
+"""add device_status_snapshot.last_seen_sort and the attention index
+
+Revision ID: f6c3a9d2e8b4
+Revises: e5b2c8f4a1d6
+Create Date: 2026-10-19 18:00:00.000000
+
+last_seen_sort is last_seen with never-seen devices mapped to year 1, so
+(severity, last_seen_sort, device_id) orders the attention queue the same
+way on Postgres and SQLite without NULLS FIRST in the index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'f6c3a9d2e8b4'
+down_revision = 'e5b2c8f4a1d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('device_status_snapshot', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('last_seen_sort', sa.DateTime(), server_default='0001-01-01 00:00:00', nullable=False))
+        batch_op.create_index('ix_device_status_snapshot_attention', ['severity', 'last_seen_sort', 'device_id'], unique=False)
+
+    op.execute('UPDATE device_status_snapshot SET last_seen_sort = last_seen WHERE last_seen IS NOT NULL')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('device_status_snapshot', schema=None) as batch_op:
+        batch_op.drop_index('ix_device_status_snapshot_attention')
+        batch_op.drop_column('last_seen_sort')
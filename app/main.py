@@ -1,6 +1,7 @@
 ﻿# api/app/main.py
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 import logging
 import traceback
@@ -11,7 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.settings import settings
@@ -21,6 +22,13 @@ from app.routers import metrics
 from app.routers import devices
 from app.routers import constants
 from app.routers import farms
+from app.routers.common import NotModified
+from app.services.singleflight import coalescing_stats
+from app.workers.status_scheduler import StatusScheduler
+from app.workers.partition_maintainer import PartitionMaintainer
+from app.workers.farm_clusterer import FarmClusterer
+from app.workers.anomaly_detector import AnomalyDetector
+from app.db.session import engine
 
 # ---------- Logging ----------
 logging.basicConfig(
@@ -29,10 +37,33 @@ logging.basicConfig(
 )
 log = logging.getLogger("soilprobe")
 
+# ---------- Background jobs ----------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    jobs = []
+    if settings.STATUS_SCHEDULER_ENABLED and settings.ENV != "test":
+        jobs.append(StatusScheduler())
+    if (
+        settings.PARTITION_MAINTENANCE_ENABLED
+        and settings.ENV != "test"
+        and engine.dialect.name == "postgresql"
+    ):
+        jobs.append(PartitionMaintainer())
+    if settings.FARM_CLUSTER_ENABLED and settings.ENV != "test":
+        jobs.append(FarmClusterer())
+    if settings.NEIGHBOR_ANOMALY_ENABLED and settings.ENV != "test":
+        jobs.append(AnomalyDetector())
+    for job in jobs:
+        job.start()
+    yield
+    for job in jobs:
+        job.stop()
+
 # ---------- App ----------
 app = FastAPI(
     title="Soil Probe Platform API",
     debug=(settings.ENV in {"local", "dev"}),
+    lifespan=lifespan,
 )
 
 # ---------- Static files (UI) ----------
@@ -80,6 +111,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ---------- Conditional GET ----------
+# Routers call check_etag(); the tag it computed is attached to successful responses here
+@app.middleware("http")
+async def etag_header(request: Request, call_next):
+    response = await call_next(request)
+    etag = getattr(request.state, "etag", None)
+    if etag and response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"  # always revalidate
+    return response
+
 # ---------- Routers ----------
 app.include_router(uplink.router)
 app.include_router(readings_router.router)
@@ -97,6 +139,11 @@ def root():
 def ping():
     return {"status": "ok", "message": "pong"}
 
+@app.get("/stats/coalescing")
+def coalescing():
+    # Identical concurrent requests served by one computation (services/singleflight.py)
+    return coalescing_stats()
+
 # ---------- DEBUG UTILITIES ----------
 @app.api_route("/__debug/echo", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
 async def debug_echo(request: Request):
@@ -123,6 +170,10 @@ def debug_sql():
     return {"db_ok": True, "select_1": val}
 
 # ---------- ERROR HANDLERS ----------
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    return Response(status_code=304, headers={"ETag": exc.etag, "Cache-Control": "no-cache"})
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exc_handler(request: Request, exc: StarletteHTTPException):
     payload = {
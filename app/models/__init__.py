@@ -3,5 +3,26 @@ from .device import Device
 from .device_config import DeviceConfig
 from .message import Message
 from .reading import Reading
+from .status_snapshot import DeviceStatusSnapshot
+from .alert_transition import AlertTransition
+from .device_depth import DeviceDepth
+from .reading_rollup import ReadingHourly, ReadingDaily, ReadingPyramid
+from .ingest_watermark import IngestWatermark
+from .farm_aggregate import FarmAggregate
+from .farm_cluster import FarmCluster
 
-__all__ = ["Device", "DeviceConfig", "Message", "Reading"]
+__all__ = [
+    "Device",
+    "DeviceConfig",
+    "Message",
+    "Reading",
+    "DeviceStatusSnapshot",
+    "AlertTransition",
+    "DeviceDepth",
+    "ReadingHourly",
+    "ReadingDaily",
+    "ReadingPyramid",
+    "IngestWatermark",
+    "FarmAggregate",
+    "FarmCluster",
+]
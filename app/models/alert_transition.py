@@ -0,0 +1,26 @@
+# api/app/models/alert_transition.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Float, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AlertTransition(Base):
+    """One device status change (old -> new) observed by the status scheduler."""
+
+    __tablename__ = "alert_transition"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    device_id: Mapped[int] = mapped_column(
+        ForeignKey("device.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    old_status: Mapped[str] = mapped_column(String(16), nullable=False)
+    new_status: Mapped[str] = mapped_column(String(16), nullable=False)
+    depth_cm: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # worst depth driving the new status
+    transitioned_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, index=True, nullable=False
+    )
@@ -1,11 +1,17 @@
 # api/app/models/device.py
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import String, DateTime
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import Optional
+from sqlalchemy import String, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from app.db.base import Base
 
 
+def location_slug(location: Optional[str]) -> str:
+    """Farm id of a device location (farms group devices by location)."""
+    return (location or "Unassigned").lower().replace(" ", "-")
+
+
 class Device(Base):
     """Represents one physical soil probe unit (linked to Globalstar ESN)."""
 
@@ -13,8 +19,45 @@ class Device(Base):
     esn: Mapped[str] = mapped_column(String(32), unique=True, index=True, nullable=False)
     name: Mapped[str] = mapped_column(String(64), nullable=True)
     location: Mapped[str] = mapped_column(String(128), nullable=True)
+    # Proximity cluster of the device's coordinates (services/farm_clusters.py), None if unlocated
+    farm_cluster_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("farm_cluster.id", ondelete="SET NULL"), index=True, nullable=True
+    )
+    # farm_cluster.slug, else location_slug(location); set whenever either is assigned
+    farm_slug: Mapped[str] = mapped_column(
+        String(128), index=True, nullable=False, server_default=location_slug(None)
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # Relationship
     config: Mapped["DeviceConfig"] = relationship("DeviceConfig", back_populates="device", uselist=False)
+    farm_cluster: Mapped[Optional["FarmCluster"]] = relationship("FarmCluster")
+
+    @property
+    def farm_name(self) -> str:
+        """Display name of the device's farm (loads farm_cluster)."""
+        if self.farm_cluster is not None:
+            return self.farm_cluster.name
+        return self.location or "Unassigned"
+
+    @validates("location")
+    def _sync_farm_slug(self, key: str, location: Optional[str]) -> Optional[str]:
+        if self.farm_cluster is None:
+            self.farm_slug = location_slug(location)
+        return location
+
+    @validates("farm_cluster")
+    def _sync_cluster_slug(self, key: str, cluster: Optional["FarmCluster"]) -> Optional["FarmCluster"]:
+        self.farm_slug = cluster.slug if cluster is not None else location_slug(self.location)
+        return cluster
+
+
+# /v1/devices (alembic a2f7c5e9d3b1) sorts on the alias it shows (name, else ESN) and filters by ESN prefix
+device_sort_name = func.coalesce(Device.name, Device.esn)
+# Keyset cursors are also compared in Python, so Postgres sorts bytewise (alembic
+# e7f1a3c5b9d2) to match str order; SQLite's default BINARY collation already does
+device_sort_name_c = device_sort_name.collate("C")
+Index("ix_device_sort_name", device_sort_name, Device.id).ddl_if(dialect="sqlite")
+Index("ix_device_sort_name", device_sort_name_c, Device.id).ddl_if(dialect="postgresql")
+Index("ix_device_esn_pattern", Device.esn, postgresql_ops={"esn": "varchar_pattern_ops"}).ddl_if(dialect="postgresql")
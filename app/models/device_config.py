@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal, Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Float, Integer, DateTime, ForeignKey  # pyright: ignore[reportMissingImports]
+from sqlalchemy import String, Float, Integer, DateTime, ForeignKey, Index, func  # pyright: ignore[reportMissingImports]
 from sqlalchemy.orm import Mapped, mapped_column, relationship  # pyright: ignore[reportMissingImports]
 
 from app.db.base import Base
@@ -35,9 +35,16 @@ class DeviceConfig(Base):
     farm_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Indexed: the farm clusterer picks up configs changed since its last run
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
     )
 
     # Relationship
     device: Mapped["Device"] = relationship("Device", back_populates="config")
+
+
+# /v1/devices/map viewport queries: point(lon, lat) <@ box (alembic b8e2d6f4a9c1, services/geo.py)
+Index(
+    "ix_device_config_point", func.point(DeviceConfig.lon, DeviceConfig.lat), postgresql_using="gist"
+).ddl_if(dialect="postgresql")
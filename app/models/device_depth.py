@@ -0,0 +1,21 @@
+# api/app/models/device_depth.py
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import Float, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DeviceDepth(Base):
+    """Sensor depths a device has actually reported (maintained on ingest)."""
+
+    __tablename__ = "device_depth"
+
+    device_id: Mapped[int] = mapped_column(
+        ForeignKey("device.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth_cm: Mapped[float] = mapped_column(Float, primary_key=True)
+    first_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    last_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
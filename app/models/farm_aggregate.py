@@ -0,0 +1,26 @@
+# api/app/models/farm_aggregate.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Float, Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class FarmAggregate(Base):
+    """Per-farm summary for /v1/farms, kept current by services/farm_aggregate.py."""
+
+    __tablename__ = "farm_aggregate"
+
+    farm_slug: Mapped[str] = mapped_column(String(128), primary_key=True)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
+    device_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)  # worst device status
+    attention_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_reading_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # centroid of configured devices
+    lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Last time the row was known current: rewritten, or checked by a status scheduler run
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
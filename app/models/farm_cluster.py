@@ -0,0 +1,25 @@
+# api/app/models/farm_cluster.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Float, Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class FarmCluster(Base):
+    """A proximity group of located devices, kept current by services/farm_clusters.py."""
+
+    __tablename__ = "farm_cluster"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # Farm id (Device.farm_slug) of the members: location_slug(name) with a "-<n>" suffix only when
+    # another cluster has that location too, so links to location-based farms keep working
+    slug: Mapped[str] = mapped_column(String(128), unique=True, nullable=False)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)  # most common member location, "(n)" as in slug
+    device_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # member centroid
+    lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
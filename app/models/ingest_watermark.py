@@ -0,0 +1,21 @@
+# api/app/models/ingest_watermark.py
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class IngestWatermark(Base):
+    """
+    Monotonic change counters that HTTP ETags are derived from.
+    scope: 0 = whole fleet, -1 = status scheduler runs, otherwise a device id.
+    """
+
+    __tablename__ = "ingest_watermark"
+
+    scope: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
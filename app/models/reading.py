@@ -1,7 +1,7 @@
 # api/app/models/reading.py
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import Float, DateTime, ForeignKey
+from sqlalchemy import Float, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
@@ -10,12 +10,31 @@ class Reading(Base):
     """Parsed measurement from a probe (per sensor depth)."""
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    message_id: Mapped[int] = mapped_column(ForeignKey("message.id", ondelete="CASCADE"), nullable=False)
+    # No foreign key: on Postgres message is partitioned by month and its key is
+    # (id, received_at); retention retires both tables month by month instead
+    message_id: Mapped[int] = mapped_column(Integer, nullable=False)
     device_id: Mapped[int] = mapped_column(ForeignKey("device.id", ondelete="CASCADE"), nullable=False)
     depth_cm: Mapped[float] = mapped_column(Float, nullable=False)
     moisture_pct: Mapped[float] = mapped_column(Float, nullable=True)
     temperature_c: Mapped[float] = mapped_column(Float, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
-    message = relationship("Message", backref="readings")
+    message = relationship(
+        "Message", primaryjoin="foreign(Reading.message_id) == Message.id", backref="readings"
+    )
     device = relationship("Device", backref="readings")
+
+
+# Hot-path indexes (alembic f3c8a1d5b6e2; plans checked by scripts/check_query_plans.py)
+# Latest readings per (device, depth) for status, per-device series; INCLUDE makes them index-only
+Index(
+    "ix_reading_device_depth_timestamp",
+    Reading.device_id, Reading.depth_cm, Reading.timestamp.desc(),
+    postgresql_include=["moisture_pct", "temperature_c"],
+)
+# last_seen per device, device series across all depths
+Index("ix_reading_device_timestamp", Reading.device_id, Reading.timestamp)
+# /v1/readings/latest ordering
+Index("ix_reading_timestamp_id", Reading.timestamp, Reading.id)
+# Fleet-wide time-range scans; append-only inserts keep timestamp correlated with the heap
+Index("brin_reading_timestamp", Reading.timestamp, postgresql_using="brin").ddl_if(dialect="postgresql")
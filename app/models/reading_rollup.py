@@ -0,0 +1,64 @@
+# api/app/models/reading_rollup.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Float, Integer, DateTime, ForeignKey, Index, PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ReadingAggregateMixin:
+    """Count/sum/min/max of moisture and temperature."""
+
+    reading_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    moisture_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    moisture_sum: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    moisture_min: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    moisture_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    temp_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    temp_sum: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    temp_min: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    temp_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+
+class ReadingRollupMixin(ReadingAggregateMixin):
+    """Aggregates per device, depth and time bucket."""
+
+    device_id: Mapped[int] = mapped_column(
+        ForeignKey("device.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth_cm: Mapped[float] = mapped_column(Float, primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True, index=True)
+
+
+class ReadingHourly(ReadingRollupMixin, Base):
+    """Hourly rollup of reading (bucket_start truncated to the UTC hour)."""
+
+    __tablename__ = "reading_hourly"
+
+
+class ReadingDaily(ReadingRollupMixin, Base):
+    """Daily rollup of reading (bucket_start truncated to the UTC day)."""
+
+    __tablename__ = "reading_daily"
+
+
+class ReadingPyramid(ReadingAggregateMixin, Base):
+    """
+    Multi-resolution rollup of reading: level L buckets are
+    PYRAMID_BASE_SECONDS * 2**L wide (services/rollups.py).
+    """
+
+    __tablename__ = "reading_pyramid"
+    __table_args__ = (
+        PrimaryKeyConstraint("device_id", "depth_cm", "level", "bucket_start"),
+        # Fleet-wide series (no device filter)
+        Index("ix_reading_pyramid_level_bucket_start", "level", "bucket_start"),
+    )
+
+    device_id: Mapped[int] = mapped_column(ForeignKey("device.id", ondelete="CASCADE"))
+    depth_cm: Mapped[float] = mapped_column(Float)
+    level: Mapped[int] = mapped_column(Integer)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime)
@@ -0,0 +1,48 @@
+# api/app/models/status_snapshot.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Float, Integer, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, validates
+
+from app.db.base import Base
+
+# last_seen_sort of a device that never reported: sorts before every real timestamp
+NEVER_SEEN = datetime(1, 1, 1)
+
+
+class DeviceStatusSnapshot(Base):
+    """Latest computed status per device, written by the background status scheduler."""
+
+    __tablename__ = "device_status_snapshot"
+    __table_args__ = (
+        # Attention queue: worst severity first, then longest since last seen
+        Index("ix_device_status_snapshot_attention", "severity", "last_seen_sort", "device_id"),
+        # /v1/devices?sort=last_seen
+        Index("ix_device_status_snapshot_last_seen_sort", "last_seen_sort", "device_id"),
+    )
+
+    device_id: Mapped[int] = mapped_column(
+        ForeignKey("device.id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    severity: Mapped[int] = mapped_column(Integer, nullable=False)  # severity_order(status)
+    worst_depth_cm: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    last_seen: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # last_seen or NEVER_SEEN, set whenever last_seen is assigned (NULLs order differently per database)
+    last_seen_sort: Mapped[datetime] = mapped_column(
+        DateTime, default=NEVER_SEEN, nullable=False, server_default="0001-01-01 00:00:00"
+    )
+    battery_hint: Mapped[str] = mapped_column(String(16), default="unknown", nullable=False)
+    spike_detected: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    moisture_30cm: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Divergence from nearby probes in the same farm, written by the neighbour anomaly job
+    # (services/neighbor_anomaly.py); None if the device cannot be compared
+    anomaly_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    @validates("last_seen")
+    def _sync_last_seen_sort(self, key: str, last_seen: Optional[datetime]) -> Optional[datetime]:
+        self.last_seen_sort = last_seen or NEVER_SEEN
+        return last_seen
@@ -0,0 +1,133 @@
+# api/app/routers/common.py
+"""Response helpers shared by routers."""
+import hashlib
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.settings import settings
+from app.services.result_cache import get_result_cache
+from app.services.singleflight import coalesce
+from app.services.watermark import GLOBAL_SCOPE, STATUS_SCOPE, get_versions
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON rendered with orjson. NumPy arrays are serialized directly from
+    their buffers (no tolist() round-trip), so column-oriented payloads stay cheap.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 query value into a naive UTC datetime (None if absent/invalid)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except Exception:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+# ---- conditional GET ----------------------------------------------------------
+
+
+class NotModified(Exception):
+    """Raised by check_etag(); main.py turns it into a bodiless 304."""
+
+    def __init__(self, etag: str) -> None:
+        self.etag = etag
+
+
+def _normalized_query(request: Request) -> list[tuple[str, str]]:
+    # Parameter order and repeated-value order (device_ids[]=2&device_ids[]=1) don't matter
+    return sorted(request.query_params.multi_items())
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return etag in tags
+
+
+def check_etag(
+    request: Request,
+    db: Session,
+    device_ids: Optional[Iterable[int]] = None,
+    status: bool = False,
+    params: Optional[dict] = None,
+) -> str:
+    """
+    Derive a strong ETag for this GET and raise NotModified if the client
+    already has it. The tag hashes the route, the normalized query and Accept
+    header (or the caller's already-normalized params) and the ingest
+    watermark: the given devices' counters, or the fleet-wide one.
+    status=True also keys on the status scheduler counter (endpoints that
+    show computed status) and on a STATUS_SNAPSHOT_MAX_AGE_SEC time bucket:
+    when snapshots are missing or stale (no scheduler running, or a lost
+    leader), status is computed live and ages with the clock.
+    Only ingest_watermark is read - never reading.
+    """
+    scopes = set(device_ids) if device_ids else {GLOBAL_SCOPE}
+    if status:
+        scopes.add(STATUS_SCOPE)
+    versions = sorted(get_versions(db, scopes).items())
+    
+    if params is not None:
+        # Caller already resolved content negotiation into params
+        parts: list[Any] = [request.url.path, params, versions]
+    else:
+        parts = [request.url.path, _normalized_query(request), request.headers.get("accept", ""), versions]
+    if status:
+        parts.append(int(time.time() // settings.STATUS_SNAPSHOT_MAX_AGE_SEC))
+    etag = '"' + hashlib.blake2b(
+        orjson.dumps(parts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS), digest_size=16
+    ).hexdigest() + '"'
+    
+    request.state.etag = etag
+    if _etag_matches(request, etag):
+        raise NotModified(etag)
+    return etag
+
+
+def cached_response(
+    etag: str,
+    compute: Callable[[], Response],
+    device_ids: Optional[Iterable[int]] = None,
+) -> Response:
+    """
+    Serve the rendered body cached under this ETag (services/result_cache.py),
+    or compute, render and store it. device_ids tags the entry for invalidation.
+    Concurrent misses for the same ETag share one computation (services/singleflight.py).
+    """
+    cache = get_result_cache()
+    hit = cache.get(etag)
+    if hit is not None:
+        body, media_type = hit
+        return Response(body, media_type=media_type)
+
+    def render() -> tuple[bytes, str, int]:
+        response = compute()
+        body = bytes(response.body)
+        if response.status_code == 200:
+            cache.set(etag, (body, response.media_type), device_ids)
+        return body, response.media_type, response.status_code
+
+    # Each caller gets its own Response; middleware mutates headers per request
+    body, media_type, status_code = coalesce(etag, render)
+    return Response(body, status_code=status_code, media_type=media_type)
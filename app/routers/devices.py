@@ -1,14 +1,26 @@
 # api/app/routers/devices.py
+import base64
+import json
+import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from typing import Literal, Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, and_, or_, tuple_
 from app.db.session import get_db
 from app.models import device as device_model
-from app.models import device_config as device_config_model
-from app.models import reading as reading_model
-from app.services.status import compute_device_status, severity_order
+from app.models import alert_transition as alert_transition_model
+from app.models import DeviceConfig, DeviceStatusSnapshot
+from app.models.status_snapshot import NEVER_SEEN
+from app.routers.common import check_etag, parse_iso
+from app.services.singleflight import coalesce
+from app.services.status import StatusType, compute_status_batch, severity_order
+from app.settings import settings
+from app.services.status_snapshot import load_attention_queue, load_status_map
+from app.services.depths import get_depths_for_devices, get_all_depths
+from app.services.geo import BBox, cluster_markers, devices_in_bbox
+
+log = logging.getLogger("soilprobe.devices")
 
 router = APIRouter(prefix="/v1/devices", tags=["devices"])
 
@@ -31,107 +43,325 @@ def _format_last_seen(last_seen: Optional[datetime]) -> str:
     return f"{days}d"
 
 
-@router.get("/attention")
-def devices_attention(
-    limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
-):
-    """
-    Get devices needing attention, sorted worst to best.
-    Status: 'red' | 'amber' | 'green' | 'blue' | 'stale' | 'offline' | 'gray'
-    Priority: RED > AMBER > STALE > OFFLINE > BLUE > GREEN
-    """
-    devices = db.query(device_model.Device).all()
+def _attention(db: Session, limit: int):
     result = []
-    
-    for device in devices:
-        # Get device config
-        config = (
-            db.query(device_config_model.DeviceConfig)
-            .filter(device_config_model.DeviceConfig.device_id == device.id)
-            .first()
-        )
-        
-        # Compute status
-        status_info = compute_device_status(db, device, config)
-        
-        # Get latest 30cm moisture for display
-        latest_30cm = (
-            db.query(reading_model.Reading.moisture_pct)
-            .filter(
-                reading_model.Reading.device_id == device.id,
-                reading_model.Reading.depth_cm == 30.0,
-            )
-            .order_by(reading_model.Reading.timestamp.desc())
-            .limit(1)
-            .scalar()
-        )
-        
-        last_seen_dt = status_info["last_seen"]
+    for device, status_info in load_attention_queue(db, limit):
+        latest_30cm = status_info["moisture_30cm"]
         result.append({
             "device_id": device.id,
             "alias": device.name or device.esn or f"Device {device.id}",
             "status": status_info["status"],
-            "last_seen": _format_last_seen(last_seen_dt),
-            "last_seen_dt": last_seen_dt,  # Keep datetime for sorting
+            "last_seen": _format_last_seen(status_info["last_seen"]),
             "moisture30": round(latest_30cm, 1) if latest_30cm is not None else None,
             "battery_hint": status_info["battery_hint"],
             "worst_depth_cm": status_info["worst_depth_cm"],
             "spike_detected": status_info["spike_detected"],
+            "anomaly_score": status_info["anomaly_score"],
+            "anomaly_detected": status_info["anomaly_detected"],
         })
+    return result
+
+
+@router.get("/attention")
+def devices_attention(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Get devices needing attention, sorted worst to best.
+    Status: 'red' | 'amber' | 'green' | 'blue' | 'stale' | 'offline' | 'gray'
+    Priority: RED > AMBER > STALE > OFFLINE > BLUE > GREEN
+    """
+    etag = check_etag(request, db, status=True)
+    return coalesce(etag, lambda: _attention(db, limit))
+
+
+def _parse_bbox(bbox: str) -> BBox:
+    try:
+        west, south, east, north = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox must be west,south,east,north")
+    if south > north:
+        raise HTTPException(status_code=400, detail="bbox south is above north")
+    # A zoomed-out or panned map reports longitudes outside [-180, 180]
+    if east - west >= 360:
+        west, east = -180.0, 180.0
+    else:
+        west, east = (west + 180) % 360 - 180, (east + 180) % 360 - 180
+        if east == -180 and west != -180:
+            east = 180.0
+    return west, max(south, -90.0), east, min(north, 90.0)
+
+
+def _device_map(db: Session, bbox: BBox, zoom: int):
+    devices = devices_in_bbox(db, bbox)
+    markers = cluster_markers(devices, load_status_map(db, devices), zoom)
+    return {"zoom": zoom, "device_count": len(devices), "markers": markers}
+
+
+@router.get("/map")
+def devices_map(
+    request: Request,
+    bbox: str = Query(..., description="west,south,east,north in degrees (Leaflet toBBoxString); west > east crosses the antimeridian"),
+    zoom: int = Query(..., ge=0, le=22),
+    db: Session = Depends(get_db),
+):
+    """
+    Clustered device markers for a map viewport.
+    Devices with coordinates inside bbox are grouped into ~64px cells at this
+    zoom; each marker has the member count, worst status and centroid (plus
+    bounds for clusters, or the device for single markers).
+    """
+    box = _parse_bbox(bbox)
+    etag = check_etag(request, db, status=True)
+    return coalesce(etag, lambda: _device_map(db, box, zoom))
+
+
+def _depths(db: Session, device_ids: Optional[List[int]]):
+    if not device_ids:
+        return {"depths": get_all_depths(db), "by_device": {}}
     
-    # Sort by severity (lower severity_order = higher priority), then by most stale
-    now = datetime.utcnow()
-    result.sort(key=lambda x: (
-        severity_order(x["status"]),
-        -(
-            (now - x["last_seen_dt"]).total_seconds()
-            if x["last_seen_dt"] is not None
-            else float("inf")
-        ),
-    ))
+    catalog = get_depths_for_devices(db, device_ids)
+    return {
+        "depths": sorted({d for ds in catalog.values() for d in ds}),
+        "by_device": {str(k): list(v) for k, v in sorted(catalog.items())},
+    }
+
+
+@router.get("/depths")
+def devices_depths(
+    request: Request,
+    device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
+    db: Session = Depends(get_db),
+):
+    """
+    Sensor depths reported by the given devices (or the whole fleet).
+    Drives the depth filter in the UI.
+    """
+    etag = check_etag(request, db, device_ids)
+    return coalesce(etag, lambda: _depths(db, device_ids))
+
+
+def _alerts(db: Session, since: Optional[str], limit: int):
+    AlertTransition = alert_transition_model.AlertTransition
+    query = db.query(AlertTransition)
     
-    # Remove last_seen_dt from response
-    for item in result:
-        item.pop("last_seen_dt", None)
+    since_date = parse_iso(since)
+    if since_date:
+        query = query.filter(AlertTransition.transitioned_at >= since_date)
     
-    return result[:limit]
+    rows = query.order_by(AlertTransition.transitioned_at.desc()).limit(limit).all()
+    return [
+        {
+            "device_id": t.device_id,
+            "old_status": t.old_status,
+            "new_status": t.new_status,
+            "depth_cm": t.depth_cm,
+            "at": t.transitioned_at,
+        }
+        for t in rows
+    ]
 
 
-@router.get("")
-def devices_list(
-    farm_id: Optional[str] = Query(None),
+@router.get("/alerts")
+def devices_alerts(
+    request: Request,
+    since: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db),
 ):
     """
-    Get list of devices with computed status.
-    Later: filter by farm_id when we add org/field model.
+    Recent status transitions recorded by the status scheduler, newest first.
     """
-    devices = db.query(device_model.Device).all()
-    result = []
-    
-    for device in devices:
-        # Get device config (for lat/lon)
-        config = (
-            db.query(device_config_model.DeviceConfig)
-            .filter(device_config_model.DeviceConfig.device_id == device.id)
-            .first()
-        )
-        
-        # Compute status
-        status_info = compute_device_status(db, device, config)
-        
-        result.append({
+    etag = check_etag(request, db, status=True)
+    return coalesce(etag, lambda: _alerts(db, since, limit))
+
+
+# Hard cap on a /v1/devices page; walk further with the cursor
+DEVICE_PAGE_MAX = 500
+# Warn when more devices than this need live status for one status-sorted page
+LIVE_RANK_WARN = 1000
+
+DeviceSort = Literal["name", "severity", "last_seen"]
+SortOrder = Literal["asc", "desc"]
+
+
+def _sort_key(sort: DeviceSort, device, severity: int, last_seen: Optional[datetime]) -> tuple:
+    """Keyset position of a device; mirrors the SQL ordering in _device_list."""
+    if sort == "severity":
+        return (severity, last_seen or NEVER_SEEN, device.id)
+    if sort == "last_seen":
+        return (last_seen or NEVER_SEEN, device.id)
+    return (device.name if device.name is not None else device.esn, device.id)
+
+
+def _encode_cursor(key: tuple) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in key]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: DeviceSort) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        if sort == "severity":
+            severity, last_seen, device_id = json.loads(raw)
+            return (int(severity), datetime.fromisoformat(last_seen), int(device_id))
+        if sort == "last_seen":
+            last_seen, device_id = json.loads(raw)
+            return (datetime.fromisoformat(last_seen), int(device_id))
+        name, device_id = json.loads(raw)
+        return (str(name), int(device_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _device_list(
+    db: Session,
+    limit: int,
+    cursor: Optional[str],
+    farm_id: Optional[str],
+    statuses: Optional[List[StatusType]],
+    esn_prefix: Optional[str],
+    has_coordinates: Optional[bool],
+    sort: DeviceSort,
+    order: SortOrder,
+):
+    Device = device_model.Device
+    Snapshot = DeviceStatusSnapshot
+    after = _decode_cursor(cursor, sort) if cursor else None
+    desc = order == "desc"
+    by_status = bool(statuses) or sort != "name"
+
+    query = db.query(Device).options(selectinload(Device.config), selectinload(Device.farm_cluster))
+    if farm_id:
+        query = query.filter(Device.farm_slug == farm_id)
+    if esn_prefix:
+        query = query.filter(Device.esn.startswith(esn_prefix, autoescape=True))
+    if has_coordinates is not None:
+        query = query.outerjoin(DeviceConfig, DeviceConfig.device_id == Device.id)
+        if has_coordinates:
+            query = query.filter(DeviceConfig.lat.isnot(None), DeviceConfig.lon.isnot(None))
+        else:
+            query = query.filter(or_(DeviceConfig.lat.is_(None), DeviceConfig.lon.is_(None)))
+
+    def rank_live(devices) -> list:
+        """Keyset rows for devices whose status has to be computed live."""
+        status_map = compute_status_batch(db, devices)
+        ranked = [
+            (_sort_key(sort, d, severity_order(status_map[d.id]["status"]), status_map[d.id]["last_seen"]), d)
+            for d in devices
+            if not statuses or status_map[d.id]["status"] in statuses
+        ]
+        if after is not None:
+            ranked = [row for row in ranked if (row[0] < after if desc else row[0] > after)]
+        return ranked
+
+    def merged(ranked: list) -> list:
+        ranked.sort(key=lambda row: row[0], reverse=desc)
+        return ranked[:limit + 1]
+
+    if by_status and not settings.STATUS_SCHEDULER_ENABLED:
+        # Scheduler off, so no snapshots to filter/sort on: rank the filtered devices live
+        rows = merged(rank_live(query.all()))
+    else:
+        # Status filter and status sorts read fresh snapshots; devices whose snapshot
+        # is missing or stale (cutoff as in load_status_map) are ranked live and merged in
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.STATUS_SNAPSHOT_MAX_AGE_SEC)
+        base = query
+        if sort == "severity":
+            columns = [Snapshot.severity, Snapshot.last_seen_sort, Snapshot.device_id]
+        elif sort == "last_seen":
+            columns = [Snapshot.last_seen_sort, Snapshot.device_id]
+        elif db.get_bind().dialect.name == "postgresql":
+            columns = [device_model.device_sort_name_c, Device.id]
+        else:
+            columns = [device_model.device_sort_name, Device.id]
+        if by_status:
+            query = (
+                query.join(Snapshot, Snapshot.device_id == Device.id)
+                .filter(Snapshot.computed_at >= cutoff)
+                .add_entity(Snapshot)
+            )
+        if statuses:
+            query = query.filter(Snapshot.status.in_(statuses))
+        position = tuple_(*columns)
+        if after is not None:
+            query = query.filter(position < tuple_(*after) if desc else position > tuple_(*after))
+        query = query.order_by(*(c.desc() if desc else c for c in columns)).limit(limit + 1)
+        if by_status:
+            rows = [(_sort_key(sort, d, snap.severity, snap.last_seen), d) for d, snap in query.all()]
+            live = base.outerjoin(Snapshot, Snapshot.device_id == Device.id).filter(
+                or_(Snapshot.device_id.is_(None), Snapshot.computed_at < cutoff)
+            )
+            if sort == "name":
+                # The name is known without status: only devices inside this page's window can make it
+                if after is not None:
+                    live = live.filter(position < tuple_(*after) if desc else position > tuple_(*after))
+                if len(rows) > limit:
+                    last = tuple_(*rows[-1][0])
+                    live = live.filter(position >= last if desc else position <= last)
+            live = live.all()
+            if len(live) > LIVE_RANK_WARN:
+                log.warning("/v1/devices ranked %d devices live; status snapshots are missing or stale", len(live))
+            if live:
+                rows = merged(rows + rank_live(live))
+        else:
+            rows = [(_sort_key(sort, d, 0, None), d) for d in query.all()]
+
+    # One extra row tells whether another page exists
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1][0])
+
+    page = [d for _, d in rows]
+    status_map = load_status_map(db, page)
+    items = []
+    for device in page:
+        config = device.config
+        status_info = status_map[device.id]
+        items.append({
             "id": device.id,
             "alias": device.name or device.esn or f"Device {device.id}",
             "esn": device.esn,
-            "field": device.location or "Unassigned",
+            "field": device.farm_name,
+            "farm_slug": device.farm_slug,
+            "farm_name": device.farm_name,
             "lat": config.lat if config else None,
             "lon": config.lon if config else None,
             "status": status_info["status"],
             "last_seen": status_info["last_seen"],
             "battery_hint": status_info["battery_hint"],
         })
-    
-    return result
+    return {"count": len(items), "items": items, "next_cursor": next_cursor}
 
+
+@router.get("")
+def devices_list(
+    request: Request,
+    limit: int = Query(50, ge=1, le=DEVICE_PAGE_MAX),
+    cursor: Optional[str] = Query(None),
+    farm_id: Optional[str] = Query(None),
+    status: Optional[List[StatusType]] = Query(None, alias="status[]"),
+    esn_prefix: Optional[str] = Query(None),
+    has_coordinates: Optional[bool] = Query(None),
+    sort: DeviceSort = Query("name"),
+    order: SortOrder = Query("asc"),
+    db: Session = Depends(get_db),
+):
+    """
+    Devices with their status, one page at a time.
+
+    Filters: farm_id (farm slug, as in /v1/farms), status[], esn_prefix,
+    has_coordinates. sort=name (alias) | severity (worst first, then longest
+    since last seen) | last_seen, in the given order. Pages are keyset-paginated
+    on the sort key plus device id: pass next_cursor back as cursor (with the
+    same filters and sort) for the next page; it is null on the last one.
+    Filtering, sorting and paging run in SQL on indexed columns; status
+    filters and sorts use the status scheduler's snapshots.
+    """
+    etag = check_etag(request, db, status=True)
+    return coalesce(etag, lambda: _device_list(
+        db, limit, cursor, farm_id, status, esn_prefix, has_coordinates, sort, order,
+    ))
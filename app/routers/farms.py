@@ -1,116 +1,81 @@
 # app/routers/farms.py
 """
-Farms API endpoint - aggregates devices by location to create farm groups.
+Farms API endpoint - aggregates devices into farms: proximity clusters of
+located devices (services/farm_clusters.py), else by location.
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 from app.db.session import get_db
 from app.models import device as device_model
-from app.models import device_config as device_config_model
-from app.models import reading as reading_model
-from app.services.status import compute_device_status, severity_order
+from app.models import FarmAggregate
+from app.routers.common import check_etag
+from app.services.farm_aggregate import summarize_farms
+from app.services.singleflight import coalesce
+from app.services.status import severity_order
+from app.services.status_snapshot import load_status_map
+from app.settings import settings
 
 router = APIRouter(prefix="/v1/farms", tags=["farms"])
 
 
-def _get_worst_status(statuses: list[str]) -> str:
-    """Get the worst status from a list of statuses."""
-    priority = {'red': 0, 'amber': 1, 'stale': 2, 'offline': 3, 'gray': 4, 'blue': 5, 'green': 6}
-    if not statuses:
-        return 'gray'
-    return min(statuses, key=lambda s: priority.get(s, 99))
-
-
-@router.get("")
-def farms_list(db: Session = Depends(get_db)):
-    """
-    Get list of farms (grouped by device location/field).
-    Returns farm name, status, device count, last reading, and centroid coordinates.
-    """
-    devices = db.query(device_model.Device).all()
-
-    # Group devices by location (field name)
-    farms_dict: dict[str, dict] = {}
-
-    for device in devices:
-        # Get device config (for lat/lon and farm_id)
-        config = (
-            db.query(device_config_model.DeviceConfig)
-            .filter(device_config_model.DeviceConfig.device_id == device.id)
-            .first()
-        )
-
-        # Use location field for grouping, fall back to "Unassigned"
-        farm_name = device.location or "Unassigned"
-
-        # Initialize farm entry if needed
-        if farm_name not in farms_dict:
-            farms_dict[farm_name] = {
-                "id": farm_name.lower().replace(" ", "-"),
-                "name": farm_name,
-                "device_count": 0,
-                "statuses": [],
-                "last_reading": None,
-                "lats": [],
-                "lons": [],
+def _last_reading_label(last_reading: Optional[datetime]) -> Optional[str]:
+    if last_reading is None:
+        return None
+    minutes = int((datetime.utcnow() - last_reading).total_seconds() / 60)
+    if minutes < 60:
+        return f"{minutes}m ago"
+    if minutes < 1440:
+        return f"{minutes // 60}h ago"
+    return f"{minutes // 1440}d ago"
+
+
+def _live_farm_aggregates(db: Session) -> dict[str, dict]:
+    """Aggregate every device now (statuses from snapshots or computed live)."""
+    Device = device_model.Device
+    devices = db.query(Device).options(selectinload(Device.config), selectinload(Device.farm_cluster)).all()
+    return summarize_farms(devices, load_status_map(db, devices))
+
+
+def _farms(db: Session):
+    # farm_aggregate is kept current by the status scheduler; without it, before
+    # its first run or when it has stopped (rows older than the snapshot max age)
+    # aggregate live
+    farms = None
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.STATUS_SNAPSHOT_MAX_AGE_SEC)
+    oldest = db.query(func.min(FarmAggregate.updated_at)).scalar() if settings.STATUS_SCHEDULER_ENABLED else None
+    if oldest is not None and oldest >= cutoff:
+        farms = {
+            row.farm_slug: {
+                "name": row.name,
+                "device_count": row.device_count,
+                "status": row.status,
+                "attention_count": row.attention_count,
+                "last_reading_at": row.last_reading_at,
+                "lat": row.lat,
+                "lon": row.lon,
             }
-
-        farm = farms_dict[farm_name]
-        farm["device_count"] += 1
-
-        # Compute status
-        status_info = compute_device_status(db, device, config)
-        farm["statuses"].append(status_info["status"])
-
-        # Track last reading
-        if status_info["last_seen"] is not None:
-            if farm["last_reading"] is None or status_info["last_seen"] > farm["last_reading"]:
-                farm["last_reading"] = status_info["last_seen"]
-
-        # Collect coordinates for centroid
-        if config and config.lat is not None and config.lon is not None:
-            farm["lats"].append(config.lat)
-            farm["lons"].append(config.lon)
-
-    # Format output
-    result = []
-    for farm_name, farm in farms_dict.items():
-        # Calculate centroid
-        lat = sum(farm["lats"]) / len(farm["lats"]) if farm["lats"] else None
-        lon = sum(farm["lons"]) / len(farm["lons"]) if farm["lons"] else None
-
-        # Determine overall status (worst case)
-        overall_status = _get_worst_status(farm["statuses"])
-
-        # Count devices needing attention
-        attention_count = sum(1 for s in farm["statuses"] if s in ['red', 'amber', 'stale', 'offline'])
-
-        # Format last reading
-        last_reading_str = None
-        if farm["last_reading"]:
-            delta = datetime.utcnow() - farm["last_reading"]
-            minutes = int(delta.total_seconds() / 60)
-            if minutes < 60:
-                last_reading_str = f"{minutes}m ago"
-            elif minutes < 1440:
-                last_reading_str = f"{minutes // 60}h ago"
-            else:
-                last_reading_str = f"{minutes // 1440}d ago"
-
-        result.append({
-            "id": farm["id"],
+            for row in db.query(FarmAggregate)
+        }
+    if not farms:
+        farms = _live_farm_aggregates(db)
+
+    result = [
+        {
+            "id": slug,
             "name": farm["name"],
             "device_count": farm["device_count"],
-            "status": overall_status,
-            "attention_count": attention_count,
-            "last_reading": last_reading_str,
-            "last_reading_at": farm["last_reading"].isoformat() if farm["last_reading"] else None,
-            "lat": lat,
-            "lon": lon,
-        })
+            "status": farm["status"],
+            "attention_count": farm["attention_count"],
+            "last_reading": _last_reading_label(farm["last_reading_at"]),
+            "last_reading_at": farm["last_reading_at"].isoformat() if farm["last_reading_at"] else None,
+            "lat": farm["lat"],
+            "lon": farm["lon"],
+        }
+        for slug, farm in farms.items()
+    ]
 
     # Sort: farms with attention first, then by name
     result.sort(key=lambda f: (
@@ -121,56 +86,45 @@ def farms_list(db: Session = Depends(get_db)):
     return result
 
 
-@router.get("/{farm_id}")
-def farm_detail(farm_id: str, db: Session = Depends(get_db)):
+@router.get("")
+def farms_list(request: Request, db: Session = Depends(get_db)):
     """
-    Get detailed info for a specific farm including all its devices.
+    Get list of farms (grouped by device location/field).
+    Returns farm name, status, device count, last reading, and centroid coordinates,
+    read from farm_aggregate (services/farm_aggregate.py).
     """
-    devices = db.query(device_model.Device).all()
-
-    # Find devices belonging to this farm
+    etag = check_etag(request, db, status=True)
+    return coalesce(etag, lambda: _farms(db))
+
+
+def _farm_detail(db: Session, farm_id: str):
+    # Indexed lookup; configs and statuses are batch-loaded, so the query count doesn't grow with the farm
+    matched = (
+        db.query(device_model.Device)
+        .options(selectinload(device_model.Device.config), selectinload(device_model.Device.farm_cluster))
+        .filter(device_model.Device.farm_slug == farm_id)
+        .all()
+    )
+    statuses = load_status_map(db, matched)
     farm_devices = []
     farm_name = None
 
-    for device in devices:
-        location = device.location or "Unassigned"
-        location_id = location.lower().replace(" ", "-")
-
-        if location_id == farm_id:
-            farm_name = location
-
-            # Get device config
-            config = (
-                db.query(device_config_model.DeviceConfig)
-                .filter(device_config_model.DeviceConfig.device_id == device.id)
-                .first()
-            )
-
-            # Compute status
-            status_info = compute_device_status(db, device, config)
-
-            # Get latest 30cm moisture
-            latest_30cm = (
-                db.query(reading_model.Reading.moisture_pct)
-                .filter(
-                    reading_model.Reading.device_id == device.id,
-                    reading_model.Reading.depth_cm == 30.0,
-                )
-                .order_by(reading_model.Reading.timestamp.desc())
-                .limit(1)
-                .scalar()
-            )
-
-            farm_devices.append({
-                "id": device.id,
-                "alias": device.name or device.esn or f"Device {device.id}",
-                "status": status_info["status"],
-                "lat": config.lat if config else None,
-                "lon": config.lon if config else None,
-                "last_seen": status_info["last_seen"],
-                "moisture30": round(latest_30cm, 1) if latest_30cm is not None else None,
-                "battery_hint": status_info["battery_hint"],
-            })
+    for device in matched:
+        farm_name = device.farm_name
+        config = device.config
+        status_info = statuses[device.id]
+        latest_30cm = status_info["moisture_30cm"]
+
+        farm_devices.append({
+            "id": device.id,
+            "alias": device.name or device.esn or f"Device {device.id}",
+            "status": status_info["status"],
+            "lat": config.lat if config else None,
+            "lon": config.lon if config else None,
+            "last_seen": status_info["last_seen"],
+            "moisture30": round(latest_30cm, 1) if latest_30cm is not None else None,
+            "battery_hint": status_info["battery_hint"],
+        })
 
     if not farm_devices:
         return {"error": "Farm not found", "id": farm_id}
@@ -190,3 +144,12 @@ def farm_detail(farm_id: str, db: Session = Depends(get_db)):
         "lat": sum(lats) / len(lats) if lats else None,
         "lon": sum(lons) / len(lons) if lons else None,
     }
+
+
+@router.get("/{farm_id}")
+def farm_detail(request: Request, farm_id: str, db: Session = Depends(get_db)):
+    """
+    Get detailed info for a specific farm including all its devices.
+    """
+    etag = check_etag(request, db, status=True)
+    return coalesce(etag, lambda: _farm_detail(db, farm_id))
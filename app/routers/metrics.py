@@ -1,37 +1,491 @@
 # api/app/routers/metrics.py
+import math
 from datetime import datetime, timedelta
-from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, case
+from typing import Optional, List, Literal, Union
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, or_
 from app.db.session import get_db
+from app.settings import settings
+from app.routers.common import FastJSONResponse, cached_response, check_etag, parse_iso
 from app.models import reading as reading_model
 from app.models import device as device_model
 from app.models import device_config as device_config_model
-from app.services.status import compute_device_status
+from app.models import reading_rollup as rollup_model
+from app.services.status import severity_order, texture_bounds
+from app.services.status_snapshot import load_status_map
+from app.services.depths import get_depths_for_devices, get_all_depths
+from app.services import tswire
+from app.services.downsample import downsample_indices
+from app.services.rollups import floor_to, pyramid_level, pyramid_width
+from app.services.series import bucket_index, bucket_start, bucket_width_seconds, resolve_range
 
 router = APIRouter(prefix="/v1/metrics", tags=["metrics"])
 
+# "bucket": avg/min/max per time bucket computed in SQL (default)
+# "lttb" / "m4": raw rows downsampled in NumPy (exact points, more DB traffic)
+# "pyramid": avg/min/max at power-of-two multiples of 15 min, read straight from
+#            reading_pyramid (about max_points rows per series at any zoom level)
+SeriesMode = Literal["bucket", "lttb", "m4", "pyramid"]
 
-def _downsample_readings(readings: List[dict], max_points: int = 800) -> List[dict]:
+# "points": [{"t": iso, "v", ...}] per series (default)
+# "columnar": per series "t" (epoch seconds) / "v" (/ "min" / "max") arrays, rendered by orjson
+# "binary": the same columns Gorilla-compressed (services/tswire.py); also chosen by
+#           Accept: application/vnd.soilprobe.ts
+SeriesFormat = Literal["points", "columnar", "binary"]
+
+# /v1/metrics/series: depletion is % of total available water, derived from
+# moisture for texture-aware devices (services/status.py Mode 1)
+Metric = Literal["moisture", "temp", "depletion"]
+MultiSeriesMode = Literal["bucket", "pyramid"]
+
+
+def _epoch_seconds(timestamps: List[datetime]) -> np.ndarray:
+    return np.array(timestamps, dtype="datetime64[us]").astype(np.int64) // 1_000_000
+
+
+def _series_points(
+    timestamps: List[datetime],
+    values: List[float],
+    max_points: int = 800,
+    method: SeriesMode = "lttb",
+    columnar: bool = False,
+):
+    """
+    Downsample one series to max_points (LTTB or M4, see services/downsample.py)
+    and format it as [{"t", "v"}], or as {"t": epoch seconds, "v"} arrays when columnar.
+    """
+    if len(values) > max_points:
+        t = np.array(timestamps, dtype="datetime64[us]").astype(np.int64) / 1e6
+        keep = downsample_indices(t, np.asarray(values, dtype=np.float64), max_points, method)
+        timestamps = [timestamps[i] for i in keep]
+        values = [values[i] for i in keep]
+    
+    if columnar:
+        return {
+            "t": _epoch_seconds(timestamps),
+            "v": np.round(np.asarray(values, dtype=np.float64), 2),
+        }
+    return [{"t": ts.isoformat(), "v": round(v, 2)} for ts, v in zip(timestamps, values)]
+
+
+def _bucketed_series(
+    db: Session,
+    timestamp_col,
+    aggregates: tuple,
+    key_cols: list,
+    filters: list,
+    width: int,
+    columnar: bool = False,
+) -> dict[tuple, Union[List[dict], dict]]:
+    """
+    One avg/min/max row per (key_cols..., bucket) computed in SQL.
+    aggregates is the (avg, min, max) expression triple for the source table.
+    Returns {key tuple: [{"t", "v", "min", "max"}, ...]} ordered by time, or
+    {key tuple: {"t", "v", "min", "max"} arrays} when columnar.
+    """
+    avg_expr, min_expr, max_expr = aggregates
+    bucket = bucket_index(db, timestamp_col, width).label("bucket")
+    rows = (
+        db.query(
+            *key_cols,
+            bucket,
+            avg_expr.label("v_avg"),
+            min_expr.label("v_min"),
+            max_expr.label("v_max"),
+        )
+        .filter(*filters)
+        .group_by(*key_cols, bucket)
+        .order_by(*key_cols, bucket)
+        .all()
+    )
+    
+    n_keys = len(key_cols)
+    if columnar:
+        grouped: dict[tuple, list] = {}
+        for row in rows:
+            grouped.setdefault(tuple(row[:n_keys]), []).append(row[n_keys:])
+        return {
+            key: {
+                "t": cols[:, 0].astype(np.int64) * width,
+                "v": np.round(cols[:, 1], 2),
+                "min": np.round(cols[:, 2], 2),
+                "max": np.round(cols[:, 3], 2),
+            }
+            for key, cols in ((k, np.array(r, dtype=np.float64)) for k, r in grouped.items())
+        }
+    
+    series: dict[tuple, List[dict]] = {}
+    for row in rows:
+        key = tuple(row[:n_keys])
+        series.setdefault(key, []).append({
+            "t": bucket_start(row.bucket, width).isoformat(),
+            "v": round(row.v_avg, 2),
+            "min": round(row.v_min, 2),
+            "max": round(row.v_max, 2),
+        })
+    return series
+
+
+def _raw_series(
+    db: Session,
+    value_col,
+    key_cols: list,
+    filters: list,
+    max_points: int,
+    method: SeriesMode,
+    columnar: bool = False,
+) -> dict[tuple, Union[List[dict], dict]]:
+    """Every matching reading, downsampled per series in NumPy (LTTB / M4)."""
+    Reading = reading_model.Reading
+    rows = (
+        db.query(*key_cols, Reading.timestamp, value_col.label("value"))
+        .filter(*filters)
+        .order_by(Reading.timestamp)
+        .all()
+    )
+    
+    grouped: dict[tuple, tuple[list, list]] = {}
+    n_keys = len(key_cols)
+    for row in rows:
+        timestamps, values = grouped.setdefault(tuple(row[:n_keys]), ([], []))
+        timestamps.append(row.timestamp)
+        values.append(row.value)
+    
+    return {
+        key: _series_points(timestamps, values, max_points, method, columnar)
+        for key, (timestamps, values) in grouped.items()
+    }
+
+
+def _series_source(width: int):
+    """
+    Pick the table a bucketed query reads from: (rollup model, rollup width)
+    or (None, None) for raw readings. The coarsest rollup no wider than the
+    bucket width wins; callers round the width up to a whole number of rollup
+    buckets, so every bucket is built from complete rollup rows.
+    """
+    if width >= 86400:
+        return rollup_model.ReadingDaily, 86400
+    if width >= 3600:
+        return rollup_model.ReadingHourly, 3600
+    return None, None
+
+
+def _scope_filters(model, ts_col, device_ids, depths, from_date, to_date) -> list:
+    """Device, depth and time-range filters on reading or a rollup table."""
+    filters = []
+    if device_ids:
+        filters.append(model.device_id.in_(device_ids))
+    if depths:
+        filters.append(model.depth_cm.in_(depths))
+    if from_date:
+        filters.append(ts_col >= from_date)
+    if to_date:
+        filters.append(ts_col <= to_date)
+    return filters
+
+
+def _rollup_aggregates(model, metric: Literal["moisture", "temp"]) -> tuple:
+    """(avg, min, max) of a metric over rollup rows; avg is NULL where it has no values."""
+    return (
+        func.sum(getattr(model, f"{metric}_sum")) / func.nullif(func.sum(getattr(model, f"{metric}_count")), 0),
+        func.min(getattr(model, f"{metric}_min")),
+        func.max(getattr(model, f"{metric}_max")),
+    )
+
+
+def _series_for(
+    db: Session,
+    metric: Literal["moisture", "temp"],
+    key_names: List[str],
+    device_ids: Optional[List[int]],
+    depths: Optional[List[float]],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    max_points: int,
+    mode: SeriesMode,
+    columnar: bool = False,
+) -> dict[tuple, Union[List[dict], dict]]:
+    """
+    Apply filters and the time range, then dispatch to the raw (LTTB / M4),
+    SQL-bucketed raw, rollup-backed or pyramid path. key_names are the grouping
+    columns ("device_id", "depth_cm"), present on reading and both rollups.
+    Series are point lists, or column arrays when columnar.
     """
-    Simple downsampling: take evenly spaced points.
-    For production, use LTTB (Largest-Triangle-Three-Buckets) algorithm.
+    Reading = reading_model.Reading
+    value_col = Reading.moisture_pct if metric == "moisture" else Reading.temperature_c
+    
+    def scoped(model, ts_col) -> list:
+        return _scope_filters(model, ts_col, device_ids, depths, from_date, to_date)
+    
+    raw_filters = [value_col.isnot(None), *scoped(Reading, Reading.timestamp)]
+    raw_keys = [getattr(Reading, name) for name in key_names]
+    
+    if mode == "pyramid":
+        model = rollup_model.ReadingPyramid
+        span = resolve_range(
+            db, model.bucket_start, from_date, to_date, model.level == 0, *scoped(model, model.bucket_start)
+        )
+        if span is None:
+            return {}
+        level = pyramid_level(span[0], span[1], max_points)
+        width = pyramid_width(level)
+        if from_date:
+            from_date = floor_to(from_date, width)
+        filters = [
+            model.level == level,
+            getattr(model, f"{metric}_count") > 0,
+            *scoped(model, model.bucket_start),
+        ]
+        keys = [getattr(model, name) for name in key_names]
+        return _bucketed_series(
+            db, model.bucket_start, _rollup_aggregates(model, metric), keys, filters, width, columnar
+        )
+    
+    if mode != "bucket":
+        return _raw_series(db, value_col, raw_keys, raw_filters, max_points, mode, columnar)
+    
+    span = resolve_range(db, Reading.timestamp, from_date, to_date, *raw_filters)
+    if span is None:
+        return {}
+    width = bucket_width_seconds(span[0], span[1], max_points)
+    
+    model, rollup_width = _series_source(width)
+    if model is None:
+        aggregates = (func.avg(value_col), func.min(value_col), func.max(value_col))
+        return _bucketed_series(
+            db, Reading.timestamp, aggregates, raw_keys, raw_filters, width, columnar
+        )
+    
+    # Whole rollup buckets only: widen the width and pull from_date back to a bucket start
+    width = rollup_width * math.ceil(width / rollup_width)
+    if from_date:
+        from_date = floor_to(from_date, rollup_width)
+    filters = [getattr(model, f"{metric}_count") > 0, *scoped(model, model.bucket_start)]
+    keys = [getattr(model, name) for name in key_names]
+    return _bucketed_series(
+        db, model.bucket_start, _rollup_aggregates(model, metric), keys, filters, width, columnar
+    )
+
+
+def _multi_series(
+    db: Session,
+    metrics: List[Literal["moisture", "temp"]],
+    device_ids: Optional[List[int]],
+    depths: Optional[List[float]],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    max_points: int,
+    mode: MultiSeriesMode,
+) -> tuple[dict[tuple, dict], int]:
+    """
+    avg/min/max of several metrics per (device_id, depth_cm) and bucket from
+    one grouped query, over reading, a rollup or the pyramid (chosen as in
+    _series_for). Returns ({(device_id, depth_cm): {"t": epoch seconds,
+    "<metric>", "<metric>_min", "<metric>_max": arrays}}, bucket width) on one
+    shared time axis; NaN where a bucket has no value for a metric.
     """
-    if len(readings) <= max_points:
-        return readings
+    Reading = reading_model.Reading
+    raw_cols = {"moisture": Reading.moisture_pct, "temp": Reading.temperature_c}
+    
+    def scoped(model, ts_col) -> list:
+        return _scope_filters(model, ts_col, device_ids, depths, from_date, to_date)
+    
+    if mode == "pyramid":
+        model = rollup_model.ReadingPyramid
+        span = resolve_range(
+            db, model.bucket_start, from_date, to_date, model.level == 0, *scoped(model, model.bucket_start)
+        )
+        if span is None:
+            return {}, 0
+        level = pyramid_level(span[0], span[1], max_points)
+        width = align = pyramid_width(level)
+        source_filters = [model.level == level]
+    else:
+        has_value = or_(*(raw_cols[m].isnot(None) for m in metrics))
+        span = resolve_range(db, Reading.timestamp, from_date, to_date, has_value, *scoped(Reading, Reading.timestamp))
+        if span is None:
+            return {}, 0
+        width = bucket_width_seconds(span[0], span[1], max_points)
+        model, align = _series_source(width)
+        if model is None:
+            source_filters = [has_value]
+        else:
+            width = align * math.ceil(width / align)
+            source_filters = []
+    
+    if model is None:
+        model, ts_col = Reading, Reading.timestamp
+        aggregates = [agg for m in metrics for agg in (func.avg(raw_cols[m]), func.min(raw_cols[m]), func.max(raw_cols[m]))]
+    else:
+        # Whole rollup / pyramid buckets only
+        if from_date:
+            from_date = floor_to(from_date, align)
+        ts_col = model.bucket_start
+        aggregates = [agg for m in metrics for agg in _rollup_aggregates(model, m)]
+        source_filters.append(or_(*(getattr(model, f"{m}_count") > 0 for m in metrics)))
     
-    step = len(readings) / max_points
-    return [readings[int(i * step)] for i in range(max_points)]
+    keys = [model.device_id, model.depth_cm]
+    bucket = bucket_index(db, ts_col, width).label("bucket")
+    rows = (
+        db.query(*keys, bucket, *aggregates)
+        .filter(*source_filters, *scoped(model, ts_col))
+        .group_by(*keys, bucket)
+        .order_by(*keys, bucket)
+        .all()
+    )
+    
+    grouped: dict[tuple, list] = {}
+    for row in rows:
+        grouped.setdefault(tuple(row[:2]), []).append(row[2:])
+    series = {}
+    for key, values in grouped.items():
+        cols = np.array(values, dtype=np.float64)  # None -> NaN
+        columns = {"t": cols[:, 0].astype(np.int64) * width}
+        for i, metric in enumerate(metrics):
+            columns[metric] = np.round(cols[:, 1 + 3 * i], 2)
+            columns[f"{metric}_min"] = np.round(cols[:, 2 + 3 * i], 2)
+            columns[f"{metric}_max"] = np.round(cols[:, 3 + 3 * i], 2)
+        series[key] = columns
+    return series, width
+
+
+def _add_depletion(db: Session, series: dict[tuple, dict]) -> None:
+    """
+    Add depletion columns, (FC - VWC) / (FC - PWP) clamped to 0-100 %, from
+    the moisture columns of _multi_series(). NaN for devices without a
+    texture-aware FC/PWP config.
+    """
+    DeviceConfig = device_config_model.DeviceConfig
+    device_ids = {device_id for device_id, _ in series}
+    configs = {
+        config.device_id: config
+        for config in db.query(DeviceConfig).filter(DeviceConfig.device_id.in_(device_ids))
+    }
+    for (device_id, _), columns in series.items():
+        bounds = texture_bounds(configs.get(device_id))
+        if bounds is None:
+            missing = np.full(len(columns["t"]), np.nan)
+            columns.update(depletion=missing, depletion_min=missing, depletion_max=missing)
+            continue
+        fc, pwp = bounds
+        
+        def pct(vwc: np.ndarray) -> np.ndarray:
+            return np.round(np.clip(fc - vwc, 0, fc - pwp) / (fc - pwp) * 100, 2)
+        
+        # The wettest reading of a bucket is its least depleted one
+        columns.update(
+            depletion=pct(columns["moisture"]),
+            depletion_min=pct(columns["moisture_max"]),
+            depletion_max=pct(columns["moisture_min"]),
+        )
+
+
+def _column_points(columns: dict) -> List[dict]:
+    """Shared-axis columns as [{"t": iso, "<column>": value or None, ...}]."""
+    names = [name for name in columns if name != "t"]
+    times = columns["t"].astype("datetime64[s]").tolist()
+    rows = zip(*(columns[name].tolist() for name in names))
+    return [
+        {"t": ts.isoformat(), **{name: None if math.isnan(v) else v for name, v in zip(names, values)}}
+        for ts, values in zip(times, rows)
+    ]
+
+
+def _fill_gaps(row: np.ndarray) -> np.ndarray:
+    """Linearly interpolate NaN cells between known values; leading/trailing NaNs stay."""
+    known = np.flatnonzero(~np.isnan(row))
+    if len(known) < 2:
+        return row
+    inner = np.arange(known[0], known[-1] + 1)
+    row = row.copy()
+    row[inner] = np.interp(inner, known, row[known])
+    return row
+
+
+def _device_names(db: Session, device_ids) -> dict[int, str]:
+    ids = list(set(device_ids))
+    if not ids:
+        return {}
+    rows = (
+        db.query(device_model.Device.id, device_model.Device.name)
+        .filter(device_model.Device.id.in_(ids))
+        .all()
+    )
+    return {device_id: name or f"Device {device_id}" for device_id, name in rows}
+
+
+def _series_format(request: Request, format: SeriesFormat) -> SeriesFormat:
+    if format == "points" and tswire.MEDIA_TYPE in request.headers.get("accept", ""):
+        return "binary"
+    return format
+
+
+def _series_entry(meta: dict, data, format: SeriesFormat) -> dict:
+    """Attach one series' points (or columns, for columnar/binary) to its metadata."""
+    if format == "points":
+        return {**meta, "points": data}
+    return {**meta, **data}
+
+
+def _series_response(series: List[dict], format: SeriesFormat) -> Response:
+    if format == "binary":
+        return Response(tswire.encode_series(series), media_type=tswire.MEDIA_TYPE)
+    return FastJSONResponse(series)
+
+
+def _selected_depths(
+    db: Session, device_ids: Optional[List[int]], depths: Optional[List[float]]
+) -> List[float]:
+    """Requested depths the selected probes actually report (depth catalog); all of them by default."""
+    if device_ids:
+        catalog = get_depths_for_devices(db, device_ids)
+        known_depths = sorted({d for ds in catalog.values() for d in ds})
+    else:
+        known_depths = get_all_depths(db)
+    return [d for d in depths if d in known_depths] if depths else known_depths
+
+
+def _normalized_ids(values: Optional[list]) -> Optional[list]:
+    """Sorted, de-duplicated filter values (None when absent) - part of cache keys."""
+    return sorted(set(values)) if values else None
 
 
-def _should_aggregate_daily(from_dt: datetime, to_dt: datetime) -> bool:
-    """Return True if range > 90 days."""
-    return (to_dt - from_dt).days > 90
+def _snap_range(
+    from_date: Optional[datetime], to_date: Optional[datetime], step: int
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """
+    [from, to] widened outward to epoch-aligned multiples of step seconds, for
+    the cache key and ETag only: queries use the caller's range, and requests
+    a few seconds apart share the body computed for the first of them.
+    """
+    if from_date:
+        from_date = floor_to(from_date, step)
+    if to_date:
+        floored = floor_to(to_date, step)
+        to_date = floored if floored == to_date else floored + timedelta(seconds=step)
+    return from_date, to_date
+
+
+def _snap_series_range(
+    from_date: Optional[datetime], to_date: Optional[datetime], max_points: int
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Cache-key range for a series (see _snap_range), snapped to its bucket
+    width, so dashboards asking for "last 7 days" a few seconds apart share
+    one cache entry and ETag.
+    """
+    step = settings.RESULT_CACHE_SNAP_SEC
+    if from_date and to_date:
+        step = max(step, bucket_width_seconds(from_date, to_date, max_points))
+    return _snap_range(from_date, to_date, step)
 
 
 @router.get("/summary")
 def metrics_summary(
+    request: Request,
     from_dt: Optional[str] = Query(None, alias="from"),
     to_dt: Optional[str] = Query(None, alias="to"),
     device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
@@ -39,241 +493,311 @@ def metrics_summary(
     db: Session = Depends(get_db),
 ):
     """Get summary metrics for the selected time range and filters."""
-    query = db.query(reading_model.Reading).join(device_model.Device)
-    
-    # Time filter
-    if from_dt:
-        try:
-            from_date = datetime.fromisoformat(from_dt.replace("Z", "+00:00"))
-            query = query.filter(reading_model.Reading.timestamp >= from_date)
-        except Exception:
-            pass
-    
-    if to_dt:
-        try:
-            to_date = datetime.fromisoformat(to_dt.replace("Z", "+00:00"))
-            query = query.filter(reading_model.Reading.timestamp <= to_date)
-        except Exception:
-            pass
-    
-    # Device filter
-    if device_ids:
-        query = query.filter(reading_model.Reading.device_id.in_(device_ids))
+    device_ids = _normalized_ids(device_ids)
+    depths = _normalized_ids(depths)
+    from_date, to_date = parse_iso(from_dt), parse_iso(to_dt)
+    key_from, key_to = _snap_range(from_date, to_date, settings.RESULT_CACHE_SNAP_SEC)
+    params = {"from": key_from, "to": key_to, "device_ids": device_ids, "depths": depths}
+    etag = check_etag(request, db, device_ids, status=True, params=params)
+    
+    return cached_response(
+        etag,
+        lambda: FastJSONResponse(_summary(db, from_date, to_date, device_ids, depths)),
+        device_ids,
+    )
+
+
+def _summary(
+    db: Session,
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    device_ids: Optional[List[int]],
+    depths: Optional[List[float]],
+) -> dict:
+    """
+    Averages, last reading and device count come from one aggregate query;
+    attention status comes from snapshots / the batch status path.
+    """
+    Reading = reading_model.Reading
+    filters = []
     
-    # Depth filter
+    if from_date:
+        filters.append(Reading.timestamp >= from_date)
+    if to_date:
+        filters.append(Reading.timestamp <= to_date)
+    if device_ids:
+        filters.append(Reading.device_id.in_(device_ids))
     if depths:
-        query = query.filter(reading_model.Reading.depth_cm.in_(depths))
+        filters.append(Reading.depth_cm.in_(depths))
     
-    readings = query.all()
+    avg_moisture, avg_temp, last_reading_at, device_count = (
+        db.query(
+            func.avg(Reading.moisture_pct),
+            func.avg(Reading.temperature_c),
+            func.max(Reading.timestamp),
+            func.count(func.distinct(Reading.device_id)),
+        )
+        .filter(*filters)
+        .one()
+    )
     
-    if not readings:
+    if not device_count:
         return {
             "avg_moisture": None,
             "avg_temp": None,
             "devices_needing_attention": [],
             "last_reading_at": None,
+            "device_count": 0,
         }
     
-    # Calculate averages
-    moistures = [r.moisture_pct for r in readings if r.moisture_pct is not None]
-    temps = [r.temperature_c for r in readings if r.temperature_c is not None]
+    # Devices needing attention (RED or AMBER status) among those with readings in range
+    in_range = db.query(Reading.device_id).filter(*filters).distinct()
+    devices = (
+        db.query(device_model.Device)
+        .options(selectinload(device_model.Device.config))
+        .filter(device_model.Device.id.in_(in_range))
+        .all()
+    )
+    status_map = load_status_map(db, devices)
     
-    avg_moisture = sum(moistures) / len(moistures) if moistures else None
-    avg_temp = sum(temps) / len(temps) if temps else None
-    
-    # Last reading timestamp
-    last_reading = max(readings, key=lambda r: r.timestamp)
-    last_reading_at = last_reading.timestamp.isoformat() if last_reading else None
-    
-    # Devices needing attention (RED or AMBER status)
-    # Get unique device IDs from readings
-    device_ids_in_range = list(set(r.device_id for r in readings))
     attention_devices = []
-    
-    for device_id in device_ids_in_range:
-        device = db.query(device_model.Device).filter_by(id=device_id).first()
-        if not device:
+    for device in devices:
+        status_info = status_map[device.id]
+        if status_info["status"] not in ("red", "amber"):
             continue
-        
-        # Get device config
-        config = (
-            db.query(device_config_model.DeviceConfig)
-            .filter(device_config_model.DeviceConfig.device_id == device.id)
-            .first()
-        )
-        
-        # Compute status
-        status_info = compute_device_status(db, device, config)
-        status = status_info["status"]
-        
-        # Include if RED or AMBER
-        if status in ("red", "amber"):
-            # Get latest 30cm moisture for display
-            latest_30cm = (
-                db.query(reading_model.Reading.moisture_pct)
-                .filter(
-                    reading_model.Reading.device_id == device.id,
-                    reading_model.Reading.depth_cm == 30.0,
-                )
-                .order_by(reading_model.Reading.timestamp.desc())
-                .limit(1)
-                .scalar()
-            )
-            
-            attention_devices.append({
-                "device_id": device_id,
-                "alias": device.name or device.esn or f"Device {device_id}",
-                "avg_moisture_30cm": round(latest_30cm, 1) if latest_30cm is not None else None,
-                "status": status,
-            })
+        latest_30cm = status_info.get("moisture_30cm")
+        attention_devices.append({
+            "device_id": device.id,
+            "alias": device.name or device.esn or f"Device {device.id}",
+            "avg_moisture_30cm": round(latest_30cm, 1) if latest_30cm is not None else None,
+            "status": status_info["status"],
+        })
+    attention_devices.sort(key=lambda d: (severity_order(d["status"]), d["device_id"]))
     
     return {
-        "avg_moisture": round(avg_moisture, 2) if avg_moisture else None,
-        "avg_temp": round(avg_temp, 2) if avg_temp else None,
+        "avg_moisture": round(avg_moisture, 2) if avg_moisture is not None else None,
+        "avg_temp": round(avg_temp, 2) if avg_temp is not None else None,
         "devices_needing_attention": attention_devices,
-        "last_reading_at": last_reading_at,
+        "last_reading_at": last_reading_at.isoformat() if last_reading_at else None,
+        "device_count": device_count,
     }
 
 
 @router.get("/moisture-series")
 def moisture_series(
+    request: Request,
     from_dt: Optional[str] = Query(None, alias="from"),
     to_dt: Optional[str] = Query(None, alias="to"),
     device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
     depths: Optional[List[float]] = Query(None, alias="depths[]"),
-    max_points: int = Query(800, alias="max_points"),
+    max_points: int = Query(800, alias="max_points", ge=3, le=10000),
+    downsample: SeriesMode = Query("bucket"),
+    format: SeriesFormat = Query("points"),
     db: Session = Depends(get_db),
 ):
-    """Get moisture time series data, downsampled to max_points."""
-    query = db.query(
-        reading_model.Reading.device_id,
-        reading_model.Reading.depth_cm,
-        reading_model.Reading.timestamp,
-        reading_model.Reading.moisture_pct,
-        device_model.Device.name.label("device_name"),
-    ).join(device_model.Device)
-    
-    # Filters
-    if from_dt:
-        try:
-            from_date = datetime.fromisoformat(from_dt.replace("Z", "+00:00"))
-            query = query.filter(reading_model.Reading.timestamp >= from_date)
-        except Exception:
-            pass
-    
-    if to_dt:
-        try:
-            to_date = datetime.fromisoformat(to_dt.replace("Z", "+00:00"))
-            query = query.filter(reading_model.Reading.timestamp <= to_date)
-        except Exception:
-            pass
-    
-    if device_ids:
-        query = query.filter(reading_model.Reading.device_id.in_(device_ids))
-    
-    if depths:
-        query = query.filter(reading_model.Reading.depth_cm.in_(depths))
-    
-    query = query.order_by(reading_model.Reading.timestamp)
-    rows = query.all()
-    
-    # Group by device_id + depth_cm
-    series = {}
-    for row in rows:
-        if row.moisture_pct is None:
-            continue
-        key = f"{row.device_id}-{row.depth_cm}"
-        if key not in series:
-            series[key] = {
-                "device_id": row.device_id,
-                "depth_cm": row.depth_cm,
-                "device_name": row.device_name or f"Device {row.device_id}",
-                "points": [],
-            }
-        series[key]["points"].append({
-            "t": row.timestamp.isoformat(),
-            "v": round(row.moisture_pct, 2),
-        })
+    """
+    Get moisture time series data, at most max_points per (device, depth).
+    Default: SQL time buckets with avg (v), min and max per point.
+    """
+    format = _series_format(request, format)
+    device_ids = _normalized_ids(device_ids)
+    depths = _normalized_ids(depths)
+    from_date, to_date = parse_iso(from_dt), parse_iso(to_dt)
+    key_from, key_to = _snap_series_range(from_date, to_date, max_points)
+    params = {
+        "from": key_from, "to": key_to, "device_ids": device_ids, "depths": depths,
+        "max_points": max_points, "downsample": downsample, "format": format,
+    }
+    etag = check_etag(request, db, device_ids, params=params)
     
-    # Downsample each series
-    result = []
-    for key, data in series.items():
-        if len(data["points"]) > max_points:
-            data["points"] = _downsample_readings(data["points"], max_points)
-        result.append({
-            "device_id": data["device_id"],
-            "depth_cm": data["depth_cm"],
-            "device_name": data["device_name"],
-            "points": data["points"],
-        })
+    def compute() -> Response:
+        selected = _selected_depths(db, device_ids, depths)
+        if not selected:
+            return _series_response([], format)
+        
+        series = _series_for(
+            db, "moisture", ["device_id", "depth_cm"], device_ids, selected,
+            from_date, to_date, max_points, downsample, format != "points",
+        )
+        names = _device_names(db, [device_id for device_id, _ in series])
+        return _series_response([
+            _series_entry({
+                "device_id": device_id,
+                "depth_cm": depth_cm,
+                "device_name": names.get(device_id, f"Device {device_id}"),
+            }, data, format)
+            for (device_id, depth_cm), data in series.items()
+        ], format)
     
-    return result
+    return cached_response(etag, compute, device_ids)
 
 
 @router.get("/temp-series")
 def temp_series(
+    request: Request,
     from_dt: Optional[str] = Query(None, alias="from"),
     to_dt: Optional[str] = Query(None, alias="to"),
     device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
-    max_points: int = Query(800, alias="max_points"),
+    max_points: int = Query(800, alias="max_points", ge=3, le=10000),
+    downsample: SeriesMode = Query("bucket"),
+    format: SeriesFormat = Query("points"),
     db: Session = Depends(get_db),
 ):
-    """Get temperature time series data, downsampled to max_points."""
-    query = db.query(
-        reading_model.Reading.device_id,
-        reading_model.Reading.timestamp,
-        reading_model.Reading.temperature_c,
-        device_model.Device.name.label("device_name"),
-    ).join(device_model.Device)
-    
-    # Filters
-    if from_dt:
-        try:
-            from_date = datetime.fromisoformat(from_dt.replace("Z", "+00:00"))
-            query = query.filter(reading_model.Reading.timestamp >= from_date)
-        except Exception:
-            pass
-    
-    if to_dt:
-        try:
-            to_date = datetime.fromisoformat(to_dt.replace("Z", "+00:00"))
-            query = query.filter(reading_model.Reading.timestamp <= to_date)
-        except Exception:
-            pass
+    """
+    Get temperature time series data (all depths pooled per device),
+    at most max_points per device.
+    """
+    format = _series_format(request, format)
+    device_ids = _normalized_ids(device_ids)
+    from_date, to_date = parse_iso(from_dt), parse_iso(to_dt)
+    key_from, key_to = _snap_series_range(from_date, to_date, max_points)
+    params = {
+        "from": key_from, "to": key_to, "device_ids": device_ids,
+        "max_points": max_points, "downsample": downsample, "format": format,
+    }
+    etag = check_etag(request, db, device_ids, params=params)
     
-    if device_ids:
-        query = query.filter(reading_model.Reading.device_id.in_(device_ids))
+    def compute() -> Response:
+        series = _series_for(
+            db, "temp", ["device_id"], device_ids, None,
+            from_date, to_date, max_points, downsample, format != "points",
+        )
+        names = _device_names(db, [device_id for (device_id,) in series])
+        return _series_response([
+            _series_entry({
+                "device_id": device_id,
+                "device_name": names.get(device_id, f"Device {device_id}"),
+            }, data, format)
+            for (device_id,), data in series.items()
+        ], format)
     
-    query = query.order_by(reading_model.Reading.timestamp)
-    rows = query.all()
+    return cached_response(etag, compute, device_ids)
+
+
+@router.get("/series")
+def metrics_series(
+    request: Request,
+    from_dt: Optional[str] = Query(None, alias="from"),
+    to_dt: Optional[str] = Query(None, alias="to"),
+    device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
+    depths: Optional[List[float]] = Query(None, alias="depths[]"),
+    metrics: List[Metric] = Query(["moisture", "temp"], alias="metrics[]"),
+    max_points: int = Query(800, alias="max_points", ge=3, le=10000),
+    downsample: MultiSeriesMode = Query("bucket"),
+    format: SeriesFormat = Query("points"),
+    db: Session = Depends(get_db),
+):
+    """
+    Several metrics per (device, depth) from one pass over the data, on a
+    shared time axis: "<metric>" (avg), "<metric>_min" and "<metric>_max"
+    per bucket, at most max_points buckets. Covers moisture-series and
+    temp-series in one request; temperature is per depth here.
+    """
+    format = _series_format(request, format)
+    device_ids = _normalized_ids(device_ids)
+    depths = _normalized_ids(depths)
+    metrics = sorted(set(metrics))
+    from_date, to_date = parse_iso(from_dt), parse_iso(to_dt)
+    key_from, key_to = _snap_series_range(from_date, to_date, max_points)
+    params = {
+        "from": key_from, "to": key_to, "device_ids": device_ids, "depths": depths, "metrics": metrics,
+        "max_points": max_points, "downsample": downsample, "format": format,
+    }
+    # Depletion depends on device configs, which change with status
+    etag = check_etag(request, db, device_ids, status="depletion" in metrics, params=params)
     
-    # Group by device_id
-    series = {}
-    for row in rows:
-        if row.temperature_c is None:
-            continue
-        key = str(row.device_id)
-        if key not in series:
-            series[key] = {
-                "device_id": row.device_id,
-                "device_name": row.device_name or f"Device {row.device_id}",
-                "points": [],
+    def compute() -> Response:
+        selected = _selected_depths(db, device_ids, depths)
+        if not selected:
+            return _series_response([], format)
+        
+        queried = [m for m in ("moisture", "temp") if m in metrics]
+        if "depletion" in metrics and "moisture" not in queried:
+            queried.insert(0, "moisture")
+        series, _ = _multi_series(
+            db, queried, device_ids, selected, from_date, to_date, max_points, downsample
+        )
+        if "depletion" in metrics:
+            _add_depletion(db, series)
+        
+        names = _device_names(db, [device_id for device_id, _ in series])
+        entries = []
+        for (device_id, depth_cm), columns in series.items():
+            columns = {
+                name: column for name, column in columns.items()
+                if name == "t" or name.split("_", 1)[0] in metrics
             }
-        series[key]["points"].append({
-            "t": row.timestamp.isoformat(),
-            "v": round(row.temperature_c, 2),
-        })
-    
-    # Downsample each series
-    result = []
-    for key, data in series.items():
-        if len(data["points"]) > max_points:
-            data["points"] = _downsample_readings(data["points"], max_points)
-        result.append({
-            "device_id": data["device_id"],
-            "device_name": data["device_name"],
-            "points": data["points"],
-        })
+            entries.append(_series_entry({
+                "device_id": device_id,
+                "depth_cm": depth_cm,
+                "device_name": names.get(device_id, f"Device {device_id}"),
+            }, _column_points(columns) if format == "points" else columns, format))
+        return _series_response(entries, format)
     
-    return result
+    return cached_response(etag, compute, device_ids)
 
+
+@router.get("/heatmap")
+def moisture_heatmap(
+    request: Request,
+    device_id: int = Query(...),
+    from_dt: Optional[str] = Query(None, alias="from"),
+    to_dt: Optional[str] = Query(None, alias="to"),
+    max_buckets: int = Query(200, ge=3, le=2000),
+    interpolate: bool = Query(False),
+    db: Session = Depends(get_db),
+):
+    """
+    Soil-profile heatmap for one device: mean VWC per depth and time bucket
+    as a dense matrix, flattened row-major into "values" (a row per entry of
+    "depths", a column per entry of "t"). Cells without readings are null,
+    unless interpolate fills the gaps linearly in time within each depth.
+    """
+    if db.get(device_model.Device, device_id) is None:
+        raise HTTPException(status_code=404, detail="Device not found")
+    from_date, to_date = parse_iso(from_dt), parse_iso(to_dt)
+    key_from, key_to = _snap_series_range(from_date, to_date, max_buckets)
+    params = {
+        "device_id": device_id, "from": key_from, "to": key_to,
+        "max_buckets": max_buckets, "interpolate": interpolate,
+    }
+    etag = check_etag(request, db, [device_id], params=params)
+    
+    def compute() -> Response:
+        depths = _selected_depths(db, [device_id], None)
+        series, width = _multi_series(
+            db, ["moisture"], [device_id], depths, from_date, to_date, max_buckets, "bucket"
+        )
+        body = {
+            "device_id": device_id,
+            "device_name": _device_names(db, [device_id]).get(device_id),
+            "depths": depths,
+            "width": width,
+            "t": [],
+            "values": [],
+        }
+        if not series:
+            return FastJSONResponse(body)
+        
+        # Dense time axis: every bucket of the requested range (or of the data when open-ended)
+        starts = np.concatenate([columns["t"] for columns in series.values()])
+        first = int(_epoch_seconds([floor_to(from_date, width)])[0]) if from_date else int(starts.min())
+        last = int(_epoch_seconds([floor_to(to_date, width)])[0]) if to_date else int(starts.max())
+        # Flooring both ends to the width can add a partial column; keep the newest max_buckets
+        first = max(first, last - (max_buckets - 1) * width)
+        t = np.arange(first, last + width, width, dtype=np.int64)
+        
+        grid = np.full((len(depths), len(t)), np.nan)
+        row_of = {depth: i for i, depth in enumerate(depths)}
+        for (_, depth), columns in series.items():
+            if depth not in row_of:
+                continue
+            col = (columns["t"] - first) // width
+            inside = (col >= 0) & (col < len(t))
+            grid[row_of[depth], col[inside]] = columns["moisture"][inside]
+        if interpolate:
+            grid = np.array([_fill_gaps(row) for row in grid]).reshape(grid.shape)
+        
+        return FastJSONResponse({**body, "t": t, "values": np.round(grid, 2).ravel()})
+    
+    return cached_response(etag, compute, [device_id])
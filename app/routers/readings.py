@@ -1,34 +1,118 @@
 # api/app/routers/readings.py
-from fastapi import APIRouter, Depends
+import base64
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.settings import settings
+from app.routers.common import parse_iso
 from app.models import reading as reading_model
 from app.models import device as device_model
 from app.models import message as message_model
+from app.services import export
 
 router = APIRouter(prefix="/v1/readings", tags=["readings"])
 
+# Hard cap on a /latest page; walk further with the cursor
+LATEST_PAGE_MAX = 500
+
+
+def _encode_cursor(timestamp: datetime, reading_id: int) -> str:
+    raw = f"{timestamp.isoformat()}|{reading_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, reading_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), int(reading_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/latest")
-def latest_readings(limit: int = 50, db: Session = Depends(get_db)):
+def latest_readings(
+    limit: int = Query(50, ge=1, le=LATEST_PAGE_MAX),
+    cursor: Optional[str] = Query(None),
+    device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
+    depths: Optional[List[float]] = Query(None, alias="depths[]"),
+    db: Session = Depends(get_db),
+):
     """
-    Return the most recent readings with device + message context.
+    Return the most recent readings with device + message context, newest first.
+    Pages are keyset-paginated on (timestamp, id): pass next_cursor back as
+    cursor for the next page (null on the last one). Each page is an index
+    range scan starting at the cursor, so deep pages cost the same as the first.
     """
+    Reading = reading_model.Reading
+    page = db.query(
+        Reading.id, Reading.timestamp, Reading.depth_cm, Reading.moisture_pct,
+        Reading.temperature_c, Reading.device_id, Reading.message_id,
+    )
+    if cursor:
+        after_ts, after_id = _decode_cursor(cursor)
+        page = page.filter(
+            Reading.timestamp <= after_ts,  # implied by the row comparison; lets Postgres prune partitions
+            tuple_(Reading.timestamp, Reading.id) < tuple_(after_ts, after_id),
+        )
+    if device_ids:
+        page = page.filter(Reading.device_id.in_(device_ids))
+    if depths:
+        page = page.filter(Reading.depth_cm.in_(depths))
+    # One extra row tells whether another page exists
+    page = page.order_by(Reading.timestamp.desc(), Reading.id.desc()).limit(limit + 1).subquery()
+
+    # Device / message context joined onto the page only
     q = (
         db.query(
-            reading_model.Reading.id.label("reading_id"),
-            reading_model.Reading.timestamp,
-            reading_model.Reading.depth_cm,
-            reading_model.Reading.moisture_pct,
-            reading_model.Reading.temperature_c,
+            page.c.id.label("reading_id"),
+            page.c.timestamp,
+            page.c.depth_cm,
+            page.c.moisture_pct,
+            page.c.temperature_c,
             device_model.Device.id.label("device_id"),
             device_model.Device.esn,
             device_model.Device.name.label("device_name"),
             message_model.Message.message_id.label("message_external_id"),
         )
-        .join(device_model.Device, device_model.Device.id == reading_model.Reading.device_id)
-        .join(message_model.Message, message_model.Message.id == reading_model.Reading.message_id)
-        .order_by(reading_model.Reading.timestamp.desc())
-        .limit(limit)
+        .join(device_model.Device, device_model.Device.id == page.c.device_id)
+        .join(message_model.Message, message_model.Message.id == page.c.message_id)
+        .order_by(page.c.timestamp.desc(), page.c.id.desc())
     )
     rows = [dict(r._mapping) for r in q.all()]
-    return {"count": len(rows), "items": rows}
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["timestamp"], rows[-1]["reading_id"])
+    return {"count": len(rows), "items": rows, "next_cursor": next_cursor}
+
+
+@router.get("/export")
+def export_readings(
+    format: export.ExportFormat = Query("arrow"),
+    device_ids: Optional[List[int]] = Query(None, alias="device_ids[]"),
+    from_dt: Optional[str] = Query(None, alias="from"),
+    to_dt: Optional[str] = Query(None, alias="to"),
+):
+    """
+    Stream raw readings for a device set and time range as Arrow IPC
+    (format=arrow, read with pyarrow.ipc.open_stream) or Parquet.
+    Batches of EXPORT_BATCH_SIZE rows come straight off a server-side cursor.
+    """
+    if not export.available():
+        raise HTTPException(status_code=501, detail="Export needs pyarrow installed on the server")
+
+    from_date, to_date = parse_iso(from_dt), parse_iso(to_dt)
+    filename = f"readings.{export.EXTENSIONS[format]}"
+    return StreamingResponse(
+        export.stream_readings(
+            format, sorted(set(device_ids)) if device_ids else None, from_date, to_date,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        ),
+        media_type=export.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
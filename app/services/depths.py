@@ -0,0 +1,113 @@
+# api/app/services/depths.py
+"""
+Per-device depth catalog.
+
+Ingest calls record_depths() for every message so the device_depth table
+lists exactly the depths each probe reports. Readers (status engine, series
+endpoints, UI depth filter) go through get_device_depths() /
+get_depths_for_devices(), which are backed by a small in-process TTL cache.
+"""
+from __future__ import annotations
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.settings import settings
+from app.models import DeviceDepth
+
+_cache: dict[int, tuple[float, tuple[float, ...]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_get(device_id: int) -> Optional[tuple[float, ...]]:
+    with _cache_lock:
+        hit = _cache.get(device_id)
+    if hit is None or hit[0] < time.monotonic():
+        return None
+    return hit[1]
+
+
+def _cache_put(device_id: int, depths: Iterable[float]) -> None:
+    expires = time.monotonic() + settings.DEPTH_CACHE_TTL_SEC
+    with _cache_lock:
+        _cache[device_id] = (expires, tuple(sorted(set(depths))))
+
+
+def invalidate_depth_cache(device_id: Optional[int] = None) -> None:
+    with _cache_lock:
+        if device_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(device_id, None)
+
+
+def get_depths_for_devices(db: Session, device_ids: Iterable[int]) -> dict[int, tuple[float, ...]]:
+    """Return {device_id: sorted depths}; one query for all cache misses."""
+    result: dict[int, tuple[float, ...]] = {}
+    missing: list[int] = []
+    for device_id in set(device_ids):
+        cached = _cache_get(device_id)
+        if cached is None:
+            missing.append(device_id)
+        else:
+            result[device_id] = cached
+
+    if missing:
+        loaded: dict[int, list[float]] = {device_id: [] for device_id in missing}
+        rows = (
+            db.query(DeviceDepth.device_id, DeviceDepth.depth_cm)
+            .filter(DeviceDepth.device_id.in_(missing))
+            .all()
+        )
+        for device_id, depth_cm in rows:
+            loaded[device_id].append(float(depth_cm))
+        for device_id, depths in loaded.items():
+            _cache_put(device_id, depths)
+            result[device_id] = tuple(sorted(depths))
+
+    return result
+
+
+def get_device_depths(db: Session, device_id: int) -> tuple[float, ...]:
+    """Sorted depths (cm) this device has reported."""
+    return get_depths_for_devices(db, [device_id])[device_id]
+
+
+def get_all_depths(db: Session) -> list[float]:
+    """Distinct depths across the whole fleet (for UI filters with no device selected)."""
+    rows = db.query(DeviceDepth.depth_cm).distinct().order_by(DeviceDepth.depth_cm).all()
+    return [float(r[0]) for r in rows]
+
+
+def record_depths(
+    db: Session, device_id: int, depths: Iterable[float], seen_at: Optional[datetime] = None
+) -> None:
+    """
+    Upsert catalog rows for depths seen in one message. Called by ingest inside
+    its transaction (no commit here).
+    """
+    depths = {float(d) for d in depths if d is not None}
+    if not depths:
+        return
+    seen_at = seen_at or datetime.utcnow()
+
+    existing = {
+        row.depth_cm: row
+        for row in db.query(DeviceDepth).filter(
+            DeviceDepth.device_id == device_id, DeviceDepth.depth_cm.in_(depths)
+        )
+    }
+    for depth in depths:
+        row = existing.get(depth)
+        if row is None:
+            db.add(DeviceDepth(device_id=device_id, depth_cm=depth, first_seen=seen_at, last_seen=seen_at))
+        elif row.last_seen is None or seen_at > row.last_seen:
+            row.last_seen = seen_at
+
+    known = _cache_get(device_id)
+    if known is None or not depths.issubset(known):
+        # New depth (or cold cache): drop the entry so the next read reloads it
+        invalidate_depth_cache(device_id)
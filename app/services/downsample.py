@@ -0,0 +1,114 @@
+# api/app/services/downsample.py
+"""
+Visual downsampling for time series charts.
+
+Both algorithms take sorted timestamps `t` (any numeric unit, e.g. epoch
+seconds) and values `v` as NumPy arrays and return the *indices* of the
+points to keep, so callers can carry extra columns along.
+
+- lttb_indices: Largest-Triangle-Three-Buckets (Steinarsson 2013). Keeps the
+  point of each bucket that forms the largest triangle with the previously
+  kept point and the next bucket's mean - preserves peaks, troughs and
+  irrigation steps that stride sampling drops.
+- m4_indices: M4 (Jugel et al. 2014). For equal-width time buckets keeps the
+  first, last, min and max point, so every spike survives exactly.
+"""
+from __future__ import annotations
+from typing import Literal
+
+import numpy as np
+
+DownsampleMethod = Literal["lttb", "m4"]
+
+
+def lttb_indices(t: np.ndarray, v: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the n_out points LTTB keeps (always includes first and last)."""
+    n = len(t)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Work relative to the first timestamp to keep the area products well-conditioned
+    x = np.asarray(t, dtype=np.float64) - float(t[0])
+    y = np.asarray(v, dtype=np.float64)
+
+    n_buckets = n_out - 2
+    # Bucket i covers [edges[i], edges[i+1]) over the interior points 1..n-2
+    edges = (np.arange(n_buckets + 1) * ((n - 2) / n_buckets)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    lengths = np.diff(edges)
+
+    # Mean of each bucket; the "next bucket" of the last bucket is the last point
+    sums_x = np.add.reduceat(x[:-1], edges[:-1])
+    sums_y = np.add.reduceat(y[:-1], edges[:-1])
+    avg_x = np.append(sums_x / lengths, x[-1])
+    avg_y = np.append(sums_y / lengths, y[-1])
+
+    # Pack every bucket into one padded (bucket, slot, [y, x, 1]) block so each
+    # step is a single small matmul. Padding repeats the bucket's first point,
+    # which can never beat the real point it duplicates.
+    width = int(lengths.max())
+    slot = np.minimum(np.arange(width)[None, :], (lengths - 1)[:, None])
+    idx = edges[:-1, None] + slot
+    block = np.stack([y[idx], x[idx], np.ones_like(x[idx])], axis=-1)
+
+    # Triangle area (x2) for candidate (px, py) given kept point a and next mean c:
+    #   |py*(ax - cx) + px*(cy - ay) + (cx*ay - ax*cy)|
+    # Scalars come from small .tolist() calls: NumPy scalar arithmetic would dominate
+    cxs, cys = avg_x.tolist(), avg_y.tolist()
+    coef = np.empty(3)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    ay, ax = float(y[0]), 0.0
+    for i in range(n_buckets):
+        cx, cy = cxs[i + 1], cys[i + 1]
+        coef[0] = ax - cx
+        coef[1] = cy - ay
+        coef[2] = cx * ay - ax * cy
+        j = int(np.abs(block[i] @ coef).argmax())
+        ay, ax, _ = block[i, j].tolist()
+        out[i + 1] = idx[i, j]
+    return out
+
+
+def m4_indices(t: np.ndarray, v: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices of the first/last/min/max point of each of n_out // 4 equal-width
+    time buckets. Below 4 points there is no whole bucket, so LTTB picks them.
+    """
+    n = len(t)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 4:
+        return lttb_indices(t, v, n_out)
+
+    x = np.asarray(t, dtype=np.float64)
+    y = np.asarray(v, dtype=np.float64)
+    n_buckets = n_out // 4
+    span = x[-1] - x[0]
+    if span <= 0:
+        return np.array([0, n - 1])
+
+    bucket = np.minimum(((x - x[0]) * (n_buckets / span)).astype(np.int64), n_buckets - 1)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], n]
+    counts = ends - starts
+
+    # First index in each bucket whose value equals the bucket min / max
+    seg_min = np.repeat(np.minimum.reduceat(y, starts), counts)
+    seg_max = np.repeat(np.maximum.reduceat(y, starts), counts)
+    min_hits = np.flatnonzero(y == seg_min)
+    max_hits = np.flatnonzero(y == seg_max)
+    i_min = min_hits[np.searchsorted(min_hits, starts)]
+    i_max = max_hits[np.searchsorted(max_hits, starts)]
+
+    return np.unique(np.concatenate([starts, ends - 1, i_min, i_max]))
+
+
+def downsample_indices(
+    t: np.ndarray, v: np.ndarray, n_out: int, method: DownsampleMethod = "lttb"
+) -> np.ndarray:
+    """Dispatch to the selected algorithm."""
+    if method == "m4":
+        return m4_indices(t, v, n_out)
+    return lttb_indices(t, v, n_out)
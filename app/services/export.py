@@ -0,0 +1,144 @@
+# api/app/services/export.py
+"""
+Bulk export of readings as Apache Arrow IPC (stream format) or Parquet.
+
+Rows come off a server-side cursor (stream_results) yield_per rows at a time;
+each chunk becomes one Arrow RecordBatch (one Parquet row group) and the
+bytes the writer emits for it are handed to the response right away, so an
+export never sits in memory as a whole. Both formats are zstd-compressed
+column by column. Rows are ordered by reading id (primary key), which
+streams without a sort.
+
+pyarrow is optional: without it available() is False and the endpoint answers 501.
+"""
+from __future__ import annotations
+import io
+from datetime import datetime
+from typing import Iterator, Literal, Optional, Sequence
+
+from sqlalchemy import select
+
+from app.db.session import engine
+from app.models import Device, Reading
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:
+    pa = None
+    pq = None
+
+ExportFormat = Literal["arrow", "parquet"]
+
+MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+EXTENSIONS = {"arrow": "arrows", "parquet": "parquet"}
+
+COMPRESSION = "zstd"
+
+
+def available() -> bool:
+    return pa is not None
+
+
+def schema():
+    return pa.schema([
+        ("reading_id", pa.int64()),
+        ("device_id", pa.int32()),
+        ("esn", pa.string()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("depth_cm", pa.float64()),
+        ("moisture_pct", pa.float64()),
+        ("temperature_c", pa.float64()),
+    ])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what was written since the last drain()."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # Parquet records absolute offsets in its footer
+        return self._pos
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+def _statement(
+    device_ids: Optional[Sequence[int]],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+):
+    stmt = (
+        select(
+            Reading.id, Reading.device_id, Device.esn, Reading.timestamp,
+            Reading.depth_cm, Reading.moisture_pct, Reading.temperature_c,
+        )
+        .join(Device, Device.id == Reading.device_id)
+        .order_by(Reading.id)
+    )
+    if device_ids:
+        stmt = stmt.where(Reading.device_id.in_(device_ids))
+    if from_date is not None:
+        stmt = stmt.where(Reading.timestamp >= from_date)
+    if to_date is not None:
+        stmt = stmt.where(Reading.timestamp <= to_date)
+    return stmt
+
+
+def _record_batch(rows: Sequence, schema_):
+    columns = list(zip(*rows))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(col, type=field.type) for col, field in zip(columns, schema_)],
+        schema=schema_,
+    )
+
+
+def stream_readings(
+    format: ExportFormat,
+    device_ids: Optional[Sequence[int]] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    batch_size: int = 50_000,
+) -> Iterator[bytes]:
+    """
+    Yield the encoded export chunk by chunk. Uses its own connection: the
+    request's session is closed before a streaming body is sent.
+    """
+    schema_ = schema()
+    sink = _ChunkSink()
+    if format == "parquet":
+        writer = pq.ParquetWriter(sink, schema_, compression=COMPRESSION)
+    else:
+        writer = pa.ipc.new_stream(
+            sink, schema_, options=pa.ipc.IpcWriteOptions(compression=COMPRESSION)
+        )
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            _statement(device_ids, from_date, to_date)
+        )
+        for rows in result.partitions():
+            writer.write_batch(_record_batch(rows, schema_))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    writer.close()
+    yield sink.drain()
@@ -0,0 +1,186 @@
+# api/app/services/farm_aggregate.py
+"""
+Per-farm aggregates (farm_aggregate), so /v1/farms reads one small table.
+
+A farm is the set of devices sharing a farm_slug: their proximity cluster
+(services/farm_clusters.py), or Device.location for unlocated ones. A row
+holds the device count, worst status, attention count, latest reading and
+centroid, and is recomputed per farm from devices, configs and status
+snapshots (summarize_farms):
+
+- by the status scheduler, for farms whose devices changed status or
+  last_seen in the run and farms that have no row yet;
+- when an app session commits new or deleted devices, a changed location
+  or cluster, a changed config lat/lon or a renamed cluster (session hooks
+  at the bottom).
+
+Snapshots are used whatever their age (the scheduler refreshes them and
+then these rows); devices without one get their status computed live.
+Each scheduler run also stamps every row's updated_at; /v1/farms falls back
+to live aggregation once any row is older than STATUS_SNAPSHOT_MAX_AGE_SEC
+(no scheduler running).
+"""
+from __future__ import annotations
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, selectinload
+
+from app.db.session import SessionLocal
+from app.models import Device, DeviceConfig, DeviceStatusSnapshot, FarmAggregate, FarmCluster
+from app.models.device import location_slug
+from app.services.status import compute_status_batch
+
+ATTENTION_STATUSES = ("red", "amber", "stale", "offline")
+
+# Farm status is the worst device status; unlike severity_order, "no data" outranks healthy
+_FARM_PRIORITY = {"red": 0, "amber": 1, "stale": 2, "offline": 3, "gray": 4, "blue": 5, "green": 6}
+
+
+def worst_status(statuses: list[str]) -> str:
+    """Get the worst status from a list of statuses."""
+    if not statuses:
+        return "gray"
+    return min(statuses, key=lambda s: _FARM_PRIORITY.get(s, 99))
+
+
+def summarize_farms(devices: Iterable[Device], statuses: dict[int, dict]) -> dict[str, dict]:
+    """
+    {farm_slug: FarmAggregate fields} for the given devices (configs and
+    farm clusters loaded) and their {device_id: status_info} (needs "status"
+    and "last_seen").
+    """
+    farms: dict[str, dict] = {}
+    for device in devices:
+        farm = farms.setdefault(device.farm_slug, {
+            "name": device.farm_name,
+            "statuses": [],
+            "last_reading_at": None,
+            "lats": [],
+            "lons": [],
+        })
+        status_info = statuses[device.id]
+        farm["statuses"].append(status_info["status"])
+        last_seen = status_info["last_seen"]
+        if last_seen is not None and (farm["last_reading_at"] is None or last_seen > farm["last_reading_at"]):
+            farm["last_reading_at"] = last_seen
+        config = device.config
+        if config and config.lat is not None and config.lon is not None:
+            farm["lats"].append(config.lat)
+            farm["lons"].append(config.lon)
+
+    return {
+        slug: {
+            "name": farm["name"],
+            "device_count": len(farm["statuses"]),
+            "status": worst_status(farm["statuses"]),
+            "attention_count": sum(1 for s in farm["statuses"] if s in ATTENTION_STATUSES),
+            "last_reading_at": farm["last_reading_at"],
+            "lat": sum(farm["lats"]) / len(farm["lats"]) if farm["lats"] else None,
+            "lon": sum(farm["lons"]) / len(farm["lons"]) if farm["lons"] else None,
+        }
+        for slug, farm in farms.items()
+    }
+
+
+def refresh_farm_aggregates(db: Session, slugs: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute the farm_aggregate rows of the given farms (every farm when
+    None) in the caller's transaction; farms left without devices are
+    removed. Returns the number of farms written.
+    """
+    devices = db.query(Device).options(selectinload(Device.config), selectinload(Device.farm_cluster))
+    existing = db.query(FarmAggregate)
+    if slugs is not None:
+        slugs = set(slugs)
+        if not slugs:
+            return 0
+        devices = devices.filter(Device.farm_slug.in_(slugs))
+        existing = existing.filter(FarmAggregate.farm_slug.in_(slugs))
+    devices = devices.all()
+    existing = {row.farm_slug: row for row in existing}
+
+    snaps = (
+        db.query(DeviceStatusSnapshot.device_id, DeviceStatusSnapshot.status, DeviceStatusSnapshot.last_seen)
+        .filter(DeviceStatusSnapshot.device_id.in_([d.id for d in devices]))
+        .all()
+    ) if devices else []
+    statuses = {device_id: {"status": status, "last_seen": last_seen} for device_id, status, last_seen in snaps}
+    missing = [d for d in devices if d.id not in statuses]
+    if missing:
+        statuses.update(compute_status_batch(db, missing))
+
+    now = datetime.utcnow()
+    farms = summarize_farms(devices, statuses)
+    for slug, fields in farms.items():
+        row = existing.pop(slug, None)
+        if row is None:
+            row = FarmAggregate(farm_slug=slug)
+            db.add(row)
+        for name, value in fields.items():
+            setattr(row, name, value)
+        row.updated_at = now
+    for row in existing.values():
+        db.delete(row)
+    return len(farms)
+
+
+def farms_without_aggregate(db: Session) -> set[str]:
+    """Farm slugs that have devices but no farm_aggregate row yet."""
+    rows = (
+        db.query(Device.farm_slug)
+        .outerjoin(FarmAggregate, FarmAggregate.farm_slug == Device.farm_slug)
+        .filter(FarmAggregate.farm_slug.is_(None))
+        .distinct()
+        .all()
+    )
+    return {slug for (slug,) in rows}
+
+
+# ---- session hooks ------------------------------------------------------------
+
+_PENDING = "farm_aggregate.pending"
+
+
+def _touched_farms(session: Session) -> set[str]:
+    """Farms whose membership, name or centroid the pending changes affect."""
+    slugs: set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Device):
+            if obj in session.new or obj in session.deleted:
+                slugs.add(obj.farm_slug or location_slug(obj.location))
+                continue
+            history = inspect(obj).attrs.farm_slug.history
+            slugs.update(slug for slug in (*history.deleted, *history.added) if slug)
+        elif isinstance(obj, FarmCluster):
+            if obj in session.dirty and inspect(obj).attrs.name.history.has_changes():
+                slugs.add(obj.slug)
+        elif isinstance(obj, DeviceConfig):
+            attrs = inspect(obj).attrs
+            moved = attrs.lat.history.has_changes() or attrs.lon.history.has_changes()
+            if obj in session.new or obj in session.deleted or moved:
+                device = session.get(Device, obj.device_id)
+                if device is not None:
+                    slugs.add(device.farm_slug or location_slug(device.location))
+    return slugs
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _collect_touched_farms(session: Session, flush_context, instances) -> None:
+    slugs = _touched_farms(session)
+    if slugs:
+        session.info.setdefault(_PENDING, set()).update(slugs)
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _refresh_touched_farms(session: Session) -> None:
+    session.flush()
+    slugs = session.info.pop(_PENDING, None)
+    if slugs:
+        refresh_farm_aggregates(session, slugs)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_touched_farms(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,237 @@
+# api/app/services/farm_clusters.py
+"""
+Proximity farm grouping.
+
+Located devices (DeviceConfig lat/lon) are grouped by position instead of
+their free-text location: two devices closer than FARM_CLUSTER_RADIUS_M
+share a farm, and so does everything chained through such neighbours
+(DBSCAN with min_samples=1). Points are bucketed into a grid of radius-sized
+cells, so only pairs in neighbouring cells are measured, then merged with
+union-find.
+
+Each group is a FarmCluster row; member devices point at it through the
+indexed Device.farm_cluster_id and take its slug as farm_slug, which is what
+the farm views and farm_aggregate key on. The slug is the location slug of
+the members' most common location ("field-a"), so farm ids from before
+clustering keep working; a second cluster with that location gets
+"field-a-2" / "Field A (2)". A cluster keeps its slug while its most common
+location stays the same. Devices without coordinates keep their
+location-based farm.
+
+recluster_farms() recomputes either everything or only the neighbourhood of
+the given devices (the farm clusterer job passes the devices whose config
+changed since its last run). Cluster ids stay stable: a group keeps the id
+most of its members already had; a split leaves the id with the larger part.
+"""
+from __future__ import annotations
+import math
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import Device, DeviceConfig, FarmCluster
+from app.models.device import location_slug
+from app.services.geo import devices_in_bbox
+from app.settings import settings
+
+EARTH_RADIUS_M = 6_371_000.0
+METERS_PER_DEG_LAT = 111_320.0
+# Longitude cells are sized for the highest latitude in the set; past this they would get huge
+MAX_GRID_LAT = 80.0
+# Name of clusters whose members have no location
+UNNAMED_FARM = "Farm"
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))
+
+
+def proximity_groups(points: list[tuple[int, float, float]], radius_m: float) -> list[list[int]]:
+    """
+    Partition (device_id, lat, lon) points into groups chained by distances
+    below radius_m. Grid cells are at least radius_m on each side, so every
+    pair within reach sits in the same or an adjacent cell.
+    """
+    if not points:
+        return []
+    cell_lat = radius_m / METERS_PER_DEG_LAT
+    max_lat = min(MAX_GRID_LAT, max(abs(lat) for _, lat, _ in points))
+    cell_lon = radius_m / (METERS_PER_DEG_LAT * math.cos(math.radians(max_lat)))
+
+    cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for i, (_, lat, lon) in enumerate(points):
+        cells[(math.floor(lat / cell_lat), math.floor(lon / cell_lon))].append(i)
+
+    parent = list(range(len(points)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for (row, col), members in cells.items():
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                others = cells.get((row + d_row, col + d_col))
+                if not others:
+                    continue
+                for i in members:
+                    _, lat_i, lon_i = points[i]
+                    for j in others:
+                        if j <= i or find(i) == find(j):
+                            continue
+                        _, lat_j, lon_j = points[j]
+                        if haversine_m(lat_i, lon_i, lat_j, lon_j) <= radius_m:
+                            parent[find(j)] = find(i)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i, (device_id, _, _) in enumerate(points):
+        groups[find(i)].append(device_id)
+    return list(groups.values())
+
+
+def _has_base(slug: str, base: str) -> bool:
+    """slug is base or base-<n>."""
+    return slug == base or (slug.startswith(base + "-") and slug[len(base) + 1:].isdigit())
+
+
+def _name_cluster(cluster: FarmCluster, members: list[Device], taken: set[str]) -> None:
+    """
+    Set slug and name from the members' most common location, keeping the
+    current slug if it already has that base; taken holds the slugs in use.
+    """
+    locations = Counter(d.location for d in members if d.location)
+    location = min(locations, key=lambda n: (-locations[n], n)) if locations else UNNAMED_FARM
+    base = location_slug(location)
+    if not (cluster.slug and _has_base(cluster.slug, base)):
+        n = 1
+        while (base if n == 1 else f"{base}-{n}") in taken:
+            n += 1
+        cluster.slug = base if n == 1 else f"{base}-{n}"
+        taken.add(cluster.slug)
+    suffix = cluster.slug[len(base) + 1:]
+    cluster.name = f"{location} ({suffix})" if suffix else location
+
+
+def _located(device: Device) -> bool:
+    config = device.config
+    return config is not None and config.lat is not None and config.lon is not None
+
+
+def _nearby(db: Session, devices: list[Device], radius_m: float) -> dict[int, Device]:
+    """Located devices (configs loaded) within roughly radius_m of the given located ones."""
+    found: dict[int, Device] = {}
+    d_lat = radius_m / METERS_PER_DEG_LAT
+    for device in devices:
+        lat, lon = device.config.lat, device.config.lon
+        d_lon = radius_m / (METERS_PER_DEG_LAT * max(0.01, math.cos(math.radians(lat))))
+        bbox = (
+            (lon - d_lon + 180) % 360 - 180,
+            max(-90.0, lat - d_lat),
+            (lon + d_lon + 180) % 360 - 180,
+            min(90.0, lat + d_lat),
+        )
+        found.update((n.id, n) for n in devices_in_bbox(db, bbox))
+    return found
+
+
+def recluster_farms(db: Session, device_ids: Optional[Iterable[int]] = None) -> dict:
+    """
+    Regroup located devices in the caller's transaction: all of them when
+    device_ids is None, else those devices plus every cluster they leave,
+    join or bridge. Returns counts of devices regrouped, clusters written
+    and devices whose farm (cluster or slug) changed.
+    """
+    radius_m = settings.FARM_CLUSTER_RADIUS_M
+    query = db.query(Device).options(selectinload(Device.config))
+
+    if device_ids is None:
+        devices = query.all()
+        clusters = {c.id: c for c in db.query(FarmCluster)}
+    else:
+        changed = query.filter(Device.id.in_(set(device_ids))).all() if device_ids else []
+        if not changed:
+            return {"devices": 0, "clusters": 0, "reassigned": 0}
+        # Every cluster a changed device leaves or may join (or bridge), with all its members
+        nearby = _nearby(db, [d for d in changed if _located(d)], radius_m)
+        touched = {d.farm_cluster_id for d in (*changed, *nearby.values()) if d.farm_cluster_id is not None}
+        clusters = {c.id: c for c in db.query(FarmCluster).filter(FarmCluster.id.in_(touched))} if touched else {}
+        members = query.filter(Device.farm_cluster_id.in_(clusters)).all() if clusters else []
+        devices = list({d.id: d for d in (*changed, *members, *nearby.values())}.values())
+
+    # Every slug in use, including clusters outside this run; freed ones are not reused until the next run
+    taken = {slug for (slug,) in db.query(FarmCluster.slug)}
+    by_id = {d.id: d for d in devices}
+    points = [(d.id, d.config.lat, d.config.lon) for d in devices if _located(d)]
+    groups = sorted(proximity_groups(points, radius_m), key=lambda g: (-len(g), min(g)))
+
+    reassigned = 0
+    kept: set[int] = set()
+    now = datetime.utcnow()
+    for group in groups:
+        members = [by_id[device_id] for device_id in group]
+        previous = Counter(
+            d.farm_cluster_id for d in members
+            if d.farm_cluster_id in clusters and d.farm_cluster_id not in kept
+        )
+        if previous:
+            cluster_id = min(previous, key=lambda c: (-previous[c], c))
+            cluster = clusters[cluster_id]
+            _name_cluster(cluster, members, taken)
+        else:
+            cluster = FarmCluster(device_count=0)
+            _name_cluster(cluster, members, taken)
+            db.add(cluster)
+            db.flush()
+            clusters[cluster.id] = cluster
+        kept.add(cluster.id)
+
+        cluster.device_count = len(members)
+        cluster.lat = sum(d.config.lat for d in members) / len(members)
+        cluster.lon = sum(d.config.lon for d in members) / len(members)
+        cluster.updated_at = now
+        for device in members:
+            if device.farm_cluster_id != cluster.id or device.farm_slug != cluster.slug:
+                device.farm_cluster = cluster
+                reassigned += 1
+
+    for device in devices:
+        if not _located(device) and device.farm_cluster_id is not None:
+            device.farm_cluster = None
+            reassigned += 1
+    db.flush()
+    for cluster_id, cluster in clusters.items():
+        if cluster_id not in kept:
+            db.delete(cluster)
+    return {"devices": len(devices), "clusters": len(kept), "reassigned": reassigned}
+
+
+def devices_to_recluster(db: Session, since: datetime) -> set[int]:
+    """
+    Devices whose config changed after `since`, plus located devices not in
+    a cluster yet and clustered devices that lost their coordinates.
+    """
+    changed = {
+        device_id
+        for (device_id,) in db.query(DeviceConfig.device_id).filter(DeviceConfig.updated_at > since)
+    }
+    unclustered = (
+        db.query(Device.id)
+        .join(DeviceConfig, DeviceConfig.device_id == Device.id)
+        .filter(Device.farm_cluster_id.is_(None), DeviceConfig.lat.isnot(None), DeviceConfig.lon.isnot(None))
+    )
+    orphaned = (
+        db.query(Device.id)
+        .outerjoin(DeviceConfig, DeviceConfig.device_id == Device.id)
+        .filter(Device.farm_cluster_id.isnot(None), or_(DeviceConfig.lat.is_(None), DeviceConfig.lon.is_(None)))
+    )
+    return changed | {device_id for (device_id,) in unclustered} | {device_id for (device_id,) in orphaned}
@@ -0,0 +1,152 @@
+# api/app/services/geo.py
+"""
+Viewport queries and marker clustering for /v1/devices/map.
+
+Devices are placed by their DeviceConfig lat/lon. devices_in_bbox() returns
+the configured devices inside a bounding box:
+
+- Postgres: `point(lon, lat) <@ box(...)` served by the GiST index
+  ix_device_config_point (core geometric types, so PostGIS is not required);
+- other databases (SQLite dev): an in-process GridIndex of 1-degree cells,
+  rebuilt whenever device_config changes.
+
+cluster_markers() then buckets the hits into Web Mercator cells sized for
+the zoom level, so a response carries at most a few markers per map tile
+however many devices the viewport holds.
+"""
+from __future__ import annotations
+import math
+import threading
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, contains_eager
+
+from app.models import Device, DeviceConfig
+from app.services.status import severity_order
+
+# (west, south, east, north) in degrees; west > east crosses the antimeridian
+BBox = tuple[float, float, float, float]
+
+GRID_CELL_DEG = 1.0
+# Cluster cells per 256px tile edge, i.e. markers merge within ~64px
+CLUSTER_CELLS_PER_TILE = 4
+# Web Mercator is undefined at the poles
+MERCATOR_MAX_LAT = 85.05112878
+
+
+def split_antimeridian(bbox: BBox) -> list[BBox]:
+    west, south, east, north = bbox
+    if west <= east:
+        return [bbox]
+    return [(west, south, 180.0, north), (-180.0, south, east, north)]
+
+
+class GridIndex:
+    """Device ids bucketed by GRID_CELL_DEG cells of (lat, lon)."""
+
+    def __init__(self, points: Iterable[tuple[int, float, float]]) -> None:
+        self._cells: dict[tuple[int, int], list[tuple[int, float, float]]] = defaultdict(list)
+        for device_id, lat, lon in points:
+            self._cells[self._cell(lat, lon)].append((device_id, lat, lon))
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / GRID_CELL_DEG), math.floor(lon / GRID_CELL_DEG)
+
+    def query(self, bbox: BBox) -> list[int]:
+        ids = []
+        for west, south, east, north in split_antimeridian(bbox):
+            (row0, col0), (row1, col1) = self._cell(south, west), self._cell(north, east)
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    ids.extend(
+                        device_id for device_id, lat, lon in self._cells.get((row, col), ())
+                        if south <= lat <= north and west <= lon <= east
+                    )
+        return ids
+
+
+_grid: Optional[tuple[tuple, GridIndex]] = None
+_grid_lock = threading.Lock()
+
+
+def _grid_index(db: Session) -> GridIndex:
+    """The cached GridIndex, rebuilt when device_config rows are added, removed or updated."""
+    global _grid
+    version = tuple(db.query(func.count(DeviceConfig.device_id), func.max(DeviceConfig.updated_at)).one())
+    with _grid_lock:
+        if _grid is not None and _grid[0] == version:
+            return _grid[1]
+    rows = (
+        db.query(DeviceConfig.device_id, DeviceConfig.lat, DeviceConfig.lon)
+        .filter(DeviceConfig.lat.isnot(None), DeviceConfig.lon.isnot(None))
+        .all()
+    )
+    index = GridIndex(rows)
+    with _grid_lock:
+        _grid = (version, index)
+    return index
+
+
+def devices_in_bbox(db: Session, bbox: BBox) -> list[Device]:
+    """Devices whose configured coordinates fall inside bbox (configs loaded)."""
+    query = (
+        db.query(Device)
+        .join(DeviceConfig, DeviceConfig.device_id == Device.id)
+        .options(contains_eager(Device.config))
+    )
+    if db.get_bind().dialect.name != "postgresql":
+        ids = _grid_index(db).query(bbox)
+        return query.filter(Device.id.in_(ids)).all() if ids else []
+
+    point = func.point(DeviceConfig.lon, DeviceConfig.lat)
+    devices: list[Device] = []
+    for west, south, east, north in split_antimeridian(bbox):
+        box = func.box(func.point(west, south), func.point(east, north))
+        devices.extend(query.filter(point.op("<@")(box)).all())
+    return devices
+
+
+def mercator_cell(lat: float, lon: float, zoom: int) -> tuple[int, int]:
+    """Cluster cell of a coordinate at a zoom level (x right, y down, as map tiles)."""
+    cells = (1 << zoom) * CLUSTER_CELLS_PER_TILE
+    lat = max(-MERCATOR_MAX_LAT, min(MERCATOR_MAX_LAT, lat))
+    x = (lon + 180.0) / 360.0
+    y = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0
+    return min(int(x * cells), cells - 1), min(int(y * cells), cells - 1)
+
+
+def cluster_markers(devices: Iterable[Device], statuses: dict[int, dict], zoom: int) -> list[dict]:
+    """
+    One marker per occupied cell: member count, worst status (severity_order),
+    centroid and bounds. Single-device markers carry the device instead of bounds.
+    """
+    cells: dict[tuple[int, int], list[Device]] = defaultdict(list)
+    for device in devices:
+        cells[mercator_cell(device.config.lat, device.config.lon, zoom)].append(device)
+
+    markers = []
+    for (x, y), members in sorted(cells.items()):
+        lats = [d.config.lat for d in members]
+        lons = [d.config.lon for d in members]
+        status = min((statuses[d.id]["status"] for d in members), key=severity_order)
+        marker = {
+            "id": f"{zoom}/{x}/{y}",
+            "lat": sum(lats) / len(lats),
+            "lon": sum(lons) / len(lons),
+            "count": len(members),
+            "status": status,
+        }
+        if len(members) == 1:
+            device = members[0]
+            marker.update({
+                "device_id": device.id,
+                "alias": device.name or device.esn or f"Device {device.id}",
+                "last_seen": statuses[device.id]["last_seen"],
+            })
+        else:
+            marker["bounds"] = [[min(lats), min(lons)], [max(lats), max(lons)]]
+        markers.append(marker)
+    return markers
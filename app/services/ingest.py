@@ -10,6 +10,10 @@ import xmltodict
 from app.models import device as device_model
 from app.models import message as message_model
 from app.models import reading as reading_model
+from app.services.depths import record_depths
+from app.services.rollups import apply_readings
+from app.services.result_cache import invalidate_devices
+from app.services.watermark import bump_ingest
 
 # --- Guarded deps ---
 try:
@@ -48,6 +52,7 @@ def _persist_message(db: Session, device_id: int, message_id: str | None, raw_pa
 
 def _persist_readings(db: Session, device_id: int, message_id: int, readings: List[Dict[str, Any]]) -> int:
     saved = 0
+    new_readings: List[reading_model.Reading] = []
     for rec in readings:
         rd = reading_model.Reading(
             device_id=device_id,
@@ -58,7 +63,13 @@ def _persist_readings(db: Session, device_id: int, message_id: int, readings: Li
             timestamp=rec.get("timestamp") or datetime.utcnow(),
         )
         db.add(rd)
+        new_readings.append(rd)
         saved += 1
+    if new_readings:
+        db.flush()
+        record_depths(db, device_id, [r.depth_cm for r in new_readings])
+        apply_readings(db, new_readings)
+        bump_ingest(db, [device_id])
     return saved
 
 
@@ -167,6 +178,8 @@ def ingest_envelope(payload: Any, db: Session) -> dict:
                 saved = _persist_readings(db, device.id, msg.id, decoded)
 
         db.commit()
+        if saved:
+            invalidate_devices([device.id])
         note = "xml stored" + (", decoded" if saved else ", decoder pending")
         return {"status": "ok", "records_saved": saved, "note": note}
 
@@ -191,4 +204,6 @@ def ingest_envelope(payload: Any, db: Session) -> dict:
             saved += _persist_readings(db, device.id, msg.id, decoded)
 
     db.commit()
+    if saved:
+        invalidate_devices([device.id])
     return {"status": "ok", "records_saved": saved}
@@ -9,6 +9,10 @@ from datetime import datetime, timezone
 from app.models import device as device_model
 from app.models import message as message_model
 from app.models import reading as reading_model
+from app.services.depths import record_depths
+from app.services.rollups import apply_readings
+from app.services.result_cache import invalidate_devices
+from app.services.watermark import bump_ingest
 
 # Optional decoder imports (guarded)
 try:
@@ -260,6 +264,7 @@ def ingest_envelope(payload: Dict[str, Any], db: Session) -> Dict[str, Any]:
 
     # Try to decode hex payload into readings
     readings_saved = 0
+    new_readings: List[reading_model.Reading] = []
     if data.get("hex_payload"):
         decoded_readings = _try_decode_hex(data["hex_payload"])
         if decoded_readings:
@@ -290,6 +295,7 @@ def ingest_envelope(payload: Dict[str, Any], db: Session) -> Dict[str, Any]:
                 )
                 db.add(reading)
                 readings_saved += 1
+                new_readings.append(reading)
 
     # Create Reading if we have values from JSON, mapping to plausible columns
     if data.get("moisture") is not None or data.get("temp_c") is not None:
@@ -314,8 +320,18 @@ def ingest_envelope(payload: Dict[str, Any], db: Session) -> Dict[str, Any]:
             reading, ("depth_cm", "depth", "probe_depth_cm"), data.get("depth_cm", 0.0)
         )
         db.add(reading)
+        new_readings.append(reading)
+
+    if new_readings:
+        db.flush()  # populate reading timestamps
+        # Keep the depth catalog, hourly/daily rollups and ingest watermark current
+        record_depths(db, dev.id, [r.depth_cm for r in new_readings])
+        apply_readings(db, new_readings)
+        bump_ingest(db, [dev.id])
 
     db.commit()
+    if new_readings:
+        invalidate_devices([dev.id])
 
     # Get totals (three separate scalar queries)
     dcnt = db.query(func.count(device_model.Device.id)).scalar() or 0
@@ -0,0 +1,218 @@
+# api/app/services/neighbor_anomaly.py
+"""
+Neighbour-consensus anomaly score.
+
+_check_spike() only compares a probe with its own recent readings, so a
+sensor fault and a real irrigation event look the same. Here each located
+probe is compared with its NEIGHBOR_ANOMALY_K nearest probes in the same
+farm. Over the last NEIGHBOR_ANOMALY_WINDOW_HOURS of hourly rollups
+(reading_hourly), per depth:
+
+- trajectories are VWC changes per hour, so probes in wetter or drier
+  spots still agree when the field is irrigated or dries out. A probe
+  reporting every few hours gets the rate between consecutive readings
+  for each hour they span, as long as the gap is within STALE_FACTOR
+  times its cadence (expected_interval_min, or its mean spacing in the
+  window if that is longer); longer gaps are outages and stay missing;
+- consensus is the neighbours' median change per hour;
+- divergence is the mean absolute distance from consensus, for the probe
+  and for each neighbour;
+- score is the probe's divergence over its neighbours' median divergence
+  (floored at NEIGHBOR_ANOMALY_MIN_SCALE_PCT).
+
+So a score of 3 means "3x further from the consensus than its neighbours
+usually are". A probe's score is its worst depth. Probes without
+coordinates, or with fewer than two comparable neighbours, have no score.
+
+Everything is NumPy over (probe, neighbour, hour) blocks. Neighbours are an
+exact k-nearest search on unit-sphere coordinates, one farm at a time.
+Farms are proximity clusters (services/farm_clusters.py), so each search
+only covers a farm's own probes.
+"""
+from __future__ import annotations
+import warnings
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models import Device, DeviceConfig, DeviceStatusSnapshot, ReadingHourly
+from app.services.rollups import floor_to
+from app.services.watermark import bump_status
+from app.settings import settings
+
+# Hours of change a probe and its neighbours must both cover for a depth to be scored
+MIN_OVERLAP_HOURS = 3
+# Changes between actual readings a probe needs at a depth to be compared at all
+MIN_READING_CHANGES = 2
+# Cap on (rows x farm size) distance cells per k-nearest block
+KNN_BLOCK_CELLS = 1 << 22
+
+
+def is_anomalous(score: Optional[float]) -> bool:
+    return score is not None and score >= settings.NEIGHBOR_ANOMALY_THRESHOLD
+
+
+def unit_vectors(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """(n, 3) points on the unit sphere; chord order is great-circle order."""
+    phi, lam = np.radians(lat), np.radians(lon)
+    return np.stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)], axis=1)
+
+
+def nearest_in_groups(xyz: np.ndarray, groups: np.ndarray, k: int) -> np.ndarray:
+    """
+    (n, k) indices of each point's k nearest other points with the same group
+    code, nearest first; -1 pads groups with fewer than k + 1 points.
+    """
+    n = len(xyz)
+    out = np.full((n, k), -1, dtype=np.int64)
+    order = np.argsort(groups, kind="stable")
+    starts = np.flatnonzero(np.r_[True, groups[order][1:] != groups[order][:-1]])
+    for members in np.split(order, starts[1:]):
+        m = len(members)
+        if m < 2:
+            continue
+        k_eff = min(k, m - 1)
+        pts = xyz[members]
+        step = max(1, KNN_BLOCK_CELLS // m)
+        for lo in range(0, m, step):
+            block = pts[lo:lo + step]
+            d2 = ((block[:, None, :] - pts[None, :, :]) ** 2).sum(axis=2)
+            d2[np.arange(len(block)), np.arange(lo, lo + len(block))] = np.inf
+            nearest = np.argpartition(d2, k_eff - 1, axis=1)[:, :k_eff]
+            rank = np.argsort(np.take_along_axis(d2, nearest, axis=1), axis=1)
+            out[members[lo:lo + step], :k_eff] = members[np.take_along_axis(nearest, rank, axis=1)]
+    return out
+
+
+def hourly_rates(series: np.ndarray, max_gap: np.ndarray) -> np.ndarray:
+    """
+    (n, hours - 1) VWC change per hour from (n, hours) hourly values (NaN
+    where a probe did not report). Each hour between two consecutive
+    readings gets their rate, if they are at most max_gap ((n,) hours)
+    apart. For a probe reporting every hour this is np.diff(series).
+    """
+    n, hours = series.shape
+    cols = np.arange(hours)
+    has = ~np.isnan(series)
+    prev = np.maximum.accumulate(np.where(has, cols, -1), axis=1)[:, :-1]
+    nxt = np.minimum.accumulate(np.where(has, cols, hours)[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    gap = nxt - prev
+    ok = (prev >= 0) & (nxt < hours) & (gap <= max_gap[:, None])
+    rows = np.arange(n)[:, None]
+    rise = series[rows, np.where(ok, nxt, 0)] - series[rows, np.where(ok, prev, 0)]
+    return np.where(ok, rise / np.where(ok, gap, 1), np.nan)
+
+
+def consensus_scores(deltas: np.ndarray, neighbours: np.ndarray, min_scale: float) -> np.ndarray:
+    """
+    Score per row of deltas ((n, hours) VWC changes, NaN where missing)
+    against its neighbours ((n, k) row indices, -1 = none). NaN if unscored.
+    """
+    # Row n is all-NaN, so -1 padding reads as missing data
+    padded = np.vstack([deltas, np.full((1, deltas.shape[1]), np.nan)])
+    peers = padded[neighbours]  # (n, k, hours)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN slices are expected
+        consensus = np.nanmedian(peers, axis=1)
+        own_gap = np.abs(deltas - consensus)
+        own = np.nanmean(own_gap, axis=1)
+        peer_div = np.nanmean(np.abs(peers - consensus[:, None, :]), axis=2)
+        scale = np.fmax(np.nanmedian(peer_div, axis=1), min_scale)
+    enough_peers = (~np.isnan(peers).all(axis=2)).sum(axis=1) >= 2
+    enough_overlap = (~np.isnan(own_gap)).sum(axis=1) >= MIN_OVERLAP_HOURS
+    return np.where(enough_peers & enough_overlap, own / scale, np.nan)
+
+
+def compute_anomaly_scores(db: Session, now: Optional[datetime] = None) -> dict[int, float]:
+    """{device_id: score} for every located device that could be scored."""
+    now = now or datetime.utcnow()
+    end = floor_to(now, 3600)  # completed hours only
+    hours = settings.NEIGHBOR_ANOMALY_WINDOW_HOURS
+    start = end - timedelta(hours=hours)
+
+    located = db.execute(
+        select(Device.id, Device.farm_slug, DeviceConfig.lat, DeviceConfig.lon, DeviceConfig.expected_interval_min)
+        .join(DeviceConfig, DeviceConfig.device_id == Device.id)
+        .where(DeviceConfig.lat.isnot(None), DeviceConfig.lon.isnot(None))
+        .order_by(Device.id)
+    ).all()
+    if len(located) < 3:
+        return {}
+    ids = np.array([r[0] for r in located], dtype=np.int64)
+    _, farms = np.unique(np.array([r[1] for r in located], dtype=object), return_inverse=True)
+    xyz = unit_vectors(np.array([r[2] for r in located]), np.array([r[3] for r in located]))
+    interval_hours = np.array([r[4] or settings.EXPECTED_INTERVAL_MIN for r in located], dtype=np.float64) / 60
+
+    rows = db.execute(
+        select(
+            ReadingHourly.device_id,
+            ReadingHourly.depth_cm,
+            ReadingHourly.bucket_start,
+            ReadingHourly.moisture_sum / ReadingHourly.moisture_count,
+        )
+        .where(
+            ReadingHourly.bucket_start >= start,
+            ReadingHourly.bucket_start < end,
+            ReadingHourly.moisture_count > 0,
+        )
+    ).all()
+    if not rows:
+        return {}
+    device_col = np.array([r[0] for r in rows], dtype=np.int64)
+    depth_col = np.array([r[1] for r in rows], dtype=np.float64)
+    hour_col = np.array([(r[2] - start) // timedelta(hours=1) for r in rows], dtype=np.int64)
+    vwc_col = np.array([r[3] for r in rows], dtype=np.float64)
+    pos = np.searchsorted(ids, device_col)
+    keep = (pos < len(ids)) & (ids[np.minimum(pos, len(ids) - 1)] == device_col)
+
+    best = np.full(len(ids), np.nan)
+    for depth in np.unique(depth_col[keep]):
+        sel = keep & (depth_col == depth)
+        series = np.full((len(ids), hours), np.nan)
+        series[pos[sel], hour_col[sel]] = vwc_col[sel]
+        has = ~np.isnan(series)
+        readings = has.sum(axis=1)
+        # Hours from first to last reading in the window, over the gaps between them
+        span = (hours - 1 - has[:, ::-1].argmax(axis=1)) - has.argmax(axis=1)
+        cadence = np.fmax(interval_hours, span / np.maximum(readings - 1, 1))
+        deltas = hourly_rates(series, np.maximum(np.ceil(cadence * settings.STALE_FACTOR), 1))
+        has_data = ((~np.isnan(deltas)).sum(axis=1) >= MIN_OVERLAP_HOURS) & (readings > MIN_READING_CHANGES)
+        if has_data.sum() < 3:
+            continue
+        rows_idx = np.flatnonzero(has_data)
+        neighbours = nearest_in_groups(xyz[rows_idx], farms[rows_idx], settings.NEIGHBOR_ANOMALY_K)
+        scores = consensus_scores(deltas[rows_idx], neighbours, settings.NEIGHBOR_ANOMALY_MIN_SCALE_PCT)
+        best[rows_idx] = np.fmax(best[rows_idx], scores)
+
+    scored = ~np.isnan(best)
+    return dict(zip(ids[scored].tolist(), best[scored].tolist()))
+
+
+def refresh_anomaly_scores(db: Session) -> dict:
+    """
+    Write compute_anomaly_scores() onto the status snapshots (devices not
+    scored get None) and commit. Returns counts of devices scored and
+    flagged and of snapshots updated.
+    """
+    scores = {device_id: round(score, 3) for device_id, score in compute_anomaly_scores(db).items()}
+    # Device id order, like refresh_status_snapshots, so concurrent runs lock rows in the same order
+    changes = [
+        {"device_id": device_id, "anomaly_score": scores.get(device_id)}
+        for device_id, current in db.query(
+            DeviceStatusSnapshot.device_id, DeviceStatusSnapshot.anomaly_score
+        ).order_by(DeviceStatusSnapshot.device_id)
+        if scores.get(device_id) != current
+    ]
+    if changes:
+        db.execute(update(DeviceStatusSnapshot), changes)
+        # Status-bearing endpoints key their ETags on this counter
+        bump_status(db)
+    db.commit()
+    return {
+        "scored": len(scores),
+        "flagged": sum(1 for s in scores.values() if is_anomalous(s)),
+        "updated": len(changes),
+    }
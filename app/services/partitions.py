@@ -0,0 +1,214 @@
+# api/app/services/partitions.py
+"""
+Monthly range partitions of reading (timestamp) and message (received_at).
+
+Postgres only: migration a4d2e8b1c7f9 turns both tables into partitioned
+parents with one partition per UTC month, named <table>_yYYYYmMM, plus
+<table>_default for rows outside every month (probes with a bad clock, stale
+uplinks for retired months). Queries that filter on the partition key are
+pruned to the months they cover.
+
+ensure_partitions() creates months ahead of time. Each month is built as a
+standalone table and ATTACHed, which only takes SHARE UPDATE EXCLUSIVE on the
+parent; rows that already landed in the default partition for that month
+move over in the same transaction.
+
+apply_retention() retires months that ended more than RETENTION_MONTHS ago.
+It first makes sure the rollups account for every reading of the month
+(rebuilding them if not), then DETACHes the partition and, with
+RETENTION_ACTION=drop, drops it. DETACH ... CONCURRENTLY is not allowed
+while a default partition exists, so the plain form runs under
+PARTITION_LOCK_TIMEOUT_MS: it never queues behind long queries, and a month
+that could not be locked is retried on the next run. Rows for retired months
+left in the default partition (backfills for months that never had a
+partition, late uplinks) are folded into the rollups the same way before
+they are deleted.
+"""
+from __future__ import annotations
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.db.session import engine
+from app.models import ReadingDaily
+from app.services.rollups import rebuild_rollups
+from app.settings import settings
+
+log = logging.getLogger("soilprobe.partitions")
+
+# Partitioned table -> partition key column
+PARTITIONED = {
+    "reading": "timestamp",
+    "message": "received_at",
+}
+
+_MONTHLY = re.compile(r"^(?P<table>[a-z_]+)_y(?P<year>\d{4})m(?P<month>\d{2})$")
+
+
+def month_start(ts: datetime) -> datetime:
+    return datetime(ts.year, ts.month, 1)
+
+
+def add_months(month: datetime, n: int) -> datetime:
+    years, index = divmod(month.month - 1 + n, 12)
+    return datetime(month.year + years, index + 1, 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_partitioned(table: str) -> bool:
+    if engine.dialect.name != "postgresql":
+        return False
+    with engine.connect() as conn:
+        kind = conn.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:t)"), {"t": table}
+        ).scalar()
+    return kind == "p"
+
+
+def monthly_partitions(table: str) -> dict[datetime, str]:
+    """Attached monthly partitions of table by month start."""
+    with engine.connect() as conn:
+        names = conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:t)"
+            ),
+            {"t": table},
+        ).scalars().all()
+    months = {}
+    for name in names:
+        m = _MONTHLY.match(name)
+        if m and m["table"] == table:
+            months[datetime(int(m["year"]), int(m["month"]), 1)] = name
+    return months
+
+
+def _set_lock_timeout(conn) -> None:
+    conn.execute(text(f"SET LOCAL lock_timeout = '{int(settings.PARTITION_LOCK_TIMEOUT_MS)}ms'"))
+
+
+def _create_month(table: str, key: str, month: datetime) -> str:
+    name = partition_name(table, month)
+    lo, hi = month, add_months(month, 1)
+    with engine.begin() as conn:
+        _set_lock_timeout(conn)
+        conn.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        # Rows that arrived before the month had a partition
+        conn.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {table}_default "
+                f'WHERE "{key}" >= :lo AND "{key}" < :hi RETURNING *) '
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {"lo": lo, "hi": hi},
+        )
+        # Indexes matching the parent's are created on attach
+        conn.execute(text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{lo.isoformat(sep=' ')}') TO ('{hi.isoformat(sep=' ')}')"
+        ))
+    return name
+
+
+def ensure_partitions(months_ahead: int, now: Optional[datetime] = None) -> list[str]:
+    """Create the current month and the next months_ahead months where missing."""
+    current = month_start(now or datetime.utcnow())
+    created = []
+    for table, key in PARTITIONED.items():
+        if not is_partitioned(table):
+            continue
+        existing = monthly_partitions(table)
+        for i in range(months_ahead + 1):
+            month = add_months(current, i)
+            if month in existing:
+                continue
+            try:
+                created.append(_create_month(table, key, month))
+            except OperationalError as exc:
+                log.warning(
+                    "Partitions: could not create %s (%s), retrying next run",
+                    partition_name(table, month), exc.orig,
+                )
+    return created
+
+
+def _ensure_rolled_up(db: Session, month: datetime, partial: bool = False) -> None:
+    """
+    Rebuild the month's rollups unless they already count every raw reading.
+    partial: the month's raw readings may be only what is left in the default
+    partition after its monthly partition was retired, so rollups counting
+    more than that are kept - a rebuild is only done if they miss readings.
+    """
+    lo, hi = month, add_months(month, 1)
+    raw = db.execute(
+        text('SELECT count(*) FROM reading WHERE "timestamp" >= :lo AND "timestamp" < :hi'),
+        {"lo": lo, "hi": hi},
+    ).scalar()
+    rolled = (
+        db.query(func.coalesce(func.sum(ReadingDaily.reading_count), 0))
+        .filter(ReadingDaily.bucket_start >= lo, ReadingDaily.bucket_start < hi)
+        .scalar()
+    )
+    db.rollback()
+    if rolled < raw or (rolled > raw and not partial):
+        log.info("Partitions: rollups for %s cover %d of %d readings, rebuilding", lo.date(), rolled, raw)
+        rebuild_rollups(db, lo, hi - timedelta(days=1))
+
+
+def apply_retention(
+    db: Session,
+    keep_months: int,
+    action: str = "detach",
+    now: Optional[datetime] = None,
+) -> list[str]:
+    """
+    Detach (and with action="drop", drop) monthly partitions that ended before
+    the first day of the month keep_months back; keep_months <= 0 keeps everything.
+    Returns the partitions retired.
+    """
+    if keep_months <= 0:
+        return []
+    cutoff = add_months(month_start(now or datetime.utcnow()), -keep_months)
+    retired = []
+    for table, key in PARTITIONED.items():
+        if not is_partitioned(table):
+            continue
+        for month, name in sorted(monthly_partitions(table).items()):
+            if add_months(month, 1) > cutoff:
+                break
+            if table == "reading":
+                _ensure_rolled_up(db, month)
+            try:
+                with engine.begin() as conn:
+                    _set_lock_timeout(conn)
+                    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                    if action == "drop":
+                        conn.execute(text(f"DROP TABLE {name}"))
+            except OperationalError as exc:
+                log.warning("Partitions: could not detach %s (%s), retrying next run", name, exc.orig)
+                continue
+            retired.append(name)
+
+        # Stray rows for retired months that landed in the default partition
+        if table == "reading":
+            stray = db.execute(
+                text(
+                    f"SELECT DISTINCT date_trunc('month', \"{key}\") FROM {table}_default "
+                    f'WHERE "{key}" < :cutoff'
+                ),
+                {"cutoff": cutoff},
+            ).scalars().all()
+            db.rollback()
+            for month in sorted(stray):
+                _ensure_rolled_up(db, month, partial=True)
+        with engine.begin() as conn:
+            conn.execute(text(f'DELETE FROM {table}_default WHERE "{key}" < :cutoff'), {"cutoff": cutoff})
+    return retired
@@ -0,0 +1,187 @@
+# api/app/services/result_cache.py
+"""
+Result cache for the metrics endpoints.
+
+Entries are rendered response bodies (bytes + media type) keyed by the
+endpoint's ETag, which already hashes the normalized parameters and the
+ingest watermark of the devices the query covers (see
+app/routers/common.py). A key can therefore never serve data older than the
+last ingest for those devices, in any process. On top of that, ingest calls
+invalidate_devices() so entries for the affected devices are dropped right
+away instead of waiting for LRU eviction.
+
+Backends (RESULT_CACHE_BACKEND):
+- "memory": per-process LRU bounded by RESULT_CACHE_MAX_BYTES of body data.
+- "redis": shared across workers/machines at REDIS_URL; entries expire after
+  RESULT_CACHE_TTL_SEC and the server's maxmemory policy bounds the size.
+- "off": no caching.
+"""
+from __future__ import annotations
+import logging
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import redis
+
+from app.settings import settings
+
+log = logging.getLogger("soilprobe.result_cache")
+
+# Tag for entries that cover the whole fleet (no device filter)
+ALL_DEVICES = "*"
+
+CachedBody = tuple[bytes, str]  # (body, media type)
+
+
+def _tags(device_ids: Optional[Iterable[int]]) -> set[str]:
+    return {str(d) for d in device_ids} if device_ids else {ALL_DEVICES}
+
+
+class MemoryResultCache:
+    """Thread-safe LRU with a byte budget over the cached bodies."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[CachedBody, set[str]]] = OrderedDict()
+        self._by_tag: dict[str, set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: CachedBody, device_ids: Optional[Iterable[int]] = None) -> None:
+        size = len(value[0])
+        if size > self.max_bytes:
+            return
+        tags = _tags(device_ids)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (value, tags)
+            self._bytes += size
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_devices(self, device_ids: Iterable[int]) -> None:
+        with self._lock:
+            for tag in _tags(device_ids) | {ALL_DEVICES}:
+                for key in list(self._by_tag.get(tag, ())):
+                    self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+            self._bytes = 0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        (body, _), tags = entry
+        self._bytes -= len(body)
+        for tag in tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+
+class RedisResultCache:
+    """Shared cache; any Redis error degrades to a miss rather than failing the request."""
+
+    PREFIX = "soilprobe:rc:"
+
+    def __init__(self, url: str, ttl_sec: int) -> None:
+        self.ttl_sec = ttl_sec
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        try:
+            raw = self._client.get(self.PREFIX + key)
+        except redis.RedisError:
+            log.warning("Result cache: Redis get failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        media_type, _, body = raw.partition(b"\n")
+        return body, media_type.decode()
+
+    def set(self, key: str, value: CachedBody, device_ids: Optional[Iterable[int]] = None) -> None:
+        body, media_type = value
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.set(self.PREFIX + key, media_type.encode() + b"\n" + body, ex=self.ttl_sec)
+            for tag in _tags(device_ids):
+                pipe.sadd(self.PREFIX + "tag:" + tag, key)
+                pipe.expire(self.PREFIX + "tag:" + tag, self.ttl_sec)
+            pipe.execute()
+        except redis.RedisError:
+            log.warning("Result cache: Redis set failed", exc_info=True)
+
+    def invalidate_devices(self, device_ids: Iterable[int]) -> None:
+        try:
+            for tag in _tags(device_ids) | {ALL_DEVICES}:
+                tag_key = self.PREFIX + "tag:" + tag
+                keys = self._client.smembers(tag_key)
+                if keys:
+                    self._client.delete(*(self.PREFIX + k.decode() for k in keys))
+                self._client.delete(tag_key)
+        except redis.RedisError:
+            log.warning("Result cache: Redis invalidation failed", exc_info=True)
+
+    def clear(self) -> None:
+        try:
+            keys = list(self._client.scan_iter(self.PREFIX + "*"))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError:
+            log.warning("Result cache: Redis clear failed", exc_info=True)
+
+
+class _NullResultCache:
+    def get(self, key: str) -> Optional[CachedBody]:
+        return None
+
+    def set(self, key: str, value: CachedBody, device_ids: Optional[Iterable[int]] = None) -> None:
+        pass
+
+    def invalidate_devices(self, device_ids: Iterable[int]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """Process-wide cache instance for the configured backend."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                backend = settings.RESULT_CACHE_BACKEND
+                if backend == "redis" and settings.REDIS_URL:
+                    _cache = RedisResultCache(settings.REDIS_URL, settings.RESULT_CACHE_TTL_SEC)
+                elif backend == "off":
+                    _cache = _NullResultCache()
+                else:
+                    _cache = MemoryResultCache(settings.RESULT_CACHE_MAX_BYTES)
+    return _cache
+
+
+def invalidate_devices(device_ids: Iterable[int]) -> None:
+    """Drop cached results covering these devices (and fleet-wide results)."""
+    get_result_cache().invalidate_devices(list(device_ids))
@@ -0,0 +1,251 @@
+# api/app/services/rollups.py
+"""
+Hourly and daily rollups of reading, and the multi-resolution series pyramid.
+
+Ingest calls apply_readings() with the rows it just inserted; they are
+pre-aggregated in Python per (device, depth, bucket) and merged into
+reading_hourly / reading_daily / reading_pyramid with one INSERT ... ON
+CONFLICT DO UPDATE per table, so rollups stay current without rescanning
+reading. rebuild_rollups() recomputes a time range from scratch (backfill / repair).
+
+reading_pyramid level L has epoch-aligned buckets of PYRAMID_BASE_SECONDS *
+2**L (15 minutes up to ~3.7 years). A zoomed chart reads the finest level
+that covers its range in max_points buckets (pyramid_level), so any zoom
+costs about max_points rows per series however long the history is. Levels
+above 0 are rebuilt from the level below, never from reading, so they
+survive raw-reading retention.
+"""
+from __future__ import annotations
+import math
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import Reading, ReadingHourly, ReadingDaily, ReadingPyramid
+
+EPOCH = datetime(1970, 1, 1)
+
+# Rollup model and its bucket width (seconds)
+ROLLUPS = (
+    (ReadingHourly, 3600),
+    (ReadingDaily, 86400),
+)
+
+PYRAMID_BASE_SECONDS = 900
+PYRAMID_LEVELS = range(18)
+
+
+def pyramid_width(level: int) -> int:
+    return PYRAMID_BASE_SECONDS << level
+
+
+def pyramid_level(from_dt: datetime, to_dt: datetime, max_points: int) -> int:
+    """Finest pyramid level that covers [from, to] in at most max_points buckets."""
+    span = max((to_dt - from_dt).total_seconds(), 1.0)
+    for level in PYRAMID_LEVELS:
+        # Epoch alignment can split the range into one extra partial bucket
+        if math.ceil(span / pyramid_width(level)) + 1 <= max_points:
+            return level
+    return PYRAMID_LEVELS[-1]
+
+
+def floor_to(ts: datetime, width: int) -> datetime:
+    """Truncate a naive UTC timestamp to an epoch-aligned bucket of `width` seconds."""
+    seconds = int((ts - EPOCH).total_seconds())
+    return EPOCH + timedelta(seconds=seconds - seconds % width)
+
+
+def _new_bucket() -> dict:
+    return {
+        "reading_count": 0,
+        "moisture_count": 0, "moisture_sum": None, "moisture_min": None, "moisture_max": None,
+        "temp_count": 0, "temp_sum": None, "temp_min": None, "temp_max": None,
+    }
+
+
+def _merge(acc: dict, row) -> None:
+    """Fold one aggregate row (a finer bucket) into acc."""
+    acc["reading_count"] += row.reading_count
+    for prefix in ("moisture", "temp"):
+        if not getattr(row, f"{prefix}_count"):
+            continue
+        acc[f"{prefix}_count"] += getattr(row, f"{prefix}_count")
+        for field, combine in (("sum", lambda a, b: a + b), ("min", min), ("max", max)):
+            key, value = f"{prefix}_{field}", getattr(row, f"{prefix}_{field}")
+            acc[key] = value if acc[key] is None else combine(acc[key], value)
+
+
+def _add(acc: dict, prefix: str, value: Optional[float]) -> None:
+    if value is None:
+        return
+    acc[f"{prefix}_count"] += 1
+    acc[f"{prefix}_sum"] = value if acc[f"{prefix}_sum"] is None else acc[f"{prefix}_sum"] + value
+    acc[f"{prefix}_min"] = value if acc[f"{prefix}_min"] is None else min(acc[f"{prefix}_min"], value)
+    acc[f"{prefix}_max"] = value if acc[f"{prefix}_max"] is None else max(acc[f"{prefix}_max"], value)
+
+
+def _null_safe(db: Session, fn: str, a, b):
+    """LEAST/GREATEST that ignores NULLs on both Postgres and SQLite."""
+    if db.get_bind().dialect.name == "postgresql":
+        return getattr(func, fn)(a, b)  # Postgres LEAST/GREATEST already skip NULLs
+    scalar = func.min if fn == "least" else func.max
+    return scalar(func.coalesce(a, b), func.coalesce(b, a))
+
+
+def _upsert(db: Session, model, rows: list[dict]) -> None:
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(model).values(rows)
+    t, x = model.__table__.c, stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[c.name for c in model.__table__.primary_key],
+        set_={
+            "reading_count": t.reading_count + x.reading_count,
+            "moisture_count": t.moisture_count + x.moisture_count,
+            "moisture_sum": func.coalesce(t.moisture_sum, 0) + func.coalesce(x.moisture_sum, 0),
+            "moisture_min": _null_safe(db, "least", t.moisture_min, x.moisture_min),
+            "moisture_max": _null_safe(db, "greatest", t.moisture_max, x.moisture_max),
+            "temp_count": t.temp_count + x.temp_count,
+            "temp_sum": func.coalesce(t.temp_sum, 0) + func.coalesce(x.temp_sum, 0),
+            "temp_min": _null_safe(db, "least", t.temp_min, x.temp_min),
+            "temp_max": _null_safe(db, "greatest", t.temp_max, x.temp_max),
+        },
+    )
+    db.execute(stmt)
+
+
+def _aggregate(readings: list[Reading], width: int) -> dict[tuple, dict]:
+    """Aggregates per (device, depth, bucket start) for buckets of `width` seconds."""
+    buckets: dict[tuple, dict] = {}
+    for r in readings:
+        key = (r.device_id, float(r.depth_cm), floor_to(r.timestamp, width))
+        acc = buckets.get(key)
+        if acc is None:
+            acc = buckets[key] = _new_bucket()
+        acc["reading_count"] += 1
+        _add(acc, "moisture", r.moisture_pct)
+        _add(acc, "temp", r.temperature_c)
+    return buckets
+
+
+def apply_readings(
+    db: Session,
+    readings: Iterable[Reading],
+    pyramid_levels: Iterable[int] = PYRAMID_LEVELS,
+) -> None:
+    """
+    Merge freshly inserted readings into the hourly and daily rollups and the
+    given pyramid levels (all by default).
+    Readings must be flushed (timestamps populated); runs in the caller's transaction.
+    """
+    readings = [r for r in readings if r.timestamp is not None]
+    if not readings:
+        return
+
+    for model, width in ROLLUPS:
+        _upsert(db, model, [
+            {"device_id": device_id, "depth_cm": depth_cm, "bucket_start": bucket, **acc}
+            for (device_id, depth_cm, bucket), acc in _aggregate(readings, width).items()
+        ])
+
+    _upsert(db, ReadingPyramid, [
+        {"device_id": device_id, "depth_cm": depth_cm, "level": level, "bucket_start": bucket, **acc}
+        for level in pyramid_levels
+        for (device_id, depth_cm, bucket), acc in _aggregate(readings, pyramid_width(level)).items()
+    ])
+
+
+def _rebuild_pyramid_levels(
+    db: Session,
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    batch_size: int,
+) -> None:
+    """Recompute pyramid levels above 0 over [from_date, to_date) from the level below."""
+    for level in PYRAMID_LEVELS[1:]:
+        width = pyramid_width(level)
+        # Every bucket of this level that overlaps the range
+        bounds = []
+        if from_date is not None:
+            bounds.append(ReadingPyramid.bucket_start >= floor_to(from_date, width))
+        if to_date is not None:
+            upper = floor_to(to_date, width)
+            if upper < to_date:
+                upper += timedelta(seconds=width)
+            bounds.append(ReadingPyramid.bucket_start < upper)
+        db.query(ReadingPyramid).filter(ReadingPyramid.level == level, *bounds).delete(synchronize_session=False)
+
+        # Their children are the level below within the same bounds
+        children = db.query(ReadingPyramid).filter(ReadingPyramid.level == level - 1, *bounds)
+        buckets: dict[tuple, dict] = {}
+        for row in children.yield_per(batch_size):
+            key = (row.device_id, row.depth_cm, floor_to(row.bucket_start, width))
+            acc = buckets.get(key)
+            if acc is None:
+                acc = buckets[key] = _new_bucket()
+            _merge(acc, row)
+        if buckets:
+            # Nothing left to conflict with: a plain executemany insert
+            db.execute(insert(ReadingPyramid), [
+                {"device_id": device_id, "depth_cm": depth_cm, "level": level, "bucket_start": bucket, **acc}
+                for (device_id, depth_cm, bucket), acc in buckets.items()
+            ])
+
+
+def rebuild_rollups(
+    db: Session,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    batch_size: int = 5000,
+) -> int:
+    """
+    Recompute rollups for [from_date, to_date) from reading. The range is widened
+    to whole days so no bucket is left half-counted; pyramid level 0 is rebuilt
+    from reading and coarser levels from the level below, so their buckets
+    reaching outside the range keep what is there. Commits; returns readings scanned.
+    """
+    if from_date is not None:
+        from_date = floor_to(from_date, 86400)
+    if to_date is not None:
+        to_date = floor_to(to_date, 86400) + timedelta(days=1)
+
+    for model, _ in ROLLUPS:
+        q = db.query(model)
+        if from_date is not None:
+            q = q.filter(model.bucket_start >= from_date)
+        if to_date is not None:
+            q = q.filter(model.bucket_start < to_date)
+        q.delete(synchronize_session=False)
+    q = db.query(ReadingPyramid).filter(ReadingPyramid.level == 0)
+    if from_date is not None:
+        q = q.filter(ReadingPyramid.bucket_start >= from_date)
+    if to_date is not None:
+        q = q.filter(ReadingPyramid.bucket_start < to_date)
+    q.delete(synchronize_session=False)
+
+    q = db.query(Reading)
+    if from_date is not None:
+        q = q.filter(Reading.timestamp >= from_date)
+    if to_date is not None:
+        q = q.filter(Reading.timestamp < to_date)
+
+    scanned = 0
+    batch: list[Reading] = []
+    for reading in q.order_by(Reading.id).yield_per(batch_size):
+        batch.append(reading)
+        if len(batch) >= batch_size:
+            apply_readings(db, batch, pyramid_levels=(0,))
+            scanned += len(batch)
+            batch = []
+    apply_readings(db, batch, pyramid_levels=(0,))
+    scanned += len(batch)
+    _rebuild_pyramid_levels(db, from_date, to_date, batch_size)
+
+    db.commit()
+    return scanned
@@ -0,0 +1,75 @@
+# api/app/services/series.py
+"""
+Time-bucketed series queries.
+
+The series endpoints pick a bucket width from the requested range and
+max_points (bucket_width_seconds) and let the database return one
+avg/min/max row per (series, bucket) instead of shipping every reading to
+Python. Buckets are aligned to the Unix epoch, so the same width always
+produces the same bucket boundaries regardless of the requested range.
+"""
+from __future__ import annotations
+import math
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import BigInteger, cast, func
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+# Widths a chart axis can label sensibly (seconds)
+NICE_BUCKET_SECONDS = [
+    60, 300, 600, 900, 1800,
+    3600, 2 * 3600, 3 * 3600, 6 * 3600, 12 * 3600,
+    86400, 2 * 86400, 7 * 86400, 14 * 86400, 30 * 86400,
+]
+
+
+def bucket_width_seconds(from_dt: datetime, to_dt: datetime, max_points: int) -> int:
+    """Smallest nice bucket width that keeps (to - from) within max_points buckets."""
+    span = max((to_dt - from_dt).total_seconds(), 1.0)
+    # Epoch alignment can split the range into one extra partial bucket
+    needed = span / max(max_points - 1, 1)
+    for width in NICE_BUCKET_SECONDS:
+        if width >= needed:
+            return width
+    # Beyond the table: whole multiples of the largest nice width
+    largest = NICE_BUCKET_SECONDS[-1]
+    return largest * math.ceil(needed / largest)
+
+
+def epoch_seconds(db: Session, column) -> ColumnElement:
+    """Integer Unix epoch seconds of a (naive UTC) timestamp column, per dialect."""
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.floor(func.extract("epoch", column)), BigInteger)
+    # SQLite fallback
+    return cast(func.strftime("%s", column), BigInteger)
+
+
+def bucket_index(db: Session, column, width: int) -> ColumnElement:
+    """Epoch-aligned bucket number of a timestamp column for the given width."""
+    return epoch_seconds(db, column) // width
+
+
+def bucket_start(bucket: int, width: int) -> datetime:
+    """Naive UTC start of a bucket returned by bucket_index()."""
+    return datetime(1970, 1, 1) + timedelta(seconds=int(bucket) * width)
+
+
+def resolve_range(
+    db: Session,
+    timestamp_column,
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    *filters,
+) -> Optional[tuple[datetime, datetime]]:
+    """
+    Fill in an open-ended range from the data (MIN/MAX timestamp under the
+    same filters). Returns None when there is no data at all.
+    """
+    if from_date is not None and to_date is not None:
+        return from_date, to_date
+    lo, hi = db.query(func.min(timestamp_column), func.max(timestamp_column)).filter(*filters).one()
+    if lo is None:
+        return None
+    return from_date or lo, to_date or hi
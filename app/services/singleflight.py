@@ -0,0 +1,87 @@
+# api/app/services/singleflight.py
+"""
+Single-flight coalescing of identical concurrent requests.
+
+The dashboard fires the same summary / series / device requests from several
+components and tabs at once. Routers run the expensive part through
+coalesce() under their ETag (route + normalized params + ingest watermark,
+see app/routers/common.py): the first caller computes, callers arriving while
+it is in flight block and get the same result (or the same exception).
+Nothing is kept once the call finishes - the result cache covers later requests.
+
+Sync endpoints run in the threadpool, so waiters block on a threading.Event.
+Coalescing is per process; with several workers each one computes at most once.
+"""
+from __future__ import annotations
+import threading
+from typing import Any, Callable, Optional
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.deduplicated = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn() unless a call for key is already in flight; then wait for its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.deduplicated += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "deduplicated": self.deduplicated,
+                "in_flight": len(self._calls),
+                "waiting": sum(c.waiters for c in self._calls.values()),
+            }
+
+
+_flight = SingleFlight()
+
+
+def coalesce(key: str, fn: Callable[[], Any]) -> Any:
+    """Process-wide SingleFlight.do()."""
+    return _flight.do(key, fn)
+
+
+def coalescing_stats() -> dict:
+    """Counters for GET /stats/coalescing."""
+    return _flight.stats()
@@ -7,13 +7,14 @@ Priority: RED > AMBER > STALE > OFFLINE > BLUE > GREEN
 """
 from __future__ import annotations
 from datetime import datetime, timedelta
-from typing import Literal, Optional
+from typing import Iterable, Literal, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, select, true
 from statistics import median
 
 from app.settings import settings
-from app.models import Device, DeviceConfig, Reading
+from app.models import Device, DeviceConfig, DeviceDepth, Reading
+from app.services.depths import get_device_depths, get_depths_for_devices
 
 
 StatusType = Literal["red", "amber", "green", "blue", "stale", "offline", "gray"]
@@ -177,6 +178,50 @@ def _check_spike(
     return change > settings.ROC_SPIKE_PCT
 
 
+def _status_result(
+    status: StatusType,
+    worst_depth_cm: Optional[float],
+    last_seen: Optional[datetime],
+    spike_detected: bool = False,
+) -> dict:
+    return {
+        "status": status,
+        "worst_depth_cm": worst_depth_cm,
+        "last_seen": last_seen,
+        "battery_hint": "unknown",  # TODO: implement when battery data available
+        "spike_detected": spike_detected,
+    }
+
+
+def _expected_interval(device_config: Optional[DeviceConfig]) -> int:
+    return (
+        device_config.expected_interval_min if device_config else None
+    ) or settings.EXPECTED_INTERVAL_MIN
+
+
+def texture_bounds(device_config: Optional[DeviceConfig]) -> Optional[tuple[float, float]]:
+    """(FC, PWP) when the config is texture-aware with valid values, else None."""
+    if device_config is None or device_config.mode != "texture_aware":
+        return None
+    fc, pwp = device_config.fc_vwc_pct, device_config.pwp_vwc_pct
+    if fc is None or pwp is None or fc <= pwp:
+        return None
+    return fc, pwp
+
+
+def _depth_status(vwc: float, device_config: Optional[DeviceConfig]) -> StatusType:
+    """Mode 1 if the config is texture-aware with valid FC/PWP, else Mode 2."""
+    bounds = texture_bounds(device_config)
+    if bounds is not None:
+        return _compute_mode1_status(vwc, *bounds)
+    return _compute_mode2_status(vwc)
+
+
+def _worst_depth(depth_statuses: dict[float, StatusType]) -> tuple[float, StatusType]:
+    """Find worst depth (highest priority status)."""
+    return min(depth_statuses.items(), key=lambda x: _severity_order(x[1]))
+
+
 def compute_device_status(
     db: Session, device: Device, device_config: Optional[DeviceConfig] = None
 ) -> dict:
@@ -196,38 +241,18 @@ def compute_device_status(
     if device_config is None:
         device_config = db.query(DeviceConfig).filter(DeviceConfig.device_id == device.id).first()
     
-    expected_interval = (
-        device_config.expected_interval_min if device_config else None
-    ) or settings.EXPECTED_INTERVAL_MIN
-    
     # Check last seen
     last_seen = _get_last_seen(db, device.id)
-    stale_status, is_stale_or_offline = _check_stale_offline(last_seen, expected_interval)
+    stale_status, is_stale_or_offline = _check_stale_offline(
+        last_seen, _expected_interval(device_config)
+    )
     
     # If stale/offline, return early (these take priority over moisture)
     if is_stale_or_offline:
-        return {
-            "status": stale_status,
-            "worst_depth_cm": None,
-            "last_seen": last_seen,
-            "battery_hint": "unknown",  # TODO: implement when battery data available
-            "spike_detected": False,
-        }
-    
-    # Get config for moisture status
-    mode = device_config.mode if device_config else "fallback"
-    fc = device_config.fc_vwc_pct if device_config else None
-    pwp = device_config.pwp_vwc_pct if device_config else None
-    
-    use_mode1 = (
-        mode == "texture_aware"
-        and fc is not None
-        and pwp is not None
-        and fc > pwp
-    )
+        return _status_result(stale_status, None, last_seen)
     
-    # Check all depths (10, 20, 30, 40, 50, 60 cm)
-    depths = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+    # Check every depth this probe actually reports (from the depth catalog)
+    depths = get_device_depths(db, device.id)
     depth_statuses: dict[float, StatusType] = {}
     spike_detected = False
     
@@ -240,34 +265,138 @@ def compute_device_status(
         if _check_spike(db, device.id, depth, vwc):
             spike_detected = True
         
-        # Compute status for this depth
-        if use_mode1:
-            status = _compute_mode1_status(vwc, fc, pwp)
-        else:
-            status = _compute_mode2_status(vwc)
-        
-        depth_statuses[depth] = status
+        depth_statuses[depth] = _depth_status(vwc, device_config)
     
     if not depth_statuses:
         # No readings at any depth
-        return {
-            "status": "gray",
-            "worst_depth_cm": None,
-            "last_seen": last_seen,
-            "battery_hint": "unknown",
-            "spike_detected": False,
-        }
+        return _status_result("gray", None, last_seen)
     
-    # Find worst depth (highest priority status)
-    worst_depth = min(depth_statuses.items(), key=lambda x: _severity_order(x[1]))
-    worst_status = worst_depth[1]
-    worst_depth_cm = worst_depth[0]
+    worst_depth_cm, worst_status = _worst_depth(depth_statuses)
+    return _status_result(worst_status, worst_depth_cm, last_seen, spike_detected)
+
+
+# ---- batch path -------------------------------------------------------------
+
+
+def _recent_moisture(
+    db: Session, device_ids: list[int], limit: int = 3
+) -> dict[tuple[int, float], list[tuple[datetime, float]]]:
+    """
+    Newest `limit` non-null moisture readings per (device, depth), newest first,
+    for all given devices in one query. Postgres walks the depth catalog with a
+    LATERAL ... ORDER BY timestamp DESC LIMIT n per depth (index range scans);
+    other dialects rank rows with ROW_NUMBER().
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        recent = (
+            select(Reading.timestamp, Reading.moisture_pct)
+            .where(
+                Reading.device_id == DeviceDepth.device_id,
+                Reading.depth_cm == DeviceDepth.depth_cm,
+                Reading.moisture_pct.isnot(None),
+            )
+            .order_by(desc(Reading.timestamp))
+            .limit(limit)
+            .lateral("recent")
+        )
+        stmt = (
+            select(DeviceDepth.device_id, DeviceDepth.depth_cm, recent.c.timestamp, recent.c.moisture_pct)
+            .select_from(DeviceDepth)
+            .join(recent, true())
+            .where(DeviceDepth.device_id.in_(device_ids))
+        )
+    else:
+        ranked = (
+            select(
+                Reading.device_id,
+                Reading.depth_cm,
+                Reading.timestamp,
+                Reading.moisture_pct,
+                func.row_number().over(
+                    partition_by=(Reading.device_id, Reading.depth_cm),
+                    order_by=desc(Reading.timestamp),
+                ).label("rn"),
+            )
+            .where(Reading.device_id.in_(device_ids), Reading.moisture_pct.isnot(None))
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.device_id, ranked.c.depth_cm, ranked.c.timestamp, ranked.c.moisture_pct)
+            .where(ranked.c.rn <= limit)
+        )
     
-    return {
-        "status": worst_status,
-        "worst_depth_cm": worst_depth_cm,
-        "last_seen": last_seen,
-        "battery_hint": "unknown",  # TODO: implement when battery data available
-        "spike_detected": spike_detected,
-    }
+    windows: dict[tuple[int, float], list[tuple[datetime, float]]] = {}
+    for device_id, depth_cm, ts, vwc in db.execute(stmt):
+        windows.setdefault((device_id, float(depth_cm)), []).append((ts, vwc))
+    for rows in windows.values():
+        rows.sort(key=lambda r: r[0], reverse=True)
+    return windows
 
+
+def _spike_in_window(rows: list[tuple[datetime, float]], current_vwc: float, now: datetime) -> bool:
+    """_check_spike() over already-loaded rows (newest first)."""
+    window_start = now - timedelta(minutes=settings.ROC_WINDOW_MIN)
+    prev = [vwc for ts, vwc in rows if window_start <= ts < now][:2]
+    if len(prev) < 2:
+        return False
+    return abs(current_vwc - prev[1]) > settings.ROC_SPIKE_PCT
+
+
+def compute_status_batch(db: Session, devices: Iterable[Device]) -> dict[int, dict]:
+    """
+    compute_device_status() for many devices with a fixed number of queries
+    (last seen, depth catalog, recent moisture) instead of several per device
+    and depth. Uses device.config, so callers should selectinload it.
+    
+    Each result also carries "moisture_30cm": the latest 30 cm reading shown
+    next to the status in list views, and "anomaly_score" / "anomaly_detected"
+    (None / False: the neighbour score is only served from snapshots).
+    """
+    devices = list(devices)
+    if not devices:
+        return {}
+    ids = [d.id for d in devices]
+    now = datetime.utcnow()
+    
+    last_seen_map = dict(
+        db.query(Reading.device_id, func.max(Reading.timestamp))
+        .filter(Reading.device_id.in_(ids))
+        .group_by(Reading.device_id)
+        .all()
+    )
+    depth_map = get_depths_for_devices(db, ids)
+    windows = _recent_moisture(db, ids)
+    
+    result: dict[int, dict] = {}
+    for device in devices:
+        config = device.config
+        last_seen = last_seen_map.get(device.id)
+        latest_30 = windows.get((device.id, 30.0))
+        moisture_30cm = latest_30[0][1] if latest_30 else None
+        
+        stale_status, is_stale_or_offline = _check_stale_offline(last_seen, _expected_interval(config))
+        if is_stale_or_offline:
+            info = _status_result(stale_status, None, last_seen)
+        else:
+            depth_statuses: dict[float, StatusType] = {}
+            spike_detected = False
+            for depth in depth_map.get(device.id, ()):
+                rows = windows.get((device.id, depth))
+                if not rows:
+                    continue
+                vwc = float(median(v for _, v in rows))
+                if _spike_in_window(rows, vwc, now):
+                    spike_detected = True
+                depth_statuses[depth] = _depth_status(vwc, config)
+            
+            if depth_statuses:
+                worst_depth_cm, worst_status = _worst_depth(depth_statuses)
+                info = _status_result(worst_status, worst_depth_cm, last_seen, spike_detected)
+            else:
+                info = _status_result("gray", None, last_seen)
+        
+        info["moisture_30cm"] = moisture_30cm
+        info["anomaly_score"] = None
+        info["anomaly_detected"] = False
+        result[device.id] = info
+    return result
@@ -0,0 +1,199 @@
+# api/app/services/status_snapshot.py
+"""
+Persisted device status.
+
+The status scheduler (app/workers/status_scheduler.py) calls
+refresh_status_snapshots() periodically; it recomputes status for the whole
+fleet in batches, upserts one DeviceStatusSnapshot row per device and appends
+an AlertTransition row whenever a device's status changes. Farms whose
+devices changed are then re-aggregated (services/farm_aggregate.py).
+
+List endpoints call load_status_map(), which serves fresh snapshots and only
+computes status live for devices whose snapshot is missing or too old.
+/v1/devices/attention reads only the worst k snapshots (load_attention_queue).
+
+Snapshots also carry the neighbour anomaly score, written separately by the
+neighbour anomaly job (services/neighbor_anomaly.py); statuses computed live
+have none.
+"""
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
+
+from app.settings import settings
+from app.models import Device, DeviceStatusSnapshot, AlertTransition, FarmAggregate
+from app.models.status_snapshot import NEVER_SEEN
+from app.services.farm_aggregate import farms_without_aggregate, refresh_farm_aggregates
+from app.services.neighbor_anomaly import is_anomalous
+from app.services.status import compute_status_batch, severity_order
+from app.services.watermark import bump_status
+
+
+def _snapshot_to_status(snap: DeviceStatusSnapshot) -> dict:
+    return {
+        "status": snap.status,
+        "worst_depth_cm": snap.worst_depth_cm,
+        "last_seen": snap.last_seen,
+        "battery_hint": snap.battery_hint,
+        "spike_detected": snap.spike_detected,
+        "moisture_30cm": snap.moisture_30cm,
+        "anomaly_score": snap.anomaly_score,
+        "anomaly_detected": is_anomalous(snap.anomaly_score),
+    }
+
+
+def _apply_status(
+    db: Session,
+    device_id: int,
+    status_info: dict,
+    snap: Optional[DeviceStatusSnapshot],
+    now: datetime,
+) -> bool:
+    """Upsert one snapshot row; record a transition if the status changed. Returns True on change."""
+    changed = False
+    if snap is None:
+        snap = DeviceStatusSnapshot(device_id=device_id)
+        db.add(snap)
+    elif snap.status != status_info["status"]:
+        db.add(AlertTransition(
+            device_id=device_id,
+            old_status=snap.status,
+            new_status=status_info["status"],
+            depth_cm=status_info["worst_depth_cm"],
+            transitioned_at=now,
+        ))
+        changed = True
+
+    snap.status = status_info["status"]
+    snap.severity = severity_order(status_info["status"])
+    snap.worst_depth_cm = status_info["worst_depth_cm"]
+    snap.last_seen = status_info["last_seen"]
+    snap.battery_hint = status_info["battery_hint"]
+    snap.spike_detected = bool(status_info["spike_detected"])
+    snap.moisture_30cm = status_info.get("moisture_30cm")
+    snap.computed_at = now
+    return changed
+
+
+def refresh_status_snapshots(db: Session, batch_size: Optional[int] = None) -> dict:
+    """
+    Recompute status for every device, batch by batch (keyset on device id).
+    Each batch is committed on its own so a long run never holds one big transaction.
+    """
+    batch_size = batch_size or settings.STATUS_BATCH_SIZE
+    last_id = 0
+    devices_seen = 0
+    transitions = 0
+    changed_farms: set[str] = set()
+
+    while True:
+        batch = (
+            db.query(Device)
+            .options(selectinload(Device.config))
+            .filter(Device.id > last_id)
+            .order_by(Device.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+
+        ids = [d.id for d in batch]
+        snaps = {
+            s.device_id: s
+            for s in db.query(DeviceStatusSnapshot).filter(DeviceStatusSnapshot.device_id.in_(ids))
+        }
+        statuses = compute_status_batch(db, batch)
+        now = datetime.utcnow()
+        for device in batch:
+            snap = snaps.get(device.id)
+            before = (snap.status, snap.last_seen) if snap else None
+            if _apply_status(db, device.id, statuses[device.id], snap, now):
+                transitions += 1
+            if before != (statuses[device.id]["status"], statuses[device.id]["last_seen"]):
+                changed_farms.add(device.farm_slug)
+
+        db.commit()
+        devices_seen += len(batch)
+        last_id = ids[-1]
+
+    farms = refresh_farm_aggregates(db, changed_farms | farms_without_aggregate(db))
+    # Every farm was checked in this run, so all rows are current (readers compare updated_at to the max age)
+    db.query(FarmAggregate).update({FarmAggregate.updated_at: datetime.utcnow()}, synchronize_session=False)
+    # Status-bearing endpoints key their ETags on this counter
+    bump_status(db)
+    db.commit()
+    return {"devices": devices_seen, "transitions": transitions, "farms": farms}
+
+
+def load_attention_queue(db: Session, limit: int) -> list[tuple[Device, dict]]:
+    """
+    The `limit` devices needing attention most, as (device, status_info):
+    worst severity first, then longest since last seen (never seen first),
+    then device id.
+
+    Fresh snapshots are read top-k off ix_device_status_snapshot_attention
+    instead of ranking the whole fleet. Only devices whose snapshot is
+    missing or stale (cutoff as in load_status_map) have status computed
+    live; they compete for the same slots.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.STATUS_SNAPSHOT_MAX_AGE_SEC)
+    rows = (
+        db.query(Device, DeviceStatusSnapshot)
+        .join(DeviceStatusSnapshot, DeviceStatusSnapshot.device_id == Device.id)
+        .filter(DeviceStatusSnapshot.computed_at >= cutoff)
+        .order_by(
+            DeviceStatusSnapshot.severity,
+            DeviceStatusSnapshot.last_seen_sort,
+            DeviceStatusSnapshot.device_id,
+        )
+        .limit(limit)
+        .all()
+    )
+    queue = [(device, _snapshot_to_status(snap)) for device, snap in rows]
+
+    live = (
+        db.query(Device)
+        .options(selectinload(Device.config))
+        .outerjoin(DeviceStatusSnapshot, DeviceStatusSnapshot.device_id == Device.id)
+        .filter(or_(DeviceStatusSnapshot.device_id.is_(None), DeviceStatusSnapshot.computed_at < cutoff))
+        .all()
+    )
+    if live:
+        statuses = compute_status_batch(db, live)
+        queue.extend((device, statuses[device.id]) for device in live)
+        queue.sort(key=lambda item: (
+            severity_order(item[1]["status"]),
+            item[1]["last_seen"] or NEVER_SEEN,
+            item[0].id,
+        ))
+    return queue[:limit]
+
+
+def load_status_map(db: Session, devices: Iterable[Device]) -> dict[int, dict]:
+    """
+    Return {device_id: status_info} for the given devices.
+
+    Snapshots newer than STATUS_SNAPSHOT_MAX_AGE_SEC are used as-is; anything
+    missing or stale is computed live with compute_status_batch() (and not
+    written back - that is the scheduler's job).
+    """
+    devices = list(devices)
+    if not devices:
+        return {}
+
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.STATUS_SNAPSHOT_MAX_AGE_SEC)
+    snaps = {
+        s.device_id: s
+        for s in db.query(DeviceStatusSnapshot).filter(
+            DeviceStatusSnapshot.device_id.in_([d.id for d in devices]),
+            DeviceStatusSnapshot.computed_at >= cutoff,
+        )
+    }
+
+    result = {device_id: _snapshot_to_status(snap) for device_id, snap in snaps.items()}
+    result.update(compute_status_batch(db, [d for d in devices if d.id not in snaps]))
+    return result
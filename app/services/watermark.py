@@ -0,0 +1,65 @@
+# api/app/services/watermark.py
+"""
+Ingest watermark.
+
+Every ingest transaction bumps the fleet-wide counter and the counter of each
+device it wrote readings for; the status scheduler bumps its own counter after
+each run. Read endpoints derive their ETags from these counters (see
+app/routers/common.py), so a conditional GET is answered from this small
+table without touching reading.
+"""
+from __future__ import annotations
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import IngestWatermark
+
+GLOBAL_SCOPE = 0
+STATUS_SCOPE = -1
+
+
+def _bump(db: Session, scopes: Iterable[int]) -> None:
+    # Sorted so concurrent transactions take the row locks in the same order
+    scopes = sorted(set(scopes))
+    if not scopes:
+        return
+    now = datetime.utcnow()
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(IngestWatermark).values(
+        [{"scope": scope, "version": 1, "updated_at": now} for scope in scopes]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["scope"],
+        set_={
+            "version": IngestWatermark.__table__.c.version + 1,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+
+
+def bump_ingest(db: Session, device_ids: Iterable[int]) -> None:
+    """Mark new readings for these devices. Runs in the caller's transaction."""
+    _bump(db, [GLOBAL_SCOPE, *device_ids])
+
+
+def bump_status(db: Session) -> None:
+    """Mark a status scheduler run (snapshots / transitions may have changed)."""
+    _bump(db, [STATUS_SCOPE])
+
+
+def get_versions(db: Session, scopes: Iterable[int]) -> dict[int, int]:
+    """{scope: version}; scopes never bumped read as 0."""
+    scopes = set(scopes)
+    rows = (
+        db.query(IngestWatermark.scope, IngestWatermark.version)
+        .filter(IngestWatermark.scope.in_(scopes))
+        .all()
+    )
+    versions = dict.fromkeys(scopes, 0)
+    versions.update(rows)
+    return versions
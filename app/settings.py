@@ -73,6 +73,46 @@ class Settings(BaseSettings):
     TEMP_MIN_C: float = 0.0
     TEMP_MAX_C: float = 50.0
 
+    # ---- Status scheduler ----
+    STATUS_SCHEDULER_ENABLED: bool = True
+    STATUS_SCHEDULER_INTERVAL_SEC: int = 300  # Recompute fleet status every 5 min
+    STATUS_BATCH_SIZE: int = 200  # Devices per batch/commit
+    STATUS_SNAPSHOT_MAX_AGE_SEC: int = 900  # Older snapshots are recomputed live by list endpoints
+
+    # ---- Farm clustering ----
+    FARM_CLUSTER_ENABLED: bool = True
+    FARM_CLUSTER_INTERVAL_SEC: int = 60  # Regroup devices whose config changed since the last run
+    FARM_CLUSTER_RADIUS_M: float = 1500.0  # Located devices this close (chained) share a farm
+
+    # ---- Neighbour anomaly detection ----
+    NEIGHBOR_ANOMALY_ENABLED: bool = True
+    NEIGHBOR_ANOMALY_INTERVAL_SEC: int = 900  # Scores are built from hourly rollups
+    NEIGHBOR_ANOMALY_K: int = 5  # Nearest probes in the same farm each probe is compared with
+    NEIGHBOR_ANOMALY_WINDOW_HOURS: int = 24  # Trajectory length
+    NEIGHBOR_ANOMALY_MIN_SCALE_PCT: float = 0.5  # Floor for neighbours' typical divergence (VWC %/h)
+    NEIGHBOR_ANOMALY_THRESHOLD: float = 3.0  # Flag probes scoring at or above this
+
+    # ---- Depth catalog ----
+    DEPTH_CACHE_TTL_SEC: int = 300  # In-process cache of per-device depths
+
+    # ---- Result cache (metrics endpoints) ----
+    RESULT_CACHE_BACKEND: Literal["memory", "redis", "off"] = "memory"
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # LRU budget for the memory backend
+    RESULT_CACHE_TTL_SEC: int = 3600  # Expiry for the redis backend
+    RESULT_CACHE_SNAP_SEC: int = 60  # Metrics cache keys snap from/to to this grid (queries keep the exact range)
+    REDIS_URL: Optional[str] = None  # e.g. redis://redis:6379/0 (docker-compose)
+
+    # ---- Bulk export ----
+    EXPORT_BATCH_SIZE: int = 50_000  # Rows per Arrow batch / Parquet row group
+
+    # ---- Partitioning / retention (Postgres) ----
+    PARTITION_MAINTENANCE_ENABLED: bool = True
+    PARTITION_MAINTENANCE_INTERVAL_SEC: int = 6 * 3600
+    PARTITION_PREMAKE_MONTHS: int = 3  # Monthly partitions created ahead of time
+    PARTITION_LOCK_TIMEOUT_MS: int = 3000  # Attach/detach give up instead of queueing behind queries
+    RETENTION_MONTHS: int = 0  # Raw reading/message months kept; 0 = keep forever (rollups are kept)
+    RETENTION_ACTION: Literal["detach", "drop"] = "detach"  # detach leaves the old table for archiving
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
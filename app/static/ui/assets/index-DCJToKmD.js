@@ -64,7 +64,7 @@ Error generating stack: `+o.message+`
  * LICENSE.md file in the root directory of this source tree.
  *
  * @license MIT
- */function Hv(){return Hv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Hv.apply(this,arguments)}function sN(e,t){if(e==null)return{};var n={},r=Object.keys(e),i,o;for(o=0;o<r.length;o++)i=r[o],!(t.indexOf(i)>=0)&&(n[i]=e[i]);return n}function uN(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function lN(e,t){return e.button===0&&(!t||t==="_self")&&!uN(e)}function Zv(e){return e===void 0&&(e=""),new URLSearchParams(typeof e=="string"||Array.isArray(e)||e instanceof URLSearchParams?e:Object.keys(e).reduce((t,n)=>{let r=e[n];return t.concat(Array.isArray(r)?r.map(i=>[n,i]):[[n,r]])},[]))}function cN(e,t){let n=Zv(e);return t&&t.forEach((r,i)=>{n.has(i)||t.getAll(i).forEach(o=>{n.append(i,o)})}),n}const fN=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],hN="6";try{window.__reactRouterVersion=hN}catch{}const dN="startTransition",fw=b$[dN];function pN(e){let{basename:t,children:n,future:r,window:i}=e,o=I.useRef();o.current==null&&(o.current=pI({window:i,v5Compat:!0}));let s=o.current,[l,c]=I.useState({action:s.action,location:s.location}),{v7_startTransition:f}=r||{},p=I.useCallback(d=>{f&&fw?fw(()=>c(d)):c(d)},[c,f]);return I.useLayoutEffect(()=>s.listen(p),[s,p]),I.useEffect(()=>rN(r),[r]),I.createElement(oN,{basename:t,children:n,location:l.location,navigationType:l.action,navigator:s,future:r})}const mN=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",vN=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,w0=I.forwardRef(function(t,n){let{onClick:r,relative:i,reloadDocument:o,replace:s,state:l,target:c,to:f,preventScrollReset:p,viewTransition:d}=t,m=sN(t,fN),{basename:y}=I.useContext(Hi),b,g=!1;if(typeof f=="string"&&vN.test(f)&&(b=f,mN))try{let w=new URL(window.location.href),E=f.startsWith("//")?new URL(w.protocol+f):new URL(f),O=g0(E.pathname,y);E.origin===w.origin&&O!=null?f=O+E.search+E.hash:g=!0}catch{}let P=FI(f,{relative:i}),_=yN(f,{replace:s,state:l,target:c,preventScrollReset:p,relative:i,viewTransition:d});function x(w){r&&r(w),w.defaultPrevented||_(w)}return I.createElement("a",Hv({},m,{href:b||P,onClick:g||o?r:x,ref:n,target:c}))});var hw;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(hw||(hw={}));var dw;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(dw||(dw={}));function yN(e,t){let{target:n,replace:r,state:i,preventScrollReset:o,relative:s,viewTransition:l}=t===void 0?{}:t,c=md(),f=Es(),p=ZT(e,{relative:s});return I.useCallback(d=>{if(lN(d,n)){d.preventDefault();let m=r!==void 0?r:Qf(f)===Qf(p);c(e,{replace:m,state:i,preventScrollReset:o,relative:s,viewTransition:l})}},[f,c,p,r,i,n,e,o,s,l])}function vd(e){let t=I.useRef(Zv(e)),n=I.useRef(!1),r=Es(),i=I.useMemo(()=>cN(r.search,n.current?null:t.current),[r.search]),o=md(),s=I.useCallback((l,c)=>{const f=Zv(typeof l=="function"?l(i):l);n.current=!0,o("?"+f,c)},[o,i]);return[i,s]}const GT=window.location.origin;async function Jl(e,t={}){const n=new URL(e,GT);Object.entries(t).forEach(([i,o])=>{Array.isArray(o)?o.forEach(s=>n.searchParams.append(i,String(s))):o!=null&&n.searchParams.set(i,String(o))});const r=await fetch(n.toString());if(!r.ok)throw new Error(await r.text());return r.json()}function gN(e){return Ss({queryKey:["summary",e],queryFn:()=>Jl("/v1/metrics/summary",e)})}function _N(e){return Ss({queryKey:["moisture",e],queryFn:()=>Jl("/v1/metrics/moisture-series",{...e,max_points:800})})}function bN(e){return Ss({queryKey:["temp",e],queryFn:()=>Jl("/v1/metrics/temp-series",{...e,max_points:800})})}function XT(){return Ss({queryKey:["attention"],queryFn:()=>Jl("/v1/devices/attention",{limit:20})})}function YT(e){return Ss({queryKey:["devices",e],queryFn:()=>Jl("/v1/devices",{farm_id:e})})}function xN(){return Ss({queryKey:["farms"],queryFn:async()=>{const e=new URL("/v1/farms",GT),t=await fetch(e.toString());if(t.status===404)return[];if(!t.ok)throw new Error(await t.text());return t.json()},staleTime:6e4,retry:0})}function QT(e){switch(e){case"red":return{bg:"bg-red-50",border:"border-red-300",text:"text-red-700",label:"Needs Attention"};case"amber":return{bg:"bg-amber-50",border:"border-amber-300",text:"text-amber-700",label:"Monitor"};case"stale":case"offline":return{bg:"bg-gray-50",border:"border-gray-300",text:"text-gray-600",label:"Offline"};case"gray":return{bg:"bg-gray-50",border:"border-gray-300",text:"text-gray-600",label:"No Data"};case"blue":return{bg:"bg-blue-50",border:"border-blue-300",text:"text-blue-700",label:"Too Wet"};case"green":default:return{bg:"bg-emerald-50",border:"border-emerald-300",text:"text-emerald-700",label:"Healthy"}}}function wN({status:e}){const t=QT(e);return k.jsxs("span",{className:`inline-flex items-center gap-1.5 px-2.5 py-1 rounded-full text-xs font-medium ${t.bg} ${t.text}`,children:[k.jsx("span",{className:`w-2 h-2 rounded-full ${e==="green"?"bg-emerald-500":e==="red"?"bg-red-500":e==="amber"?"bg-amber-500":e==="blue"?"bg-blue-500":"bg-gray-400"}`}),t.label]})}function SN({farm:e}){const t=QT(e.status);return k.jsxs(w0,{to:`/readings/farm/${e.id}`,className:`relative block p-5 rounded-2xl border-2 ${t.border} ${t.bg} hover:shadow-lg transition-all duration-200 cursor-pointer group overflow-hidden`,children:[k.jsxs("div",{className:"flex items-start justify-between mb-4",children:[k.jsxs("div",{children:[k.jsx("div",{className:"text-xs uppercase tracking-[0.35em] text-stone-500 mb-1",children:t.label}),k.jsx("h3",{className:"text-2xl font-semibold text-stone-900 group-hover:text-stone-950",children:e.name})]}),k.jsx(wN,{status:e.status})]}),k.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[k.jsxs("div",{children:[k.jsx("div",{className:"text-stone-500 mb-0.5",children:"Devices"}),k.jsx("div",{className:"text-xl font-semibold text-stone-900",children:e.device_count})]}),k.jsxs("div",{children:[k.jsx("div",{className:"text-stone-500 mb-0.5",children:"Last Reading"}),k.jsx("div",{className:"text-base font-medium text-stone-800",children:e.last_reading||"No data"})]})]}),e.attention_count>0&&k.jsxs("div",{className:"mt-3 pt-3 border-t border-stone-200 flex items-center justify-between text-sm",children:[k.jsxs("span",{className:"text-red-600 font-medium",children:[e.attention_count," device",e.attention_count>1?"s":""," need",e.attention_count===1?"s":""," attention"]}),k.jsx("span",{className:"text-stone-500",children:"Monitor"})]})]})}function JT(e,t){const n=I.useRef(t);I.useEffect(function(){t!==n.current&&e.attributionControl!=null&&(n.current!=null&&e.attributionControl.removeAttribution(n.current),t!=null&&e.attributionControl.addAttribution(t)),n.current=t},[e,t])}const PN=1;function ON(e){return Object.freeze({__version:PN,map:e})}function EN(e,t){return Object.freeze({...e,...t})}const eA=I.createContext(null),tA=eA.Provider;function S0(){const e=I.useContext(eA);if(e==null)throw new Error("No context provided: useLeafletContext() can only be used in a descendant of <MapContainer>");return e}function TN(e){function t(n,r){const{instance:i,context:o}=e(n).current;return I.useImperativeHandle(r,()=>i),n.children==null?null:z.createElement(tA,{value:o},n.children)}return I.forwardRef(t)}function AN(e){function t(n,r){const[i,o]=I.useState(!1),{instance:s}=e(n,o).current;I.useImperativeHandle(r,()=>s),I.useEffect(function(){i&&s.update()},[s,i,n.children]);const l=s._contentNode;return l?AT.createPortal(n.children,l):null}return I.forwardRef(t)}function CN(e){function t(n,r){const{instance:i}=e(n).current;return I.useImperativeHandle(r,()=>i),null}return I.forwardRef(t)}function nA(e,t){const n=I.useRef();I.useEffect(function(){return t!=null&&e.instance.on(t),n.current=t,function(){n.current!=null&&e.instance.off(n.current),n.current=null}},[e,t])}function P0(e,t){const n=e.pane??t.pane;return n?{...e,pane:n}:e}function MN(e,t){return function(r,i){const o=S0(),s=e(P0(r,o),o);return JT(o.map,r.attribution),nA(s.current,r.eventHandlers),t(s.current,o,r,i),s}}var qv={exports:{}};/* @preserve
+ */function Hv(){return Hv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Hv.apply(this,arguments)}function sN(e,t){if(e==null)return{};var n={},r=Object.keys(e),i,o;for(o=0;o<r.length;o++)i=r[o],!(t.indexOf(i)>=0)&&(n[i]=e[i]);return n}function uN(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function lN(e,t){return e.button===0&&(!t||t==="_self")&&!uN(e)}function Zv(e){return e===void 0&&(e=""),new URLSearchParams(typeof e=="string"||Array.isArray(e)||e instanceof URLSearchParams?e:Object.keys(e).reduce((t,n)=>{let r=e[n];return t.concat(Array.isArray(r)?r.map(i=>[n,i]):[[n,r]])},[]))}function cN(e,t){let n=Zv(e);return t&&t.forEach((r,i)=>{n.has(i)||t.getAll(i).forEach(o=>{n.append(i,o)})}),n}const fN=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],hN="6";try{window.__reactRouterVersion=hN}catch{}const dN="startTransition",fw=b$[dN];function pN(e){let{basename:t,children:n,future:r,window:i}=e,o=I.useRef();o.current==null&&(o.current=pI({window:i,v5Compat:!0}));let s=o.current,[l,c]=I.useState({action:s.action,location:s.location}),{v7_startTransition:f}=r||{},p=I.useCallback(d=>{f&&fw?fw(()=>c(d)):c(d)},[c,f]);return I.useLayoutEffect(()=>s.listen(p),[s,p]),I.useEffect(()=>rN(r),[r]),I.createElement(oN,{basename:t,children:n,location:l.location,navigationType:l.action,navigator:s,future:r})}const mN=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",vN=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,w0=I.forwardRef(function(t,n){let{onClick:r,relative:i,reloadDocument:o,replace:s,state:l,target:c,to:f,preventScrollReset:p,viewTransition:d}=t,m=sN(t,fN),{basename:y}=I.useContext(Hi),b,g=!1;if(typeof f=="string"&&vN.test(f)&&(b=f,mN))try{let w=new URL(window.location.href),E=f.startsWith("//")?new URL(w.protocol+f):new URL(f),O=g0(E.pathname,y);E.origin===w.origin&&O!=null?f=O+E.search+E.hash:g=!0}catch{}let P=FI(f,{relative:i}),_=yN(f,{replace:s,state:l,target:c,preventScrollReset:p,relative:i,viewTransition:d});function x(w){r&&r(w),w.defaultPrevented||_(w)}return I.createElement("a",Hv({},m,{href:b||P,onClick:g||o?r:x,ref:n,target:c}))});var hw;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(hw||(hw={}));var dw;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(dw||(dw={}));function yN(e,t){let{target:n,replace:r,state:i,preventScrollReset:o,relative:s,viewTransition:l}=t===void 0?{}:t,c=md(),f=Es(),p=ZT(e,{relative:s});return I.useCallback(d=>{if(lN(d,n)){d.preventDefault();let m=r!==void 0?r:Qf(f)===Qf(p);c(e,{replace:m,state:i,preventScrollReset:o,relative:s,viewTransition:l})}},[f,c,p,r,i,n,e,o,s,l])}function vd(e){let t=I.useRef(Zv(e)),n=I.useRef(!1),r=Es(),i=I.useMemo(()=>cN(r.search,n.current?null:t.current),[r.search]),o=md(),s=I.useCallback((l,c)=>{const f=Zv(typeof l=="function"?l(i):l);n.current=!0,o("?"+f,c)},[o,i]);return[i,s]}const GT=window.location.origin;async function Jl(e,t={}){const n=new URL(e,GT);Object.entries(t).forEach(([i,o])=>{Array.isArray(o)?o.forEach(s=>n.searchParams.append(i,String(s))):o!=null&&n.searchParams.set(i,String(o))});const r=await fetch(n.toString());if(!r.ok)throw new Error(await r.text());return r.json()}function gN(e){return Ss({queryKey:["summary",e],queryFn:()=>Jl("/v1/metrics/summary",e)})}function _N(e){return Ss({queryKey:["moisture",e],queryFn:()=>Jl("/v1/metrics/moisture-series",{...e,max_points:800})})}function bN(e){return Ss({queryKey:["temp",e],queryFn:()=>Jl("/v1/metrics/temp-series",{...e,max_points:800})})}function XT(){return Ss({queryKey:["attention"],queryFn:()=>Jl("/v1/devices/attention",{limit:20})})}function YT(e){return Ss({queryKey:["devices",e],queryFn:async()=>(await Jl("/v1/devices",{farm_id:e,limit:500})).items})}function xN(){return Ss({queryKey:["farms"],queryFn:async()=>{const e=new URL("/v1/farms",GT),t=await fetch(e.toString());if(t.status===404)return[];if(!t.ok)throw new Error(await t.text());return t.json()},staleTime:6e4,retry:0})}function QT(e){switch(e){case"red":return{bg:"bg-red-50",border:"border-red-300",text:"text-red-700",label:"Needs Attention"};case"amber":return{bg:"bg-amber-50",border:"border-amber-300",text:"text-amber-700",label:"Monitor"};case"stale":case"offline":return{bg:"bg-gray-50",border:"border-gray-300",text:"text-gray-600",label:"Offline"};case"gray":return{bg:"bg-gray-50",border:"border-gray-300",text:"text-gray-600",label:"No Data"};case"blue":return{bg:"bg-blue-50",border:"border-blue-300",text:"text-blue-700",label:"Too Wet"};case"green":default:return{bg:"bg-emerald-50",border:"border-emerald-300",text:"text-emerald-700",label:"Healthy"}}}function wN({status:e}){const t=QT(e);return k.jsxs("span",{className:`inline-flex items-center gap-1.5 px-2.5 py-1 rounded-full text-xs font-medium ${t.bg} ${t.text}`,children:[k.jsx("span",{className:`w-2 h-2 rounded-full ${e==="green"?"bg-emerald-500":e==="red"?"bg-red-500":e==="amber"?"bg-amber-500":e==="blue"?"bg-blue-500":"bg-gray-400"}`}),t.label]})}function SN({farm:e}){const t=QT(e.status);return k.jsxs(w0,{to:`/readings/farm/${e.id}`,className:`relative block p-5 rounded-2xl border-2 ${t.border} ${t.bg} hover:shadow-lg transition-all duration-200 cursor-pointer group overflow-hidden`,children:[k.jsxs("div",{className:"flex items-start justify-between mb-4",children:[k.jsxs("div",{children:[k.jsx("div",{className:"text-xs uppercase tracking-[0.35em] text-stone-500 mb-1",children:t.label}),k.jsx("h3",{className:"text-2xl font-semibold text-stone-900 group-hover:text-stone-950",children:e.name})]}),k.jsx(wN,{status:e.status})]}),k.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[k.jsxs("div",{children:[k.jsx("div",{className:"text-stone-500 mb-0.5",children:"Devices"}),k.jsx("div",{className:"text-xl font-semibold text-stone-900",children:e.device_count})]}),k.jsxs("div",{children:[k.jsx("div",{className:"text-stone-500 mb-0.5",children:"Last Reading"}),k.jsx("div",{className:"text-base font-medium text-stone-800",children:e.last_reading||"No data"})]})]}),e.attention_count>0&&k.jsxs("div",{className:"mt-3 pt-3 border-t border-stone-200 flex items-center justify-between text-sm",children:[k.jsxs("span",{className:"text-red-600 font-medium",children:[e.attention_count," device",e.attention_count>1?"s":""," need",e.attention_count===1?"s":""," attention"]}),k.jsx("span",{className:"text-stone-500",children:"Monitor"})]})]})}function JT(e,t){const n=I.useRef(t);I.useEffect(function(){t!==n.current&&e.attributionControl!=null&&(n.current!=null&&e.attributionControl.removeAttribution(n.current),t!=null&&e.attributionControl.addAttribution(t)),n.current=t},[e,t])}const PN=1;function ON(e){return Object.freeze({__version:PN,map:e})}function EN(e,t){return Object.freeze({...e,...t})}const eA=I.createContext(null),tA=eA.Provider;function S0(){const e=I.useContext(eA);if(e==null)throw new Error("No context provided: useLeafletContext() can only be used in a descendant of <MapContainer>");return e}function TN(e){function t(n,r){const{instance:i,context:o}=e(n).current;return I.useImperativeHandle(r,()=>i),n.children==null?null:z.createElement(tA,{value:o},n.children)}return I.forwardRef(t)}function AN(e){function t(n,r){const[i,o]=I.useState(!1),{instance:s}=e(n,o).current;I.useImperativeHandle(r,()=>s),I.useEffect(function(){i&&s.update()},[s,i,n.children]);const l=s._contentNode;return l?AT.createPortal(n.children,l):null}return I.forwardRef(t)}function CN(e){function t(n,r){const{instance:i}=e(n).current;return I.useImperativeHandle(r,()=>i),null}return I.forwardRef(t)}function nA(e,t){const n=I.useRef();I.useEffect(function(){return t!=null&&e.instance.on(t),n.current=t,function(){n.current!=null&&e.instance.off(n.current),n.current=null}},[e,t])}function P0(e,t){const n=e.pane??t.pane;return n?{...e,pane:n}:e}function MN(e,t){return function(r,i){const o=S0(),s=e(P0(r,o),o);return JT(o.map,r.attribution),nA(s.current,r.eventHandlers),t(s.current,o,r,i),s}}var qv={exports:{}};/* @preserve
  * Leaflet 1.9.4, a JS library for interactive maps. https://leafletjs.com
  * (c) 2010-2023 Vladimir Agafonkin, (c) 2010-2011 CloudMade
  */(function(e,t){(function(n,r){r(t)})(_u,function(n){var r="1.9.4";function i(a){var u,h,v,S;for(h=1,v=arguments.length;h<v;h++){S=arguments[h];for(u in S)a[u]=S[u]}return a}var o=Object.create||function(){function a(){}return function(u){return a.prototype=u,new a}}();function s(a,u){var h=Array.prototype.slice;if(a.bind)return a.bind.apply(a,h.call(arguments,1));var v=h.call(arguments,2);return function(){return a.apply(u,v.length?v.concat(h.call(arguments)):arguments)}}var l=0;function c(a){return"_leaflet_id"in a||(a._leaflet_id=++l),a._leaflet_id}function f(a,u,h){var v,S,A,$;return $=function(){v=!1,S&&(A.apply(h,S),S=!1)},A=function(){v?S=arguments:(a.apply(h,arguments),setTimeout($,u),v=!0)},A}function p(a,u,h){var v=u[1],S=u[0],A=v-S;return a===v&&h?a:((a-S)%A+A)%A+S}function d(){return!1}function m(a,u){if(u===!1)return a;var h=Math.pow(10,u===void 0?6:u);return Math.round(a*h)/h}function y(a){return a.trim?a.trim():a.replace(/^\s+|\s+$/g,"")}function b(a){return y(a).split(/\s+/)}function g(a,u){Object.prototype.hasOwnProperty.call(a,"options")||(a.options=a.options?o(a.options):{});for(var h in u)a.options[h]=u[h];return a.options}function P(a,u,h){var v=[];for(var S in a)v.push(encodeURIComponent(h?S.toUpperCase():S)+"="+encodeURIComponent(a[S]));return(!u||u.indexOf("?")===-1?"?":"&")+v.join("&")}var _=/\{ *([\w_ -]+) *\}/g;function x(a,u){return a.replace(_,function(h,v){var S=u[v];if(S===void 0)throw new Error("No value provided for variable "+h);return typeof S=="function"&&(S=S(u)),S})}var w=Array.isArray||function(a){return Object.prototype.toString.call(a)==="[object Array]"};function E(a,u){for(var h=0;h<a.length;h++)if(a[h]===u)return h;return-1}var O="data:image/gif;base64,R0lGODlhAQABAAD/ACwAAAAAAQABAAACADs=";function T(a){return window["webkit"+a]||window["moz"+a]||window["ms"+a]}var C=0;function M(a){var u=+new Date,h=Math.max(0,16-(u-C));return C=u+h,window.setTimeout(a,h)}var j=window.requestAnimationFrame||T("RequestAnimationFrame")||M,R=window.cancelAnimationFrame||T("CancelAnimationFrame")||T("CancelRequestAnimationFrame")||function(a){window.clearTimeout(a)};function N(a,u,h){if(h&&j===M)a.call(u);else return j.call(window,s(a,u))}function F(a){a&&R.call(window,a)}var K={__proto__:null,extend:i,create:o,bind:s,get lastId(){return l},stamp:c,throttle:f,wrapNum:p,falseFn:d,formatNum:m,trim:y,splitWords:b,setOptions:g,getParamString:P,template:x,isArray:w,indexOf:E,emptyImageUrl:O,requestFn:j,cancelFn:R,requestAnimFrame:N,cancelAnimFrame:F};function q(){}q.extend=function(a){var u=function(){g(this),this.initialize&&this.initialize.apply(this,arguments),this.callInitHooks()},h=u.__super__=this.prototype,v=o(h);v.constructor=u,u.prototype=v;for(var S in this)Object.prototype.hasOwnProperty.call(this,S)&&S!=="prototype"&&S!=="__super__"&&(u[S]=this[S]);return a.statics&&i(u,a.statics),a.includes&&(G(a.includes),i.apply(null,[v].concat(a.includes))),i(v,a),delete v.statics,delete v.includes,v.options&&(v.options=h.options?o(h.options):{},i(v.options,a.options)),v._initHooks=[],v.callInitHooks=function(){if(!this._initHooksCalled){h.callInitHooks&&h.callInitHooks.call(this),this._initHooksCalled=!0;for(var A=0,$=v._initHooks.length;A<$;A++)v._initHooks[A].call(this)}},u},q.include=function(a){var u=this.prototype.options;return i(this.prototype,a),a.options&&(this.prototype.options=u,this.mergeOptions(a.options)),this},q.mergeOptions=function(a){return i(this.prototype.options,a),this},q.addInitHook=function(a){var u=Array.prototype.slice.call(arguments,1),h=typeof a=="function"?a:function(){this[a].apply(this,u)};return this.prototype._initHooks=this.prototype._initHooks||[],this.prototype._initHooks.push(h),this};function G(a){if(!(typeof L>"u"||!L||!L.Mixin)){a=w(a)?a:[a];for(var u=0;u<a.length;u++)a[u]===L.Mixin.Events&&console.warn("Deprecated include of L.Mixin.Events: this property will be removed in future releases, please inherit from L.Evented instead.",new Error().stack)}}var Z={on:function(a,u,h){if(typeof a=="object")for(var v in a)this._on(v,a[v],u);else{a=b(a);for(var S=0,A=a.length;S<A;S++)this._on(a[S],u,h)}return this},off:function(a,u,h){if(!arguments.length)delete this._events;else if(typeof a=="object")for(var v in a)this._off(v,a[v],u);else{a=b(a);for(var S=arguments.length===1,A=0,$=a.length;A<$;A++)S?this._off(a[A]):this._off(a[A],u,h)}return this},_on:function(a,u,h,v){if(typeof u!="function"){console.warn("wrong listener type: "+typeof u);return}if(this._listens(a,u,h)===!1){h===this&&(h=void 0);var S={fn:u,ctx:h};v&&(S.once=!0),this._events=this._events||{},this._events[a]=this._events[a]||[],this._events[a].push(S)}},_off:function(a,u,h){var v,S,A;if(this._events&&(v=this._events[a],!!v)){if(arguments.length===1){if(this._firingCount)for(S=0,A=v.length;S<A;S++)v[S].fn=d;delete this._events[a];return}if(typeof u!="function"){console.warn("wrong listener type: "+typeof u);return}var $=this._listens(a,u,h);if($!==!1){var U=v[$];this._firingCount&&(U.fn=d,this._events[a]=v=v.slice()),v.splice($,1)}}},fire:function(a,u,h){if(!this.listens(a,h))return this;var v=i({},u,{type:a,target:this,sourceTarget:u&&u.sourceTarget||this});if(this._events){var S=this._events[a];if(S){this._firingCount=this._firingCount+1||1;for(var A=0,$=S.length;A<$;A++){var U=S[A],W=U.fn;U.once&&this.off(a,W,U.ctx),W.call(U.ctx||this,v)}this._firingCount--}}return h&&this._propagateEvent(v),this},listens:function(a,u,h,v){typeof a!="string"&&console.warn('"string" type argument expected');var S=u;typeof u!="function"&&(v=!!u,S=void 0,h=void 0);var A=this._events&&this._events[a];if(A&&A.length&&this._listens(a,S,h)!==!1)return!0;if(v){for(var $ in this._eventParents)if(this._eventParents[$].listens(a,u,h,v))return!0}return!1},_listens:function(a,u,h){if(!this._events)return!1;var v=this._events[a]||[];if(!u)return!!v.length;h===this&&(h=void 0);for(var S=0,A=v.length;S<A;S++)if(v[S].fn===u&&v[S].ctx===h)return S;return!1},once:function(a,u,h){if(typeof a=="object")for(var v in a)this._on(v,a[v],u,!0);else{a=b(a);for(var S=0,A=a.length;S<A;S++)this._on(a[S],u,h,!0)}return this},addEventParent:function(a){return this._eventParents=this._eventParents||{},this._eventParents[c(a)]=a,this},removeEventParent:function(a){return this._eventParents&&delete this._eventParents[c(a)],this},_propagateEvent:function(a){for(var u in this._eventParents)this._eventParents[u].fire(a.type,i({layer:a.target,propagatedFrom:a.target},a),!0)}};Z.addEventListener=Z.on,Z.removeEventListener=Z.clearAllEventListeners=Z.off,Z.addOneTimeEventListener=Z.once,Z.fireEvent=Z.fire,Z.hasEventListeners=Z.listens;var Y=q.extend(Z);function B(a,u,h){this.x=h?Math.round(a):a,this.y=h?Math.round(u):u}var X=Math.trunc||function(a){return a>0?Math.floor(a):Math.ceil(a)};B.prototype={clone:function(){return new B(this.x,this.y)},add:function(a){return this.clone()._add(H(a))},_add:function(a){return this.x+=a.x,this.y+=a.y,this},subtract:function(a){return this.clone()._subtract(H(a))},_subtract:function(a){return this.x-=a.x,this.y-=a.y,this},divideBy:function(a){return this.clone()._divideBy(a)},_divideBy:function(a){return this.x/=a,this.y/=a,this},multiplyBy:function(a){return this.clone()._multiplyBy(a)},_multiplyBy:function(a){return this.x*=a,this.y*=a,this},scaleBy:function(a){return new B(this.x*a.x,this.y*a.y)},unscaleBy:function(a){return new B(this.x/a.x,this.y/a.y)},round:function(){return this.clone()._round()},_round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this},floor:function(){return this.clone()._floor()},_floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this},ceil:function(){return this.clone()._ceil()},_ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this},trunc:function(){return this.clone()._trunc()},_trunc:function(){return this.x=X(this.x),this.y=X(this.y),this},distanceTo:function(a){a=H(a);var u=a.x-this.x,h=a.y-this.y;return Math.sqrt(u*u+h*h)},equals:function(a){return a=H(a),a.x===this.x&&a.y===this.y},contains:function(a){return a=H(a),Math.abs(a.x)<=Math.abs(this.x)&&Math.abs(a.y)<=Math.abs(this.y)},toString:function(){return"Point("+m(this.x)+", "+m(this.y)+")"}};function H(a,u,h){return a instanceof B?a:w(a)?new B(a[0],a[1]):a==null?a:typeof a=="object"&&"x"in a&&"y"in a?new B(a.x,a.y):new B(a,u,h)}function te(a,u){if(a)for(var h=u?[a,u]:a,v=0,S=h.length;v<S;v++)this.extend(h[v])}te.prototype={extend:function(a){var u,h;if(!a)return this;if(a instanceof B||typeof a[0]=="number"||"x"in a)u=h=H(a);else if(a=J(a),u=a.min,h=a.max,!u||!h)return this;return!this.min&&!this.max?(this.min=u.clone(),this.max=h.clone()):(this.min.x=Math.min(u.x,this.min.x),this.max.x=Math.max(h.x,this.max.x),this.min.y=Math.min(u.y,this.min.y),this.max.y=Math.max(h.y,this.max.y)),this},getCenter:function(a){return H((this.min.x+this.max.x)/2,(this.min.y+this.max.y)/2,a)},getBottomLeft:function(){return H(this.min.x,this.max.y)},getTopRight:function(){return H(this.max.x,this.min.y)},getTopLeft:function(){return this.min},getBottomRight:function(){return this.max},getSize:function(){return this.max.subtract(this.min)},contains:function(a){var u,h;return typeof a[0]=="number"||a instanceof B?a=H(a):a=J(a),a instanceof te?(u=a.min,h=a.max):u=h=a,u.x>=this.min.x&&h.x<=this.max.x&&u.y>=this.min.y&&h.y<=this.max.y},intersects:function(a){a=J(a);var u=this.min,h=this.max,v=a.min,S=a.max,A=S.x>=u.x&&v.x<=h.x,$=S.y>=u.y&&v.y<=h.y;return A&&$},overlaps:function(a){a=J(a);var u=this.min,h=this.max,v=a.min,S=a.max,A=S.x>u.x&&v.x<h.x,$=S.y>u.y&&v.y<h.y;return A&&$},isValid:function(){return!!(this.min&&this.max)},pad:function(a){var u=this.min,h=this.max,v=Math.abs(u.x-h.x)*a,S=Math.abs(u.y-h.y)*a;return J(H(u.x-v,u.y-S),H(h.x+v,h.y+S))},equals:function(a){return a?(a=J(a),this.min.equals(a.getTopLeft())&&this.max.equals(a.getBottomRight())):!1}};function J(a,u){return!a||a instanceof te?a:new te(a,u)}function ae(a,u){if(a)for(var h=u?[a,u]:a,v=0,S=h.length;v<S;v++)this.extend(h[v])}ae.prototype={extend:function(a){var u=this._southWest,h=this._northEast,v,S;if(a instanceof de)v=a,S=a;else if(a instanceof ae){if(v=a._southWest,S=a._northEast,!v||!S)return this}else return a?this.extend(ce(a)||he(a)):this;return!u&&!h?(this._southWest=new de(v.lat,v.lng),this._northEast=new de(S.lat,S.lng)):(u.lat=Math.min(v.lat,u.lat),u.lng=Math.min(v.lng,u.lng),h.lat=Math.max(S.lat,h.lat),h.lng=Math.max(S.lng,h.lng)),this},pad:function(a){var u=this._southWest,h=this._northEast,v=Math.abs(u.lat-h.lat)*a,S=Math.abs(u.lng-h.lng)*a;return new ae(new de(u.lat-v,u.lng-S),new de(h.lat+v,h.lng+S))},getCenter:function(){return new de((this._southWest.lat+this._northEast.lat)/2,(this._southWest.lng+this._northEast.lng)/2)},getSouthWest:function(){return this._southWest},getNorthEast:function(){return this._northEast},getNorthWest:function(){return new de(this.getNorth(),this.getWest())},getSouthEast:function(){return new de(this.getSouth(),this.getEast())},getWest:function(){return this._southWest.lng},getSouth:function(){return this._southWest.lat},getEast:function(){return this._northEast.lng},getNorth:function(){return this._northEast.lat},contains:function(a){typeof a[0]=="number"||a instanceof de||"lat"in a?a=ce(a):a=he(a);var u=this._southWest,h=this._northEast,v,S;return a instanceof ae?(v=a.getSouthWest(),S=a.getNorthEast()):v=S=a,v.lat>=u.lat&&S.lat<=h.lat&&v.lng>=u.lng&&S.lng<=h.lng},intersects:function(a){a=he(a);var u=this._southWest,h=this._northEast,v=a.getSouthWest(),S=a.getNorthEast(),A=S.lat>=u.lat&&v.lat<=h.lat,$=S.lng>=u.lng&&v.lng<=h.lng;return A&&$},overlaps:function(a){a=he(a);var u=this._southWest,h=this._northEast,v=a.getSouthWest(),S=a.getNorthEast(),A=S.lat>u.lat&&v.lat<h.lat,$=S.lng>u.lng&&v.lng<h.lng;return A&&$},toBBoxString:function(){return[this.getWest(),this.getSouth(),this.getEast(),this.getNorth()].join(",")},equals:function(a,u){return a?(a=he(a),this._southWest.equals(a.getSouthWest(),u)&&this._northEast.equals(a.getNorthEast(),u)):!1},isValid:function(){return!!(this._southWest&&this._northEast)}};function he(a,u){return a instanceof ae?a:new ae(a,u)}function de(a,u,h){if(isNaN(a)||isNaN(u))throw new Error("Invalid LatLng object: ("+a+", "+u+")");this.lat=+a,this.lng=+u,h!==void 0&&(this.alt=+h)}de.prototype={equals:function(a,u){if(!a)return!1;a=ce(a);var h=Math.max(Math.abs(this.lat-a.lat),Math.abs(this.lng-a.lng));return h<=(u===void 0?1e-9:u)},toString:function(a){return"LatLng("+m(this.lat,a)+", "+m(this.lng,a)+")"},distanceTo:function(a){return Ye.distance(this,ce(a))},wrap:function(){return Ye.wrapLatLng(this)},toBounds:function(a){var u=180*a/40075017,h=u/Math.cos(Math.PI/180*this.lat);return he([this.lat-u,this.lng-h],[this.lat+u,this.lng+h])},clone:function(){return new de(this.lat,this.lng,this.alt)}};function ce(a,u,h){return a instanceof de?a:w(a)&&typeof a[0]!="object"?a.length===3?new de(a[0],a[1],a[2]):a.length===2?new de(a[0],a[1]):null:a==null?a:typeof a=="object"&&"lat"in a?new de(a.lat,"lng"in a?a.lng:a.lon,a.alt):u===void 0?null:new de(a,u,h)}var nt={latLngToPoint:function(a,u){var h=this.projection.project(a),v=this.scale(u);return this.transformation._transform(h,v)},pointToLatLng:function(a,u){var h=this.scale(u),v=this.transformation.untransform(a,h);return this.projection.unproject(v)},project:function(a){return this.projection.project(a)},unproject:function(a){return this.projection.unproject(a)},scale:function(a){return 256*Math.pow(2,a)},zoom:function(a){return Math.log(a/256)/Math.LN2},getProjectedBounds:function(a){if(this.infinite)return null;var u=this.projection.bounds,h=this.scale(a),v=this.transformation.transform(u.min,h),S=this.transformation.transform(u.max,h);return new te(v,S)},infinite:!1,wrapLatLng:function(a){var u=this.wrapLng?p(a.lng,this.wrapLng,!0):a.lng,h=this.wrapLat?p(a.lat,this.wrapLat,!0):a.lat,v=a.alt;return new de(h,u,v)},wrapLatLngBounds:function(a){var u=a.getCenter(),h=this.wrapLatLng(u),v=u.lat-h.lat,S=u.lng-h.lng;if(v===0&&S===0)return a;var A=a.getSouthWest(),$=a.getNorthEast(),U=new de(A.lat-v,A.lng-S),W=new de($.lat-v,$.lng-S);return new ae(U,W)}},Ye=i({},nt,{wrapLng:[-180,180],R:6371e3,distance:function(a,u){var h=Math.PI/180,v=a.lat*h,S=u.lat*h,A=Math.sin((u.lat-a.lat)*h/2),$=Math.sin((u.lng-a.lng)*h/2),U=A*A+Math.cos(v)*Math.cos(S)*$*$,W=2*Math.atan2(Math.sqrt(U),Math.sqrt(1-U));return this.R*W}}),ie=6378137,ye={R:ie,MAX_LATITUDE:85.0511287798,project:function(a){var u=Math.PI/180,h=this.MAX_LATITUDE,v=Math.max(Math.min(h,a.lat),-h),S=Math.sin(v*u);return new B(this.R*a.lng*u,this.R*Math.log((1+S)/(1-S))/2)},unproject:function(a){var u=180/Math.PI;return new de((2*Math.atan(Math.exp(a.y/this.R))-Math.PI/2)*u,a.x*u/this.R)},bounds:function(){var a=ie*Math.PI;return new te([-a,-a],[a,a])}()};function ge(a,u,h,v){if(w(a)){this._a=a[0],this._b=a[1],this._c=a[2],this._d=a[3];return}this._a=a,this._b=u,this._c=h,this._d=v}ge.prototype={transform:function(a,u){return this._transform(a.clone(),u)},_transform:function(a,u){return u=u||1,a.x=u*(this._a*a.x+this._b),a.y=u*(this._c*a.y+this._d),a},untransform:function(a,u){return u=u||1,new B((a.x/u-this._b)/this._a,(a.y/u-this._d)/this._c)}};function ee(a,u,h,v){return new ge(a,u,h,v)}var Fe=i({},Ye,{code:"EPSG:3857",projection:ye,transformation:function(){var a=.5/(Math.PI*ye.R);return ee(a,.5,-a,.5)}()}),Oe=i({},Fe,{code:"EPSG:900913"});function rt(a){return document.createElementNS("http://www.w3.org/2000/svg",a)}function it(a,u){var h="",v,S,A,$,U,W;for(v=0,A=a.length;v<A;v++){for(U=a[v],S=0,$=U.length;S<$;S++)W=U[S],h+=(S?"L":"M")+W.x+" "+W.y;h+=u?fe.svg?"z":"x":""}return h||"M0 0"}var St=document.documentElement.style,ln="ActiveXObject"in window,ri=ln&&!document.addEventListener,Xi="msLaunchUri"in navigator&&!("documentMode"in document),Fn=ur("webkit"),sr=ur("android"),Vo=ur("android 2")||ur("android 3"),dc=parseInt(/WebKit\/([0-9]+)|$/.exec(navigator.userAgent)[1],10),pc=sr&&ur("Google")&&dc<537&&!("AudioNode"in window),ip=!!window.opera,I_=!Xi&&ur("chrome"),N_=ur("gecko")&&!Fn&&!ip&&!ln,Rk=!I_&&ur("safari"),D_=ur("phantom"),R_="OTransition"in St,Bk=navigator.platform.indexOf("Win")===0,B_=ln&&"transition"in St,op="WebKitCSSMatrix"in window&&"m11"in new window.WebKitCSSMatrix&&!Vo,z_="MozPerspective"in St,zk=!window.L_DISABLE_3D&&(B_||op||z_)&&!R_&&!D_,Us=typeof orientation<"u"||ur("mobile"),Fk=Us&&Fn,Uk=Us&&op,F_=!window.PointerEvent&&window.MSPointerEvent,U_=!!(window.PointerEvent||F_),W_="ontouchstart"in window||!!window.TouchEvent,Wk=!window.L_NO_TOUCH&&(W_||U_),Hk=Us&&ip,Zk=Us&&N_,qk=(window.devicePixelRatio||window.screen.deviceXDPI/window.screen.logicalXDPI)>1,Vk=function(){var a=!1;try{var u=Object.defineProperty({},"passive",{get:function(){a=!0}});window.addEventListener("testPassiveEventSupport",d,u),window.removeEventListener("testPassiveEventSupport",d,u)}catch{}return a}(),Kk=function(){return!!document.createElement("canvas").getContext}(),ap=!!(document.createElementNS&&rt("svg").createSVGRect),Gk=!!ap&&function(){var a=document.createElement("div");return a.innerHTML="<svg/>",(a.firstChild&&a.firstChild.namespaceURI)==="http://www.w3.org/2000/svg"}(),Xk=!ap&&function(){try{var a=document.createElement("div");a.innerHTML='<v:shape adj="1"/>';var u=a.firstChild;return u.style.behavior="url(#default#VML)",u&&typeof u.adj=="object"}catch{return!1}}(),Yk=navigator.platform.indexOf("Mac")===0,Qk=navigator.platform.indexOf("Linux")===0;function ur(a){return navigator.userAgent.toLowerCase().indexOf(a)>=0}var fe={ie:ln,ielt9:ri,edge:Xi,webkit:Fn,android:sr,android23:Vo,androidStock:pc,opera:ip,chrome:I_,gecko:N_,safari:Rk,phantom:D_,opera12:R_,win:Bk,ie3d:B_,webkit3d:op,gecko3d:z_,any3d:zk,mobile:Us,mobileWebkit:Fk,mobileWebkit3d:Uk,msPointer:F_,pointer:U_,touch:Wk,touchNative:W_,mobileOpera:Hk,mobileGecko:Zk,retina:qk,passiveEvents:Vk,canvas:Kk,svg:ap,vml:Xk,inlineSvg:Gk,mac:Yk,linux:Qk},H_=fe.msPointer?"MSPointerDown":"pointerdown",Z_=fe.msPointer?"MSPointerMove":"pointermove",q_=fe.msPointer?"MSPointerUp":"pointerup",V_=fe.msPointer?"MSPointerCancel":"pointercancel",sp={touchstart:H_,touchmove:Z_,touchend:q_,touchcancel:V_},K_={touchstart:i2,touchmove:mc,touchend:mc,touchcancel:mc},Ko={},G_=!1;function Jk(a,u,h){return u==="touchstart"&&r2(),K_[u]?(h=K_[u].bind(this,h),a.addEventListener(sp[u],h,!1),h):(console.warn("wrong event specified:",u),d)}function e2(a,u,h){if(!sp[u]){console.warn("wrong event specified:",u);return}a.removeEventListener(sp[u],h,!1)}function t2(a){Ko[a.pointerId]=a}function n2(a){Ko[a.pointerId]&&(Ko[a.pointerId]=a)}function X_(a){delete Ko[a.pointerId]}function r2(){G_||(document.addEventListener(H_,t2,!0),document.addEventListener(Z_,n2,!0),document.addEventListener(q_,X_,!0),document.addEventListener(V_,X_,!0),G_=!0)}function mc(a,u){if(u.pointerType!==(u.MSPOINTER_TYPE_MOUSE||"mouse")){u.touches=[];for(var h in Ko)u.touches.push(Ko[h]);u.changedTouches=[u],a(u)}}function i2(a,u){u.MSPOINTER_TYPE_TOUCH&&u.pointerType===u.MSPOINTER_TYPE_TOUCH&&Mt(u),mc(a,u)}function o2(a){var u={},h,v;for(v in a)h=a[v],u[v]=h&&h.bind?h.bind(a):h;return a=u,u.type="dblclick",u.detail=2,u.isTrusted=!1,u._simulated=!0,u}var a2=200;function s2(a,u){a.addEventListener("dblclick",u);var h=0,v;function S(A){if(A.detail!==1){v=A.detail;return}if(!(A.pointerType==="mouse"||A.sourceCapabilities&&!A.sourceCapabilities.firesTouchEvents)){var $=tb(A);if(!($.some(function(W){return W instanceof HTMLLabelElement&&W.attributes.for})&&!$.some(function(W){return W instanceof HTMLInputElement||W instanceof HTMLSelectElement}))){var U=Date.now();U-h<=a2?(v++,v===2&&u(o2(A))):v=1,h=U}}}return a.addEventListener("click",S),{dblclick:u,simDblclick:S}}function u2(a,u){a.removeEventListener("dblclick",u.dblclick),a.removeEventListener("click",u.simDblclick)}var up=gc(["transform","webkitTransform","OTransform","MozTransform","msTransform"]),Ws=gc(["webkitTransition","transition","OTransition","MozTransition","msTransition"]),Y_=Ws==="webkitTransition"||Ws==="OTransition"?Ws+"End":"transitionend";function Q_(a){return typeof a=="string"?document.getElementById(a):a}function Hs(a,u){var h=a.style[u]||a.currentStyle&&a.currentStyle[u];if((!h||h==="auto")&&document.defaultView){var v=document.defaultView.getComputedStyle(a,null);h=v?v[u]:null}return h==="auto"?null:h}function $e(a,u,h){var v=document.createElement(a);return v.className=u||"",h&&h.appendChild(v),v}function Qe(a){var u=a.parentNode;u&&u.removeChild(a)}function vc(a){for(;a.firstChild;)a.removeChild(a.firstChild)}function Go(a){var u=a.parentNode;u&&u.lastChild!==a&&u.appendChild(a)}function Xo(a){var u=a.parentNode;u&&u.firstChild!==a&&u.insertBefore(a,u.firstChild)}function lp(a,u){if(a.classList!==void 0)return a.classList.contains(u);var h=yc(a);return h.length>0&&new RegExp("(^|\\s)"+u+"(\\s|$)").test(h)}function be(a,u){if(a.classList!==void 0)for(var h=b(u),v=0,S=h.length;v<S;v++)a.classList.add(h[v]);else if(!lp(a,u)){var A=yc(a);cp(a,(A?A+" ":"")+u)}}function ut(a,u){a.classList!==void 0?a.classList.remove(u):cp(a,y((" "+yc(a)+" ").replace(" "+u+" "," ")))}function cp(a,u){a.className.baseVal===void 0?a.className=u:a.className.baseVal=u}function yc(a){return a.correspondingElement&&(a=a.correspondingElement),a.className.baseVal===void 0?a.className:a.className.baseVal}function xn(a,u){"opacity"in a.style?a.style.opacity=u:"filter"in a.style&&l2(a,u)}function l2(a,u){var h=!1,v="DXImageTransform.Microsoft.Alpha";try{h=a.filters.item(v)}catch{if(u===1)return}u=Math.round(u*100),h?(h.Enabled=u!==100,h.Opacity=u):a.style.filter+=" progid:"+v+"(opacity="+u+")"}function gc(a){for(var u=document.documentElement.style,h=0;h<a.length;h++)if(a[h]in u)return a[h];return!1}function Yi(a,u,h){var v=u||new B(0,0);a.style[up]=(fe.ie3d?"translate("+v.x+"px,"+v.y+"px)":"translate3d("+v.x+"px,"+v.y+"px,0)")+(h?" scale("+h+")":"")}function ht(a,u){a._leaflet_pos=u,fe.any3d?Yi(a,u):(a.style.left=u.x+"px",a.style.top=u.y+"px")}function Qi(a){return a._leaflet_pos||new B(0,0)}var Zs,qs,fp;if("onselectstart"in document)Zs=function(){_e(window,"selectstart",Mt)},qs=function(){Ue(window,"selectstart",Mt)};else{var Vs=gc(["userSelect","WebkitUserSelect","OUserSelect","MozUserSelect","msUserSelect"]);Zs=function(){if(Vs){var a=document.documentElement.style;fp=a[Vs],a[Vs]="none"}},qs=function(){Vs&&(document.documentElement.style[Vs]=fp,fp=void 0)}}function hp(){_e(window,"dragstart",Mt)}function dp(){Ue(window,"dragstart",Mt)}var _c,pp;function mp(a){for(;a.tabIndex===-1;)a=a.parentNode;a.style&&(bc(),_c=a,pp=a.style.outlineStyle,a.style.outlineStyle="none",_e(window,"keydown",bc))}function bc(){_c&&(_c.style.outlineStyle=pp,_c=void 0,pp=void 0,Ue(window,"keydown",bc))}function J_(a){do a=a.parentNode;while((!a.offsetWidth||!a.offsetHeight)&&a!==document.body);return a}function vp(a){var u=a.getBoundingClientRect();return{x:u.width/a.offsetWidth||1,y:u.height/a.offsetHeight||1,boundingClientRect:u}}var c2={__proto__:null,TRANSFORM:up,TRANSITION:Ws,TRANSITION_END:Y_,get:Q_,getStyle:Hs,create:$e,remove:Qe,empty:vc,toFront:Go,toBack:Xo,hasClass:lp,addClass:be,removeClass:ut,setClass:cp,getClass:yc,setOpacity:xn,testProp:gc,setTransform:Yi,setPosition:ht,getPosition:Qi,get disableTextSelection(){return Zs},get enableTextSelection(){return qs},disableImageDrag:hp,enableImageDrag:dp,preventOutline:mp,restoreOutline:bc,getSizedParentNode:J_,getScale:vp};function _e(a,u,h,v){if(u&&typeof u=="object")for(var S in u)gp(a,S,u[S],h);else{u=b(u);for(var A=0,$=u.length;A<$;A++)gp(a,u[A],h,v)}return this}var lr="_leaflet_events";function Ue(a,u,h,v){if(arguments.length===1)eb(a),delete a[lr];else if(u&&typeof u=="object")for(var S in u)_p(a,S,u[S],h);else if(u=b(u),arguments.length===2)eb(a,function(U){return E(u,U)!==-1});else for(var A=0,$=u.length;A<$;A++)_p(a,u[A],h,v);return this}function eb(a,u){for(var h in a[lr]){var v=h.split(/\d/)[0];(!u||u(v))&&_p(a,v,null,null,h)}}var yp={mouseenter:"mouseover",mouseleave:"mouseout",wheel:!("onwheel"in window)&&"mousewheel"};function gp(a,u,h,v){var S=u+c(h)+(v?"_"+c(v):"");if(a[lr]&&a[lr][S])return this;var A=function(U){return h.call(v||a,U||window.event)},$=A;!fe.touchNative&&fe.pointer&&u.indexOf("touch")===0?A=Jk(a,u,A):fe.touch&&u==="dblclick"?A=s2(a,A):"addEventListener"in a?u==="touchstart"||u==="touchmove"||u==="wheel"||u==="mousewheel"?a.addEventListener(yp[u]||u,A,fe.passiveEvents?{passive:!1}:!1):u==="mouseenter"||u==="mouseleave"?(A=function(U){U=U||window.event,xp(a,U)&&$(U)},a.addEventListener(yp[u],A,!1)):a.addEventListener(u,$,!1):a.attachEvent("on"+u,A),a[lr]=a[lr]||{},a[lr][S]=A}function _p(a,u,h,v,S){S=S||u+c(h)+(v?"_"+c(v):"");var A=a[lr]&&a[lr][S];if(!A)return this;!fe.touchNative&&fe.pointer&&u.indexOf("touch")===0?e2(a,u,A):fe.touch&&u==="dblclick"?u2(a,A):"removeEventListener"in a?a.removeEventListener(yp[u]||u,A,!1):a.detachEvent("on"+u,A),a[lr][S]=null}function Ji(a){return a.stopPropagation?a.stopPropagation():a.originalEvent?a.originalEvent._stopped=!0:a.cancelBubble=!0,this}function bp(a){return gp(a,"wheel",Ji),this}function Ks(a){return _e(a,"mousedown touchstart dblclick contextmenu",Ji),a._leaflet_disable_click=!0,this}function Mt(a){return a.preventDefault?a.preventDefault():a.returnValue=!1,this}function eo(a){return Mt(a),Ji(a),this}function tb(a){if(a.composedPath)return a.composedPath();for(var u=[],h=a.target;h;)u.push(h),h=h.parentNode;return u}function nb(a,u){if(!u)return new B(a.clientX,a.clientY);var h=vp(u),v=h.boundingClientRect;return new B((a.clientX-v.left)/h.x-u.clientLeft,(a.clientY-v.top)/h.y-u.clientTop)}var f2=fe.linux&&fe.chrome?window.devicePixelRatio:fe.mac?window.devicePixelRatio*3:window.devicePixelRatio>0?2*window.devicePixelRatio:1;function rb(a){return fe.edge?a.wheelDeltaY/2:a.deltaY&&a.deltaMode===0?-a.deltaY/f2:a.deltaY&&a.deltaMode===1?-a.deltaY*20:a.deltaY&&a.deltaMode===2?-a.deltaY*60:a.deltaX||a.deltaZ?0:a.wheelDelta?(a.wheelDeltaY||a.wheelDelta)/2:a.detail&&Math.abs(a.detail)<32765?-a.detail*20:a.detail?a.detail/-32765*60:0}function xp(a,u){var h=u.relatedTarget;if(!h)return!0;try{for(;h&&h!==a;)h=h.parentNode}catch{return!1}return h!==a}var h2={__proto__:null,on:_e,off:Ue,stopPropagation:Ji,disableScrollPropagation:bp,disableClickPropagation:Ks,preventDefault:Mt,stop:eo,getPropagationPath:tb,getMousePosition:nb,getWheelDelta:rb,isExternalTarget:xp,addListener:_e,removeListener:Ue},ib=Y.extend({run:function(a,u,h,v){this.stop(),this._el=a,this._inProgress=!0,this._duration=h||.25,this._easeOutPower=1/Math.max(v||.5,.2),this._startPos=Qi(a),this._offset=u.subtract(this._startPos),this._startTime=+new Date,this.fire("start"),this._animate()},stop:function(){this._inProgress&&(this._step(!0),this._complete())},_animate:function(){this._animId=N(this._animate,this),this._step()},_step:function(a){var u=+new Date-this._startTime,h=this._duration*1e3;u<h?this._runFrame(this._easeOut(u/h),a):(this._runFrame(1),this._complete())},_runFrame:function(a,u){var h=this._startPos.add(this._offset.multiplyBy(a));u&&h._round(),ht(this._el,h),this.fire("step")},_complete:function(){F(this._animId),this._inProgress=!1,this.fire("end")},_easeOut:function(a){return 1-Math.pow(1-a,this._easeOutPower)}}),Ce=Y.extend({options:{crs:Fe,center:void 0,zoom:void 0,minZoom:void 0,maxZoom:void 0,layers:[],maxBounds:void 0,renderer:void 0,zoomAnimation:!0,zoomAnimationThreshold:4,fadeAnimation:!0,markerZoomAnimation:!0,transform3DLimit:8388608,zoomSnap:1,zoomDelta:1,trackResize:!0},initialize:function(a,u){u=g(this,u),this._handlers=[],this._layers={},this._zoomBoundLayers={},this._sizeChanged=!0,this._initContainer(a),this._initLayout(),this._onResize=s(this._onResize,this),this._initEvents(),u.maxBounds&&this.setMaxBounds(u.maxBounds),u.zoom!==void 0&&(this._zoom=this._limitZoom(u.zoom)),u.center&&u.zoom!==void 0&&this.setView(ce(u.center),u.zoom,{reset:!0}),this.callInitHooks(),this._zoomAnimated=Ws&&fe.any3d&&!fe.mobileOpera&&this.options.zoomAnimation,this._zoomAnimated&&(this._createAnimProxy(),_e(this._proxy,Y_,this._catchTransitionEnd,this)),this._addLayers(this.options.layers)},setView:function(a,u,h){if(u=u===void 0?this._zoom:this._limitZoom(u),a=this._limitCenter(ce(a),u,this.options.maxBounds),h=h||{},this._stop(),this._loaded&&!h.reset&&h!==!0){h.animate!==void 0&&(h.zoom=i({animate:h.animate},h.zoom),h.pan=i({animate:h.animate,duration:h.duration},h.pan));var v=this._zoom!==u?this._tryAnimatedZoom&&this._tryAnimatedZoom(a,u,h.zoom):this._tryAnimatedPan(a,h.pan);if(v)return clearTimeout(this._sizeTimer),this}return this._resetView(a,u,h.pan&&h.pan.noMoveStart),this},setZoom:function(a,u){return this._loaded?this.setView(this.getCenter(),a,{zoom:u}):(this._zoom=a,this)},zoomIn:function(a,u){return a=a||(fe.any3d?this.options.zoomDelta:1),this.setZoom(this._zoom+a,u)},zoomOut:function(a,u){return a=a||(fe.any3d?this.options.zoomDelta:1),this.setZoom(this._zoom-a,u)},setZoomAround:function(a,u,h){var v=this.getZoomScale(u),S=this.getSize().divideBy(2),A=a instanceof B?a:this.latLngToContainerPoint(a),$=A.subtract(S).multiplyBy(1-1/v),U=this.containerPointToLatLng(S.add($));return this.setView(U,u,{zoom:h})},_getBoundsCenterZoom:function(a,u){u=u||{},a=a.getBounds?a.getBounds():he(a);var h=H(u.paddingTopLeft||u.padding||[0,0]),v=H(u.paddingBottomRight||u.padding||[0,0]),S=this.getBoundsZoom(a,!1,h.add(v));if(S=typeof u.maxZoom=="number"?Math.min(u.maxZoom,S):S,S===1/0)return{center:a.getCenter(),zoom:S};var A=v.subtract(h).divideBy(2),$=this.project(a.getSouthWest(),S),U=this.project(a.getNorthEast(),S),W=this.unproject($.add(U).divideBy(2).add(A),S);return{center:W,zoom:S}},fitBounds:function(a,u){if(a=he(a),!a.isValid())throw new Error("Bounds are not valid.");var h=this._getBoundsCenterZoom(a,u);return this.setView(h.center,h.zoom,u)},fitWorld:function(a){return this.fitBounds([[-90,-180],[90,180]],a)},panTo:function(a,u){return this.setView(a,this._zoom,{pan:u})},panBy:function(a,u){if(a=H(a).round(),u=u||{},!a.x&&!a.y)return this.fire("moveend");if(u.animate!==!0&&!this.getSize().contains(a))return this._resetView(this.unproject(this.project(this.getCenter()).add(a)),this.getZoom()),this;if(this._panAnim||(this._panAnim=new ib,this._panAnim.on({step:this._onPanTransitionStep,end:this._onPanTransitionEnd},this)),u.noMoveStart||this.fire("movestart"),u.animate!==!1){be(this._mapPane,"leaflet-pan-anim");var h=this._getMapPanePos().subtract(a).round();this._panAnim.run(this._mapPane,h,u.duration||.25,u.easeLinearity)}else this._rawPanBy(a),this.fire("move").fire("moveend");return this},flyTo:function(a,u,h){if(h=h||{},h.animate===!1||!fe.any3d)return this.setView(a,u,h);this._stop();var v=this.project(this.getCenter()),S=this.project(a),A=this.getSize(),$=this._zoom;a=ce(a),u=u===void 0?$:u;var U=Math.max(A.x,A.y),W=U*this.getZoomScale($,u),Q=S.distanceTo(v)||1,oe=1.42,ve=oe*oe;function we(dt){var $c=dt?-1:1,e$=dt?W:U,t$=W*W-U*U+$c*ve*ve*Q*Q,n$=2*e$*ve*Q,$p=t$/n$,Rb=Math.sqrt($p*$p+1)-$p,r$=Rb<1e-9?-18:Math.log(Rb);return r$}function Ht(dt){return(Math.exp(dt)-Math.exp(-dt))/2}function Pt(dt){return(Math.exp(dt)+Math.exp(-dt))/2}function Sn(dt){return Ht(dt)/Pt(dt)}var Qt=we(0);function na(dt){return U*(Pt(Qt)/Pt(Qt+oe*dt))}function X2(dt){return U*(Pt(Qt)*Sn(Qt+oe*dt)-Ht(Qt))/ve}function Y2(dt){return 1-Math.pow(1-dt,1.5)}var Q2=Date.now(),Nb=(we(1)-Qt)/oe,J2=h.duration?1e3*h.duration:1e3*Nb*.8;function Db(){var dt=(Date.now()-Q2)/J2,$c=Y2(dt)*Nb;dt<=1?(this._flyToFrame=N(Db,this),this._move(this.unproject(v.add(S.subtract(v).multiplyBy(X2($c)/Q)),$),this.getScaleZoom(U/na($c),$),{flyTo:!0})):this._move(a,u)._moveEnd(!0)}return this._moveStart(!0,h.noMoveStart),Db.call(this),this},flyToBounds:function(a,u){var h=this._getBoundsCenterZoom(a,u);return this.flyTo(h.center,h.zoom,u)},setMaxBounds:function(a){return a=he(a),this.listens("moveend",this._panInsideMaxBounds)&&this.off("moveend",this._panInsideMaxBounds),a.isValid()?(this.options.maxBounds=a,this._loaded&&this._panInsideMaxBounds(),this.on("moveend",this._panInsideMaxBounds)):(this.options.maxBounds=null,this)},setMinZoom:function(a){var u=this.options.minZoom;return this.options.minZoom=a,this._loaded&&u!==a&&(this.fire("zoomlevelschange"),this.getZoom()<this.options.minZoom)?this.setZoom(a):this},setMaxZoom:function(a){var u=this.options.maxZoom;return this.options.maxZoom=a,this._loaded&&u!==a&&(this.fire("zoomlevelschange"),this.getZoom()>this.options.maxZoom)?this.setZoom(a):this},panInsideBounds:function(a,u){this._enforcingBounds=!0;var h=this.getCenter(),v=this._limitCenter(h,this._zoom,he(a));return h.equals(v)||this.panTo(v,u),this._enforcingBounds=!1,this},panInside:function(a,u){u=u||{};var h=H(u.paddingTopLeft||u.padding||[0,0]),v=H(u.paddingBottomRight||u.padding||[0,0]),S=this.project(this.getCenter()),A=this.project(a),$=this.getPixelBounds(),U=J([$.min.add(h),$.max.subtract(v)]),W=U.getSize();if(!U.contains(A)){this._enforcingBounds=!0;var Q=A.subtract(U.getCenter()),oe=U.extend(A).getSize().subtract(W);S.x+=Q.x<0?-oe.x:oe.x,S.y+=Q.y<0?-oe.y:oe.y,this.panTo(this.unproject(S),u),this._enforcingBounds=!1}return this},invalidateSize:function(a){if(!this._loaded)return this;a=i({animate:!1,pan:!0},a===!0?{animate:!0}:a);var u=this.getSize();this._sizeChanged=!0,this._lastCenter=null;var h=this.getSize(),v=u.divideBy(2).round(),S=h.divideBy(2).round(),A=v.subtract(S);return!A.x&&!A.y?this:(a.animate&&a.pan?this.panBy(A):(a.pan&&this._rawPanBy(A),this.fire("move"),a.debounceMoveend?(clearTimeout(this._sizeTimer),this._sizeTimer=setTimeout(s(this.fire,this,"moveend"),200)):this.fire("moveend")),this.fire("resize",{oldSize:u,newSize:h}))},stop:function(){return this.setZoom(this._limitZoom(this._zoom)),this.options.zoomSnap||this.fire("viewreset"),this._stop()},locate:function(a){if(a=this._locateOptions=i({timeout:1e4,watch:!1},a),!("geolocation"in navigator))return this._handleGeolocationError({code:0,message:"Geolocation not supported."}),this;var u=s(this._handleGeolocationResponse,this),h=s(this._handleGeolocationError,this);return a.watch?this._locationWatchId=navigator.geolocation.watchPosition(u,h,a):navigator.geolocation.getCurrentPosition(u,h,a),this},stopLocate:function(){return navigator.geolocation&&navigator.geolocation.clearWatch&&navigator.geolocation.clearWatch(this._locationWatchId),this._locateOptions&&(this._locateOptions.setView=!1),this},_handleGeolocationError:function(a){if(this._container._leaflet_id){var u=a.code,h=a.message||(u===1?"permission denied":u===2?"position unavailable":"timeout");this._locateOptions.setView&&!this._loaded&&this.fitWorld(),this.fire("locationerror",{code:u,message:"Geolocation error: "+h+"."})}},_handleGeolocationResponse:function(a){if(this._container._leaflet_id){var u=a.coords.latitude,h=a.coords.longitude,v=new de(u,h),S=v.toBounds(a.coords.accuracy*2),A=this._locateOptions;if(A.setView){var $=this.getBoundsZoom(S);this.setView(v,A.maxZoom?Math.min($,A.maxZoom):$)}var U={latlng:v,bounds:S,timestamp:a.timestamp};for(var W in a.coords)typeof a.coords[W]=="number"&&(U[W]=a.coords[W]);this.fire("locationfound",U)}},addHandler:function(a,u){if(!u)return this;var h=this[a]=new u(this);return this._handlers.push(h),this.options[a]&&h.enable(),this},remove:function(){if(this._initEvents(!0),this.options.maxBounds&&this.off("moveend",this._panInsideMaxBounds),this._containerId!==this._container._leaflet_id)throw new Error("Map container is being reused by another instance");try{delete this._container._leaflet_id,delete this._containerId}catch{this._container._leaflet_id=void 0,this._containerId=void 0}this._locationWatchId!==void 0&&this.stopLocate(),this._stop(),Qe(this._mapPane),this._clearControlPos&&this._clearControlPos(),this._resizeRequest&&(F(this._resizeRequest),this._resizeRequest=null),this._clearHandlers(),this._loaded&&this.fire("unload");var a;for(a in this._layers)this._layers[a].remove();for(a in this._panes)Qe(this._panes[a]);return this._layers=[],this._panes=[],delete this._mapPane,delete this._renderer,this},createPane:function(a,u){var h="leaflet-pane"+(a?" leaflet-"+a.replace("Pane","")+"-pane":""),v=$e("div",h,u||this._mapPane);return a&&(this._panes[a]=v),v},getCenter:function(){return this._checkIfLoaded(),this._lastCenter&&!this._moved()?this._lastCenter.clone():this.layerPointToLatLng(this._getCenterLayerPoint())},getZoom:function(){return this._zoom},getBounds:function(){var a=this.getPixelBounds(),u=this.unproject(a.getBottomLeft()),h=this.unproject(a.getTopRight());return new ae(u,h)},getMinZoom:function(){return this.options.minZoom===void 0?this._layersMinZoom||0:this.options.minZoom},getMaxZoom:function(){return this.options.maxZoom===void 0?this._layersMaxZoom===void 0?1/0:this._layersMaxZoom:this.options.maxZoom},getBoundsZoom:function(a,u,h){a=he(a),h=H(h||[0,0]);var v=this.getZoom()||0,S=this.getMinZoom(),A=this.getMaxZoom(),$=a.getNorthWest(),U=a.getSouthEast(),W=this.getSize().subtract(h),Q=J(this.project(U,v),this.project($,v)).getSize(),oe=fe.any3d?this.options.zoomSnap:1,ve=W.x/Q.x,we=W.y/Q.y,Ht=u?Math.max(ve,we):Math.min(ve,we);return v=this.getScaleZoom(Ht,v),oe&&(v=Math.round(v/(oe/100))*(oe/100),v=u?Math.ceil(v/oe)*oe:Math.floor(v/oe)*oe),Math.max(S,Math.min(A,v))},getSize:function(){return(!this._size||this._sizeChanged)&&(this._size=new B(this._container.clientWidth||0,this._container.clientHeight||0),this._sizeChanged=!1),this._size.clone()},getPixelBounds:function(a,u){var h=this._getTopLeftPoint(a,u);return new te(h,h.add(this.getSize()))},getPixelOrigin:function(){return this._checkIfLoaded(),this._pixelOrigin},getPixelWorldBounds:function(a){return this.options.crs.getProjectedBounds(a===void 0?this.getZoom():a)},getPane:function(a){return typeof a=="string"?this._panes[a]:a},getPanes:function(){return this._panes},getContainer:function(){return this._container},getZoomScale:function(a,u){var h=this.options.crs;return u=u===void 0?this._zoom:u,h.scale(a)/h.scale(u)},getScaleZoom:function(a,u){var h=this.options.crs;u=u===void 0?this._zoom:u;var v=h.zoom(a*h.scale(u));return isNaN(v)?1/0:v},project:function(a,u){return u=u===void 0?this._zoom:u,this.options.crs.latLngToPoint(ce(a),u)},unproject:function(a,u){return u=u===void 0?this._zoom:u,this.options.crs.pointToLatLng(H(a),u)},layerPointToLatLng:function(a){var u=H(a).add(this.getPixelOrigin());return this.unproject(u)},latLngToLayerPoint:function(a){var u=this.project(ce(a))._round();return u._subtract(this.getPixelOrigin())},wrapLatLng:function(a){return this.options.crs.wrapLatLng(ce(a))},wrapLatLngBounds:function(a){return this.options.crs.wrapLatLngBounds(he(a))},distance:function(a,u){return this.options.crs.distance(ce(a),ce(u))},containerPointToLayerPoint:function(a){return H(a).subtract(this._getMapPanePos())},layerPointToContainerPoint:function(a){return H(a).add(this._getMapPanePos())},containerPointToLatLng:function(a){var u=this.containerPointToLayerPoint(H(a));return this.layerPointToLatLng(u)},latLngToContainerPoint:function(a){return this.layerPointToContainerPoint(this.latLngToLayerPoint(ce(a)))},mouseEventToContainerPoint:function(a){return nb(a,this._container)},mouseEventToLayerPoint:function(a){return this.containerPointToLayerPoint(this.mouseEventToContainerPoint(a))},mouseEventToLatLng:function(a){return this.layerPointToLatLng(this.mouseEventToLayerPoint(a))},_initContainer:function(a){var u=this._container=Q_(a);if(u){if(u._leaflet_id)throw new Error("Map container is already initialized.")}else throw new Error("Map container not found.");_e(u,"scroll",this._onScroll,this),this._containerId=c(u)},_initLayout:function(){var a=this._container;this._fadeAnimated=this.options.fadeAnimation&&fe.any3d,be(a,"leaflet-container"+(fe.touch?" leaflet-touch":"")+(fe.retina?" leaflet-retina":"")+(fe.ielt9?" leaflet-oldie":"")+(fe.safari?" leaflet-safari":"")+(this._fadeAnimated?" leaflet-fade-anim":""));var u=Hs(a,"position");u!=="absolute"&&u!=="relative"&&u!=="fixed"&&u!=="sticky"&&(a.style.position="relative"),this._initPanes(),this._initControlPos&&this._initControlPos()},_initPanes:function(){var a=this._panes={};this._paneRenderers={},this._mapPane=this.createPane("mapPane",this._container),ht(this._mapPane,new B(0,0)),this.createPane("tilePane"),this.createPane("overlayPane"),this.createPane("shadowPane"),this.createPane("markerPane"),this.createPane("tooltipPane"),this.createPane("popupPane"),this.options.markerZoomAnimation||(be(a.markerPane,"leaflet-zoom-hide"),be(a.shadowPane,"leaflet-zoom-hide"))},_resetView:function(a,u,h){ht(this._mapPane,new B(0,0));var v=!this._loaded;this._loaded=!0,u=this._limitZoom(u),this.fire("viewprereset");var S=this._zoom!==u;this._moveStart(S,h)._move(a,u)._moveEnd(S),this.fire("viewreset"),v&&this.fire("load")},_moveStart:function(a,u){return a&&this.fire("zoomstart"),u||this.fire("movestart"),this},_move:function(a,u,h,v){u===void 0&&(u=this._zoom);var S=this._zoom!==u;return this._zoom=u,this._lastCenter=a,this._pixelOrigin=this._getNewPixelOrigin(a),v?h&&h.pinch&&this.fire("zoom",h):((S||h&&h.pinch)&&this.fire("zoom",h),this.fire("move",h)),this},_moveEnd:function(a){return a&&this.fire("zoomend"),this.fire("moveend")},_stop:function(){return F(this._flyToFrame),this._panAnim&&this._panAnim.stop(),this},_rawPanBy:function(a){ht(this._mapPane,this._getMapPanePos().subtract(a))},_getZoomSpan:function(){return this.getMaxZoom()-this.getMinZoom()},_panInsideMaxBounds:function(){this._enforcingBounds||this.panInsideBounds(this.options.maxBounds)},_checkIfLoaded:function(){if(!this._loaded)throw new Error("Set map center and zoom first.")},_initEvents:function(a){this._targets={},this._targets[c(this._container)]=this;var u=a?Ue:_e;u(this._container,"click dblclick mousedown mouseup mouseover mouseout mousemove contextmenu keypress keydown keyup",this._handleDOMEvent,this),this.options.trackResize&&u(window,"resize",this._onResize,this),fe.any3d&&this.options.transform3DLimit&&(a?this.off:this.on).call(this,"moveend",this._onMoveEnd)},_onResize:function(){F(this._resizeRequest),this._resizeRequest=N(function(){this.invalidateSize({debounceMoveend:!0})},this)},_onScroll:function(){this._container.scrollTop=0,this._container.scrollLeft=0},_onMoveEnd:function(){var a=this._getMapPanePos();Math.max(Math.abs(a.x),Math.abs(a.y))>=this.options.transform3DLimit&&this._resetView(this.getCenter(),this.getZoom())},_findEventTargets:function(a,u){for(var h=[],v,S=u==="mouseout"||u==="mouseover",A=a.target||a.srcElement,$=!1;A;){if(v=this._targets[c(A)],v&&(u==="click"||u==="preclick")&&this._draggableMoved(v)){$=!0;break}if(v&&v.listens(u,!0)&&(S&&!xp(A,a)||(h.push(v),S))||A===this._container)break;A=A.parentNode}return!h.length&&!$&&!S&&this.listens(u,!0)&&(h=[this]),h},_isClickDisabled:function(a){for(;a&&a!==this._container;){if(a._leaflet_disable_click)return!0;a=a.parentNode}},_handleDOMEvent:function(a){var u=a.target||a.srcElement;if(!(!this._loaded||u._leaflet_disable_events||a.type==="click"&&this._isClickDisabled(u))){var h=a.type;h==="mousedown"&&mp(u),this._fireDOMEvent(a,h)}},_mouseEvents:["click","dblclick","mouseover","mouseout","contextmenu"],_fireDOMEvent:function(a,u,h){if(a.type==="click"){var v=i({},a);v.type="preclick",this._fireDOMEvent(v,v.type,h)}var S=this._findEventTargets(a,u);if(h){for(var A=[],$=0;$<h.length;$++)h[$].listens(u,!0)&&A.push(h[$]);S=A.concat(S)}if(S.length){u==="contextmenu"&&Mt(a);var U=S[0],W={originalEvent:a};if(a.type!=="keypress"&&a.type!=="keydown"&&a.type!=="keyup"){var Q=U.getLatLng&&(!U._radius||U._radius<=10);W.containerPoint=Q?this.latLngToContainerPoint(U.getLatLng()):this.mouseEventToContainerPoint(a),W.layerPoint=this.containerPointToLayerPoint(W.containerPoint),W.latlng=Q?U.getLatLng():this.layerPointToLatLng(W.layerPoint)}for($=0;$<S.length;$++)if(S[$].fire(u,W,!0),W.originalEvent._stopped||S[$].options.bubblingMouseEvents===!1&&E(this._mouseEvents,u)!==-1)return}},_draggableMoved:function(a){return a=a.dragging&&a.dragging.enabled()?a:this,a.dragging&&a.dragging.moved()||this.boxZoom&&this.boxZoom.moved()},_clearHandlers:function(){for(var a=0,u=this._handlers.length;a<u;a++)this._handlers[a].disable()},whenReady:function(a,u){return this._loaded?a.call(u||this,{target:this}):this.on("load",a,u),this},_getMapPanePos:function(){return Qi(this._mapPane)||new B(0,0)},_moved:function(){var a=this._getMapPanePos();return a&&!a.equals([0,0])},_getTopLeftPoint:function(a,u){var h=a&&u!==void 0?this._getNewPixelOrigin(a,u):this.getPixelOrigin();return h.subtract(this._getMapPanePos())},_getNewPixelOrigin:function(a,u){var h=this.getSize()._divideBy(2);return this.project(a,u)._subtract(h)._add(this._getMapPanePos())._round()},_latLngToNewLayerPoint:function(a,u,h){var v=this._getNewPixelOrigin(h,u);return this.project(a,u)._subtract(v)},_latLngBoundsToNewLayerBounds:function(a,u,h){var v=this._getNewPixelOrigin(h,u);return J([this.project(a.getSouthWest(),u)._subtract(v),this.project(a.getNorthWest(),u)._subtract(v),this.project(a.getSouthEast(),u)._subtract(v),this.project(a.getNorthEast(),u)._subtract(v)])},_getCenterLayerPoint:function(){return this.containerPointToLayerPoint(this.getSize()._divideBy(2))},_getCenterOffset:function(a){return this.latLngToLayerPoint(a).subtract(this._getCenterLayerPoint())},_limitCenter:function(a,u,h){if(!h)return a;var v=this.project(a,u),S=this.getSize().divideBy(2),A=new te(v.subtract(S),v.add(S)),$=this._getBoundsOffset(A,h,u);return Math.abs($.x)<=1&&Math.abs($.y)<=1?a:this.unproject(v.add($),u)},_limitOffset:function(a,u){if(!u)return a;var h=this.getPixelBounds(),v=new te(h.min.add(a),h.max.add(a));return a.add(this._getBoundsOffset(v,u))},_getBoundsOffset:function(a,u,h){var v=J(this.project(u.getNorthEast(),h),this.project(u.getSouthWest(),h)),S=v.min.subtract(a.min),A=v.max.subtract(a.max),$=this._rebound(S.x,-A.x),U=this._rebound(S.y,-A.y);return new B($,U)},_rebound:function(a,u){return a+u>0?Math.round(a-u)/2:Math.max(0,Math.ceil(a))-Math.max(0,Math.floor(u))},_limitZoom:function(a){var u=this.getMinZoom(),h=this.getMaxZoom(),v=fe.any3d?this.options.zoomSnap:1;return v&&(a=Math.round(a/v)*v),Math.max(u,Math.min(h,a))},_onPanTransitionStep:function(){this.fire("move")},_onPanTransitionEnd:function(){ut(this._mapPane,"leaflet-pan-anim"),this.fire("moveend")},_tryAnimatedPan:function(a,u){var h=this._getCenterOffset(a)._trunc();return(u&&u.animate)!==!0&&!this.getSize().contains(h)?!1:(this.panBy(h,u),!0)},_createAnimProxy:function(){var a=this._proxy=$e("div","leaflet-proxy leaflet-zoom-animated");this._panes.mapPane.appendChild(a),this.on("zoomanim",function(u){var h=up,v=this._proxy.style[h];Yi(this._proxy,this.project(u.center,u.zoom),this.getZoomScale(u.zoom,1)),v===this._proxy.style[h]&&this._animatingZoom&&this._onZoomTransitionEnd()},this),this.on("load moveend",this._animMoveEnd,this),this._on("unload",this._destroyAnimProxy,this)},_destroyAnimProxy:function(){Qe(this._proxy),this.off("load moveend",this._animMoveEnd,this),delete this._proxy},_animMoveEnd:function(){var a=this.getCenter(),u=this.getZoom();Yi(this._proxy,this.project(a,u),this.getZoomScale(u,1))},_catchTransitionEnd:function(a){this._animatingZoom&&a.propertyName.indexOf("transform")>=0&&this._onZoomTransitionEnd()},_nothingToAnimate:function(){return!this._container.getElementsByClassName("leaflet-zoom-animated").length},_tryAnimatedZoom:function(a,u,h){if(this._animatingZoom)return!0;if(h=h||{},!this._zoomAnimated||h.animate===!1||this._nothingToAnimate()||Math.abs(u-this._zoom)>this.options.zoomAnimationThreshold)return!1;var v=this.getZoomScale(u),S=this._getCenterOffset(a)._divideBy(1-1/v);return h.animate!==!0&&!this.getSize().contains(S)?!1:(N(function(){this._moveStart(!0,h.noMoveStart||!1)._animateZoom(a,u,!0)},this),!0)},_animateZoom:function(a,u,h,v){this._mapPane&&(h&&(this._animatingZoom=!0,this._animateToCenter=a,this._animateToZoom=u,be(this._mapPane,"leaflet-zoom-anim")),this.fire("zoomanim",{center:a,zoom:u,noUpdate:v}),this._tempFireZoomEvent||(this._tempFireZoomEvent=this._zoom!==this._animateToZoom),this._move(this._animateToCenter,this._animateToZoom,void 0,!0),setTimeout(s(this._onZoomTransitionEnd,this),250))},_onZoomTransitionEnd:function(){this._animatingZoom&&(this._mapPane&&ut(this._mapPane,"leaflet-zoom-anim"),this._animatingZoom=!1,this._move(this._animateToCenter,this._animateToZoom,void 0,!0),this._tempFireZoomEvent&&this.fire("zoom"),delete this._tempFireZoomEvent,this.fire("move"),this._moveEnd(!0))}});function d2(a,u){return new Ce(a,u)}var Un=q.extend({options:{position:"topright"},initialize:function(a){g(this,a)},getPosition:function(){return this.options.position},setPosition:function(a){var u=this._map;return u&&u.removeControl(this),this.options.position=a,u&&u.addControl(this),this},getContainer:function(){return this._container},addTo:function(a){this.remove(),this._map=a;var u=this._container=this.onAdd(a),h=this.getPosition(),v=a._controlCorners[h];return be(u,"leaflet-control"),h.indexOf("bottom")!==-1?v.insertBefore(u,v.firstChild):v.appendChild(u),this._map.on("unload",this.remove,this),this},remove:function(){return this._map?(Qe(this._container),this.onRemove&&this.onRemove(this._map),this._map.off("unload",this.remove,this),this._map=null,this):this},_refocusOnMap:function(a){this._map&&a&&a.screenX>0&&a.screenY>0&&this._map.getContainer().focus()}}),Gs=function(a){return new Un(a)};Ce.include({addControl:function(a){return a.addTo(this),this},removeControl:function(a){return a.remove(),this},_initControlPos:function(){var a=this._controlCorners={},u="leaflet-",h=this._controlContainer=$e("div",u+"control-container",this._container);function v(S,A){var $=u+S+" "+u+A;a[S+A]=$e("div",$,h)}v("top","left"),v("top","right"),v("bottom","left"),v("bottom","right")},_clearControlPos:function(){for(var a in this._controlCorners)Qe(this._controlCorners[a]);Qe(this._controlContainer),delete this._controlCorners,delete this._controlContainer}});var ob=Un.extend({options:{collapsed:!0,position:"topright",autoZIndex:!0,hideSingleBase:!1,sortLayers:!1,sortFunction:function(a,u,h,v){return h<v?-1:v<h?1:0}},initialize:function(a,u,h){g(this,h),this._layerControlInputs=[],this._layers=[],this._lastZIndex=0,this._handlingClick=!1,this._preventClick=!1;for(var v in a)this._addLayer(a[v],v);for(v in u)this._addLayer(u[v],v,!0)},onAdd:function(a){this._initLayout(),this._update(),this._map=a,a.on("zoomend",this._checkDisabledLayers,this);for(var u=0;u<this._layers.length;u++)this._layers[u].layer.on("add remove",this._onLayerChange,this);return this._container},addTo:function(a){return Un.prototype.addTo.call(this,a),this._expandIfNotCollapsed()},onRemove:function(){this._map.off("zoomend",this._checkDisabledLayers,this);for(var a=0;a<this._layers.length;a++)this._layers[a].layer.off("add remove",this._onLayerChange,this)},addBaseLayer:function(a,u){return this._addLayer(a,u),this._map?this._update():this},addOverlay:function(a,u){return this._addLayer(a,u,!0),this._map?this._update():this},removeLayer:function(a){a.off("add remove",this._onLayerChange,this);var u=this._getLayer(c(a));return u&&this._layers.splice(this._layers.indexOf(u),1),this._map?this._update():this},expand:function(){be(this._container,"leaflet-control-layers-expanded"),this._section.style.height=null;var a=this._map.getSize().y-(this._container.offsetTop+50);return a<this._section.clientHeight?(be(this._section,"leaflet-control-layers-scrollbar"),this._section.style.height=a+"px"):ut(this._section,"leaflet-control-layers-scrollbar"),this._checkDisabledLayers(),this},collapse:function(){return ut(this._container,"leaflet-control-layers-expanded"),this},_initLayout:function(){var a="leaflet-control-layers",u=this._container=$e("div",a),h=this.options.collapsed;u.setAttribute("aria-haspopup",!0),Ks(u),bp(u);var v=this._section=$e("section",a+"-list");h&&(this._map.on("click",this.collapse,this),_e(u,{mouseenter:this._expandSafely,mouseleave:this.collapse},this));var S=this._layersLink=$e("a",a+"-toggle",u);S.href="#",S.title="Layers",S.setAttribute("role","button"),_e(S,{keydown:function(A){A.keyCode===13&&this._expandSafely()},click:function(A){Mt(A),this._expandSafely()}},this),h||this.expand(),this._baseLayersList=$e("div",a+"-base",v),this._separator=$e("div",a+"-separator",v),this._overlaysList=$e("div",a+"-overlays",v),u.appendChild(v)},_getLayer:function(a){for(var u=0;u<this._layers.length;u++)if(this._layers[u]&&c(this._layers[u].layer)===a)return this._layers[u]},_addLayer:function(a,u,h){this._map&&a.on("add remove",this._onLayerChange,this),this._layers.push({layer:a,name:u,overlay:h}),this.options.sortLayers&&this._layers.sort(s(function(v,S){return this.options.sortFunction(v.layer,S.layer,v.name,S.name)},this)),this.options.autoZIndex&&a.setZIndex&&(this._lastZIndex++,a.setZIndex(this._lastZIndex)),this._expandIfNotCollapsed()},_update:function(){if(!this._container)return this;vc(this._baseLayersList),vc(this._overlaysList),this._layerControlInputs=[];var a,u,h,v,S=0;for(h=0;h<this._layers.length;h++)v=this._layers[h],this._addItem(v),u=u||v.overlay,a=a||!v.overlay,S+=v.overlay?0:1;return this.options.hideSingleBase&&(a=a&&S>1,this._baseLayersList.style.display=a?"":"none"),this._separator.style.display=u&&a?"":"none",this},_onLayerChange:function(a){this._handlingClick||this._update();var u=this._getLayer(c(a.target)),h=u.overlay?a.type==="add"?"overlayadd":"overlayremove":a.type==="add"?"baselayerchange":null;h&&this._map.fire(h,u)},_createRadioElement:function(a,u){var h='<input type="radio" class="leaflet-control-layers-selector" name="'+a+'"'+(u?' checked="checked"':"")+"/>",v=document.createElement("div");return v.innerHTML=h,v.firstChild},_addItem:function(a){var u=document.createElement("label"),h=this._map.hasLayer(a.layer),v;a.overlay?(v=document.createElement("input"),v.type="checkbox",v.className="leaflet-control-layers-selector",v.defaultChecked=h):v=this._createRadioElement("leaflet-base-layers_"+c(this),h),this._layerControlInputs.push(v),v.layerId=c(a.layer),_e(v,"click",this._onInputClick,this);var S=document.createElement("span");S.innerHTML=" "+a.name;var A=document.createElement("span");u.appendChild(A),A.appendChild(v),A.appendChild(S);var $=a.overlay?this._overlaysList:this._baseLayersList;return $.appendChild(u),this._checkDisabledLayers(),u},_onInputClick:function(){if(!this._preventClick){var a=this._layerControlInputs,u,h,v=[],S=[];this._handlingClick=!0;for(var A=a.length-1;A>=0;A--)u=a[A],h=this._getLayer(u.layerId).layer,u.checked?v.push(h):u.checked||S.push(h);for(A=0;A<S.length;A++)this._map.hasLayer(S[A])&&this._map.removeLayer(S[A]);for(A=0;A<v.length;A++)this._map.hasLayer(v[A])||this._map.addLayer(v[A]);this._handlingClick=!1,this._refocusOnMap()}},_checkDisabledLayers:function(){for(var a=this._layerControlInputs,u,h,v=this._map.getZoom(),S=a.length-1;S>=0;S--)u=a[S],h=this._getLayer(u.layerId).layer,u.disabled=h.options.minZoom!==void 0&&v<h.options.minZoom||h.options.maxZoom!==void 0&&v>h.options.maxZoom},_expandIfNotCollapsed:function(){return this._map&&!this.options.collapsed&&this.expand(),this},_expandSafely:function(){var a=this._section;this._preventClick=!0,_e(a,"click",Mt),this.expand();var u=this;setTimeout(function(){Ue(a,"click",Mt),u._preventClick=!1})}}),p2=function(a,u,h){return new ob(a,u,h)},wp=Un.extend({options:{position:"topleft",zoomInText:'<span aria-hidden="true">+</span>',zoomInTitle:"Zoom in",zoomOutText:'<span aria-hidden="true">&#x2212;</span>',zoomOutTitle:"Zoom out"},onAdd:function(a){var u="leaflet-control-zoom",h=$e("div",u+" leaflet-bar"),v=this.options;return this._zoomInButton=this._createButton(v.zoomInText,v.zoomInTitle,u+"-in",h,this._zoomIn),this._zoomOutButton=this._createButton(v.zoomOutText,v.zoomOutTitle,u+"-out",h,this._zoomOut),this._updateDisabled(),a.on("zoomend zoomlevelschange",this._updateDisabled,this),h},onRemove:function(a){a.off("zoomend zoomlevelschange",this._updateDisabled,this)},disable:function(){return this._disabled=!0,this._updateDisabled(),this},enable:function(){return this._disabled=!1,this._updateDisabled(),this},_zoomIn:function(a){!this._disabled&&this._map._zoom<this._map.getMaxZoom()&&this._map.zoomIn(this._map.options.zoomDelta*(a.shiftKey?3:1))},_zoomOut:function(a){!this._disabled&&this._map._zoom>this._map.getMinZoom()&&this._map.zoomOut(this._map.options.zoomDelta*(a.shiftKey?3:1))},_createButton:function(a,u,h,v,S){var A=$e("a",h,v);return A.innerHTML=a,A.href="#",A.title=u,A.setAttribute("role","button"),A.setAttribute("aria-label",u),Ks(A),_e(A,"click",eo),_e(A,"click",S,this),_e(A,"click",this._refocusOnMap,this),A},_updateDisabled:function(){var a=this._map,u="leaflet-disabled";ut(this._zoomInButton,u),ut(this._zoomOutButton,u),this._zoomInButton.setAttribute("aria-disabled","false"),this._zoomOutButton.setAttribute("aria-disabled","false"),(this._disabled||a._zoom===a.getMinZoom())&&(be(this._zoomOutButton,u),this._zoomOutButton.setAttribute("aria-disabled","true")),(this._disabled||a._zoom===a.getMaxZoom())&&(be(this._zoomInButton,u),this._zoomInButton.setAttribute("aria-disabled","true"))}});Ce.mergeOptions({zoomControl:!0}),Ce.addInitHook(function(){this.options.zoomControl&&(this.zoomControl=new wp,this.addControl(this.zoomControl))});var m2=function(a){return new wp(a)},ab=Un.extend({options:{position:"bottomleft",maxWidth:100,metric:!0,imperial:!0},onAdd:function(a){var u="leaflet-control-scale",h=$e("div",u),v=this.options;return this._addScales(v,u+"-line",h),a.on(v.updateWhenIdle?"moveend":"move",this._update,this),a.whenReady(this._update,this),h},onRemove:function(a){a.off(this.options.updateWhenIdle?"moveend":"move",this._update,this)},_addScales:function(a,u,h){a.metric&&(this._mScale=$e("div",u,h)),a.imperial&&(this._iScale=$e("div",u,h))},_update:function(){var a=this._map,u=a.getSize().y/2,h=a.distance(a.containerPointToLatLng([0,u]),a.containerPointToLatLng([this.options.maxWidth,u]));this._updateScales(h)},_updateScales:function(a){this.options.metric&&a&&this._updateMetric(a),this.options.imperial&&a&&this._updateImperial(a)},_updateMetric:function(a){var u=this._getRoundNum(a),h=u<1e3?u+" m":u/1e3+" km";this._updateScale(this._mScale,h,u/a)},_updateImperial:function(a){var u=a*3.2808399,h,v,S;u>5280?(h=u/5280,v=this._getRoundNum(h),this._updateScale(this._iScale,v+" mi",v/h)):(S=this._getRoundNum(u),this._updateScale(this._iScale,S+" ft",S/u))},_updateScale:function(a,u,h){a.style.width=Math.round(this.options.maxWidth*h)+"px",a.innerHTML=u},_getRoundNum:function(a){var u=Math.pow(10,(Math.floor(a)+"").length-1),h=a/u;return h=h>=10?10:h>=5?5:h>=3?3:h>=2?2:1,u*h}}),v2=function(a){return new ab(a)},y2='<svg aria-hidden="true" xmlns="http://www.w3.org/2000/svg" width="12" height="8" viewBox="0 0 12 8" class="leaflet-attribution-flag"><path fill="#4C7BE1" d="M0 0h12v4H0z"/><path fill="#FFD500" d="M0 4h12v3H0z"/><path fill="#E0BC00" d="M0 7h12v1H0z"/></svg>',Sp=Un.extend({options:{position:"bottomright",prefix:'<a href="https://leafletjs.com" title="A JavaScript library for interactive maps">'+(fe.inlineSvg?y2+" ":"")+"Leaflet</a>"},initialize:function(a){g(this,a),this._attributions={}},onAdd:function(a){a.attributionControl=this,this._container=$e("div","leaflet-control-attribution"),Ks(this._container);for(var u in a._layers)a._layers[u].getAttribution&&this.addAttribution(a._layers[u].getAttribution());return this._update(),a.on("layeradd",this._addAttribution,this),this._container},onRemove:function(a){a.off("layeradd",this._addAttribution,this)},_addAttribution:function(a){a.layer.getAttribution&&(this.addAttribution(a.layer.getAttribution()),a.layer.once("remove",function(){this.removeAttribution(a.layer.getAttribution())},this))},setPrefix:function(a){return this.options.prefix=a,this._update(),this},addAttribution:function(a){return a?(this._attributions[a]||(this._attributions[a]=0),this._attributions[a]++,this._update(),this):this},removeAttribution:function(a){return a?(this._attributions[a]&&(this._attributions[a]--,this._update()),this):this},_update:function(){if(this._map){var a=[];for(var u in this._attributions)this._attributions[u]&&a.push(u);var h=[];this.options.prefix&&h.push(this.options.prefix),a.length&&h.push(a.join(", ")),this._container.innerHTML=h.join(' <span aria-hidden="true">|</span> ')}}});Ce.mergeOptions({attributionControl:!0}),Ce.addInitHook(function(){this.options.attributionControl&&new Sp().addTo(this)});var g2=function(a){return new Sp(a)};Un.Layers=ob,Un.Zoom=wp,Un.Scale=ab,Un.Attribution=Sp,Gs.layers=p2,Gs.zoom=m2,Gs.scale=v2,Gs.attribution=g2;var cr=q.extend({initialize:function(a){this._map=a},enable:function(){return this._enabled?this:(this._enabled=!0,this.addHooks(),this)},disable:function(){return this._enabled?(this._enabled=!1,this.removeHooks(),this):this},enabled:function(){return!!this._enabled}});cr.addTo=function(a,u){return a.addHandler(u,this),this};var _2={Events:Z},sb=fe.touch?"touchstart mousedown":"mousedown",ii=Y.extend({options:{clickTolerance:3},initialize:function(a,u,h,v){g(this,v),this._element=a,this._dragStartTarget=u||a,this._preventOutline=h},enable:function(){this._enabled||(_e(this._dragStartTarget,sb,this._onDown,this),this._enabled=!0)},disable:function(){this._enabled&&(ii._dragging===this&&this.finishDrag(!0),Ue(this._dragStartTarget,sb,this._onDown,this),this._enabled=!1,this._moved=!1)},_onDown:function(a){if(this._enabled&&(this._moved=!1,!lp(this._element,"leaflet-zoom-anim"))){if(a.touches&&a.touches.length!==1){ii._dragging===this&&this.finishDrag();return}if(!(ii._dragging||a.shiftKey||a.which!==1&&a.button!==1&&!a.touches)&&(ii._dragging=this,this._preventOutline&&mp(this._element),hp(),Zs(),!this._moving)){this.fire("down");var u=a.touches?a.touches[0]:a,h=J_(this._element);this._startPoint=new B(u.clientX,u.clientY),this._startPos=Qi(this._element),this._parentScale=vp(h);var v=a.type==="mousedown";_e(document,v?"mousemove":"touchmove",this._onMove,this),_e(document,v?"mouseup":"touchend touchcancel",this._onUp,this)}}},_onMove:function(a){if(this._enabled){if(a.touches&&a.touches.length>1){this._moved=!0;return}var u=a.touches&&a.touches.length===1?a.touches[0]:a,h=new B(u.clientX,u.clientY)._subtract(this._startPoint);!h.x&&!h.y||Math.abs(h.x)+Math.abs(h.y)<this.options.clickTolerance||(h.x/=this._parentScale.x,h.y/=this._parentScale.y,Mt(a),this._moved||(this.fire("dragstart"),this._moved=!0,be(document.body,"leaflet-dragging"),this._lastTarget=a.target||a.srcElement,window.SVGElementInstance&&this._lastTarget instanceof window.SVGElementInstance&&(this._lastTarget=this._lastTarget.correspondingUseElement),be(this._lastTarget,"leaflet-drag-target")),this._newPos=this._startPos.add(h),this._moving=!0,this._lastEvent=a,this._updatePosition())}},_updatePosition:function(){var a={originalEvent:this._lastEvent};this.fire("predrag",a),ht(this._element,this._newPos),this.fire("drag",a)},_onUp:function(){this._enabled&&this.finishDrag()},finishDrag:function(a){ut(document.body,"leaflet-dragging"),this._lastTarget&&(ut(this._lastTarget,"leaflet-drag-target"),this._lastTarget=null),Ue(document,"mousemove touchmove",this._onMove,this),Ue(document,"mouseup touchend touchcancel",this._onUp,this),dp(),qs();var u=this._moved&&this._moving;this._moving=!1,ii._dragging=!1,u&&this.fire("dragend",{noInertia:a,distance:this._newPos.distanceTo(this._startPos)})}});function ub(a,u,h){var v,S=[1,4,2,8],A,$,U,W,Q,oe,ve,we;for(A=0,oe=a.length;A<oe;A++)a[A]._code=to(a[A],u);for(U=0;U<4;U++){for(ve=S[U],v=[],A=0,oe=a.length,$=oe-1;A<oe;$=A++)W=a[A],Q=a[$],W._code&ve?Q._code&ve||(we=xc(Q,W,ve,u,h),we._code=to(we,u),v.push(we)):(Q._code&ve&&(we=xc(Q,W,ve,u,h),we._code=to(we,u),v.push(we)),v.push(W));a=v}return a}function lb(a,u){var h,v,S,A,$,U,W,Q,oe;if(!a||a.length===0)throw new Error("latlngs not passed");wn(a)||(console.warn("latlngs are not flat! Only the first ring will be used"),a=a[0]);var ve=ce([0,0]),we=he(a),Ht=we.getNorthWest().distanceTo(we.getSouthWest())*we.getNorthEast().distanceTo(we.getNorthWest());Ht<1700&&(ve=Pp(a));var Pt=a.length,Sn=[];for(h=0;h<Pt;h++){var Qt=ce(a[h]);Sn.push(u.project(ce([Qt.lat-ve.lat,Qt.lng-ve.lng])))}for(U=W=Q=0,h=0,v=Pt-1;h<Pt;v=h++)S=Sn[h],A=Sn[v],$=S.y*A.x-A.y*S.x,W+=(S.x+A.x)*$,Q+=(S.y+A.y)*$,U+=$*3;U===0?oe=Sn[0]:oe=[W/U,Q/U];var na=u.unproject(H(oe));return ce([na.lat+ve.lat,na.lng+ve.lng])}function Pp(a){for(var u=0,h=0,v=0,S=0;S<a.length;S++){var A=ce(a[S]);u+=A.lat,h+=A.lng,v++}return ce([u/v,h/v])}var b2={__proto__:null,clipPolygon:ub,polygonCenter:lb,centroid:Pp};function cb(a,u){if(!u||!a.length)return a.slice();var h=u*u;return a=S2(a,h),a=w2(a,h),a}function fb(a,u,h){return Math.sqrt(Xs(a,u,h,!0))}function x2(a,u,h){return Xs(a,u,h)}function w2(a,u){var h=a.length,v=typeof Uint8Array<"u"?Uint8Array:Array,S=new v(h);S[0]=S[h-1]=1,Op(a,S,u,0,h-1);var A,$=[];for(A=0;A<h;A++)S[A]&&$.push(a[A]);return $}function Op(a,u,h,v,S){var A=0,$,U,W;for(U=v+1;U<=S-1;U++)W=Xs(a[U],a[v],a[S],!0),W>A&&($=U,A=W);A>h&&(u[$]=1,Op(a,u,h,v,$),Op(a,u,h,$,S))}function S2(a,u){for(var h=[a[0]],v=1,S=0,A=a.length;v<A;v++)P2(a[v],a[S])>u&&(h.push(a[v]),S=v);return S<A-1&&h.push(a[A-1]),h}var hb;function db(a,u,h,v,S){var A=v?hb:to(a,h),$=to(u,h),U,W,Q;for(hb=$;;){if(!(A|$))return[a,u];if(A&$)return!1;U=A||$,W=xc(a,u,U,h,S),Q=to(W,h),U===A?(a=W,A=Q):(u=W,$=Q)}}function xc(a,u,h,v,S){var A=u.x-a.x,$=u.y-a.y,U=v.min,W=v.max,Q,oe;return h&8?(Q=a.x+A*(W.y-a.y)/$,oe=W.y):h&4?(Q=a.x+A*(U.y-a.y)/$,oe=U.y):h&2?(Q=W.x,oe=a.y+$*(W.x-a.x)/A):h&1&&(Q=U.x,oe=a.y+$*(U.x-a.x)/A),new B(Q,oe,S)}function to(a,u){var h=0;return a.x<u.min.x?h|=1:a.x>u.max.x&&(h|=2),a.y<u.min.y?h|=4:a.y>u.max.y&&(h|=8),h}function P2(a,u){var h=u.x-a.x,v=u.y-a.y;return h*h+v*v}function Xs(a,u,h,v){var S=u.x,A=u.y,$=h.x-S,U=h.y-A,W=$*$+U*U,Q;return W>0&&(Q=((a.x-S)*$+(a.y-A)*U)/W,Q>1?(S=h.x,A=h.y):Q>0&&(S+=$*Q,A+=U*Q)),$=a.x-S,U=a.y-A,v?$*$+U*U:new B(S,A)}function wn(a){return!w(a[0])||typeof a[0][0]!="object"&&typeof a[0][0]<"u"}function pb(a){return console.warn("Deprecated use of _flat, please use L.LineUtil.isFlat instead."),wn(a)}function mb(a,u){var h,v,S,A,$,U,W,Q;if(!a||a.length===0)throw new Error("latlngs not passed");wn(a)||(console.warn("latlngs are not flat! Only the first ring will be used"),a=a[0]);var oe=ce([0,0]),ve=he(a),we=ve.getNorthWest().distanceTo(ve.getSouthWest())*ve.getNorthEast().distanceTo(ve.getNorthWest());we<1700&&(oe=Pp(a));var Ht=a.length,Pt=[];for(h=0;h<Ht;h++){var Sn=ce(a[h]);Pt.push(u.project(ce([Sn.lat-oe.lat,Sn.lng-oe.lng])))}for(h=0,v=0;h<Ht-1;h++)v+=Pt[h].distanceTo(Pt[h+1])/2;if(v===0)Q=Pt[0];else for(h=0,A=0;h<Ht-1;h++)if($=Pt[h],U=Pt[h+1],S=$.distanceTo(U),A+=S,A>v){W=(A-v)/S,Q=[U.x-W*(U.x-$.x),U.y-W*(U.y-$.y)];break}var Qt=u.unproject(H(Q));return ce([Qt.lat+oe.lat,Qt.lng+oe.lng])}var O2={__proto__:null,simplify:cb,pointToSegmentDistance:fb,closestPointOnSegment:x2,clipSegment:db,_getEdgeIntersection:xc,_getBitCode:to,_sqClosestPointOnSegment:Xs,isFlat:wn,_flat:pb,polylineCenter:mb},Ep={project:function(a){return new B(a.lng,a.lat)},unproject:function(a){return new de(a.y,a.x)},bounds:new te([-180,-90],[180,90])},Tp={R:6378137,R_MINOR:6356752314245179e-9,bounds:new te([-2003750834279e-5,-1549657073972e-5],[2003750834279e-5,1876465623138e-5]),project:function(a){var u=Math.PI/180,h=this.R,v=a.lat*u,S=this.R_MINOR/h,A=Math.sqrt(1-S*S),$=A*Math.sin(v),U=Math.tan(Math.PI/4-v/2)/Math.pow((1-$)/(1+$),A/2);return v=-h*Math.log(Math.max(U,1e-10)),new B(a.lng*u*h,v)},unproject:function(a){for(var u=180/Math.PI,h=this.R,v=this.R_MINOR/h,S=Math.sqrt(1-v*v),A=Math.exp(-a.y/h),$=Math.PI/2-2*Math.atan(A),U=0,W=.1,Q;U<15&&Math.abs(W)>1e-7;U++)Q=S*Math.sin($),Q=Math.pow((1-Q)/(1+Q),S/2),W=Math.PI/2-2*Math.atan(A*Q)-$,$+=W;return new de($*u,a.x*u/h)}},E2={__proto__:null,LonLat:Ep,Mercator:Tp,SphericalMercator:ye},T2=i({},Ye,{code:"EPSG:3395",projection:Tp,transformation:function(){var a=.5/(Math.PI*Tp.R);return ee(a,.5,-a,.5)}()}),vb=i({},Ye,{code:"EPSG:4326",projection:Ep,transformation:ee(1/180,1,-1/180,.5)}),A2=i({},nt,{projection:Ep,transformation:ee(1,0,-1,0),scale:function(a){return Math.pow(2,a)},zoom:function(a){return Math.log(a)/Math.LN2},distance:function(a,u){var h=u.lng-a.lng,v=u.lat-a.lat;return Math.sqrt(h*h+v*v)},infinite:!0});nt.Earth=Ye,nt.EPSG3395=T2,nt.EPSG3857=Fe,nt.EPSG900913=Oe,nt.EPSG4326=vb,nt.Simple=A2;var Wn=Y.extend({options:{pane:"overlayPane",attribution:null,bubblingMouseEvents:!0},addTo:function(a){return a.addLayer(this),this},remove:function(){return this.removeFrom(this._map||this._mapToAdd)},removeFrom:function(a){return a&&a.removeLayer(this),this},getPane:function(a){return this._map.getPane(a?this.options[a]||a:this.options.pane)},addInteractiveTarget:function(a){return this._map._targets[c(a)]=this,this},removeInteractiveTarget:function(a){return delete this._map._targets[c(a)],this},getAttribution:function(){return this.options.attribution},_layerAdd:function(a){var u=a.target;if(u.hasLayer(this)){if(this._map=u,this._zoomAnimated=u._zoomAnimated,this.getEvents){var h=this.getEvents();u.on(h,this),this.once("remove",function(){u.off(h,this)},this)}this.onAdd(u),this.fire("add"),u.fire("layeradd",{layer:this})}}});Ce.include({addLayer:function(a){if(!a._layerAdd)throw new Error("The provided object is not a Layer.");var u=c(a);return this._layers[u]?this:(this._layers[u]=a,a._mapToAdd=this,a.beforeAdd&&a.beforeAdd(this),this.whenReady(a._layerAdd,a),this)},removeLayer:function(a){var u=c(a);return this._layers[u]?(this._loaded&&a.onRemove(this),delete this._layers[u],this._loaded&&(this.fire("layerremove",{layer:a}),a.fire("remove")),a._map=a._mapToAdd=null,this):this},hasLayer:function(a){return c(a)in this._layers},eachLayer:function(a,u){for(var h in this._layers)a.call(u,this._layers[h]);return this},_addLayers:function(a){a=a?w(a)?a:[a]:[];for(var u=0,h=a.length;u<h;u++)this.addLayer(a[u])},_addZoomLimit:function(a){(!isNaN(a.options.maxZoom)||!isNaN(a.options.minZoom))&&(this._zoomBoundLayers[c(a)]=a,this._updateZoomLevels())},_removeZoomLimit:function(a){var u=c(a);this._zoomBoundLayers[u]&&(delete this._zoomBoundLayers[u],this._updateZoomLevels())},_updateZoomLevels:function(){var a=1/0,u=-1/0,h=this._getZoomSpan();for(var v in this._zoomBoundLayers){var S=this._zoomBoundLayers[v].options;a=S.minZoom===void 0?a:Math.min(a,S.minZoom),u=S.maxZoom===void 0?u:Math.max(u,S.maxZoom)}this._layersMaxZoom=u===-1/0?void 0:u,this._layersMinZoom=a===1/0?void 0:a,h!==this._getZoomSpan()&&this.fire("zoomlevelschange"),this.options.maxZoom===void 0&&this._layersMaxZoom&&this.getZoom()>this._layersMaxZoom&&this.setZoom(this._layersMaxZoom),this.options.minZoom===void 0&&this._layersMinZoom&&this.getZoom()<this._layersMinZoom&&this.setZoom(this._layersMinZoom)}});var Yo=Wn.extend({initialize:function(a,u){g(this,u),this._layers={};var h,v;if(a)for(h=0,v=a.length;h<v;h++)this.addLayer(a[h])},addLayer:function(a){var u=this.getLayerId(a);return this._layers[u]=a,this._map&&this._map.addLayer(a),this},removeLayer:function(a){var u=a in this._layers?a:this.getLayerId(a);return this._map&&this._layers[u]&&this._map.removeLayer(this._layers[u]),delete this._layers[u],this},hasLayer:function(a){var u=typeof a=="number"?a:this.getLayerId(a);return u in this._layers},clearLayers:function(){return this.eachLayer(this.removeLayer,this)},invoke:function(a){var u=Array.prototype.slice.call(arguments,1),h,v;for(h in this._layers)v=this._layers[h],v[a]&&v[a].apply(v,u);return this},onAdd:function(a){this.eachLayer(a.addLayer,a)},onRemove:function(a){this.eachLayer(a.removeLayer,a)},eachLayer:function(a,u){for(var h in this._layers)a.call(u,this._layers[h]);return this},getLayer:function(a){return this._layers[a]},getLayers:function(){var a=[];return this.eachLayer(a.push,a),a},setZIndex:function(a){return this.invoke("setZIndex",a)},getLayerId:function(a){return c(a)}}),C2=function(a,u){return new Yo(a,u)},Or=Yo.extend({addLayer:function(a){return this.hasLayer(a)?this:(a.addEventParent(this),Yo.prototype.addLayer.call(this,a),this.fire("layeradd",{layer:a}))},removeLayer:function(a){return this.hasLayer(a)?(a in this._layers&&(a=this._layers[a]),a.removeEventParent(this),Yo.prototype.removeLayer.call(this,a),this.fire("layerremove",{layer:a})):this},setStyle:function(a){return this.invoke("setStyle",a)},bringToFront:function(){return this.invoke("bringToFront")},bringToBack:function(){return this.invoke("bringToBack")},getBounds:function(){var a=new ae;for(var u in this._layers){var h=this._layers[u];a.extend(h.getBounds?h.getBounds():h.getLatLng())}return a}}),M2=function(a,u){return new Or(a,u)},Qo=q.extend({options:{popupAnchor:[0,0],tooltipAnchor:[0,0],crossOrigin:!1},initialize:function(a){g(this,a)},createIcon:function(a){return this._createIcon("icon",a)},createShadow:function(a){return this._createIcon("shadow",a)},_createIcon:function(a,u){var h=this._getIconUrl(a);if(!h){if(a==="icon")throw new Error("iconUrl not set in Icon options (see the docs).");return null}var v=this._createImg(h,u&&u.tagName==="IMG"?u:null);return this._setIconStyles(v,a),(this.options.crossOrigin||this.options.crossOrigin==="")&&(v.crossOrigin=this.options.crossOrigin===!0?"":this.options.crossOrigin),v},_setIconStyles:function(a,u){var h=this.options,v=h[u+"Size"];typeof v=="number"&&(v=[v,v]);var S=H(v),A=H(u==="shadow"&&h.shadowAnchor||h.iconAnchor||S&&S.divideBy(2,!0));a.className="leaflet-marker-"+u+" "+(h.className||""),A&&(a.style.marginLeft=-A.x+"px",a.style.marginTop=-A.y+"px"),S&&(a.style.width=S.x+"px",a.style.height=S.y+"px")},_createImg:function(a,u){return u=u||document.createElement("img"),u.src=a,u},_getIconUrl:function(a){return fe.retina&&this.options[a+"RetinaUrl"]||this.options[a+"Url"]}});function k2(a){return new Qo(a)}var Ys=Qo.extend({options:{iconUrl:"marker-icon.png",iconRetinaUrl:"marker-icon-2x.png",shadowUrl:"marker-shadow.png",iconSize:[25,41],iconAnchor:[12,41],popupAnchor:[1,-34],tooltipAnchor:[16,-28],shadowSize:[41,41]},_getIconUrl:function(a){return typeof Ys.imagePath!="string"&&(Ys.imagePath=this._detectIconPath()),(this.options.imagePath||Ys.imagePath)+Qo.prototype._getIconUrl.call(this,a)},_stripUrl:function(a){var u=function(h,v,S){var A=v.exec(h);return A&&A[S]};return a=u(a,/^url\((['"])?(.+)\1\)$/,2),a&&u(a,/^(.*)marker-icon\.png$/,1)},_detectIconPath:function(){var a=$e("div","leaflet-default-icon-path",document.body),u=Hs(a,"background-image")||Hs(a,"backgroundImage");if(document.body.removeChild(a),u=this._stripUrl(u),u)return u;var h=document.querySelector('link[href$="leaflet.css"]');return h?h.href.substring(0,h.href.length-11-1):""}}),yb=cr.extend({initialize:function(a){this._marker=a},addHooks:function(){var a=this._marker._icon;this._draggable||(this._draggable=new ii(a,a,!0)),this._draggable.on({dragstart:this._onDragStart,predrag:this._onPreDrag,drag:this._onDrag,dragend:this._onDragEnd},this).enable(),be(a,"leaflet-marker-draggable")},removeHooks:function(){this._draggable.off({dragstart:this._onDragStart,predrag:this._onPreDrag,drag:this._onDrag,dragend:this._onDragEnd},this).disable(),this._marker._icon&&ut(this._marker._icon,"leaflet-marker-draggable")},moved:function(){return this._draggable&&this._draggable._moved},_adjustPan:function(a){var u=this._marker,h=u._map,v=this._marker.options.autoPanSpeed,S=this._marker.options.autoPanPadding,A=Qi(u._icon),$=h.getPixelBounds(),U=h.getPixelOrigin(),W=J($.min._subtract(U).add(S),$.max._subtract(U).subtract(S));if(!W.contains(A)){var Q=H((Math.max(W.max.x,A.x)-W.max.x)/($.max.x-W.max.x)-(Math.min(W.min.x,A.x)-W.min.x)/($.min.x-W.min.x),(Math.max(W.max.y,A.y)-W.max.y)/($.max.y-W.max.y)-(Math.min(W.min.y,A.y)-W.min.y)/($.min.y-W.min.y)).multiplyBy(v);h.panBy(Q,{animate:!1}),this._draggable._newPos._add(Q),this._draggable._startPos._add(Q),ht(u._icon,this._draggable._newPos),this._onDrag(a),this._panRequest=N(this._adjustPan.bind(this,a))}},_onDragStart:function(){this._oldLatLng=this._marker.getLatLng(),this._marker.closePopup&&this._marker.closePopup(),this._marker.fire("movestart").fire("dragstart")},_onPreDrag:function(a){this._marker.options.autoPan&&(F(this._panRequest),this._panRequest=N(this._adjustPan.bind(this,a)))},_onDrag:function(a){var u=this._marker,h=u._shadow,v=Qi(u._icon),S=u._map.layerPointToLatLng(v);h&&ht(h,v),u._latlng=S,a.latlng=S,a.oldLatLng=this._oldLatLng,u.fire("move",a).fire("drag",a)},_onDragEnd:function(a){F(this._panRequest),delete this._oldLatLng,this._marker.fire("moveend").fire("dragend",a)}}),wc=Wn.extend({options:{icon:new Ys,interactive:!0,keyboard:!0,title:"",alt:"Marker",zIndexOffset:0,opacity:1,riseOnHover:!1,riseOffset:250,pane:"markerPane",shadowPane:"shadowPane",bubblingMouseEvents:!1,autoPanOnFocus:!0,draggable:!1,autoPan:!1,autoPanPadding:[50,50],autoPanSpeed:10},initialize:function(a,u){g(this,u),this._latlng=ce(a)},onAdd:function(a){this._zoomAnimated=this._zoomAnimated&&a.options.markerZoomAnimation,this._zoomAnimated&&a.on("zoomanim",this._animateZoom,this),this._initIcon(),this.update()},onRemove:function(a){this.dragging&&this.dragging.enabled()&&(this.options.draggable=!0,this.dragging.removeHooks()),delete this.dragging,this._zoomAnimated&&a.off("zoomanim",this._animateZoom,this),this._removeIcon(),this._removeShadow()},getEvents:function(){return{zoom:this.update,viewreset:this.update}},getLatLng:function(){return this._latlng},setLatLng:function(a){var u=this._latlng;return this._latlng=ce(a),this.update(),this.fire("move",{oldLatLng:u,latlng:this._latlng})},setZIndexOffset:function(a){return this.options.zIndexOffset=a,this.update()},getIcon:function(){return this.options.icon},setIcon:function(a){return this.options.icon=a,this._map&&(this._initIcon(),this.update()),this._popup&&this.bindPopup(this._popup,this._popup.options),this},getElement:function(){return this._icon},update:function(){if(this._icon&&this._map){var a=this._map.latLngToLayerPoint(this._latlng).round();this._setPos(a)}return this},_initIcon:function(){var a=this.options,u="leaflet-zoom-"+(this._zoomAnimated?"animated":"hide"),h=a.icon.createIcon(this._icon),v=!1;h!==this._icon&&(this._icon&&this._removeIcon(),v=!0,a.title&&(h.title=a.title),h.tagName==="IMG"&&(h.alt=a.alt||"")),be(h,u),a.keyboard&&(h.tabIndex="0",h.setAttribute("role","button")),this._icon=h,a.riseOnHover&&this.on({mouseover:this._bringToFront,mouseout:this._resetZIndex}),this.options.autoPanOnFocus&&_e(h,"focus",this._panOnFocus,this);var S=a.icon.createShadow(this._shadow),A=!1;S!==this._shadow&&(this._removeShadow(),A=!0),S&&(be(S,u),S.alt=""),this._shadow=S,a.opacity<1&&this._updateOpacity(),v&&this.getPane().appendChild(this._icon),this._initInteraction(),S&&A&&this.getPane(a.shadowPane).appendChild(this._shadow)},_removeIcon:function(){this.options.riseOnHover&&this.off({mouseover:this._bringToFront,mouseout:this._resetZIndex}),this.options.autoPanOnFocus&&Ue(this._icon,"focus",this._panOnFocus,this),Qe(this._icon),this.removeInteractiveTarget(this._icon),this._icon=null},_removeShadow:function(){this._shadow&&Qe(this._shadow),this._shadow=null},_setPos:function(a){this._icon&&ht(this._icon,a),this._shadow&&ht(this._shadow,a),this._zIndex=a.y+this.options.zIndexOffset,this._resetZIndex()},_updateZIndex:function(a){this._icon&&(this._icon.style.zIndex=this._zIndex+a)},_animateZoom:function(a){var u=this._map._latLngToNewLayerPoint(this._latlng,a.zoom,a.center).round();this._setPos(u)},_initInteraction:function(){if(this.options.interactive&&(be(this._icon,"leaflet-interactive"),this.addInteractiveTarget(this._icon),yb)){var a=this.options.draggable;this.dragging&&(a=this.dragging.enabled(),this.dragging.disable()),this.dragging=new yb(this),a&&this.dragging.enable()}},setOpacity:function(a){return this.options.opacity=a,this._map&&this._updateOpacity(),this},_updateOpacity:function(){var a=this.options.opacity;this._icon&&xn(this._icon,a),this._shadow&&xn(this._shadow,a)},_bringToFront:function(){this._updateZIndex(this.options.riseOffset)},_resetZIndex:function(){this._updateZIndex(0)},_panOnFocus:function(){var a=this._map;if(a){var u=this.options.icon.options,h=u.iconSize?H(u.iconSize):H(0,0),v=u.iconAnchor?H(u.iconAnchor):H(0,0);a.panInside(this._latlng,{paddingTopLeft:v,paddingBottomRight:h.subtract(v)})}},_getPopupAnchor:function(){return this.options.icon.options.popupAnchor},_getTooltipAnchor:function(){return this.options.icon.options.tooltipAnchor}});function $2(a,u){return new wc(a,u)}var oi=Wn.extend({options:{stroke:!0,color:"#3388ff",weight:3,opacity:1,lineCap:"round",lineJoin:"round",dashArray:null,dashOffset:null,fill:!1,fillColor:null,fillOpacity:.2,fillRule:"evenodd",interactive:!0,bubblingMouseEvents:!0},beforeAdd:function(a){this._renderer=a.getRenderer(this)},onAdd:function(){this._renderer._initPath(this),this._reset(),this._renderer._addPath(this)},onRemove:function(){this._renderer._removePath(this)},redraw:function(){return this._map&&this._renderer._updatePath(this),this},setStyle:function(a){return g(this,a),this._renderer&&(this._renderer._updateStyle(this),this.options.stroke&&a&&Object.prototype.hasOwnProperty.call(a,"weight")&&this._updateBounds()),this},bringToFront:function(){return this._renderer&&this._renderer._bringToFront(this),this},bringToBack:function(){return this._renderer&&this._renderer._bringToBack(this),this},getElement:function(){return this._path},_reset:function(){this._project(),this._update()},_clickTolerance:function(){return(this.options.stroke?this.options.weight/2:0)+(this._renderer.options.tolerance||0)}}),Sc=oi.extend({options:{fill:!0,radius:10},initialize:function(a,u){g(this,u),this._latlng=ce(a),this._radius=this.options.radius},setLatLng:function(a){var u=this._latlng;return this._latlng=ce(a),this.redraw(),this.fire("move",{oldLatLng:u,latlng:this._latlng})},getLatLng:function(){return this._latlng},setRadius:function(a){return this.options.radius=this._radius=a,this.redraw()},getRadius:function(){return this._radius},setStyle:function(a){var u=a&&a.radius||this._radius;return oi.prototype.setStyle.call(this,a),this.setRadius(u),this},_project:function(){this._point=this._map.latLngToLayerPoint(this._latlng),this._updateBounds()},_updateBounds:function(){var a=this._radius,u=this._radiusY||a,h=this._clickTolerance(),v=[a+h,u+h];this._pxBounds=new te(this._point.subtract(v),this._point.add(v))},_update:function(){this._map&&this._updatePath()},_updatePath:function(){this._renderer._updateCircle(this)},_empty:function(){return this._radius&&!this._renderer._bounds.intersects(this._pxBounds)},_containsPoint:function(a){return a.distanceTo(this._point)<=this._radius+this._clickTolerance()}});function j2(a,u){return new Sc(a,u)}var Ap=Sc.extend({initialize:function(a,u,h){if(typeof u=="number"&&(u=i({},h,{radius:u})),g(this,u),this._latlng=ce(a),isNaN(this.options.radius))throw new Error("Circle radius cannot be NaN");this._mRadius=this.options.radius},setRadius:function(a){return this._mRadius=a,this.redraw()},getRadius:function(){return this._mRadius},getBounds:function(){var a=[this._radius,this._radiusY||this._radius];return new ae(this._map.layerPointToLatLng(this._point.subtract(a)),this._map.layerPointToLatLng(this._point.add(a)))},setStyle:oi.prototype.setStyle,_project:function(){var a=this._latlng.lng,u=this._latlng.lat,h=this._map,v=h.options.crs;if(v.distance===Ye.distance){var S=Math.PI/180,A=this._mRadius/Ye.R/S,$=h.project([u+A,a]),U=h.project([u-A,a]),W=$.add(U).divideBy(2),Q=h.unproject(W).lat,oe=Math.acos((Math.cos(A*S)-Math.sin(u*S)*Math.sin(Q*S))/(Math.cos(u*S)*Math.cos(Q*S)))/S;(isNaN(oe)||oe===0)&&(oe=A/Math.cos(Math.PI/180*u)),this._point=W.subtract(h.getPixelOrigin()),this._radius=isNaN(oe)?0:W.x-h.project([Q,a-oe]).x,this._radiusY=W.y-$.y}else{var ve=v.unproject(v.project(this._latlng).subtract([this._mRadius,0]));this._point=h.latLngToLayerPoint(this._latlng),this._radius=this._point.x-h.latLngToLayerPoint(ve).x}this._updateBounds()}});function L2(a,u,h){return new Ap(a,u,h)}var Er=oi.extend({options:{smoothFactor:1,noClip:!1},initialize:function(a,u){g(this,u),this._setLatLngs(a)},getLatLngs:function(){return this._latlngs},setLatLngs:function(a){return this._setLatLngs(a),this.redraw()},isEmpty:function(){return!this._latlngs.length},closestLayerPoint:function(a){for(var u=1/0,h=null,v=Xs,S,A,$=0,U=this._parts.length;$<U;$++)for(var W=this._parts[$],Q=1,oe=W.length;Q<oe;Q++){S=W[Q-1],A=W[Q];var ve=v(a,S,A,!0);ve<u&&(u=ve,h=v(a,S,A))}return h&&(h.distance=Math.sqrt(u)),h},getCenter:function(){if(!this._map)throw new Error("Must add layer to map before using getCenter()");return mb(this._defaultShape(),this._map.options.crs)},getBounds:function(){return this._bounds},addLatLng:function(a,u){return u=u||this._defaultShape(),a=ce(a),u.push(a),this._bounds.extend(a),this.redraw()},_setLatLngs:function(a){this._bounds=new ae,this._latlngs=this._convertLatLngs(a)},_defaultShape:function(){return wn(this._latlngs)?this._latlngs:this._latlngs[0]},_convertLatLngs:function(a){for(var u=[],h=wn(a),v=0,S=a.length;v<S;v++)h?(u[v]=ce(a[v]),this._bounds.extend(u[v])):u[v]=this._convertLatLngs(a[v]);return u},_project:function(){var a=new te;this._rings=[],this._projectLatlngs(this._latlngs,this._rings,a),this._bounds.isValid()&&a.isValid()&&(this._rawPxBounds=a,this._updateBounds())},_updateBounds:function(){var a=this._clickTolerance(),u=new B(a,a);this._rawPxBounds&&(this._pxBounds=new te([this._rawPxBounds.min.subtract(u),this._rawPxBounds.max.add(u)]))},_projectLatlngs:function(a,u,h){var v=a[0]instanceof de,S=a.length,A,$;if(v){for($=[],A=0;A<S;A++)$[A]=this._map.latLngToLayerPoint(a[A]),h.extend($[A]);u.push($)}else for(A=0;A<S;A++)this._projectLatlngs(a[A],u,h)},_clipPoints:function(){var a=this._renderer._bounds;if(this._parts=[],!(!this._pxBounds||!this._pxBounds.intersects(a))){if(this.options.noClip){this._parts=this._rings;return}var u=this._parts,h,v,S,A,$,U,W;for(h=0,S=0,A=this._rings.length;h<A;h++)for(W=this._rings[h],v=0,$=W.length;v<$-1;v++)U=db(W[v],W[v+1],a,v,!0),U&&(u[S]=u[S]||[],u[S].push(U[0]),(U[1]!==W[v+1]||v===$-2)&&(u[S].push(U[1]),S++))}},_simplifyPoints:function(){for(var a=this._parts,u=this.options.smoothFactor,h=0,v=a.length;h<v;h++)a[h]=cb(a[h],u)},_update:function(){this._map&&(this._clipPoints(),this._simplifyPoints(),this._updatePath())},_updatePath:function(){this._renderer._updatePoly(this)},_containsPoint:function(a,u){var h,v,S,A,$,U,W=this._clickTolerance();if(!this._pxBounds||!this._pxBounds.contains(a))return!1;for(h=0,A=this._parts.length;h<A;h++)for(U=this._parts[h],v=0,$=U.length,S=$-1;v<$;S=v++)if(!(!u&&v===0)&&fb(a,U[S],U[v])<=W)return!0;return!1}});function I2(a,u){return new Er(a,u)}Er._flat=pb;var Jo=Er.extend({options:{fill:!0},isEmpty:function(){return!this._latlngs.length||!this._latlngs[0].length},getCenter:function(){if(!this._map)throw new Error("Must add layer to map before using getCenter()");return lb(this._defaultShape(),this._map.options.crs)},_convertLatLngs:function(a){var u=Er.prototype._convertLatLngs.call(this,a),h=u.length;return h>=2&&u[0]instanceof de&&u[0].equals(u[h-1])&&u.pop(),u},_setLatLngs:function(a){Er.prototype._setLatLngs.call(this,a),wn(this._latlngs)&&(this._latlngs=[this._latlngs])},_defaultShape:function(){return wn(this._latlngs[0])?this._latlngs[0]:this._latlngs[0][0]},_clipPoints:function(){var a=this._renderer._bounds,u=this.options.weight,h=new B(u,u);if(a=new te(a.min.subtract(h),a.max.add(h)),this._parts=[],!(!this._pxBounds||!this._pxBounds.intersects(a))){if(this.options.noClip){this._parts=this._rings;return}for(var v=0,S=this._rings.length,A;v<S;v++)A=ub(this._rings[v],a,!0),A.length&&this._parts.push(A)}},_updatePath:function(){this._renderer._updatePoly(this,!0)},_containsPoint:function(a){var u=!1,h,v,S,A,$,U,W,Q;if(!this._pxBounds||!this._pxBounds.contains(a))return!1;for(A=0,W=this._parts.length;A<W;A++)for(h=this._parts[A],$=0,Q=h.length,U=Q-1;$<Q;U=$++)v=h[$],S=h[U],v.y>a.y!=S.y>a.y&&a.x<(S.x-v.x)*(a.y-v.y)/(S.y-v.y)+v.x&&(u=!u);return u||Er.prototype._containsPoint.call(this,a,!0)}});function N2(a,u){return new Jo(a,u)}var Tr=Or.extend({initialize:function(a,u){g(this,u),this._layers={},a&&this.addData(a)},addData:function(a){var u=w(a)?a:a.features,h,v,S;if(u){for(h=0,v=u.length;h<v;h++)S=u[h],(S.geometries||S.geometry||S.features||S.coordinates)&&this.addData(S);return this}var A=this.options;if(A.filter&&!A.filter(a))return this;var $=Pc(a,A);return $?($.feature=Tc(a),$.defaultOptions=$.options,this.resetStyle($),A.onEachFeature&&A.onEachFeature(a,$),this.addLayer($)):this},resetStyle:function(a){return a===void 0?this.eachLayer(this.resetStyle,this):(a.options=i({},a.defaultOptions),this._setLayerStyle(a,this.options.style),this)},setStyle:function(a){return this.eachLayer(function(u){this._setLayerStyle(u,a)},this)},_setLayerStyle:function(a,u){a.setStyle&&(typeof u=="function"&&(u=u(a.feature)),a.setStyle(u))}});function Pc(a,u){var h=a.type==="Feature"?a.geometry:a,v=h?h.coordinates:null,S=[],A=u&&u.pointToLayer,$=u&&u.coordsToLatLng||Cp,U,W,Q,oe;if(!v&&!h)return null;switch(h.type){case"Point":return U=$(v),gb(A,a,U,u);case"MultiPoint":for(Q=0,oe=v.length;Q<oe;Q++)U=$(v[Q]),S.push(gb(A,a,U,u));return new Or(S);case"LineString":case"MultiLineString":return W=Oc(v,h.type==="LineString"?0:1,$),new Er(W,u);case"Polygon":case"MultiPolygon":return W=Oc(v,h.type==="Polygon"?1:2,$),new Jo(W,u);case"GeometryCollection":for(Q=0,oe=h.geometries.length;Q<oe;Q++){var ve=Pc({geometry:h.geometries[Q],type:"Feature",properties:a.properties},u);ve&&S.push(ve)}return new Or(S);case"FeatureCollection":for(Q=0,oe=h.features.length;Q<oe;Q++){var we=Pc(h.features[Q],u);we&&S.push(we)}return new Or(S);default:throw new Error("Invalid GeoJSON object.")}}function gb(a,u,h,v){return a?a(u,h):new wc(h,v&&v.markersInheritOptions&&v)}function Cp(a){return new de(a[1],a[0],a[2])}function Oc(a,u,h){for(var v=[],S=0,A=a.length,$;S<A;S++)$=u?Oc(a[S],u-1,h):(h||Cp)(a[S]),v.push($);return v}function Mp(a,u){return a=ce(a),a.alt!==void 0?[m(a.lng,u),m(a.lat,u),m(a.alt,u)]:[m(a.lng,u),m(a.lat,u)]}function Ec(a,u,h,v){for(var S=[],A=0,$=a.length;A<$;A++)S.push(u?Ec(a[A],wn(a[A])?0:u-1,h,v):Mp(a[A],v));return!u&&h&&S.length>0&&S.push(S[0].slice()),S}function ea(a,u){return a.feature?i({},a.feature,{geometry:u}):Tc(u)}function Tc(a){return a.type==="Feature"||a.type==="FeatureCollection"?a:{type:"Feature",properties:{},geometry:a}}var kp={toGeoJSON:function(a){return ea(this,{type:"Point",coordinates:Mp(this.getLatLng(),a)})}};wc.include(kp),Ap.include(kp),Sc.include(kp),Er.include({toGeoJSON:function(a){var u=!wn(this._latlngs),h=Ec(this._latlngs,u?1:0,!1,a);return ea(this,{type:(u?"Multi":"")+"LineString",coordinates:h})}}),Jo.include({toGeoJSON:function(a){var u=!wn(this._latlngs),h=u&&!wn(this._latlngs[0]),v=Ec(this._latlngs,h?2:u?1:0,!0,a);return u||(v=[v]),ea(this,{type:(h?"Multi":"")+"Polygon",coordinates:v})}}),Yo.include({toMultiPoint:function(a){var u=[];return this.eachLayer(function(h){u.push(h.toGeoJSON(a).geometry.coordinates)}),ea(this,{type:"MultiPoint",coordinates:u})},toGeoJSON:function(a){var u=this.feature&&this.feature.geometry&&this.feature.geometry.type;if(u==="MultiPoint")return this.toMultiPoint(a);var h=u==="GeometryCollection",v=[];return this.eachLayer(function(S){if(S.toGeoJSON){var A=S.toGeoJSON(a);if(h)v.push(A.geometry);else{var $=Tc(A);$.type==="FeatureCollection"?v.push.apply(v,$.features):v.push($)}}}),h?ea(this,{geometries:v,type:"GeometryCollection"}):{type:"FeatureCollection",features:v}}});function _b(a,u){return new Tr(a,u)}var D2=_b,Ac=Wn.extend({options:{opacity:1,alt:"",interactive:!1,crossOrigin:!1,errorOverlayUrl:"",zIndex:1,className:""},initialize:function(a,u,h){this._url=a,this._bounds=he(u),g(this,h)},onAdd:function(){this._image||(this._initImage(),this.options.opacity<1&&this._updateOpacity()),this.options.interactive&&(be(this._image,"leaflet-interactive"),this.addInteractiveTarget(this._image)),this.getPane().appendChild(this._image),this._reset()},onRemove:function(){Qe(this._image),this.options.interactive&&this.removeInteractiveTarget(this._image)},setOpacity:function(a){return this.options.opacity=a,this._image&&this._updateOpacity(),this},setStyle:function(a){return a.opacity&&this.setOpacity(a.opacity),this},bringToFront:function(){return this._map&&Go(this._image),this},bringToBack:function(){return this._map&&Xo(this._image),this},setUrl:function(a){return this._url=a,this._image&&(this._image.src=a),this},setBounds:function(a){return this._bounds=he(a),this._map&&this._reset(),this},getEvents:function(){var a={zoom:this._reset,viewreset:this._reset};return this._zoomAnimated&&(a.zoomanim=this._animateZoom),a},setZIndex:function(a){return this.options.zIndex=a,this._updateZIndex(),this},getBounds:function(){return this._bounds},getElement:function(){return this._image},_initImage:function(){var a=this._url.tagName==="IMG",u=this._image=a?this._url:$e("img");if(be(u,"leaflet-image-layer"),this._zoomAnimated&&be(u,"leaflet-zoom-animated"),this.options.className&&be(u,this.options.className),u.onselectstart=d,u.onmousemove=d,u.onload=s(this.fire,this,"load"),u.onerror=s(this._overlayOnError,this,"error"),(this.options.crossOrigin||this.options.crossOrigin==="")&&(u.crossOrigin=this.options.crossOrigin===!0?"":this.options.crossOrigin),this.options.zIndex&&this._updateZIndex(),a){this._url=u.src;return}u.src=this._url,u.alt=this.options.alt},_animateZoom:function(a){var u=this._map.getZoomScale(a.zoom),h=this._map._latLngBoundsToNewLayerBounds(this._bounds,a.zoom,a.center).min;Yi(this._image,h,u)},_reset:function(){var a=this._image,u=new te(this._map.latLngToLayerPoint(this._bounds.getNorthWest()),this._map.latLngToLayerPoint(this._bounds.getSouthEast())),h=u.getSize();ht(a,u.min),a.style.width=h.x+"px",a.style.height=h.y+"px"},_updateOpacity:function(){xn(this._image,this.options.opacity)},_updateZIndex:function(){this._image&&this.options.zIndex!==void 0&&this.options.zIndex!==null&&(this._image.style.zIndex=this.options.zIndex)},_overlayOnError:function(){this.fire("error");var a=this.options.errorOverlayUrl;a&&this._url!==a&&(this._url=a,this._image.src=a)},getCenter:function(){return this._bounds.getCenter()}}),R2=function(a,u,h){return new Ac(a,u,h)},bb=Ac.extend({options:{autoplay:!0,loop:!0,keepAspectRatio:!0,muted:!1,playsInline:!0},_initImage:function(){var a=this._url.tagName==="VIDEO",u=this._image=a?this._url:$e("video");if(be(u,"leaflet-image-layer"),this._zoomAnimated&&be(u,"leaflet-zoom-animated"),this.options.className&&be(u,this.options.className),u.onselectstart=d,u.onmousemove=d,u.onloadeddata=s(this.fire,this,"load"),a){for(var h=u.getElementsByTagName("source"),v=[],S=0;S<h.length;S++)v.push(h[S].src);this._url=h.length>0?v:[u.src];return}w(this._url)||(this._url=[this._url]),!this.options.keepAspectRatio&&Object.prototype.hasOwnProperty.call(u.style,"objectFit")&&(u.style.objectFit="fill"),u.autoplay=!!this.options.autoplay,u.loop=!!this.options.loop,u.muted=!!this.options.muted,u.playsInline=!!this.options.playsInline;for(var A=0;A<this._url.length;A++){var $=$e("source");$.src=this._url[A],u.appendChild($)}}});function B2(a,u,h){return new bb(a,u,h)}var xb=Ac.extend({_initImage:function(){var a=this._image=this._url;be(a,"leaflet-image-layer"),this._zoomAnimated&&be(a,"leaflet-zoom-animated"),this.options.className&&be(a,this.options.className),a.onselectstart=d,a.onmousemove=d}});function z2(a,u,h){return new xb(a,u,h)}var fr=Wn.extend({options:{interactive:!1,offset:[0,0],className:"",pane:void 0,content:""},initialize:function(a,u){a&&(a instanceof de||w(a))?(this._latlng=ce(a),g(this,u)):(g(this,a),this._source=u),this.options.content&&(this._content=this.options.content)},openOn:function(a){return a=arguments.length?a:this._source._map,a.hasLayer(this)||a.addLayer(this),this},close:function(){return this._map&&this._map.removeLayer(this),this},toggle:function(a){return this._map?this.close():(arguments.length?this._source=a:a=this._source,this._prepareOpen(),this.openOn(a._map)),this},onAdd:function(a){this._zoomAnimated=a._zoomAnimated,this._container||this._initLayout(),a._fadeAnimated&&xn(this._container,0),clearTimeout(this._removeTimeout),this.getPane().appendChild(this._container),this.update(),a._fadeAnimated&&xn(this._container,1),this.bringToFront(),this.options.interactive&&(be(this._container,"leaflet-interactive"),this.addInteractiveTarget(this._container))},onRemove:function(a){a._fadeAnimated?(xn(this._container,0),this._removeTimeout=setTimeout(s(Qe,void 0,this._container),200)):Qe(this._container),this.options.interactive&&(ut(this._container,"leaflet-interactive"),this.removeInteractiveTarget(this._container))},getLatLng:function(){return this._latlng},setLatLng:function(a){return this._latlng=ce(a),this._map&&(this._updatePosition(),this._adjustPan()),this},getContent:function(){return this._content},setContent:function(a){return this._content=a,this.update(),this},getElement:function(){return this._container},update:function(){this._map&&(this._container.style.visibility="hidden",this._updateContent(),this._updateLayout(),this._updatePosition(),this._container.style.visibility="",this._adjustPan())},getEvents:function(){var a={zoom:this._updatePosition,viewreset:this._updatePosition};return this._zoomAnimated&&(a.zoomanim=this._animateZoom),a},isOpen:function(){return!!this._map&&this._map.hasLayer(this)},bringToFront:function(){return this._map&&Go(this._container),this},bringToBack:function(){return this._map&&Xo(this._container),this},_prepareOpen:function(a){var u=this._source;if(!u._map)return!1;if(u instanceof Or){u=null;var h=this._source._layers;for(var v in h)if(h[v]._map){u=h[v];break}if(!u)return!1;this._source=u}if(!a)if(u.getCenter)a=u.getCenter();else if(u.getLatLng)a=u.getLatLng();else if(u.getBounds)a=u.getBounds().getCenter();else throw new Error("Unable to get source layer LatLng.");return this.setLatLng(a),this._map&&this.update(),!0},_updateContent:function(){if(this._content){var a=this._contentNode,u=typeof this._content=="function"?this._content(this._source||this):this._content;if(typeof u=="string")a.innerHTML=u;else{for(;a.hasChildNodes();)a.removeChild(a.firstChild);a.appendChild(u)}this.fire("contentupdate")}},_updatePosition:function(){if(this._map){var a=this._map.latLngToLayerPoint(this._latlng),u=H(this.options.offset),h=this._getAnchor();this._zoomAnimated?ht(this._container,a.add(h)):u=u.add(a).add(h);var v=this._containerBottom=-u.y,S=this._containerLeft=-Math.round(this._containerWidth/2)+u.x;this._container.style.bottom=v+"px",this._container.style.left=S+"px"}},_getAnchor:function(){return[0,0]}});Ce.include({_initOverlay:function(a,u,h,v){var S=u;return S instanceof a||(S=new a(v).setContent(u)),h&&S.setLatLng(h),S}}),Wn.include({_initOverlay:function(a,u,h,v){var S=h;return S instanceof a?(g(S,v),S._source=this):(S=u&&!v?u:new a(v,this),S.setContent(h)),S}});var Cc=fr.extend({options:{pane:"popupPane",offset:[0,7],maxWidth:300,minWidth:50,maxHeight:null,autoPan:!0,autoPanPaddingTopLeft:null,autoPanPaddingBottomRight:null,autoPanPadding:[5,5],keepInView:!1,closeButton:!0,autoClose:!0,closeOnEscapeKey:!0,className:""},openOn:function(a){return a=arguments.length?a:this._source._map,!a.hasLayer(this)&&a._popup&&a._popup.options.autoClose&&a.removeLayer(a._popup),a._popup=this,fr.prototype.openOn.call(this,a)},onAdd:function(a){fr.prototype.onAdd.call(this,a),a.fire("popupopen",{popup:this}),this._source&&(this._source.fire("popupopen",{popup:this},!0),this._source instanceof oi||this._source.on("preclick",Ji))},onRemove:function(a){fr.prototype.onRemove.call(this,a),a.fire("popupclose",{popup:this}),this._source&&(this._source.fire("popupclose",{popup:this},!0),this._source instanceof oi||this._source.off("preclick",Ji))},getEvents:function(){var a=fr.prototype.getEvents.call(this);return(this.options.closeOnClick!==void 0?this.options.closeOnClick:this._map.options.closePopupOnClick)&&(a.preclick=this.close),this.options.keepInView&&(a.moveend=this._adjustPan),a},_initLayout:function(){var a="leaflet-popup",u=this._container=$e("div",a+" "+(this.options.className||"")+" leaflet-zoom-animated"),h=this._wrapper=$e("div",a+"-content-wrapper",u);if(this._contentNode=$e("div",a+"-content",h),Ks(u),bp(this._contentNode),_e(u,"contextmenu",Ji),this._tipContainer=$e("div",a+"-tip-container",u),this._tip=$e("div",a+"-tip",this._tipContainer),this.options.closeButton){var v=this._closeButton=$e("a",a+"-close-button",u);v.setAttribute("role","button"),v.setAttribute("aria-label","Close popup"),v.href="#close",v.innerHTML='<span aria-hidden="true">&#215;</span>',_e(v,"click",function(S){Mt(S),this.close()},this)}},_updateLayout:function(){var a=this._contentNode,u=a.style;u.width="",u.whiteSpace="nowrap";var h=a.offsetWidth;h=Math.min(h,this.options.maxWidth),h=Math.max(h,this.options.minWidth),u.width=h+1+"px",u.whiteSpace="",u.height="";var v=a.offsetHeight,S=this.options.maxHeight,A="leaflet-popup-scrolled";S&&v>S?(u.height=S+"px",be(a,A)):ut(a,A),this._containerWidth=this._container.offsetWidth},_animateZoom:function(a){var u=this._map._latLngToNewLayerPoint(this._latlng,a.zoom,a.center),h=this._getAnchor();ht(this._container,u.add(h))},_adjustPan:function(){if(this.options.autoPan){if(this._map._panAnim&&this._map._panAnim.stop(),this._autopanning){this._autopanning=!1;return}var a=this._map,u=parseInt(Hs(this._container,"marginBottom"),10)||0,h=this._container.offsetHeight+u,v=this._containerWidth,S=new B(this._containerLeft,-h-this._containerBottom);S._add(Qi(this._container));var A=a.layerPointToContainerPoint(S),$=H(this.options.autoPanPadding),U=H(this.options.autoPanPaddingTopLeft||$),W=H(this.options.autoPanPaddingBottomRight||$),Q=a.getSize(),oe=0,ve=0;A.x+v+W.x>Q.x&&(oe=A.x+v-Q.x+W.x),A.x-oe-U.x<0&&(oe=A.x-U.x),A.y+h+W.y>Q.y&&(ve=A.y+h-Q.y+W.y),A.y-ve-U.y<0&&(ve=A.y-U.y),(oe||ve)&&(this.options.keepInView&&(this._autopanning=!0),a.fire("autopanstart").panBy([oe,ve]))}},_getAnchor:function(){return H(this._source&&this._source._getPopupAnchor?this._source._getPopupAnchor():[0,0])}}),F2=function(a,u){return new Cc(a,u)};Ce.mergeOptions({closePopupOnClick:!0}),Ce.include({openPopup:function(a,u,h){return this._initOverlay(Cc,a,u,h).openOn(this),this},closePopup:function(a){return a=arguments.length?a:this._popup,a&&a.close(),this}}),Wn.include({bindPopup:function(a,u){return this._popup=this._initOverlay(Cc,this._popup,a,u),this._popupHandlersAdded||(this.on({click:this._openPopup,keypress:this._onKeyPress,remove:this.closePopup,move:this._movePopup}),this._popupHandlersAdded=!0),this},unbindPopup:function(){return this._popup&&(this.off({click:this._openPopup,keypress:this._onKeyPress,remove:this.closePopup,move:this._movePopup}),this._popupHandlersAdded=!1,this._popup=null),this},openPopup:function(a){return this._popup&&(this instanceof Or||(this._popup._source=this),this._popup._prepareOpen(a||this._latlng)&&this._popup.openOn(this._map)),this},closePopup:function(){return this._popup&&this._popup.close(),this},togglePopup:function(){return this._popup&&this._popup.toggle(this),this},isPopupOpen:function(){return this._popup?this._popup.isOpen():!1},setPopupContent:function(a){return this._popup&&this._popup.setContent(a),this},getPopup:function(){return this._popup},_openPopup:function(a){if(!(!this._popup||!this._map)){eo(a);var u=a.layer||a.target;if(this._popup._source===u&&!(u instanceof oi)){this._map.hasLayer(this._popup)?this.closePopup():this.openPopup(a.latlng);return}this._popup._source=u,this.openPopup(a.latlng)}},_movePopup:function(a){this._popup.setLatLng(a.latlng)},_onKeyPress:function(a){a.originalEvent.keyCode===13&&this._openPopup(a)}});var Mc=fr.extend({options:{pane:"tooltipPane",offset:[0,0],direction:"auto",permanent:!1,sticky:!1,opacity:.9},onAdd:function(a){fr.prototype.onAdd.call(this,a),this.setOpacity(this.options.opacity),a.fire("tooltipopen",{tooltip:this}),this._source&&(this.addEventParent(this._source),this._source.fire("tooltipopen",{tooltip:this},!0))},onRemove:function(a){fr.prototype.onRemove.call(this,a),a.fire("tooltipclose",{tooltip:this}),this._source&&(this.removeEventParent(this._source),this._source.fire("tooltipclose",{tooltip:this},!0))},getEvents:function(){var a=fr.prototype.getEvents.call(this);return this.options.permanent||(a.preclick=this.close),a},_initLayout:function(){var a="leaflet-tooltip",u=a+" "+(this.options.className||"")+" leaflet-zoom-"+(this._zoomAnimated?"animated":"hide");this._contentNode=this._container=$e("div",u),this._container.setAttribute("role","tooltip"),this._container.setAttribute("id","leaflet-tooltip-"+c(this))},_updateLayout:function(){},_adjustPan:function(){},_setPosition:function(a){var u,h,v=this._map,S=this._container,A=v.latLngToContainerPoint(v.getCenter()),$=v.layerPointToContainerPoint(a),U=this.options.direction,W=S.offsetWidth,Q=S.offsetHeight,oe=H(this.options.offset),ve=this._getAnchor();U==="top"?(u=W/2,h=Q):U==="bottom"?(u=W/2,h=0):U==="center"?(u=W/2,h=Q/2):U==="right"?(u=0,h=Q/2):U==="left"?(u=W,h=Q/2):$.x<A.x?(U="right",u=0,h=Q/2):(U="left",u=W+(oe.x+ve.x)*2,h=Q/2),a=a.subtract(H(u,h,!0)).add(oe).add(ve),ut(S,"leaflet-tooltip-right"),ut(S,"leaflet-tooltip-left"),ut(S,"leaflet-tooltip-top"),ut(S,"leaflet-tooltip-bottom"),be(S,"leaflet-tooltip-"+U),ht(S,a)},_updatePosition:function(){var a=this._map.latLngToLayerPoint(this._latlng);this._setPosition(a)},setOpacity:function(a){this.options.opacity=a,this._container&&xn(this._container,a)},_animateZoom:function(a){var u=this._map._latLngToNewLayerPoint(this._latlng,a.zoom,a.center);this._setPosition(u)},_getAnchor:function(){return H(this._source&&this._source._getTooltipAnchor&&!this.options.sticky?this._source._getTooltipAnchor():[0,0])}}),U2=function(a,u){return new Mc(a,u)};Ce.include({openTooltip:function(a,u,h){return this._initOverlay(Mc,a,u,h).openOn(this),this},closeTooltip:function(a){return a.close(),this}}),Wn.include({bindTooltip:function(a,u){return this._tooltip&&this.isTooltipOpen()&&this.unbindTooltip(),this._tooltip=this._initOverlay(Mc,this._tooltip,a,u),this._initTooltipInteractions(),this._tooltip.options.permanent&&this._map&&this._map.hasLayer(this)&&this.openTooltip(),this},unbindTooltip:function(){return this._tooltip&&(this._initTooltipInteractions(!0),this.closeTooltip(),this._tooltip=null),this},_initTooltipInteractions:function(a){if(!(!a&&this._tooltipHandlersAdded)){var u=a?"off":"on",h={remove:this.closeTooltip,move:this._moveTooltip};this._tooltip.options.permanent?h.add=this._openTooltip:(h.mouseover=this._openTooltip,h.mouseout=this.closeTooltip,h.click=this._openTooltip,this._map?this._addFocusListeners():h.add=this._addFocusListeners),this._tooltip.options.sticky&&(h.mousemove=this._moveTooltip),this[u](h),this._tooltipHandlersAdded=!a}},openTooltip:function(a){return this._tooltip&&(this instanceof Or||(this._tooltip._source=this),this._tooltip._prepareOpen(a)&&(this._tooltip.openOn(this._map),this.getElement?this._setAriaDescribedByOnLayer(this):this.eachLayer&&this.eachLayer(this._setAriaDescribedByOnLayer,this))),this},closeTooltip:function(){if(this._tooltip)return this._tooltip.close()},toggleTooltip:function(){return this._tooltip&&this._tooltip.toggle(this),this},isTooltipOpen:function(){return this._tooltip.isOpen()},setTooltipContent:function(a){return this._tooltip&&this._tooltip.setContent(a),this},getTooltip:function(){return this._tooltip},_addFocusListeners:function(){this.getElement?this._addFocusListenersOnLayer(this):this.eachLayer&&this.eachLayer(this._addFocusListenersOnLayer,this)},_addFocusListenersOnLayer:function(a){var u=typeof a.getElement=="function"&&a.getElement();u&&(_e(u,"focus",function(){this._tooltip._source=a,this.openTooltip()},this),_e(u,"blur",this.closeTooltip,this))},_setAriaDescribedByOnLayer:function(a){var u=typeof a.getElement=="function"&&a.getElement();u&&u.setAttribute("aria-describedby",this._tooltip._container.id)},_openTooltip:function(a){if(!(!this._tooltip||!this._map)){if(this._map.dragging&&this._map.dragging.moving()&&!this._openOnceFlag){this._openOnceFlag=!0;var u=this;this._map.once("moveend",function(){u._openOnceFlag=!1,u._openTooltip(a)});return}this._tooltip._source=a.layer||a.target,this.openTooltip(this._tooltip.options.sticky?a.latlng:void 0)}},_moveTooltip:function(a){var u=a.latlng,h,v;this._tooltip.options.sticky&&a.originalEvent&&(h=this._map.mouseEventToContainerPoint(a.originalEvent),v=this._map.containerPointToLayerPoint(h),u=this._map.layerPointToLatLng(v)),this._tooltip.setLatLng(u)}});var wb=Qo.extend({options:{iconSize:[12,12],html:!1,bgPos:null,className:"leaflet-div-icon"},createIcon:function(a){var u=a&&a.tagName==="DIV"?a:document.createElement("div"),h=this.options;if(h.html instanceof Element?(vc(u),u.appendChild(h.html)):u.innerHTML=h.html!==!1?h.html:"",h.bgPos){var v=H(h.bgPos);u.style.backgroundPosition=-v.x+"px "+-v.y+"px"}return this._setIconStyles(u,"icon"),u},createShadow:function(){return null}});function W2(a){return new wb(a)}Qo.Default=Ys;var Qs=Wn.extend({options:{tileSize:256,opacity:1,updateWhenIdle:fe.mobile,updateWhenZooming:!0,updateInterval:200,zIndex:1,bounds:null,minZoom:0,maxZoom:void 0,maxNativeZoom:void 0,minNativeZoom:void 0,noWrap:!1,pane:"tilePane",className:"",keepBuffer:2},initialize:function(a){g(this,a)},onAdd:function(){this._initContainer(),this._levels={},this._tiles={},this._resetView()},beforeAdd:function(a){a._addZoomLimit(this)},onRemove:function(a){this._removeAllTiles(),Qe(this._container),a._removeZoomLimit(this),this._container=null,this._tileZoom=void 0},bringToFront:function(){return this._map&&(Go(this._container),this._setAutoZIndex(Math.max)),this},bringToBack:function(){return this._map&&(Xo(this._container),this._setAutoZIndex(Math.min)),this},getContainer:function(){return this._container},setOpacity:function(a){return this.options.opacity=a,this._updateOpacity(),this},setZIndex:function(a){return this.options.zIndex=a,this._updateZIndex(),this},isLoading:function(){return this._loading},redraw:function(){if(this._map){this._removeAllTiles();var a=this._clampZoom(this._map.getZoom());a!==this._tileZoom&&(this._tileZoom=a,this._updateLevels()),this._update()}return this},getEvents:function(){var a={viewprereset:this._invalidateAll,viewreset:this._resetView,zoom:this._resetView,moveend:this._onMoveEnd};return this.options.updateWhenIdle||(this._onMove||(this._onMove=f(this._onMoveEnd,this.options.updateInterval,this)),a.move=this._onMove),this._zoomAnimated&&(a.zoomanim=this._animateZoom),a},createTile:function(){return document.createElement("div")},getTileSize:function(){var a=this.options.tileSize;return a instanceof B?a:new B(a,a)},_updateZIndex:function(){this._container&&this.options.zIndex!==void 0&&this.options.zIndex!==null&&(this._container.style.zIndex=this.options.zIndex)},_setAutoZIndex:function(a){for(var u=this.getPane().children,h=-a(-1/0,1/0),v=0,S=u.length,A;v<S;v++)A=u[v].style.zIndex,u[v]!==this._container&&A&&(h=a(h,+A));isFinite(h)&&(this.options.zIndex=h+a(-1,1),this._updateZIndex())},_updateOpacity:function(){if(this._map&&!fe.ielt9){xn(this._container,this.options.opacity);var a=+new Date,u=!1,h=!1;for(var v in this._tiles){var S=this._tiles[v];if(!(!S.current||!S.loaded)){var A=Math.min(1,(a-S.loaded)/200);xn(S.el,A),A<1?u=!0:(S.active?h=!0:this._onOpaqueTile(S),S.active=!0)}}h&&!this._noPrune&&this._pruneTiles(),u&&(F(this._fadeFrame),this._fadeFrame=N(this._updateOpacity,this))}},_onOpaqueTile:d,_initContainer:function(){this._container||(this._container=$e("div","leaflet-layer "+(this.options.className||"")),this._updateZIndex(),this.options.opacity<1&&this._updateOpacity(),this.getPane().appendChild(this._container))},_updateLevels:function(){var a=this._tileZoom,u=this.options.maxZoom;if(a!==void 0){for(var h in this._levels)h=Number(h),this._levels[h].el.children.length||h===a?(this._levels[h].el.style.zIndex=u-Math.abs(a-h),this._onUpdateLevel(h)):(Qe(this._levels[h].el),this._removeTilesAtZoom(h),this._onRemoveLevel(h),delete this._levels[h]);var v=this._levels[a],S=this._map;return v||(v=this._levels[a]={},v.el=$e("div","leaflet-tile-container leaflet-zoom-animated",this._container),v.el.style.zIndex=u,v.origin=S.project(S.unproject(S.getPixelOrigin()),a).round(),v.zoom=a,this._setZoomTransform(v,S.getCenter(),S.getZoom()),d(v.el.offsetWidth),this._onCreateLevel(v)),this._level=v,v}},_onUpdateLevel:d,_onRemoveLevel:d,_onCreateLevel:d,_pruneTiles:function(){if(this._map){var a,u,h=this._map.getZoom();if(h>this.options.maxZoom||h<this.options.minZoom){this._removeAllTiles();return}for(a in this._tiles)u=this._tiles[a],u.retain=u.current;for(a in this._tiles)if(u=this._tiles[a],u.current&&!u.active){var v=u.coords;this._retainParent(v.x,v.y,v.z,v.z-5)||this._retainChildren(v.x,v.y,v.z,v.z+2)}for(a in this._tiles)this._tiles[a].retain||this._removeTile(a)}},_removeTilesAtZoom:function(a){for(var u in this._tiles)this._tiles[u].coords.z===a&&this._removeTile(u)},_removeAllTiles:function(){for(var a in this._tiles)this._removeTile(a)},_invalidateAll:function(){for(var a in this._levels)Qe(this._levels[a].el),this._onRemoveLevel(Number(a)),delete this._levels[a];this._removeAllTiles(),this._tileZoom=void 0},_retainParent:function(a,u,h,v){var S=Math.floor(a/2),A=Math.floor(u/2),$=h-1,U=new B(+S,+A);U.z=+$;var W=this._tileCoordsToKey(U),Q=this._tiles[W];return Q&&Q.active?(Q.retain=!0,!0):(Q&&Q.loaded&&(Q.retain=!0),$>v?this._retainParent(S,A,$,v):!1)},_retainChildren:function(a,u,h,v){for(var S=2*a;S<2*a+2;S++)for(var A=2*u;A<2*u+2;A++){var $=new B(S,A);$.z=h+1;var U=this._tileCoordsToKey($),W=this._tiles[U];if(W&&W.active){W.retain=!0;continue}else W&&W.loaded&&(W.retain=!0);h+1<v&&this._retainChildren(S,A,h+1,v)}},_resetView:function(a){var u=a&&(a.pinch||a.flyTo);this._setView(this._map.getCenter(),this._map.getZoom(),u,u)},_animateZoom:function(a){this._setView(a.center,a.zoom,!0,a.noUpdate)},_clampZoom:function(a){var u=this.options;return u.minNativeZoom!==void 0&&a<u.minNativeZoom?u.minNativeZoom:u.maxNativeZoom!==void 0&&u.maxNativeZoom<a?u.maxNativeZoom:a},_setView:function(a,u,h,v){var S=Math.round(u);this.options.maxZoom!==void 0&&S>this.options.maxZoom||this.options.minZoom!==void 0&&S<this.options.minZoom?S=void 0:S=this._clampZoom(S);var A=this.options.updateWhenZooming&&S!==this._tileZoom;(!v||A)&&(this._tileZoom=S,this._abortLoading&&this._abortLoading(),this._updateLevels(),this._resetGrid(),S!==void 0&&this._update(a),h||this._pruneTiles(),this._noPrune=!!h),this._setZoomTransforms(a,u)},_setZoomTransforms:function(a,u){for(var h in this._levels)this._setZoomTransform(this._levels[h],a,u)},_setZoomTransform:function(a,u,h){var v=this._map.getZoomScale(h,a.zoom),S=a.origin.multiplyBy(v).subtract(this._map._getNewPixelOrigin(u,h)).round();fe.any3d?Yi(a.el,S,v):ht(a.el,S)},_resetGrid:function(){var a=this._map,u=a.options.crs,h=this._tileSize=this.getTileSize(),v=this._tileZoom,S=this._map.getPixelWorldBounds(this._tileZoom);S&&(this._globalTileRange=this._pxBoundsToTileRange(S)),this._wrapX=u.wrapLng&&!this.options.noWrap&&[Math.floor(a.project([0,u.wrapLng[0]],v).x/h.x),Math.ceil(a.project([0,u.wrapLng[1]],v).x/h.y)],this._wrapY=u.wrapLat&&!this.options.noWrap&&[Math.floor(a.project([u.wrapLat[0],0],v).y/h.x),Math.ceil(a.project([u.wrapLat[1],0],v).y/h.y)]},_onMoveEnd:function(){!this._map||this._map._animatingZoom||this._update()},_getTiledPixelBounds:function(a){var u=this._map,h=u._animatingZoom?Math.max(u._animateToZoom,u.getZoom()):u.getZoom(),v=u.getZoomScale(h,this._tileZoom),S=u.project(a,this._tileZoom).floor(),A=u.getSize().divideBy(v*2);return new te(S.subtract(A),S.add(A))},_update:function(a){var u=this._map;if(u){var h=this._clampZoom(u.getZoom());if(a===void 0&&(a=u.getCenter()),this._tileZoom!==void 0){var v=this._getTiledPixelBounds(a),S=this._pxBoundsToTileRange(v),A=S.getCenter(),$=[],U=this.options.keepBuffer,W=new te(S.getBottomLeft().subtract([U,-U]),S.getTopRight().add([U,-U]));if(!(isFinite(S.min.x)&&isFinite(S.min.y)&&isFinite(S.max.x)&&isFinite(S.max.y)))throw new Error("Attempted to load an infinite number of tiles");for(var Q in this._tiles){var oe=this._tiles[Q].coords;(oe.z!==this._tileZoom||!W.contains(new B(oe.x,oe.y)))&&(this._tiles[Q].current=!1)}if(Math.abs(h-this._tileZoom)>1){this._setView(a,h);return}for(var ve=S.min.y;ve<=S.max.y;ve++)for(var we=S.min.x;we<=S.max.x;we++){var Ht=new B(we,ve);if(Ht.z=this._tileZoom,!!this._isValidTile(Ht)){var Pt=this._tiles[this._tileCoordsToKey(Ht)];Pt?Pt.current=!0:$.push(Ht)}}if($.sort(function(Qt,na){return Qt.distanceTo(A)-na.distanceTo(A)}),$.length!==0){this._loading||(this._loading=!0,this.fire("loading"));var Sn=document.createDocumentFragment();for(we=0;we<$.length;we++)this._addTile($[we],Sn);this._level.el.appendChild(Sn)}}}},_isValidTile:function(a){var u=this._map.options.crs;if(!u.infinite){var h=this._globalTileRange;if(!u.wrapLng&&(a.x<h.min.x||a.x>h.max.x)||!u.wrapLat&&(a.y<h.min.y||a.y>h.max.y))return!1}if(!this.options.bounds)return!0;var v=this._tileCoordsToBounds(a);return he(this.options.bounds).overlaps(v)},_keyToBounds:function(a){return this._tileCoordsToBounds(this._keyToTileCoords(a))},_tileCoordsToNwSe:function(a){var u=this._map,h=this.getTileSize(),v=a.scaleBy(h),S=v.add(h),A=u.unproject(v,a.z),$=u.unproject(S,a.z);return[A,$]},_tileCoordsToBounds:function(a){var u=this._tileCoordsToNwSe(a),h=new ae(u[0],u[1]);return this.options.noWrap||(h=this._map.wrapLatLngBounds(h)),h},_tileCoordsToKey:function(a){return a.x+":"+a.y+":"+a.z},_keyToTileCoords:function(a){var u=a.split(":"),h=new B(+u[0],+u[1]);return h.z=+u[2],h},_removeTile:function(a){var u=this._tiles[a];u&&(Qe(u.el),delete this._tiles[a],this.fire("tileunload",{tile:u.el,coords:this._keyToTileCoords(a)}))},_initTile:function(a){be(a,"leaflet-tile");var u=this.getTileSize();a.style.width=u.x+"px",a.style.height=u.y+"px",a.onselectstart=d,a.onmousemove=d,fe.ielt9&&this.options.opacity<1&&xn(a,this.options.opacity)},_addTile:function(a,u){var h=this._getTilePos(a),v=this._tileCoordsToKey(a),S=this.createTile(this._wrapCoords(a),s(this._tileReady,this,a));this._initTile(S),this.createTile.length<2&&N(s(this._tileReady,this,a,null,S)),ht(S,h),this._tiles[v]={el:S,coords:a,current:!0},u.appendChild(S),this.fire("tileloadstart",{tile:S,coords:a})},_tileReady:function(a,u,h){u&&this.fire("tileerror",{error:u,tile:h,coords:a});var v=this._tileCoordsToKey(a);h=this._tiles[v],h&&(h.loaded=+new Date,this._map._fadeAnimated?(xn(h.el,0),F(this._fadeFrame),this._fadeFrame=N(this._updateOpacity,this)):(h.active=!0,this._pruneTiles()),u||(be(h.el,"leaflet-tile-loaded"),this.fire("tileload",{tile:h.el,coords:a})),this._noTilesToLoad()&&(this._loading=!1,this.fire("load"),fe.ielt9||!this._map._fadeAnimated?N(this._pruneTiles,this):setTimeout(s(this._pruneTiles,this),250)))},_getTilePos:function(a){return a.scaleBy(this.getTileSize()).subtract(this._level.origin)},_wrapCoords:function(a){var u=new B(this._wrapX?p(a.x,this._wrapX):a.x,this._wrapY?p(a.y,this._wrapY):a.y);return u.z=a.z,u},_pxBoundsToTileRange:function(a){var u=this.getTileSize();return new te(a.min.unscaleBy(u).floor(),a.max.unscaleBy(u).ceil().subtract([1,1]))},_noTilesToLoad:function(){for(var a in this._tiles)if(!this._tiles[a].loaded)return!1;return!0}});function H2(a){return new Qs(a)}var ta=Qs.extend({options:{minZoom:0,maxZoom:18,subdomains:"abc",errorTileUrl:"",zoomOffset:0,tms:!1,zoomReverse:!1,detectRetina:!1,crossOrigin:!1,referrerPolicy:!1},initialize:function(a,u){this._url=a,u=g(this,u),u.detectRetina&&fe.retina&&u.maxZoom>0?(u.tileSize=Math.floor(u.tileSize/2),u.zoomReverse?(u.zoomOffset--,u.minZoom=Math.min(u.maxZoom,u.minZoom+1)):(u.zoomOffset++,u.maxZoom=Math.max(u.minZoom,u.maxZoom-1)),u.minZoom=Math.max(0,u.minZoom)):u.zoomReverse?u.minZoom=Math.min(u.maxZoom,u.minZoom):u.maxZoom=Math.max(u.minZoom,u.maxZoom),typeof u.subdomains=="string"&&(u.subdomains=u.subdomains.split("")),this.on("tileunload",this._onTileRemove)},setUrl:function(a,u){return this._url===a&&u===void 0&&(u=!0),this._url=a,u||this.redraw(),this},createTile:function(a,u){var h=document.createElement("img");return _e(h,"load",s(this._tileOnLoad,this,u,h)),_e(h,"error",s(this._tileOnError,this,u,h)),(this.options.crossOrigin||this.options.crossOrigin==="")&&(h.crossOrigin=this.options.crossOrigin===!0?"":this.options.crossOrigin),typeof this.options.referrerPolicy=="string"&&(h.referrerPolicy=this.options.referrerPolicy),h.alt="",h.src=this.getTileUrl(a),h},getTileUrl:function(a){var u={r:fe.retina?"@2x":"",s:this._getSubdomain(a),x:a.x,y:a.y,z:this._getZoomForUrl()};if(this._map&&!this._map.options.crs.infinite){var h=this._globalTileRange.max.y-a.y;this.options.tms&&(u.y=h),u["-y"]=h}return x(this._url,i(u,this.options))},_tileOnLoad:function(a,u){fe.ielt9?setTimeout(s(a,this,null,u),0):a(null,u)},_tileOnError:function(a,u,h){var v=this.options.errorTileUrl;v&&u.getAttribute("src")!==v&&(u.src=v),a(h,u)},_onTileRemove:function(a){a.tile.onload=null},_getZoomForUrl:function(){var a=this._tileZoom,u=this.options.maxZoom,h=this.options.zoomReverse,v=this.options.zoomOffset;return h&&(a=u-a),a+v},_getSubdomain:function(a){var u=Math.abs(a.x+a.y)%this.options.subdomains.length;return this.options.subdomains[u]},_abortLoading:function(){var a,u;for(a in this._tiles)if(this._tiles[a].coords.z!==this._tileZoom&&(u=this._tiles[a].el,u.onload=d,u.onerror=d,!u.complete)){u.src=O;var h=this._tiles[a].coords;Qe(u),delete this._tiles[a],this.fire("tileabort",{tile:u,coords:h})}},_removeTile:function(a){var u=this._tiles[a];if(u)return u.el.setAttribute("src",O),Qs.prototype._removeTile.call(this,a)},_tileReady:function(a,u,h){if(!(!this._map||h&&h.getAttribute("src")===O))return Qs.prototype._tileReady.call(this,a,u,h)}});function Sb(a,u){return new ta(a,u)}var Pb=ta.extend({defaultWmsParams:{service:"WMS",request:"GetMap",layers:"",styles:"",format:"image/jpeg",transparent:!1,version:"1.1.1"},options:{crs:null,uppercase:!1},initialize:function(a,u){this._url=a;var h=i({},this.defaultWmsParams);for(var v in u)v in this.options||(h[v]=u[v]);u=g(this,u);var S=u.detectRetina&&fe.retina?2:1,A=this.getTileSize();h.width=A.x*S,h.height=A.y*S,this.wmsParams=h},onAdd:function(a){this._crs=this.options.crs||a.options.crs,this._wmsVersion=parseFloat(this.wmsParams.version);var u=this._wmsVersion>=1.3?"crs":"srs";this.wmsParams[u]=this._crs.code,ta.prototype.onAdd.call(this,a)},getTileUrl:function(a){var u=this._tileCoordsToNwSe(a),h=this._crs,v=J(h.project(u[0]),h.project(u[1])),S=v.min,A=v.max,$=(this._wmsVersion>=1.3&&this._crs===vb?[S.y,S.x,A.y,A.x]:[S.x,S.y,A.x,A.y]).join(","),U=ta.prototype.getTileUrl.call(this,a);return U+P(this.wmsParams,U,this.options.uppercase)+(this.options.uppercase?"&BBOX=":"&bbox=")+$},setParams:function(a,u){return i(this.wmsParams,a),u||this.redraw(),this}});function Z2(a,u){return new Pb(a,u)}ta.WMS=Pb,Sb.wms=Z2;var Ar=Wn.extend({options:{padding:.1},initialize:function(a){g(this,a),c(this),this._layers=this._layers||{}},onAdd:function(){this._container||(this._initContainer(),be(this._container,"leaflet-zoom-animated")),this.getPane().appendChild(this._container),this._update(),this.on("update",this._updatePaths,this)},onRemove:function(){this.off("update",this._updatePaths,this),this._destroyContainer()},getEvents:function(){var a={viewreset:this._reset,zoom:this._onZoom,moveend:this._update,zoomend:this._onZoomEnd};return this._zoomAnimated&&(a.zoomanim=this._onAnimZoom),a},_onAnimZoom:function(a){this._updateTransform(a.center,a.zoom)},_onZoom:function(){this._updateTransform(this._map.getCenter(),this._map.getZoom())},_updateTransform:function(a,u){var h=this._map.getZoomScale(u,this._zoom),v=this._map.getSize().multiplyBy(.5+this.options.padding),S=this._map.project(this._center,u),A=v.multiplyBy(-h).add(S).subtract(this._map._getNewPixelOrigin(a,u));fe.any3d?Yi(this._container,A,h):ht(this._container,A)},_reset:function(){this._update(),this._updateTransform(this._center,this._zoom);for(var a in this._layers)this._layers[a]._reset()},_onZoomEnd:function(){for(var a in this._layers)this._layers[a]._project()},_updatePaths:function(){for(var a in this._layers)this._layers[a]._update()},_update:function(){var a=this.options.padding,u=this._map.getSize(),h=this._map.containerPointToLayerPoint(u.multiplyBy(-a)).round();this._bounds=new te(h,h.add(u.multiplyBy(1+a*2)).round()),this._center=this._map.getCenter(),this._zoom=this._map.getZoom()}}),Ob=Ar.extend({options:{tolerance:0},getEvents:function(){var a=Ar.prototype.getEvents.call(this);return a.viewprereset=this._onViewPreReset,a},_onViewPreReset:function(){this._postponeUpdatePaths=!0},onAdd:function(){Ar.prototype.onAdd.call(this),this._draw()},_initContainer:function(){var a=this._container=document.createElement("canvas");_e(a,"mousemove",this._onMouseMove,this),_e(a,"click dblclick mousedown mouseup contextmenu",this._onClick,this),_e(a,"mouseout",this._handleMouseOut,this),a._leaflet_disable_events=!0,this._ctx=a.getContext("2d")},_destroyContainer:function(){F(this._redrawRequest),delete this._ctx,Qe(this._container),Ue(this._container),delete this._container},_updatePaths:function(){if(!this._postponeUpdatePaths){var a;this._redrawBounds=null;for(var u in this._layers)a=this._layers[u],a._update();this._redraw()}},_update:function(){if(!(this._map._animatingZoom&&this._bounds)){Ar.prototype._update.call(this);var a=this._bounds,u=this._container,h=a.getSize(),v=fe.retina?2:1;ht(u,a.min),u.width=v*h.x,u.height=v*h.y,u.style.width=h.x+"px",u.style.height=h.y+"px",fe.retina&&this._ctx.scale(2,2),this._ctx.translate(-a.min.x,-a.min.y),this.fire("update")}},_reset:function(){Ar.prototype._reset.call(this),this._postponeUpdatePaths&&(this._postponeUpdatePaths=!1,this._updatePaths())},_initPath:function(a){this._updateDashArray(a),this._layers[c(a)]=a;var u=a._order={layer:a,prev:this._drawLast,next:null};this._drawLast&&(this._drawLast.next=u),this._drawLast=u,this._drawFirst=this._drawFirst||this._drawLast},_addPath:function(a){this._requestRedraw(a)},_removePath:function(a){var u=a._order,h=u.next,v=u.prev;h?h.prev=v:this._drawLast=v,v?v.next=h:this._drawFirst=h,delete a._order,delete this._layers[c(a)],this._requestRedraw(a)},_updatePath:function(a){this._extendRedrawBounds(a),a._project(),a._update(),this._requestRedraw(a)},_updateStyle:function(a){this._updateDashArray(a),this._requestRedraw(a)},_updateDashArray:function(a){if(typeof a.options.dashArray=="string"){var u=a.options.dashArray.split(/[, ]+/),h=[],v,S;for(S=0;S<u.length;S++){if(v=Number(u[S]),isNaN(v))return;h.push(v)}a.options._dashArray=h}else a.options._dashArray=a.options.dashArray},_requestRedraw:function(a){this._map&&(this._extendRedrawBounds(a),this._redrawRequest=this._redrawRequest||N(this._redraw,this))},_extendRedrawBounds:function(a){if(a._pxBounds){var u=(a.options.weight||0)+1;this._redrawBounds=this._redrawBounds||new te,this._redrawBounds.extend(a._pxBounds.min.subtract([u,u])),this._redrawBounds.extend(a._pxBounds.max.add([u,u]))}},_redraw:function(){this._redrawRequest=null,this._redrawBounds&&(this._redrawBounds.min._floor(),this._redrawBounds.max._ceil()),this._clear(),this._draw(),this._redrawBounds=null},_clear:function(){var a=this._redrawBounds;if(a){var u=a.getSize();this._ctx.clearRect(a.min.x,a.min.y,u.x,u.y)}else this._ctx.save(),this._ctx.setTransform(1,0,0,1,0,0),this._ctx.clearRect(0,0,this._container.width,this._container.height),this._ctx.restore()},_draw:function(){var a,u=this._redrawBounds;if(this._ctx.save(),u){var h=u.getSize();this._ctx.beginPath(),this._ctx.rect(u.min.x,u.min.y,h.x,h.y),this._ctx.clip()}this._drawing=!0;for(var v=this._drawFirst;v;v=v.next)a=v.layer,(!u||a._pxBounds&&a._pxBounds.intersects(u))&&a._updatePath();this._drawing=!1,this._ctx.restore()},_updatePoly:function(a,u){if(this._drawing){var h,v,S,A,$=a._parts,U=$.length,W=this._ctx;if(U){for(W.beginPath(),h=0;h<U;h++){for(v=0,S=$[h].length;v<S;v++)A=$[h][v],W[v?"lineTo":"moveTo"](A.x,A.y);u&&W.closePath()}this._fillStroke(W,a)}}},_updateCircle:function(a){if(!(!this._drawing||a._empty())){var u=a._point,h=this._ctx,v=Math.max(Math.round(a._radius),1),S=(Math.max(Math.round(a._radiusY),1)||v)/v;S!==1&&(h.save(),h.scale(1,S)),h.beginPath(),h.arc(u.x,u.y/S,v,0,Math.PI*2,!1),S!==1&&h.restore(),this._fillStroke(h,a)}},_fillStroke:function(a,u){var h=u.options;h.fill&&(a.globalAlpha=h.fillOpacity,a.fillStyle=h.fillColor||h.color,a.fill(h.fillRule||"evenodd")),h.stroke&&h.weight!==0&&(a.setLineDash&&a.setLineDash(u.options&&u.options._dashArray||[]),a.globalAlpha=h.opacity,a.lineWidth=h.weight,a.strokeStyle=h.color,a.lineCap=h.lineCap,a.lineJoin=h.lineJoin,a.stroke())},_onClick:function(a){for(var u=this._map.mouseEventToLayerPoint(a),h,v,S=this._drawFirst;S;S=S.next)h=S.layer,h.options.interactive&&h._containsPoint(u)&&(!(a.type==="click"||a.type==="preclick")||!this._map._draggableMoved(h))&&(v=h);this._fireEvent(v?[v]:!1,a)},_onMouseMove:function(a){if(!(!this._map||this._map.dragging.moving()||this._map._animatingZoom)){var u=this._map.mouseEventToLayerPoint(a);this._handleMouseHover(a,u)}},_handleMouseOut:function(a){var u=this._hoveredLayer;u&&(ut(this._container,"leaflet-interactive"),this._fireEvent([u],a,"mouseout"),this._hoveredLayer=null,this._mouseHoverThrottled=!1)},_handleMouseHover:function(a,u){if(!this._mouseHoverThrottled){for(var h,v,S=this._drawFirst;S;S=S.next)h=S.layer,h.options.interactive&&h._containsPoint(u)&&(v=h);v!==this._hoveredLayer&&(this._handleMouseOut(a),v&&(be(this._container,"leaflet-interactive"),this._fireEvent([v],a,"mouseover"),this._hoveredLayer=v)),this._fireEvent(this._hoveredLayer?[this._hoveredLayer]:!1,a),this._mouseHoverThrottled=!0,setTimeout(s(function(){this._mouseHoverThrottled=!1},this),32)}},_fireEvent:function(a,u,h){this._map._fireDOMEvent(u,h||u.type,a)},_bringToFront:function(a){var u=a._order;if(u){var h=u.next,v=u.prev;if(h)h.prev=v;else return;v?v.next=h:h&&(this._drawFirst=h),u.prev=this._drawLast,this._drawLast.next=u,u.next=null,this._drawLast=u,this._requestRedraw(a)}},_bringToBack:function(a){var u=a._order;if(u){var h=u.next,v=u.prev;if(v)v.next=h;else return;h?h.prev=v:v&&(this._drawLast=v),u.prev=null,u.next=this._drawFirst,this._drawFirst.prev=u,this._drawFirst=u,this._requestRedraw(a)}}});function Eb(a){return fe.canvas?new Ob(a):null}var Js=function(){try{return document.namespaces.add("lvml","urn:schemas-microsoft-com:vml"),function(a){return document.createElement("<lvml:"+a+' class="lvml">')}}catch{}return function(a){return document.createElement("<"+a+' xmlns="urn:schemas-microsoft.com:vml" class="lvml">')}}(),q2={_initContainer:function(){this._container=$e("div","leaflet-vml-container")},_update:function(){this._map._animatingZoom||(Ar.prototype._update.call(this),this.fire("update"))},_initPath:function(a){var u=a._container=Js("shape");be(u,"leaflet-vml-shape "+(this.options.className||"")),u.coordsize="1 1",a._path=Js("path"),u.appendChild(a._path),this._updateStyle(a),this._layers[c(a)]=a},_addPath:function(a){var u=a._container;this._container.appendChild(u),a.options.interactive&&a.addInteractiveTarget(u)},_removePath:function(a){var u=a._container;Qe(u),a.removeInteractiveTarget(u),delete this._layers[c(a)]},_updateStyle:function(a){var u=a._stroke,h=a._fill,v=a.options,S=a._container;S.stroked=!!v.stroke,S.filled=!!v.fill,v.stroke?(u||(u=a._stroke=Js("stroke")),S.appendChild(u),u.weight=v.weight+"px",u.color=v.color,u.opacity=v.opacity,v.dashArray?u.dashStyle=w(v.dashArray)?v.dashArray.join(" "):v.dashArray.replace(/( *, *)/g," "):u.dashStyle="",u.endcap=v.lineCap.replace("butt","flat"),u.joinstyle=v.lineJoin):u&&(S.removeChild(u),a._stroke=null),v.fill?(h||(h=a._fill=Js("fill")),S.appendChild(h),h.color=v.fillColor||v.color,h.opacity=v.fillOpacity):h&&(S.removeChild(h),a._fill=null)},_updateCircle:function(a){var u=a._point.round(),h=Math.round(a._radius),v=Math.round(a._radiusY||h);this._setPath(a,a._empty()?"M0 0":"AL "+u.x+","+u.y+" "+h+","+v+" 0,"+65535*360)},_setPath:function(a,u){a._path.v=u},_bringToFront:function(a){Go(a._container)},_bringToBack:function(a){Xo(a._container)}},kc=fe.vml?Js:rt,eu=Ar.extend({_initContainer:function(){this._container=kc("svg"),this._container.setAttribute("pointer-events","none"),this._rootGroup=kc("g"),this._container.appendChild(this._rootGroup)},_destroyContainer:function(){Qe(this._container),Ue(this._container),delete this._container,delete this._rootGroup,delete this._svgSize},_update:function(){if(!(this._map._animatingZoom&&this._bounds)){Ar.prototype._update.call(this);var a=this._bounds,u=a.getSize(),h=this._container;(!this._svgSize||!this._svgSize.equals(u))&&(this._svgSize=u,h.setAttribute("width",u.x),h.setAttribute("height",u.y)),ht(h,a.min),h.setAttribute("viewBox",[a.min.x,a.min.y,u.x,u.y].join(" ")),this.fire("update")}},_initPath:function(a){var u=a._path=kc("path");a.options.className&&be(u,a.options.className),a.options.interactive&&be(u,"leaflet-interactive"),this._updateStyle(a),this._layers[c(a)]=a},_addPath:function(a){this._rootGroup||this._initContainer(),this._rootGroup.appendChild(a._path),a.addInteractiveTarget(a._path)},_removePath:function(a){Qe(a._path),a.removeInteractiveTarget(a._path),delete this._layers[c(a)]},_updatePath:function(a){a._project(),a._update()},_updateStyle:function(a){var u=a._path,h=a.options;u&&(h.stroke?(u.setAttribute("stroke",h.color),u.setAttribute("stroke-opacity",h.opacity),u.setAttribute("stroke-width",h.weight),u.setAttribute("stroke-linecap",h.lineCap),u.setAttribute("stroke-linejoin",h.lineJoin),h.dashArray?u.setAttribute("stroke-dasharray",h.dashArray):u.removeAttribute("stroke-dasharray"),h.dashOffset?u.setAttribute("stroke-dashoffset",h.dashOffset):u.removeAttribute("stroke-dashoffset")):u.setAttribute("stroke","none"),h.fill?(u.setAttribute("fill",h.fillColor||h.color),u.setAttribute("fill-opacity",h.fillOpacity),u.setAttribute("fill-rule",h.fillRule||"evenodd")):u.setAttribute("fill","none"))},_updatePoly:function(a,u){this._setPath(a,it(a._parts,u))},_updateCircle:function(a){var u=a._point,h=Math.max(Math.round(a._radius),1),v=Math.max(Math.round(a._radiusY),1)||h,S="a"+h+","+v+" 0 1,0 ",A=a._empty()?"M0 0":"M"+(u.x-h)+","+u.y+S+h*2+",0 "+S+-h*2+",0 ";this._setPath(a,A)},_setPath:function(a,u){a._path.setAttribute("d",u)},_bringToFront:function(a){Go(a._path)},_bringToBack:function(a){Xo(a._path)}});fe.vml&&eu.include(q2);function Tb(a){return fe.svg||fe.vml?new eu(a):null}Ce.include({getRenderer:function(a){var u=a.options.renderer||this._getPaneRenderer(a.options.pane)||this.options.renderer||this._renderer;return u||(u=this._renderer=this._createRenderer()),this.hasLayer(u)||this.addLayer(u),u},_getPaneRenderer:function(a){if(a==="overlayPane"||a===void 0)return!1;var u=this._paneRenderers[a];return u===void 0&&(u=this._createRenderer({pane:a}),this._paneRenderers[a]=u),u},_createRenderer:function(a){return this.options.preferCanvas&&Eb(a)||Tb(a)}});var Ab=Jo.extend({initialize:function(a,u){Jo.prototype.initialize.call(this,this._boundsToLatLngs(a),u)},setBounds:function(a){return this.setLatLngs(this._boundsToLatLngs(a))},_boundsToLatLngs:function(a){return a=he(a),[a.getSouthWest(),a.getNorthWest(),a.getNorthEast(),a.getSouthEast()]}});function V2(a,u){return new Ab(a,u)}eu.create=kc,eu.pointsToPath=it,Tr.geometryToLayer=Pc,Tr.coordsToLatLng=Cp,Tr.coordsToLatLngs=Oc,Tr.latLngToCoords=Mp,Tr.latLngsToCoords=Ec,Tr.getFeature=ea,Tr.asFeature=Tc,Ce.mergeOptions({boxZoom:!0});var Cb=cr.extend({initialize:function(a){this._map=a,this._container=a._container,this._pane=a._panes.overlayPane,this._resetStateTimeout=0,a.on("unload",this._destroy,this)},addHooks:function(){_e(this._container,"mousedown",this._onMouseDown,this)},removeHooks:function(){Ue(this._container,"mousedown",this._onMouseDown,this)},moved:function(){return this._moved},_destroy:function(){Qe(this._pane),delete this._pane},_resetState:function(){this._resetStateTimeout=0,this._moved=!1},_clearDeferredResetState:function(){this._resetStateTimeout!==0&&(clearTimeout(this._resetStateTimeout),this._resetStateTimeout=0)},_onMouseDown:function(a){if(!a.shiftKey||a.which!==1&&a.button!==1)return!1;this._clearDeferredResetState(),this._resetState(),Zs(),hp(),this._startPoint=this._map.mouseEventToContainerPoint(a),_e(document,{contextmenu:eo,mousemove:this._onMouseMove,mouseup:this._onMouseUp,keydown:this._onKeyDown},this)},_onMouseMove:function(a){this._moved||(this._moved=!0,this._box=$e("div","leaflet-zoom-box",this._container),be(this._container,"leaflet-crosshair"),this._map.fire("boxzoomstart")),this._point=this._map.mouseEventToContainerPoint(a);var u=new te(this._point,this._startPoint),h=u.getSize();ht(this._box,u.min),this._box.style.width=h.x+"px",this._box.style.height=h.y+"px"},_finish:function(){this._moved&&(Qe(this._box),ut(this._container,"leaflet-crosshair")),qs(),dp(),Ue(document,{contextmenu:eo,mousemove:this._onMouseMove,mouseup:this._onMouseUp,keydown:this._onKeyDown},this)},_onMouseUp:function(a){if(!(a.which!==1&&a.button!==1)&&(this._finish(),!!this._moved)){this._clearDeferredResetState(),this._resetStateTimeout=setTimeout(s(this._resetState,this),0);var u=new ae(this._map.containerPointToLatLng(this._startPoint),this._map.containerPointToLatLng(this._point));this._map.fitBounds(u).fire("boxzoomend",{boxZoomBounds:u})}},_onKeyDown:function(a){a.keyCode===27&&(this._finish(),this._clearDeferredResetState(),this._resetState())}});Ce.addInitHook("addHandler","boxZoom",Cb),Ce.mergeOptions({doubleClickZoom:!0});var Mb=cr.extend({addHooks:function(){this._map.on("dblclick",this._onDoubleClick,this)},removeHooks:function(){this._map.off("dblclick",this._onDoubleClick,this)},_onDoubleClick:function(a){var u=this._map,h=u.getZoom(),v=u.options.zoomDelta,S=a.originalEvent.shiftKey?h-v:h+v;u.options.doubleClickZoom==="center"?u.setZoom(S):u.setZoomAround(a.containerPoint,S)}});Ce.addInitHook("addHandler","doubleClickZoom",Mb),Ce.mergeOptions({dragging:!0,inertia:!0,inertiaDeceleration:3400,inertiaMaxSpeed:1/0,easeLinearity:.2,worldCopyJump:!1,maxBoundsViscosity:0});var kb=cr.extend({addHooks:function(){if(!this._draggable){var a=this._map;this._draggable=new ii(a._mapPane,a._container),this._draggable.on({dragstart:this._onDragStart,drag:this._onDrag,dragend:this._onDragEnd},this),this._draggable.on("predrag",this._onPreDragLimit,this),a.options.worldCopyJump&&(this._draggable.on("predrag",this._onPreDragWrap,this),a.on("zoomend",this._onZoomEnd,this),a.whenReady(this._onZoomEnd,this))}be(this._map._container,"leaflet-grab leaflet-touch-drag"),this._draggable.enable(),this._positions=[],this._times=[]},removeHooks:function(){ut(this._map._container,"leaflet-grab"),ut(this._map._container,"leaflet-touch-drag"),this._draggable.disable()},moved:function(){return this._draggable&&this._draggable._moved},moving:function(){return this._draggable&&this._draggable._moving},_onDragStart:function(){var a=this._map;if(a._stop(),this._map.options.maxBounds&&this._map.options.maxBoundsViscosity){var u=he(this._map.options.maxBounds);this._offsetLimit=J(this._map.latLngToContainerPoint(u.getNorthWest()).multiplyBy(-1),this._map.latLngToContainerPoint(u.getSouthEast()).multiplyBy(-1).add(this._map.getSize())),this._viscosity=Math.min(1,Math.max(0,this._map.options.maxBoundsViscosity))}else this._offsetLimit=null;a.fire("movestart").fire("dragstart"),a.options.inertia&&(this._positions=[],this._times=[])},_onDrag:function(a){if(this._map.options.inertia){var u=this._lastTime=+new Date,h=this._lastPos=this._draggable._absPos||this._draggable._newPos;this._positions.push(h),this._times.push(u),this._prunePositions(u)}this._map.fire("move",a).fire("drag",a)},_prunePositions:function(a){for(;this._positions.length>1&&a-this._times[0]>50;)this._positions.shift(),this._times.shift()},_onZoomEnd:function(){var a=this._map.getSize().divideBy(2),u=this._map.latLngToLayerPoint([0,0]);this._initialWorldOffset=u.subtract(a).x,this._worldWidth=this._map.getPixelWorldBounds().getSize().x},_viscousLimit:function(a,u){return a-(a-u)*this._viscosity},_onPreDragLimit:function(){if(!(!this._viscosity||!this._offsetLimit)){var a=this._draggable._newPos.subtract(this._draggable._startPos),u=this._offsetLimit;a.x<u.min.x&&(a.x=this._viscousLimit(a.x,u.min.x)),a.y<u.min.y&&(a.y=this._viscousLimit(a.y,u.min.y)),a.x>u.max.x&&(a.x=this._viscousLimit(a.x,u.max.x)),a.y>u.max.y&&(a.y=this._viscousLimit(a.y,u.max.y)),this._draggable._newPos=this._draggable._startPos.add(a)}},_onPreDragWrap:function(){var a=this._worldWidth,u=Math.round(a/2),h=this._initialWorldOffset,v=this._draggable._newPos.x,S=(v-u+h)%a+u-h,A=(v+u+h)%a-u-h,$=Math.abs(S+h)<Math.abs(A+h)?S:A;this._draggable._absPos=this._draggable._newPos.clone(),this._draggable._newPos.x=$},_onDragEnd:function(a){var u=this._map,h=u.options,v=!h.inertia||a.noInertia||this._times.length<2;if(u.fire("dragend",a),v)u.fire("moveend");else{this._prunePositions(+new Date);var S=this._lastPos.subtract(this._positions[0]),A=(this._lastTime-this._times[0])/1e3,$=h.easeLinearity,U=S.multiplyBy($/A),W=U.distanceTo([0,0]),Q=Math.min(h.inertiaMaxSpeed,W),oe=U.multiplyBy(Q/W),ve=Q/(h.inertiaDeceleration*$),we=oe.multiplyBy(-ve/2).round();!we.x&&!we.y?u.fire("moveend"):(we=u._limitOffset(we,u.options.maxBounds),N(function(){u.panBy(we,{duration:ve,easeLinearity:$,noMoveStart:!0,animate:!0})}))}}});Ce.addInitHook("addHandler","dragging",kb),Ce.mergeOptions({keyboard:!0,keyboardPanDelta:80});var $b=cr.extend({keyCodes:{left:[37],right:[39],down:[40],up:[38],zoomIn:[187,107,61,171],zoomOut:[189,109,54,173]},initialize:function(a){this._map=a,this._setPanDelta(a.options.keyboardPanDelta),this._setZoomDelta(a.options.zoomDelta)},addHooks:function(){var a=this._map._container;a.tabIndex<=0&&(a.tabIndex="0"),_e(a,{focus:this._onFocus,blur:this._onBlur,mousedown:this._onMouseDown},this),this._map.on({focus:this._addHooks,blur:this._removeHooks},this)},removeHooks:function(){this._removeHooks(),Ue(this._map._container,{focus:this._onFocus,blur:this._onBlur,mousedown:this._onMouseDown},this),this._map.off({focus:this._addHooks,blur:this._removeHooks},this)},_onMouseDown:function(){if(!this._focused){var a=document.body,u=document.documentElement,h=a.scrollTop||u.scrollTop,v=a.scrollLeft||u.scrollLeft;this._map._container.focus(),window.scrollTo(v,h)}},_onFocus:function(){this._focused=!0,this._map.fire("focus")},_onBlur:function(){this._focused=!1,this._map.fire("blur")},_setPanDelta:function(a){var u=this._panKeys={},h=this.keyCodes,v,S;for(v=0,S=h.left.length;v<S;v++)u[h.left[v]]=[-1*a,0];for(v=0,S=h.right.length;v<S;v++)u[h.right[v]]=[a,0];for(v=0,S=h.down.length;v<S;v++)u[h.down[v]]=[0,a];for(v=0,S=h.up.length;v<S;v++)u[h.up[v]]=[0,-1*a]},_setZoomDelta:function(a){var u=this._zoomKeys={},h=this.keyCodes,v,S;for(v=0,S=h.zoomIn.length;v<S;v++)u[h.zoomIn[v]]=a;for(v=0,S=h.zoomOut.length;v<S;v++)u[h.zoomOut[v]]=-a},_addHooks:function(){_e(document,"keydown",this._onKeyDown,this)},_removeHooks:function(){Ue(document,"keydown",this._onKeyDown,this)},_onKeyDown:function(a){if(!(a.altKey||a.ctrlKey||a.metaKey)){var u=a.keyCode,h=this._map,v;if(u in this._panKeys){if(!h._panAnim||!h._panAnim._inProgress)if(v=this._panKeys[u],a.shiftKey&&(v=H(v).multiplyBy(3)),h.options.maxBounds&&(v=h._limitOffset(H(v),h.options.maxBounds)),h.options.worldCopyJump){var S=h.wrapLatLng(h.unproject(h.project(h.getCenter()).add(v)));h.panTo(S)}else h.panBy(v)}else if(u in this._zoomKeys)h.setZoom(h.getZoom()+(a.shiftKey?3:1)*this._zoomKeys[u]);else if(u===27&&h._popup&&h._popup.options.closeOnEscapeKey)h.closePopup();else return;eo(a)}}});Ce.addInitHook("addHandler","keyboard",$b),Ce.mergeOptions({scrollWheelZoom:!0,wheelDebounceTime:40,wheelPxPerZoomLevel:60});var jb=cr.extend({addHooks:function(){_e(this._map._container,"wheel",this._onWheelScroll,this),this._delta=0},removeHooks:function(){Ue(this._map._container,"wheel",this._onWheelScroll,this)},_onWheelScroll:function(a){var u=rb(a),h=this._map.options.wheelDebounceTime;this._delta+=u,this._lastMousePos=this._map.mouseEventToContainerPoint(a),this._startTime||(this._startTime=+new Date);var v=Math.max(h-(+new Date-this._startTime),0);clearTimeout(this._timer),this._timer=setTimeout(s(this._performZoom,this),v),eo(a)},_performZoom:function(){var a=this._map,u=a.getZoom(),h=this._map.options.zoomSnap||0;a._stop();var v=this._delta/(this._map.options.wheelPxPerZoomLevel*4),S=4*Math.log(2/(1+Math.exp(-Math.abs(v))))/Math.LN2,A=h?Math.ceil(S/h)*h:S,$=a._limitZoom(u+(this._delta>0?A:-A))-u;this._delta=0,this._startTime=null,$&&(a.options.scrollWheelZoom==="center"?a.setZoom(u+$):a.setZoomAround(this._lastMousePos,u+$))}});Ce.addInitHook("addHandler","scrollWheelZoom",jb);var K2=600;Ce.mergeOptions({tapHold:fe.touchNative&&fe.safari&&fe.mobile,tapTolerance:15});var Lb=cr.extend({addHooks:function(){_e(this._map._container,"touchstart",this._onDown,this)},removeHooks:function(){Ue(this._map._container,"touchstart",this._onDown,this)},_onDown:function(a){if(clearTimeout(this._holdTimeout),a.touches.length===1){var u=a.touches[0];this._startPos=this._newPos=new B(u.clientX,u.clientY),this._holdTimeout=setTimeout(s(function(){this._cancel(),this._isTapValid()&&(_e(document,"touchend",Mt),_e(document,"touchend touchcancel",this._cancelClickPrevent),this._simulateEvent("contextmenu",u))},this),K2),_e(document,"touchend touchcancel contextmenu",this._cancel,this),_e(document,"touchmove",this._onMove,this)}},_cancelClickPrevent:function a(){Ue(document,"touchend",Mt),Ue(document,"touchend touchcancel",a)},_cancel:function(){clearTimeout(this._holdTimeout),Ue(document,"touchend touchcancel contextmenu",this._cancel,this),Ue(document,"touchmove",this._onMove,this)},_onMove:function(a){var u=a.touches[0];this._newPos=new B(u.clientX,u.clientY)},_isTapValid:function(){return this._newPos.distanceTo(this._startPos)<=this._map.options.tapTolerance},_simulateEvent:function(a,u){var h=new MouseEvent(a,{bubbles:!0,cancelable:!0,view:window,screenX:u.screenX,screenY:u.screenY,clientX:u.clientX,clientY:u.clientY});h._simulated=!0,u.target.dispatchEvent(h)}});Ce.addInitHook("addHandler","tapHold",Lb),Ce.mergeOptions({touchZoom:fe.touch,bounceAtZoomLimits:!0});var Ib=cr.extend({addHooks:function(){be(this._map._container,"leaflet-touch-zoom"),_e(this._map._container,"touchstart",this._onTouchStart,this)},removeHooks:function(){ut(this._map._container,"leaflet-touch-zoom"),Ue(this._map._container,"touchstart",this._onTouchStart,this)},_onTouchStart:function(a){var u=this._map;if(!(!a.touches||a.touches.length!==2||u._animatingZoom||this._zooming)){var h=u.mouseEventToContainerPoint(a.touches[0]),v=u.mouseEventToContainerPoint(a.touches[1]);this._centerPoint=u.getSize()._divideBy(2),this._startLatLng=u.containerPointToLatLng(this._centerPoint),u.options.touchZoom!=="center"&&(this._pinchStartLatLng=u.containerPointToLatLng(h.add(v)._divideBy(2))),this._startDist=h.distanceTo(v),this._startZoom=u.getZoom(),this._moved=!1,this._zooming=!0,u._stop(),_e(document,"touchmove",this._onTouchMove,this),_e(document,"touchend touchcancel",this._onTouchEnd,this),Mt(a)}},_onTouchMove:function(a){if(!(!a.touches||a.touches.length!==2||!this._zooming)){var u=this._map,h=u.mouseEventToContainerPoint(a.touches[0]),v=u.mouseEventToContainerPoint(a.touches[1]),S=h.distanceTo(v)/this._startDist;if(this._zoom=u.getScaleZoom(S,this._startZoom),!u.options.bounceAtZoomLimits&&(this._zoom<u.getMinZoom()&&S<1||this._zoom>u.getMaxZoom()&&S>1)&&(this._zoom=u._limitZoom(this._zoom)),u.options.touchZoom==="center"){if(this._center=this._startLatLng,S===1)return}else{var A=h._add(v)._divideBy(2)._subtract(this._centerPoint);if(S===1&&A.x===0&&A.y===0)return;this._center=u.unproject(u.project(this._pinchStartLatLng,this._zoom).subtract(A),this._zoom)}this._moved||(u._moveStart(!0,!1),this._moved=!0),F(this._animRequest);var $=s(u._move,u,this._center,this._zoom,{pinch:!0,round:!1},void 0);this._animRequest=N($,this,!0),Mt(a)}},_onTouchEnd:function(){if(!this._moved||!this._zooming){this._zooming=!1;return}this._zooming=!1,F(this._animRequest),Ue(document,"touchmove",this._onTouchMove,this),Ue(document,"touchend touchcancel",this._onTouchEnd,this),this._map.options.zoomAnimation?this._map._animateZoom(this._center,this._map._limitZoom(this._zoom),!0,this._map.options.zoomSnap):this._map._resetView(this._center,this._map._limitZoom(this._zoom))}});Ce.addInitHook("addHandler","touchZoom",Ib),Ce.BoxZoom=Cb,Ce.DoubleClickZoom=Mb,Ce.Drag=kb,Ce.Keyboard=$b,Ce.ScrollWheelZoom=jb,Ce.TapHold=Lb,Ce.TouchZoom=Ib,n.Bounds=te,n.Browser=fe,n.CRS=nt,n.Canvas=Ob,n.Circle=Ap,n.CircleMarker=Sc,n.Class=q,n.Control=Un,n.DivIcon=wb,n.DivOverlay=fr,n.DomEvent=h2,n.DomUtil=c2,n.Draggable=ii,n.Evented=Y,n.FeatureGroup=Or,n.GeoJSON=Tr,n.GridLayer=Qs,n.Handler=cr,n.Icon=Qo,n.ImageOverlay=Ac,n.LatLng=de,n.LatLngBounds=ae,n.Layer=Wn,n.LayerGroup=Yo,n.LineUtil=O2,n.Map=Ce,n.Marker=wc,n.Mixin=_2,n.Path=oi,n.Point=B,n.PolyUtil=b2,n.Polygon=Jo,n.Polyline=Er,n.Popup=Cc,n.PosAnimation=ib,n.Projection=E2,n.Rectangle=Ab,n.Renderer=Ar,n.SVG=eu,n.SVGOverlay=xb,n.TileLayer=ta,n.Tooltip=Mc,n.Transformation=ge,n.Util=K,n.VideoOverlay=bb,n.bind=s,n.bounds=J,n.canvas=Eb,n.circle=L2,n.circleMarker=j2,n.control=Gs,n.divIcon=W2,n.extend=i,n.featureGroup=M2,n.geoJSON=_b,n.geoJson=D2,n.gridLayer=H2,n.icon=k2,n.imageOverlay=R2,n.latLng=ce,n.latLngBounds=he,n.layerGroup=C2,n.map=d2,n.marker=$2,n.point=H,n.polygon=N2,n.polyline=I2,n.popup=F2,n.rectangle=V2,n.setOptions=g,n.stamp=c,n.svg=Tb,n.svgOverlay=z2,n.tileLayer=Sb,n.tooltip=U2,n.transformation=ee,n.version=r,n.videoOverlay=B2;var G2=window.L;n.noConflict=function(){return window.L=G2,this},window.L=n})})(qv,qv.exports);var ec=qv.exports;const Ts=Be(ec);function O0(e,t,n){return Object.freeze({instance:e,context:t,container:n})}function E0(e,t){return t==null?function(r,i){const o=I.useRef();return o.current||(o.current=e(r,i)),o}:function(r,i){const o=I.useRef();o.current||(o.current=e(r,i));const s=I.useRef(r),{instance:l}=o.current;return I.useEffect(function(){s.current!==r&&(t(l,r,s.current),s.current=r)},[l,r,i]),o}}function kN(e,t){I.useEffect(function(){return(t.layerContainer??t.map).addLayer(e.instance),function(){var o;(o=t.layerContainer)==null||o.removeLayer(e.instance),t.map.removeLayer(e.instance)}},[t,e])}function rA(e){return function(n){const r=S0(),i=e(P0(n,r),r);return JT(r.map,n.attribution),nA(i.current,n.eventHandlers),kN(i.current,r),i}}function $N(e,t){const n=E0(e,t),r=rA(n);return TN(r)}function jN(e,t){const n=E0(e),r=MN(n,t);return AN(r)}function LN(e,t){const n=E0(e,t),r=rA(n);return CN(r)}function IN(e,t,n){const{opacity:r,zIndex:i}=t;r!=null&&r!==n.opacity&&e.setOpacity(r),i!=null&&i!==n.zIndex&&e.setZIndex(i)}function iA(){return S0().map}function Vv(){return Vv=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Vv.apply(this,arguments)}function NN({bounds:e,boundsOptions:t,center:n,children:r,className:i,id:o,placeholder:s,style:l,whenReady:c,zoom:f,...p},d){const[m]=I.useState({className:i,id:o,style:l}),[y,b]=I.useState(null);I.useImperativeHandle(d,()=>(y==null?void 0:y.map)??null,[y]);const g=I.useCallback(_=>{if(_!==null&&y===null){const x=new ec.Map(_,p);n!=null&&f!=null?x.setView(n,f):e!=null&&x.fitBounds(e,t),c!=null&&x.whenReady(c),b(ON(x))}},[]);I.useEffect(()=>()=>{y==null||y.map.remove()},[y]);const P=y?z.createElement(tA,{value:y},r):s??null;return z.createElement("div",Vv({},m,{ref:g}),P)}const oA=I.forwardRef(NN),aA=$N(function({position:t,...n},r){const i=new ec.Marker(t,n);return O0(i,EN(r,{overlayContainer:i}))},function(t,n,r){n.position!==r.position&&t.setLatLng(n.position),n.icon!=null&&n.icon!==r.icon&&t.setIcon(n.icon),n.zIndexOffset!=null&&n.zIndexOffset!==r.zIndexOffset&&t.setZIndexOffset(n.zIndexOffset),n.opacity!=null&&n.opacity!==r.opacity&&t.setOpacity(n.opacity),t.dragging!=null&&n.draggable!==r.draggable&&(n.draggable===!0?t.dragging.enable():t.dragging.disable())}),sA=jN(function(t,n){const r=new ec.Popup(t,n.overlayContainer);return O0(r,n)},function(t,n,{position:r},i){I.useEffect(function(){const{instance:s}=t;function l(f){f.popup===s&&(s.update(),i(!0))}function c(f){f.popup===s&&i(!1)}return n.map.on({popupopen:l,popupclose:c}),n.overlayContainer==null?(r!=null&&s.setLatLng(r),s.openOn(n.map)):n.overlayContainer.bindPopup(s),function(){var p;n.map.off({popupopen:l,popupclose:c}),(p=n.overlayContainer)==null||p.unbindPopup(),n.map.removeLayer(s)}},[t,n,i,r])}),uA=LN(function({url:t,...n},r){const i=new ec.TileLayer(t,P0(n,r));return O0(i,r)},function(t,n,r){IN(t,n,r);const{url:i}=n;i!=null&&i!==r.url&&t.setUrl(i)});function DN(e){switch(e){case"red":return"#dc2626";case"amber":return"#d97706";case"green":return"#059669";case"blue":return"#2563eb";case"stale":case"offline":case"gray":default:return"#6b7280"}}function RN(e,t){return Ts.divIcon({className:"farm-marker",html:`<div style="
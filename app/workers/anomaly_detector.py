@@ -0,0 +1,46 @@
+# api/app/workers/anomaly_detector.py
+"""
+Background neighbour anomaly scoring.
+
+Runs refresh_anomaly_scores() (services/neighbor_anomaly.py) every
+NEIGHBOR_ANOMALY_INTERVAL_SEC in a daemon thread, in one process only (see
+workers/leader.py).
+"""
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from app.db.session import SessionLocal
+from app.settings import settings
+from app.services.neighbor_anomaly import refresh_anomaly_scores
+from app.workers.leader import LeaderJob
+
+log = logging.getLogger("soilprobe.anomaly_detector")
+
+# Arbitrary but stable key for pg_try_advisory_lock
+ANOMALY_DETECTOR_LOCK_KEY = 0x50_11_57_AA
+
+
+class AnomalyDetector(LeaderJob):
+    lock_key = ANOMALY_DETECTOR_LOCK_KEY
+    label = "Anomaly detector"
+    thread_name = "anomaly-detector"
+
+    def __init__(self, interval_sec: Optional[int] = None) -> None:
+        super().__init__(interval_sec or settings.NEIGHBOR_ANOMALY_INTERVAL_SEC, log)
+
+    def run_once(self) -> dict:
+        db = SessionLocal()
+        try:
+            return refresh_anomaly_scores(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def report(self, stats: dict) -> None:
+        log.info(
+            "Anomaly detector: %d devices scored, %d flagged, %d snapshots updated",
+            stats["scored"], stats["flagged"], stats["updated"],
+        )
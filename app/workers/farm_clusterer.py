@@ -0,0 +1,60 @@
+# api/app/workers/farm_clusterer.py
+"""
+Background farm grouping.
+
+Every FARM_CLUSTER_INTERVAL_SEC: regroup the devices whose config changed
+since the previous run (services/farm_clusters.py). The first run after
+start-up regroups the whole fleet. Committing refreshes the affected
+farm_aggregate rows (services/farm_aggregate.py session hooks). Runs in one
+process only (workers/leader.py).
+"""
+from __future__ import annotations
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.db.session import SessionLocal
+from app.settings import settings
+from app.services.farm_clusters import devices_to_recluster, recluster_farms
+from app.workers.leader import LeaderJob
+
+log = logging.getLogger("soilprobe.farm_clusterer")
+
+# Arbitrary but stable key for pg_try_advisory_lock
+FARM_CLUSTERER_LOCK_KEY = 0x50_11_57_A9
+
+
+class FarmClusterer(LeaderJob):
+    lock_key = FARM_CLUSTERER_LOCK_KEY
+    label = "Farm clusterer"
+    thread_name = "farm-clusterer"
+
+    def __init__(self, interval_sec: Optional[int] = None) -> None:
+        super().__init__(interval_sec or settings.FARM_CLUSTER_INTERVAL_SEC, log)
+        # Configs updated after this are regrouped next run; None means a full pass
+        self._since: Optional[datetime] = None
+
+    def run_once(self) -> dict:
+        # Overlap runs by one interval so configs committed while a run was reading are not missed
+        started = datetime.utcnow() - timedelta(seconds=self.interval_sec)
+        db = SessionLocal()
+        try:
+            if self._since is None:
+                stats = recluster_farms(db)
+            else:
+                stats = recluster_farms(db, devices_to_recluster(db, self._since))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        self._since = started
+        return stats
+
+    def report(self, stats: dict) -> None:
+        if stats["reassigned"]:
+            log.info(
+                "Farm clusterer: %d devices regrouped into %d clusters, %d changed farm",
+                stats["devices"], stats["clusters"], stats["reassigned"],
+            )
@@ -0,0 +1,126 @@
+# api/app/workers/leader.py
+"""
+Base for background jobs that must run in exactly one process.
+
+A LeaderJob calls run_once() every interval_sec in a daemon thread. With
+several uvicorn workers / Fly machines only one process may own the job: on
+Postgres ownership is a session-level advisory lock (lock_key) held on a
+dedicated connection; on other databases (SQLite dev) the process always
+owns it.
+"""
+from __future__ import annotations
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.session import engine
+
+
+class LeaderJob:
+    lock_key: int  # arbitrary but stable key for pg_try_advisory_lock, unique per job
+    label = "Background job"  # log prefix
+    thread_name = "leader-job"
+
+    def __init__(self, interval_sec: int, log: logging.Logger) -> None:
+        self.interval_sec = interval_sec
+        self.log = log
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock_conn: Optional[Connection] = None
+
+    # ---- leadership -------------------------------------------------------
+
+    def _is_leader(self) -> bool:
+        if engine.dialect.name != "postgresql":
+            return True
+        if self._lock_conn is not None:
+            if self._still_holds_lock():
+                return True
+            self.log.warning("%s: lost the advisory lock session, re-electing", self.label)
+            self._release()
+        conn = engine.connect()
+        try:
+            got = conn.execute(
+                text("SELECT pg_try_advisory_lock(:k)"), {"k": self.lock_key}
+            ).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if got:
+            self._lock_conn = conn
+            self.log.info("%s: acquired leadership", self.label)
+            return True
+        conn.close()
+        return False
+
+    def _still_holds_lock(self) -> bool:
+        """
+        Check on the lock connection that it is alive and still holds lock_key.
+        run_once() works on other connections, so a dropped lock session
+        would otherwise go unnoticed while another process takes over.
+        """
+        try:
+            held = self._lock_conn.execute(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory'"
+                    " AND pid = pg_backend_pid() AND granted"
+                    " AND classid = :hi AND objid = :lo AND objsubid = 1)"
+                ),
+                {"hi": (self.lock_key >> 32) & 0xFFFFFFFF, "lo": self.lock_key & 0xFFFFFFFF},
+            ).scalar()
+            self._lock_conn.commit()
+        except Exception:
+            self.log.warning("%s: advisory lock connection failed", self.label, exc_info=True)
+            return False
+        return bool(held)
+
+    def _release(self) -> None:
+        if self._lock_conn is None:
+            return
+        try:
+            self._lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:k)"), {"k": self.lock_key}
+            )
+            self._lock_conn.commit()
+        except Exception:
+            self.log.warning("%s: failed to release advisory lock", self.label, exc_info=True)
+        finally:
+            self._lock_conn.close()
+            self._lock_conn = None
+
+    # ---- loop -------------------------------------------------------------
+
+    def run_once(self) -> dict:
+        raise NotImplementedError
+
+    def report(self, stats: dict) -> None:
+        """Log the outcome of a run_once() call."""
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self._is_leader():
+                    self.report(self.run_once())
+            except Exception:
+                self.log.exception("%s run failed", self.label)
+                # A broken lock connection means we may no longer own the job
+                self._release()
+            self._stop.wait(self.interval_sec)
+        self._release()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
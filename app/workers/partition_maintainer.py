@@ -0,0 +1,49 @@
+# api/app/workers/partition_maintainer.py
+"""
+Background partition maintenance for reading / message (Postgres only).
+
+Every PARTITION_MAINTENANCE_INTERVAL_SEC: create monthly partitions
+PARTITION_PREMAKE_MONTHS ahead and retire months past RETENTION_MONTHS
+(see services/partitions.py). Runs in one process only (workers/leader.py).
+"""
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from app.db.session import SessionLocal
+from app.settings import settings
+from app.services.partitions import apply_retention, ensure_partitions
+from app.workers.leader import LeaderJob
+
+log = logging.getLogger("soilprobe.partition_maintainer")
+
+# Arbitrary but stable key for pg_try_advisory_lock
+PARTITION_MAINTAINER_LOCK_KEY = 0x50_11_57_A8
+
+
+class PartitionMaintainer(LeaderJob):
+    lock_key = PARTITION_MAINTAINER_LOCK_KEY
+    label = "Partition maintenance"
+    thread_name = "partition-maintainer"
+
+    def __init__(self, interval_sec: Optional[int] = None) -> None:
+        super().__init__(interval_sec or settings.PARTITION_MAINTENANCE_INTERVAL_SEC, log)
+
+    def run_once(self) -> dict:
+        created = ensure_partitions(settings.PARTITION_PREMAKE_MONTHS)
+        db = SessionLocal()
+        try:
+            retired = apply_retention(db, settings.RETENTION_MONTHS, settings.RETENTION_ACTION)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return {"created": created, "retired": retired}
+
+    def report(self, stats: dict) -> None:
+        if stats["created"] or stats["retired"]:
+            log.info(
+                "Partition maintenance: created %s, retired %s",
+                ", ".join(stats["created"]) or "none", ", ".join(stats["retired"]) or "none",
+            )
@@ -0,0 +1,50 @@
+# api/app/workers/status_scheduler.py
+"""
+Background fleet status scheduler.
+
+Runs refresh_status_snapshots() every STATUS_SCHEDULER_INTERVAL_SEC in a
+daemon thread, in one process only (see workers/leader.py).
+"""
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from app.db.session import SessionLocal
+from app.settings import settings
+from app.services.status_snapshot import refresh_status_snapshots
+from app.workers.leader import LeaderJob
+
+log = logging.getLogger("soilprobe.status_scheduler")
+
+# Arbitrary but stable key for pg_try_advisory_lock
+STATUS_SCHEDULER_LOCK_KEY = 0x50_11_57_A7
+
+
+class StatusScheduler(LeaderJob):
+    lock_key = STATUS_SCHEDULER_LOCK_KEY
+    label = "Status scheduler"
+    thread_name = "status-scheduler"
+
+    def __init__(
+        self,
+        interval_sec: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(interval_sec or settings.STATUS_SCHEDULER_INTERVAL_SEC, log)
+        self.batch_size = batch_size or settings.STATUS_BATCH_SIZE
+
+    def run_once(self) -> dict:
+        db = SessionLocal()
+        try:
+            return refresh_status_snapshots(db, batch_size=self.batch_size)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def report(self, stats: dict) -> None:
+        log.info(
+            "Status scheduler: %d devices, %d transitions, %d farms re-aggregated",
+            stats["devices"], stats["transitions"], stats["farms"],
+        )
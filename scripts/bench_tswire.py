@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the series wire formats: payload size (raw and gzip) and encode
+time for the default JSON points, columnar JSON (orjson) and the binary
+Gorilla format (application/vnd.soilprobe.ts).
+
+Uses synthetic probe data (hourly cadence with jitter and gaps, diurnal
+moisture with irrigation steps, 2-decimal values like the API returns).
+
+    python scripts/bench_tswire.py --series 8 --points 800 20000
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import orjson
+
+from api.app.services import tswire
+
+
+def make_series(n_series: int, n_points: int, seed: int = 42) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    start = 1_700_000_000 - 1_700_000_000 % 3600
+    series = []
+    for i in range(n_series):
+        step = rng.choice([3600, 3600, 3600, 3600, 3601, 3599, 7200], n_points)
+        t = start + np.cumsum(step) - step[0]
+        hours = (t % 86400) / 3600
+        base = 25 + 3 * np.sin(hours / 24 * 2 * np.pi) - np.arange(n_points) * 0.002
+        irrigation = np.cumsum(rng.random(n_points) < 0.01) * 4.0
+        v = np.round(base + irrigation + rng.normal(0, 0.15, n_points), 2)
+        series.append({
+            "device_id": i + 1,
+            "depth_cm": float((10, 30, 60, 90)[i % 4]),
+            "device_name": f"Probe {i + 1}",
+            "t": t.astype(np.int64),
+            "v": v,
+        })
+    return series
+
+
+def as_points(series: list[dict]) -> list[dict]:
+    epoch = datetime(1970, 1, 1)
+    return [
+        {
+            "device_id": s["device_id"],
+            "depth_cm": s["depth_cm"],
+            "device_name": s["device_name"],
+            "points": [
+                {"t": (epoch + timedelta(seconds=t)).isoformat(), "v": v}
+                for t, v in zip(s["t"].tolist(), s["v"].tolist())
+            ],
+        }
+        for s in series
+    ]
+
+
+def timed(fn, repeat: int = 3) -> tuple[bytes, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return out, best * 1000
+
+
+def bench(n_series: int, n_points: int) -> None:
+    series = make_series(n_series, n_points)
+    total = n_series * n_points
+    encoders = {
+        "json points": lambda: json.dumps(as_points(series)).encode(),
+        "json columnar (orjson)": lambda: orjson.dumps(series, option=orjson.OPT_SERIALIZE_NUMPY),
+        "binary (tswire)": lambda: tswire.encode_series(series),
+    }
+
+    print(f"\n{n_series} series x {n_points} points ({total} points)")
+    print(f"{'format':<24}{'bytes':>12}{'B/point':>9}{'gzip':>12}{'encode ms':>11}")
+    for name, fn in encoders.items():
+        payload, ms = timed(fn)
+        packed = len(gzip.compress(payload))
+        print(f"{name:<24}{len(payload):>12}{len(payload) / total:>9.2f}{packed:>12}{ms:>11.1f}")
+
+    # Round trip check
+    decoded = tswire.decode_series(tswire.encode_series(series))
+    for s, d in zip(series, decoded):
+        assert d["t"] == s["t"].tolist() and d["v"] == s["v"].tolist()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--series", type=int, default=8)
+    parser.add_argument("--points", type=int, nargs="+", default=[800, 20000])
+    args = parser.parse_args()
+    for n_points in args.points:
+        bench(args.series, n_points)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check for the hot reading queries.
+
+Runs the real code paths (status batch, summary, series, readings/latest,
+export) against the configured database, captures every statement they send
+that touches the reading table, EXPLAINs each one and fails if any plan
+falls back to a full scan of reading:
+
+- Postgres: EXPLAIN (FORMAT JSON) with enable_seqscan = off, so a small
+  seeded table still reports whether an index *can* serve the query;
+  any "Seq Scan" on reading (or one of its monthly partitions) is a regression.
+- SQLite: EXPLAIN QUERY PLAN; "SCAN reading" without an index is a regression.
+
+Seed first (scripts/seed_test_data.py) and run migrations, then:
+
+    python scripts/check_query_plans.py [-v]
+
+Exits 1 when a query regressed.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import re
+from datetime import timedelta
+from typing import Callable
+
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+
+from api.app.db.session import SessionLocal, engine
+from api.app.models import device as device_model
+from api.app.models import reading as reading_model
+from api.app.routers.metrics import _series_for, _summary
+from api.app.routers.readings import _encode_cursor, latest_readings
+from api.app.services import export
+from api.app.services.status import compute_status_batch
+
+# Statements that read the reading table (not reading_hourly / reading_daily)
+READING_TABLE = re.compile(r"\b(FROM|JOIN)\s+reading\b(?!_)", re.IGNORECASE)
+# reading itself or one of its partitions (services/partitions.py)
+READING_RELATION = re.compile(r"^reading(_y\d{4}m\d{2}|_default)?$")
+
+
+class StatementCapture:
+    """Collect the statements every engine sends while active."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, object]] = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not executemany and READING_TABLE.search(statement):
+            self.statements.append((statement, parameters))
+
+    def __enter__(self) -> "StatementCapture":
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(Engine, "before_cursor_execute", self._on_execute)
+
+
+def _pg_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _pg_nodes(child)
+
+
+def explain(statement: str, parameters) -> tuple[bool, list[str]]:
+    """(uses an index for every access to reading, plan lines)"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET enable_seqscan = off")
+            (plan,) = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+            nodes = list(_pg_nodes(plan["Plan"]))
+            lines = [
+                f"{n['Node Type']} on {n['Relation Name']}" + (f" using {n['Index Name']}" if "Index Name" in n else "")
+                for n in nodes if "Relation Name" in n
+            ]
+            ok = not any(
+                n["Node Type"] == "Seq Scan" and READING_RELATION.match(n.get("Relation Name", ""))
+                for n in nodes
+            )
+            conn.rollback()
+            return ok, lines
+
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+        lines = [row[-1] for row in rows]
+        ok = not any(re.match(r"SCAN reading\b(?!_)", line) and "INDEX" not in line for line in lines)
+        return ok, lines
+
+
+def build_checks(db) -> list[tuple[str, Callable[[], object]]]:
+    Reading = reading_model.Reading
+    devices = db.query(device_model.Device).all()
+    device_ids = sorted(d.id for d in devices)
+    last = db.query(func.max(Reading.timestamp)).scalar()
+    if not devices or last is None:
+        sys.exit("No readings - seed the database first (scripts/seed_test_data.py)")
+    few = device_ids[:2]
+    day_ago, week_ago = last - timedelta(days=1), last - timedelta(days=7)
+
+    def latest(cursor, ids):
+        return latest_readings(limit=50, cursor=cursor, device_ids=ids, depths=None, db=db)
+
+    oldest = db.query(Reading.timestamp, Reading.id).order_by(Reading.timestamp, Reading.id).first()
+    deep_cursor = _encode_cursor(oldest.timestamp + timedelta(days=1), oldest.id)
+
+    checks = [
+        ("status batch", lambda: compute_status_batch(db, devices)),
+        ("metrics summary", lambda: _summary(db, week_ago, last, None, None)),
+        ("readings/latest", lambda: latest(None, None)),
+        ("readings/latest: deep page", lambda: latest(deep_cursor, None)),
+        ("readings/latest: one device", lambda: latest(deep_cursor, few[:1])),
+        ("series: raw buckets, few devices",
+         lambda: _series_for(db, "moisture", ["device_id", "depth_cm"], few, None, day_ago, last, 500, "bucket")),
+        ("series: raw buckets, one depth",
+         lambda: _series_for(db, "moisture", ["device_id", "depth_cm"], few, [30.0], day_ago, last, 500, "bucket")),
+        ("series: raw buckets, fleet-wide",
+         lambda: _series_for(db, "temp", ["device_id"], None, None, day_ago, last, 500, "bucket")),
+        ("series: lttb",
+         lambda: _series_for(db, "moisture", ["device_id", "depth_cm"], few, None, week_ago, last, 200, "lttb")),
+    ]
+    if export.available():
+        checks.append(("export", lambda: next(export.stream_readings("arrow", few, day_ago, last))))
+    return checks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    print(f"Database: {engine.url.render_as_string(hide_password=True)} ({engine.dialect.name})")
+    failures = 0
+    db = SessionLocal()
+    try:
+        for name, run in build_checks(db):
+            with StatementCapture() as capture:
+                run()
+            if not capture.statements:
+                print(f"  SKIP  {name}: no statement touched reading")
+                continue
+            for i, (statement, parameters) in enumerate(capture.statements, 1):
+                ok, lines = explain(statement, parameters)
+                failures += not ok
+                print(f"  {'OK  ' if ok else 'FAIL'}  {name} #{i}")
+                if args.verbose or not ok:
+                    for line in lines:
+                        print(f"          {line}")
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n{failures} quer{'y' if failures == 1 else 'ies'} scan reading sequentially")
+        return 1
+    print("\nAll reading queries use an index")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,9 @@ from api.app.db.session import SessionLocal
 from api.app.models import device as device_model
 from api.app.models import message as message_model
 from api.app.models import reading as reading_model
+from api.app.services.depths import record_depths
+from api.app.services.rollups import rebuild_rollups
+from api.app.services.watermark import bump_ingest
 
 # Realistic soil probe configurations
 DEVICES = [
@@ -126,8 +129,14 @@ def seed_data(db: Session):
                     )
                     db.add(reading)
                     total_readings += 1
+                
+                # Keep the per-device depth catalog in step with the readings
+                record_depths(db, device.id, DEPTHS, timestamp.replace(tzinfo=None))
     
+    # Readings were bulk-added without ingest: invalidate ETags and build the rollups here
+    bump_ingest(db, [d.id for d in devices.values()])
     db.commit()
+    rebuild_rollups(db)
     print(f"\n✅ Seeded {len(devices)} devices, {total_readings} readings over {DAYS_BACK} days")
     print(f"   ({total_readings / len(devices) / DAYS_BACK:.1f} readings per device per day)")
     return len(devices), total_readings
@@ -45,9 +45,15 @@ def main():
     
     # 3. Devices list
     try:
-        r = requests.get(f"{API_BASE}/v1/devices")
-        devices = r.json()
-        print(f"\n✅ Devices list: {len(devices)} total devices")
+        total = 0
+        params = {"limit": 500}
+        while True:
+            page = requests.get(f"{API_BASE}/v1/devices", params=params).json()
+            total += page["count"]
+            if not page["next_cursor"]:
+                break
+            params["cursor"] = page["next_cursor"]
+        print(f"\n✅ Devices list: {total} total devices")
     except Exception as e:
         print(f"❌ Devices list failed: {e}")
     
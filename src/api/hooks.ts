@@ -1,4 +1,4 @@
-import { useQuery } from '@tanstack/react-query';
+import { keepPreviousData, useQuery } from '@tanstack/react-query';
 import { API_BASE, api } from './client';
 
 export type DeviceStatus = 'red' | 'amber' | 'green' | 'blue' | 'stale' | 'offline' | 'gray';
@@ -8,22 +8,29 @@ export interface SummaryResponse {
   avg_moisture?: number;
   avg_temp?: number;
   last_reading_at?: string;
+  device_count?: number;
 }
 
-interface TimeSeriesPoint {
-  t: string;
-  v: number;
+// Series are fetched with format=columnar: parallel arrays instead of point objects
+interface SeriesColumns {
+  t: number[]; // epoch seconds (UTC)
+  v: number[];
+  min?: number[];
+  max?: number[];
 }
 
-export interface MoistureSeries {
+export interface MoistureSeries extends SeriesColumns {
   device_name: string;
   depth_cm: number;
-  points: TimeSeriesPoint[];
 }
 
-export interface TempSeries {
+export interface TempSeries extends SeriesColumns {
   device_name: string;
-  points: TimeSeriesPoint[];
+}
+
+export interface DepthCatalog {
+  depths: number[];
+  by_device: Record<string, number[]>;
 }
 
 export interface AttentionDevice {
@@ -45,6 +52,55 @@ export interface Device {
   battery_hint?: string;
 }
 
+export interface DeviceListItem extends Device {
+  esn: string;
+  field: string;
+  farm_slug: string;
+  farm_name: string;
+}
+
+export interface DeviceQuery {
+  limit?: number;
+  cursor?: string;
+  farm_id?: string;
+  'status[]'?: DeviceStatus[];
+  esn_prefix?: string;
+  has_coordinates?: boolean;
+  sort?: 'name' | 'severity' | 'last_seen';
+  order?: 'asc' | 'desc';
+}
+
+// /v1/devices is keyset-paginated: pass next_cursor back as cursor for the next page
+export interface DevicePage {
+  count: number;
+  items: DeviceListItem[];
+  next_cursor: string | null;
+}
+
+export interface MapViewport {
+  bbox: string; // west,south,east,north (Leaflet toBBoxString)
+  zoom: number;
+}
+
+// A server-side cluster; single-device markers carry the device instead of bounds
+export interface MapMarker {
+  id: string;
+  lat: number;
+  lon: number;
+  count: number;
+  status: DeviceStatus;
+  device_id?: number;
+  alias?: string;
+  last_seen?: string | null;
+  bounds?: [[number, number], [number, number]];
+}
+
+export interface DeviceMapResponse {
+  zoom: number;
+  device_count: number;
+  markers: MapMarker[];
+}
+
 export interface Farm {
   id: string;
   name: string;
@@ -76,14 +132,22 @@ export function useSummary(q: any) {
 export function useMoistureSeries(q: any) {
   return useQuery<MoistureSeries[]>({
     queryKey: ['moisture', q],
-    queryFn: () => api('/v1/metrics/moisture-series', { ...q, max_points: 800 })
+    queryFn: () => api('/v1/metrics/moisture-series', { ...q, max_points: 800, format: 'columnar' })
   });
 }
 
 export function useTempSeries(q: any) {
   return useQuery<TempSeries[]>({
     queryKey: ['temp', q],
-    queryFn: () => api('/v1/metrics/temp-series', { ...q, max_points: 800 })
+    queryFn: () => api('/v1/metrics/temp-series', { ...q, max_points: 800, format: 'columnar' })
+  });
+}
+
+export function useDepths(deviceIds?: number[]) {
+  return useQuery<DepthCatalog>({
+    queryKey: ['depths', deviceIds],
+    queryFn: () => api('/v1/devices/depths', { 'device_ids[]': deviceIds }),
+    staleTime: 300000,
   });
 }
 
@@ -94,10 +158,19 @@ export function useAttention() {
   });
 }
 
-export function useDevices(farmId?: string) {
-  return useQuery<Device[]>({
-    queryKey: ['devices', farmId],
-    queryFn: () => api('/v1/devices', { farm_id: farmId })
+export function useDevices(q: DeviceQuery = {}) {
+  return useQuery<DevicePage>({
+    queryKey: ['devices', q],
+    queryFn: () => api('/v1/devices', q)
+  });
+}
+
+export function useDeviceMap(viewport: MapViewport) {
+  return useQuery<DeviceMapResponse>({
+    queryKey: ['device-map', viewport],
+    queryFn: () => api('/v1/devices/map', viewport),
+    // Keep the old markers on screen while the new viewport loads
+    placeholderData: keepPreviousData,
   });
 }
 
@@ -1,8 +1,8 @@
-import { useEffect } from 'react';
-import { MapContainer, TileLayer, Marker, Popup, useMap } from 'react-leaflet';
+import { useEffect, useRef, useState } from 'react';
+import { MapContainer, TileLayer, Marker, Popup, useMap, useMapEvents } from 'react-leaflet';
 import L from 'leaflet';
 import 'leaflet/dist/leaflet.css';
-import { Device, DeviceStatus, useDevices } from '@/api/hooks';
+import { DeviceStatus, MapMarker, MapViewport, useDeviceMap } from '@/api/hooks';
 
 // Fix default marker icons for Leaflet
 delete (L.Icon.Default.prototype as any)._getIconUrl;
@@ -41,38 +41,85 @@ function createCustomIcon(color: string): L.DivIcon {
   });
 }
 
-// Component to center map on devices
-function MapCenter({ devices }: { devices: Device[] }) {
+function createClusterIcon(color: string, count: number): L.DivIcon {
+  const size = count < 10 ? 30 : count < 100 ? 36 : 44;
+  return L.divIcon({
+    className: 'custom-marker',
+    html: `<div style="
+      width: ${size}px;
+      height: ${size}px;
+      line-height: ${size - 4}px;
+      background-color: ${color};
+      border: 2px solid white;
+      border-radius: 50%;
+      box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+      color: white;
+      font-size: 12px;
+      font-weight: 600;
+      text-align: center;
+    ">${count}</div>`,
+    iconSize: [size, size],
+    iconAnchor: [size / 2, size / 2],
+  });
+}
+
+// First request: the whole world, to find the fleet
+const WORLD: MapViewport = { bbox: '-180,-85,180,85', zoom: 2 };
+
+// Report the visible bbox/zoom after every pan or zoom; markers are clustered server-side for it
+function ViewportWatcher({ onChange }: { onChange: (v: MapViewport) => void }) {
+  const map = useMapEvents({
+    moveend: () => onChange({ bbox: map.getBounds().toBBoxString(), zoom: map.getZoom() }),
+  });
+  return null;
+}
+
+// Fit the map to the fleet once, from the first (whole-world) response
+function MapCenter({ markers }: { markers: MapMarker[] }) {
   const map = useMap();
-  
+  const done = useRef(false);
+
   useEffect(() => {
-    const validDevices = devices.filter(d => d.lat != null && d.lon != null);
-    if (validDevices.length === 0) return;
-    
-    if (validDevices.length === 1) {
-      map.setView([validDevices[0].lat!, validDevices[0].lon!], 13);
+    if (done.current || markers.length === 0) return;
+    done.current = true;
+
+    if (markers.length === 1 && markers[0].count === 1) {
+      map.setView([markers[0].lat, markers[0].lon], 13);
     } else {
       const bounds = L.latLngBounds(
-        validDevices.map(d => [d.lat, d.lon] as [number, number])
+        markers.flatMap(m => m.bounds ?? [[m.lat, m.lon] as [number, number]])
       );
       map.fitBounds(bounds, { padding: [50, 50] });
     }
-  }, [map, devices]);
-  
+  }, [map, markers]);
+
   return null;
 }
 
+function ClusterMarker({ marker }: { marker: MapMarker }) {
+  const map = useMap();
+  const icon = createClusterIcon(statusToColor(marker.status), marker.count);
+  return (
+    <Marker
+      position={[marker.lat, marker.lon]}
+      icon={icon}
+      eventHandlers={{
+        click: () => {
+          if (marker.bounds) map.fitBounds(marker.bounds, { padding: [40, 40] });
+        },
+      }}
+    />
+  );
+}
+
 interface DeviceMapProps {
   onPick: (deviceId: string) => void;
 }
 
 export function DeviceMap({ onPick }: DeviceMapProps) {
-  const { data: devices = [], isLoading } = useDevices();
-  
-  // Filter devices that have coordinates (lat/lon from device_config, or use farm centroid if available)
-  const devicesWithLocation = devices.filter(
-    d => d.lat != null && d.lon != null
-  );
+  const [viewport, setViewport] = useState<MapViewport>(WORLD);
+  const { data, isLoading } = useDeviceMap(viewport);
+  const markers = data?.markers ?? [];
   
   // Default center (Brazil - São Paulo region)
   const defaultCenter: [number, number] = [-23.5505, -46.6333];
@@ -81,13 +128,13 @@ export function DeviceMap({ onPick }: DeviceMapProps) {
   return (
     <div>
       <h2 className="text-lg font-semibold mb-2 text-gray-900">Farm Map</h2>
-      {isLoading ? (
+      {isLoading && !data ? (
         <div className="h-64 border rounded-lg bg-gray-100 flex items-center justify-center">
           <div className="text-gray-500">Loading map...</div>
         </div>
       ) : (
         <div className="h-64 border rounded-lg overflow-hidden relative">
-          {devicesWithLocation.length === 0 && (
+          {viewport === WORLD && data?.device_count === 0 && (
             <div className="absolute inset-0 z-[1000] bg-gray-100/90 flex items-center justify-center pointer-events-none">
               <div className="text-gray-600 text-sm">Waiting for GPS data for this farm.</div>
             </div>
@@ -103,30 +150,34 @@ export function DeviceMap({ onPick }: DeviceMapProps) {
               url="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png"
             />
 
-            <MapCenter devices={devicesWithLocation} />
+            <MapCenter markers={markers} />
+            <ViewportWatcher onChange={setViewport} />
 
-            {devicesWithLocation.map((device: any) => {
-              const color = statusToColor(device.status || 'gray');
-              const icon = createCustomIcon(color);
+            {markers.map((marker) => {
+              if (marker.device_id == null) {
+                return <ClusterMarker key={marker.id} marker={marker} />;
+              }
+              const deviceId = marker.device_id;
+              const icon = createCustomIcon(statusToColor(marker.status));
 
               return (
                 <Marker
-                  key={device.id}
-                  position={[device.lat, device.lon]}
+                  key={marker.id}
+                  position={[marker.lat, marker.lon]}
                   icon={icon}
                   eventHandlers={{
                     click: () => {
-                      onPick(String(device.id));
+                      onPick(String(deviceId));
                     },
                   }}
                 >
                   <Popup>
                     <div className="text-sm">
-                      <div className="font-semibold">{device.alias}</div>
-                      <div className="text-gray-600">Status: {device.status}</div>
-                      <div className="text-gray-600">Last seen: {device.last_seen}</div>
+                      <div className="font-semibold">{marker.alias}</div>
+                      <div className="text-gray-600">Status: {marker.status}</div>
+                      <div className="text-gray-600">Last seen: {marker.last_seen}</div>
                       <button
-                        onClick={() => onPick(String(device.id))}
+                        onClick={() => onPick(String(deviceId))}
                         className="mt-2 text-xs text-blue-600 hover:underline"
                       >
                         View details →
@@ -1,11 +1,13 @@
 import { LineChart, Line, XAxis, YAxis, Tooltip, Legend, ResponsiveContainer, ReferenceArea, CartesianGrid } from 'recharts';
 import { useSearchParams } from 'react-router-dom';
 import { presetToRange } from '@/lib/time';
-import { MoistureSeries, useMoistureSeries } from '@/api/hooks';
+import { MoistureSeries, useDepths, useMoistureSeries } from '@/api/hooks';
 
 export function MoistureChart({ q }: { q: any }) {
   const [sp, setSp] = useSearchParams();
   const { data = [], isLoading } = useMoistureSeries(q);
+  const { data: depthCatalog } = useDepths(q['device_ids[]']);
+  const depthOptions = depthCatalog?.depths ?? [];
 
   if (isLoading) return (
     <div className="border-2 border-stone-200 rounded-xl p-4 bg-white min-h-[28rem] flex items-center justify-center">
@@ -20,7 +22,7 @@ export function MoistureChart({ q }: { q: any }) {
   );
 
   // Flatten series to chart rows
-  const timeMap = new Map<string, any>();
+  const timeMap = new Map<number, any>();
   const seriesMeta: Array<{ key: string; color: string; device: string; depth: number }> = [];
   // Earthy greens and browns palette
   const colors = ['#059669', '#10b981', '#0d9488', '#0891b2', '#6366f1', '#8b5cf6', '#d97706', '#ea580c'];
@@ -34,22 +36,21 @@ export function MoistureChart({ q }: { q: any }) {
       depth: series.depth_cm,
     });
 
-    series.points.forEach((point) => {
-      if (!timeMap.has(point.t)) {
-        timeMap.set(point.t, { t: point.t });
+    series.t.forEach((t, i) => {
+      if (!timeMap.has(t)) {
+        timeMap.set(t, { t });
       }
-      timeMap.get(point.t)[key] = point.v;
+      timeMap.get(t)[key] = series.v[i];
     });
   });
 
-  const rows = Array.from(timeMap.values()).sort((a, b) =>
-    new Date(a.t).getTime() - new Date(b.t).getTime()
-  );
+  const rows = Array.from(timeMap.values()).sort((a, b) => a.t - b.t);
 
   const visibleSeries = seriesMeta.slice(0, 8);
 
-  const formatTick = (value: string) =>
-    new Date(value).toLocaleString(undefined, { month: 'short', day: 'numeric', hour: 'numeric', minute: '2-digit' });
+  // t is epoch seconds (UTC)
+  const formatTick = (value: number) =>
+    new Date(value * 1000).toLocaleString(undefined, { month: 'short', day: 'numeric', hour: 'numeric', minute: '2-digit' });
 
   return (
     <div className="border border-[#ede2d3] rounded-2xl p-5 bg-white/95 shadow-sm">
@@ -57,7 +58,7 @@ export function MoistureChart({ q }: { q: any }) {
 
       {/* Depth selector */}
       <div className="flex flex-wrap gap-2 mb-4">
-        {[10, 20, 30, 40, 50, 60].map(cm => {
+        {depthOptions.map(cm => {
           const active = (sp.get('depths') ?? '').split(',').includes(String(cm));
           return (
             <button
@@ -20,7 +20,7 @@ export function TemperatureChart({ q }: { q: any }) {
   );
 
   // Flatten series to chart rows
-  const timeMap = new Map<string, any>();
+  const timeMap = new Map<number, any>();
   const seriesMeta: Array<{ key: string; color: string; device: string }> = [];
   // Warm earthy palette for temperature
   const colors = ['#dc2626', '#ea580c', '#d97706', '#ca8a04', '#65a30d', '#16a34a', '#0d9488', '#0891b2'];
@@ -33,22 +33,21 @@ export function TemperatureChart({ q }: { q: any }) {
       device: series.device_name,
     });
 
-    series.points.forEach((point) => {
-      if (!timeMap.has(point.t)) {
-        timeMap.set(point.t, { t: point.t });
+    series.t.forEach((t, i) => {
+      if (!timeMap.has(t)) {
+        timeMap.set(t, { t });
       }
-      timeMap.get(point.t)[key] = point.v;
+      timeMap.get(t)[key] = series.v[i];
     });
   });
 
-  const rows = Array.from(timeMap.values()).sort((a, b) =>
-    new Date(a.t).getTime() - new Date(b.t).getTime()
-  );
+  const rows = Array.from(timeMap.values()).sort((a, b) => a.t - b.t);
 
   const visibleSeries = seriesMeta.slice(0, 8);
 
-  const formatTick = (value: string) =>
-    new Date(value).toLocaleString(undefined, { month: 'short', day: 'numeric', hour: 'numeric', minute: '2-digit' });
+  // t is epoch seconds (UTC)
+  const formatTick = (value: number) =>
+    new Date(value * 1000).toLocaleString(undefined, { month: 'short', day: 'numeric', hour: 'numeric', minute: '2-digit' });
 
   return (
     <div className="border border-[#ede2d3] rounded-2xl p-5 bg-white/95 shadow-sm">
@@ -0,0 +1,130 @@
+// Decoder for the binary series format (application/vnd.soilprobe.ts).
+// Mirrors api/app/services/tswire.py - see that module for the layout.
+
+export const TSWIRE_MEDIA_TYPE = 'application/vnd.soilprobe.ts';
+
+export interface WireSeries {
+  device_id: number;
+  depth_cm: number | null;
+  device_name: string;
+  t: number[]; // epoch seconds (UTC)
+  [column: string]: number[] | number | string | null;
+}
+
+class BitReader {
+  private pos = 0;
+  constructor(private bytes: Uint8Array) {}
+
+  bit(): number {
+    const b = (this.bytes[this.pos >> 3] >> (7 - (this.pos & 7))) & 1;
+    this.pos += 1;
+    return b;
+  }
+
+  read(n: number): bigint {
+    let v = 0n;
+    for (let i = 0; i < n; i++) v = (v << 1n) | BigInt(this.bit());
+    return v;
+  }
+
+  // Small fields (<= 32 bits) without BigInt
+  readSmall(n: number): number {
+    let v = 0;
+    for (let i = 0; i < n; i++) v = v * 2 + this.bit();
+    return v;
+  }
+}
+
+const signed = (v: bigint, width: number) => BigInt.asIntN(width, v);
+const signedSmall = (v: number, width: number) => (v >= 2 ** (width - 1) ? v - 2 ** width : v);
+
+function decodeTimestamps(bytes: Uint8Array, n: number): number[] {
+  if (n === 0) return [];
+  const r = new BitReader(bytes);
+  const t = [Number(signed(r.read(64), 64))];
+  if (n === 1) return t;
+  let delta = Number(signed(r.read(64), 64));
+  t.push(t[0] + delta);
+  for (let i = 2; i < n; i++) {
+    let dod = 0;
+    if (r.bit()) {
+      if (!r.bit()) dod = signedSmall(r.readSmall(7), 7);
+      else if (!r.bit()) dod = signedSmall(r.readSmall(9), 9);
+      else if (!r.bit()) dod = signedSmall(r.readSmall(12), 12);
+      else dod = Number(signed(r.read(64), 64));
+    }
+    delta += dod;
+    t.push(t[t.length - 1] + delta);
+  }
+  return t;
+}
+
+function decodeValues(bytes: Uint8Array, n: number): number[] {
+  if (n === 0) return [];
+  const r = new BitReader(bytes);
+  const view = new DataView(new ArrayBuffer(8));
+  let word = r.read(64);
+  const out: number[] = [];
+  const push = () => {
+    view.setBigUint64(0, word);
+    out.push(view.getFloat64(0));
+  };
+  push();
+  let lead = 0;
+  let trail = 0;
+  for (let i = 1; i < n; i++) {
+    if (r.bit()) {
+      if (r.bit()) {
+        lead = r.readSmall(5);
+        const width = r.readSmall(6) || 64;
+        trail = 64 - lead - width;
+      }
+      word ^= r.read(64 - lead - trail) << BigInt(trail);
+    }
+    push();
+  }
+  return out;
+}
+
+export function decodeSeries(buffer: ArrayBuffer): WireSeries[] {
+  const bytes = new Uint8Array(buffer);
+  const dv = new DataView(buffer);
+  const text = new TextDecoder();
+  if (text.decode(bytes.subarray(0, 4)) !== 'SPTS' || dv.getUint8(4) !== 1) {
+    throw new Error('Not a soilprobe time-series payload');
+  }
+  const count = dv.getUint32(5, true);
+  let pos = 9;
+  const result: WireSeries[] = [];
+
+  for (let s = 0; s < count; s++) {
+    const deviceId = dv.getUint32(pos, true);
+    const depth = dv.getFloat64(pos + 4, true);
+    const nameLen = dv.getUint16(pos + 12, true);
+    const nColumns = dv.getUint8(pos + 14);
+    const n = dv.getUint32(pos + 15, true);
+    pos += 19;
+    const series: WireSeries = {
+      device_id: deviceId,
+      depth_cm: Number.isNaN(depth) ? null : depth,
+      device_name: text.decode(bytes.subarray(pos, pos + nameLen)),
+      t: [],
+    };
+    pos += nameLen;
+
+    let size = dv.getUint32(pos, true);
+    series.t = decodeTimestamps(bytes.subarray(pos + 4, pos + 4 + size), n);
+    pos += 4 + size;
+
+    for (let c = 0; c < nColumns; c++) {
+      const colLen = bytes[pos];
+      const column = text.decode(bytes.subarray(pos + 1, pos + 1 + colLen));
+      pos += 1 + colLen;
+      size = dv.getUint32(pos, true);
+      series[column] = decodeValues(bytes.subarray(pos + 4, pos + 4 + size), n);
+      pos += 4 + size;
+    }
+    result.push(series);
+  }
+  return result;
+}
@@ -82,7 +82,8 @@ function deriveFarmFromDevices(devices: Device[], attentionCount: number): Farm
 
 export default function LandingPage() {
   const { data: farms = [], isLoading } = useFarms();
-  const { data: devices = [] } = useDevices();
+  const { data: devicePage } = useDevices({ limit: 500 });
+  const devices = devicePage?.items ?? [];
   const { data: attention = [] } = useAttention();
 
   const derivedFarm = deriveFarmFromDevices(devices, attention.length);